@@ -0,0 +1,84 @@
+"""Benchmark the APA, ICONTEC and IEEE formatters on the same synthetic document.
+
+Usage:
+    python scripts/benchmark_formatters.py [--paragraphs 400] [--tables 20] [--repeat 3]
+
+Prints the median load+process+save time of each standard and its cost
+relative to the fastest one, so regressions in one pipeline stand out
+against the others.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from docx import Document
+
+from normadocs.formatters import get_formatter
+from normadocs.models import DocumentMetadata
+
+STANDARDS = ("apa7", "icontec", "ieee")
+
+
+def build_document(path: Path, paragraphs: int, tables: int) -> None:
+    """Write a synthetic pandoc-like DOCX with headings, body, tables and references."""
+    doc = Document()
+    doc.add_heading("Introducción", level=1)
+    per_section = max(paragraphs // max(tables, 1), 1)
+    for i in range(paragraphs):
+        if i and i % per_section == 0:
+            doc.add_heading(f"Sección {i // per_section}", level=2)
+            table = doc.add_table(rows=6, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"Dato {r}.{c}"
+            doc.add_paragraph(f"Fig. {i // per_section}. Figura de ejemplo.")
+        doc.add_paragraph(
+            f"Párrafo {i} con una cita (García, López y Martínez, 2020) y texto "
+            "suficiente para ocupar varias líneas en la página formateada."
+        )
+    doc.add_heading("Referencias", level=1)
+    for i in range(paragraphs // 4):
+        doc.add_paragraph(f"Autor{i:04d}, A. y Otro, B. (2020). Título {i}. Revista, {i}(2), 1-9.")
+    doc.save(str(path))
+
+
+def time_standard(style: str, source: Path, out_dir: Path, repeat: int) -> float:
+    """Return the median seconds to load, process and save ``source`` in ``style``."""
+    meta = DocumentMetadata(title="Benchmark", author="NormaDocs")
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        formatter = get_formatter(style, str(source))
+        formatter.process(meta)
+        formatter.save(str(out_dir / f"{style}.docx"))
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark and print one line per standard."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        source = out_dir / "source.docx"
+        build_document(source, args.paragraphs, args.tables)
+        results = {s: time_standard(s, source, out_dir, args.repeat) for s in STANDARDS}
+
+    fastest = min(results.values())
+    print(f"{'standard':<10} {'median (s)':>10} {'relative':>9}")
+    for style, seconds in results.items():
+        print(f"{style:<10} {seconds:>10.3f} {seconds / fastest:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure when page-sharded PDF extraction pays off.
+
+Usage:
+    python scripts/benchmark_pdf_shards.py [--pages 210] [--processes 2] [--repeat 3]
+
+Builds a synthetic text-heavy PDF and measures the three costs that decide
+whether ``PDFAnalyzer(processes=...)`` beats sequential extraction: starting
+a spawned worker, extracting a page, and shipping a page's facts back to the
+parent. Prints the page count at which two workers on two CPUs break even
+(``SHARD_MIN_PAGES`` in ``normadocs.verifier.pdf_analyzer`` is set from it),
+then times sequential and sharded extraction of the document on this
+machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import pickle
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import fitz
+
+from normadocs.verifier import pdf_analyzer
+from normadocs.verifier.pdf_analyzer import PDFAnalyzer, _extract_shard
+
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit")
+
+
+def build_pdf(path: Path, pages: int) -> None:
+    """Write ``pages`` pages of 40 text lines in three fonts."""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=612, height=792)
+        for line in range(40):
+            text = " ".join(WORDS[(line + i + k) % len(WORDS)] for k in range(12))
+            font = ("tiro", "tibo", "helv")[line % 3]
+            page.insert_text((72, 72 + 17 * line), text, fontname=font, fontsize=11)
+    doc.save(str(path))
+    doc.close()
+
+
+def median_seconds(run, repeat: int) -> float:
+    """Return the median wall time of ``repeat`` calls of ``run``."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def extract(path: Path, processes: int) -> None:
+    analyzer = PDFAnalyzer(path, processes=processes)
+    try:
+        analyzer.extract_text_by_page()
+    finally:
+        analyzer.close()
+
+
+def spawn_one_page(path: Path) -> None:
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pool.submit(_extract_shard, str(path), "pymupdf", [0]).result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=210)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.pdf"
+        build_pdf(path, args.pages)
+
+        sequential = median_seconds(lambda: extract(path, 1), args.repeat)
+        per_page = sequential / args.pages
+        startup = median_seconds(lambda: spawn_one_page(path), args.repeat) - per_page
+        shard = _extract_shard(str(path), "pymupdf", list(range(args.pages)))
+        shipping = (
+            median_seconds(lambda: pickle.loads(pickle.dumps(shard)), args.repeat) / args.pages
+        )
+        break_even = startup / (per_page / 2 - shipping)
+
+        print(f"worker start-up   {startup:8.3f} s")
+        print(f"extraction        {per_page * 1000:8.2f} ms/page")
+        print(f"shipping          {shipping * 1000:8.2f} ms/page")
+        print(f"2 workers pay off at ~{break_even:.0f} pages (2 CPUs)")
+        print(f"SHARD_MIN_PAGES   {pdf_analyzer.SHARD_MIN_PAGES:8d}")
+        print(f"sequential        {sequential:8.3f} s")
+        # Sharding is capped by usable CPUs, so force it to see the raw cost.
+        pdf_analyzer._usable_cpus = lambda: args.processes
+        pdf_analyzer.SHARD_MIN_PAGES = 1
+        sharded = median_seconds(lambda: extract(path, args.processes), args.repeat)
+        print(f"{args.processes} processes       {sharded:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,29 @@
 NormaDocs - Markdown to academic DOCX/PDF converter (APA 7th, ICONTEC, IEEE).
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 __version__ = "0.2.0"
+
+__all__ = [
+    "ConversionError",
+    "ConversionResult",
+    "ToolLimits",
+    "__version__",
+    "convert",
+    "convert_async",
+]
+
+if TYPE_CHECKING:
+    from .api import ConversionError, ConversionResult, ToolLimits, convert, convert_async
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import to avoid loading the pipeline when only the version is needed."""
+    if name in {"ConversionError", "ConversionResult", "ToolLimits", "convert", "convert_async"}:
+        from . import api
+
+        return getattr(api, name)
+    raise AttributeError(f"module 'normadocs' has no attribute '{name}'")
@@ -0,0 +1,433 @@
+"""
+Programmatic conversion API.
+
+``convert`` runs the same pipeline as ``normadocs convert`` (preprocess,
+LanguageTool, Pandoc, formatting, PDF, APA verification) without touching
+the CLI or the caller's filesystem: intermediate files live in a private
+temporary directory per call, the outputs are returned as bytes, and
+progress goes to the ``normadocs`` logger instead of stdout. Calls share no
+mutable state, so they can run concurrently from several threads.
+
+``convert_async`` is the asyncio variant: Pandoc and LibreOffice run as
+asyncio subprocesses, and the blocking stages (LanguageTool requests,
+python-docx formatting, verification) run in worker threads. Every
+external tool is capped by a per-event-loop semaphore (``ToolLimits``), so
+one loop can drive many conversions without starting a process or thread
+per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import tempfile
+import time
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from docx import Document
+
+from .formatters import get_formatter
+from .models import DocumentMetadata
+from .pandoc_client import PandocRunner
+from .pdf_generator import PDFGenerator
+from .preprocessor import MarkdownPreprocessor
+
+if TYPE_CHECKING:
+    from .languagetool_client import LanguageToolClient, LanguageToolError
+    from .verifier import VerificationResult
+
+__all__ = [
+    "APA_STYLES",
+    "DEFAULT_LIMITS",
+    "OUTPUT_FORMATS",
+    "ConversionError",
+    "ConversionResult",
+    "ToolLimits",
+    "convert",
+    "convert_async",
+]
+
+logger = logging.getLogger("normadocs")
+
+APA_STYLES = frozenset({"apa", "apa7", "apa7estudiante"})
+OUTPUT_FORMATS = frozenset({"docx", "pdf"})
+
+
+class ConversionError(RuntimeError):
+    """Raised when a pipeline stage cannot produce its output."""
+
+
+@dataclass
+class ConversionResult:
+    """Outputs of a conversion.
+
+    Attributes:
+        metadata: Metadata extracted from the Markdown front matter.
+        docx: The formatted DOCX, if requested.
+        pdf: The exported PDF, if requested.
+        verification: The APA verification result, if requested.
+        language_errors: LanguageTool errors per stage ("Pre-conversión
+            (Markdown)", "Post-conversión (DOCX)"), if a client was given.
+        timings: Wall-clock seconds per stage, plus ``"total"``.
+    """
+
+    metadata: DocumentMetadata
+    docx: bytes | None = None
+    pdf: bytes | None = None
+    verification: VerificationResult | None = None
+    language_errors: list[tuple[str, list[LanguageToolError]]] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class ToolLimits:
+    """Caps on the operations in flight per external tool.
+
+    One instance can be shared by every ``convert_async`` call; semaphores
+    are created per running event loop.
+
+    Args:
+        pandoc: Concurrent Pandoc processes.
+        libreoffice: Concurrent LibreOffice processes.
+        languagetool: Concurrent LanguageTool requests.
+        workers: Concurrent in-process stages (formatting, verification)
+            running in worker threads.
+
+    Raises:
+        ValueError: If a limit is lower than 1.
+    """
+
+    TOOLS = ("pandoc", "libreoffice", "languagetool", "workers")
+
+    def __init__(
+        self, pandoc: int = 8, libreoffice: int = 2, languagetool: int = 16, workers: int = 4
+    ) -> None:
+        self.limits = {
+            "pandoc": pandoc,
+            "libreoffice": libreoffice,
+            "languagetool": languagetool,
+            "workers": workers,
+        }
+        for tool, limit in self.limits.items():
+            if limit < 1:
+                raise ValueError(f"{tool} limit must be at least 1, got {limit}")
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{tool}={limit}" for tool, limit in self.limits.items())
+        return f"ToolLimits({args})"
+
+    def slot(self, tool: str) -> asyncio.Semaphore:
+        """Return the running loop's semaphore for ``tool``.
+
+        Args:
+            tool: One of ``TOOLS``.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = {t: asyncio.Semaphore(n) for t, n in self.limits.items()}
+            self._semaphores[loop] = semaphores
+        return semaphores[tool]
+
+
+DEFAULT_LIMITS = ToolLimits()
+
+
+@contextmanager
+def _timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def _check_request(style: str, outputs: Collection[str], verify: bool) -> set[str]:
+    wanted = set(outputs)
+    unknown = wanted - OUTPUT_FORMATS
+    if unknown:
+        raise ValueError(f"Unsupported output format(s): {', '.join(sorted(unknown))}")
+    if verify and style.lower() not in APA_STYLES:
+        raise ValueError(f"APA verification does not apply to style: {style}")
+    return wanted
+
+
+def _docx_text(docx_path: Path) -> str:
+    doc = Document(str(docx_path))
+    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+
+
+def _format_docx(
+    style: str,
+    docx_path: Path,
+    meta: DocumentMetadata,
+    optimize: bool,
+    compression_level: int | None,
+) -> bytes:
+    formatter = get_formatter(style, str(docx_path))
+    formatter.process(meta)
+    buffer = io.BytesIO()
+    formatter.save(buffer, optimize=optimize, compression_level=compression_level)
+    docx_bytes = buffer.getvalue()
+    # The PDF export and the verifier read the formatted file.
+    docx_path.write_bytes(docx_bytes)
+    return docx_bytes
+
+
+def _verify(
+    pdf_path: Path, docx_path: Path, meta: DocumentMetadata, strict: bool
+) -> VerificationResult:
+    from .verifier.apa_verifier import APAVerifier
+
+    verifier = APAVerifier(pdf_path, docx_path, meta=meta, strict=strict)
+    try:
+        verification = verifier.verify_all()
+    finally:
+        verifier.close()
+    # The files are gone once the temporary directory is removed.
+    verification.pdf_path = verification.docx_path = None
+    return verification
+
+
+def _optional(path: str | Path | None) -> str | None:
+    return str(path) if path else None
+
+
+def convert(
+    markdown: str,
+    style: str = "apa7estudiante",
+    outputs: Collection[str] = ("docx",),
+    verify: bool = False,
+    *,
+    bibliography: str | Path | None = None,
+    csl: str | Path | None = None,
+    resource_path: str | Path | None = None,
+    language_tool: LanguageToolClient | None = None,
+    strict: bool = True,
+    optimize: bool = False,
+    compression_level: int | None = None,
+) -> ConversionResult:
+    """Convert Markdown to formatted DOCX/PDF bytes.
+
+    Args:
+        markdown: The Markdown source, front matter included.
+        style: Citation style ('apa7estudiante', 'apa', 'icontec', 'ieee').
+        outputs: Formats to return, a subset of ``{"docx", "pdf"}``.
+        verify: Verify the PDF against APA 7 (APA styles only). The PDF is
+            generated for verification even if it is not requested.
+        bibliography: Optional BibTeX file for citations.
+        csl: Optional CSL style file for citation formatting.
+        resource_path: Directory images are resolved against.
+        language_tool: Client used to check the Markdown and the DOCX text;
+            its server must already be running. Errors are collected, not
+            raised.
+        strict: Treat every verification warning as a failure.
+        optimize: Shrink the DOCX package on save.
+        compression_level: Deflate level (0-9) of the DOCX.
+
+    Returns:
+        The requested outputs, verification result, LanguageTool errors and
+        per-stage timings.
+
+    Raises:
+        ValueError: If the style, an output format or ``verify`` with a
+            non-APA style is not supported.
+        ConversionError: If Pandoc or the PDF export fails.
+    """
+    wanted = _check_request(style, outputs, verify)
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+
+    with _timed(timings, "preprocess"):
+        clean_md, meta = MarkdownPreprocessor().process(markdown)
+    result = ConversionResult(metadata=meta, timings=timings)
+
+    if language_tool is not None:
+        with _timed(timings, "languagetool_pre"):
+            errors = language_tool.check(clean_md)
+        if errors:
+            result.language_errors.append(("Pre-conversión (Markdown)", errors))
+
+    with tempfile.TemporaryDirectory(prefix="normadocs-") as tmp:
+        work = Path(tmp)
+        docx_path = work / "document.docx"
+
+        with _timed(timings, "pandoc"):
+            if not PandocRunner().run(
+                clean_md,
+                str(docx_path),
+                bibliography=_optional(bibliography),
+                csl=_optional(csl),
+                resource_path=_optional(resource_path),
+            ):
+                raise ConversionError("Pandoc could not convert the Markdown")
+
+        if language_tool is not None:
+            with _timed(timings, "languagetool_post"):
+                errors = language_tool.check(_docx_text(docx_path))
+            if errors:
+                result.language_errors.append(("Post-conversión (DOCX)", errors))
+
+        with _timed(timings, "format"):
+            docx_bytes = _format_docx(style, docx_path, meta, optimize, compression_level)
+        if "docx" in wanted:
+            result.docx = docx_bytes
+
+        if "pdf" in wanted or verify:
+            pdf_path = work / "document.pdf"
+            with _timed(timings, "pdf"):
+                exported = PDFGenerator.convert(
+                    str(docx_path),
+                    str(work),
+                    clean_md,
+                    str(pdf_path),
+                    profile_dir=str(work / "libreoffice"),
+                )
+            # LibreOffice exits 0 without writing a PDF when it cannot load the source.
+            if not exported or not pdf_path.is_file():
+                raise ConversionError("No PDF backend could export the document")
+            if "pdf" in wanted:
+                result.pdf = pdf_path.read_bytes()
+
+            if verify:
+                with _timed(timings, "verify"):
+                    result.verification = _verify(pdf_path, docx_path, meta, strict)
+
+    timings["total"] = time.perf_counter() - start
+    logger.info("▸ Conversión %s completada en %.2fs", style.upper(), timings["total"])
+    return result
+
+
+async def convert_async(
+    markdown: str,
+    style: str = "apa7estudiante",
+    outputs: Collection[str] = ("docx",),
+    verify: bool = False,
+    *,
+    bibliography: str | Path | None = None,
+    csl: str | Path | None = None,
+    resource_path: str | Path | None = None,
+    language_tool: LanguageToolClient | None = None,
+    strict: bool = True,
+    optimize: bool = False,
+    compression_level: int | None = None,
+    limits: ToolLimits = DEFAULT_LIMITS,
+) -> ConversionResult:
+    """Convert Markdown to formatted DOCX/PDF bytes without blocking the event loop.
+
+    Takes the same arguments and returns the same result as ``convert``.
+    Timings measure the work of each stage, not the time spent waiting
+    for a slot; ``"total"`` includes the waits.
+
+    Args:
+        markdown: The Markdown source, front matter included.
+        style: Citation style ('apa7estudiante', 'apa', 'icontec', 'ieee').
+        outputs: Formats to return, a subset of ``{"docx", "pdf"}``.
+        verify: Verify the PDF against APA 7 (APA styles only).
+        bibliography: Optional BibTeX file for citations.
+        csl: Optional CSL style file for citation formatting.
+        resource_path: Directory images are resolved against.
+        language_tool: Client used to check the Markdown and the DOCX text.
+        strict: Treat every verification warning as a failure.
+        optimize: Shrink the DOCX package on save.
+        compression_level: Deflate level (0-9) of the DOCX.
+        limits: Per-tool concurrency caps, shared with the other calls
+            that use the same instance.
+
+    Returns:
+        The requested outputs, verification result, LanguageTool errors and
+        per-stage timings.
+
+    Raises:
+        ValueError: If the style, an output format or ``verify`` with a
+            non-APA style is not supported.
+        ConversionError: If Pandoc or the PDF export fails.
+    """
+    wanted = _check_request(style, outputs, verify)
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+
+    with _timed(timings, "preprocess"):
+        clean_md, meta = MarkdownPreprocessor().process(markdown)
+    result = ConversionResult(metadata=meta, timings=timings)
+
+    if language_tool is not None:
+        async with limits.slot("languagetool"):
+            with _timed(timings, "languagetool_pre"):
+                errors = await language_tool.check_async(clean_md)
+        if errors:
+            result.language_errors.append(("Pre-conversión (Markdown)", errors))
+
+    with tempfile.TemporaryDirectory(prefix="normadocs-") as tmp:
+        work = Path(tmp)
+        docx_path = work / "document.docx"
+
+        async with limits.slot("pandoc"):
+            with _timed(timings, "pandoc"):
+                converted = await PandocRunner().run_async(
+                    clean_md,
+                    str(docx_path),
+                    bibliography=_optional(bibliography),
+                    csl=_optional(csl),
+                    resource_path=_optional(resource_path),
+                )
+        if not converted:
+            raise ConversionError("Pandoc could not convert the Markdown")
+
+        if language_tool is not None:
+            async with limits.slot("workers"):
+                text = await asyncio.to_thread(_docx_text, docx_path)
+            async with limits.slot("languagetool"):
+                with _timed(timings, "languagetool_post"):
+                    errors = await language_tool.check_async(text)
+            if errors:
+                result.language_errors.append(("Post-conversión (DOCX)", errors))
+
+        async with limits.slot("workers"):
+            with _timed(timings, "format"):
+                docx_bytes = await asyncio.to_thread(
+                    _format_docx, style, docx_path, meta, optimize, compression_level
+                )
+        if "docx" in wanted:
+            result.docx = docx_bytes
+
+        if "pdf" in wanted or verify:
+            pdf_path = work / "document.pdf"
+            async with limits.slot("libreoffice"):
+                with _timed(timings, "pdf"):
+                    exported = await PDFGenerator.convert_with_libreoffice_async(
+                        str(docx_path), str(work), profile_dir=str(work / "libreoffice")
+                    )
+            if not exported:
+                # WeasyPrint renders in-process (and runs Pandoc for the HTML).
+                async with limits.slot("workers"), limits.slot("pandoc"):
+                    with _timed(timings, "pdf"):
+                        exported = await asyncio.to_thread(
+                            PDFGenerator.convert_with_weasyprint, clean_md, str(pdf_path)
+                        )
+            if not exported or not pdf_path.is_file():
+                raise ConversionError("No PDF backend could export the document")
+            if "pdf" in wanted:
+                result.pdf = pdf_path.read_bytes()
+
+            if verify:
+                async with limits.slot("workers"):
+                    with _timed(timings, "verify"):
+                        result.verification = await asyncio.to_thread(
+                            _verify, pdf_path, docx_path, meta, strict
+                        )
+
+    timings["total"] = time.perf_counter() - start
+    logger.info("▸ Conversión %s completada en %.2fs", style.upper(), timings["total"])
+    return result
@@ -3,6 +3,9 @@ Command Line Interface for APA Engine.
 """
 
 import logging
+import os
+import sys
+import time
 from pathlib import Path
 from typing import Annotated
 
@@ -33,6 +36,10 @@ app = typer.Typer(
     help="NormaDocs: Convert Markdown to APA 7th, ICONTEC, or IEEE formatted DOCX/PDF."
 )
 
+# ``normadocs INPUT.md`` stays the conversion command; ``normadocs verify``
+# is dispatched to this app by ``main``.
+verify_app = typer.Typer(help="NormaDocs: verify exported PDFs against APA 7th Edition.")
+
 
 def get_default_ignored_words() -> list[str]:
     """Load default ignored words from config file."""
@@ -65,6 +72,22 @@ def convert(
             help="Citation style: apa7estudiante (default), apa, icontec, or ieee",
         ),
     ] = "apa7estudiante",
+    optimize_docx: Annotated[
+        bool,
+        typer.Option(
+            "--optimize-docx/--no-optimize-docx",
+            help="Shrink the DOCX on save (dedupe media, prune unused styles and parts)",
+        ),
+    ] = False,
+    compression_level: Annotated[
+        int | None,
+        typer.Option(
+            "--compression-level",
+            min=0,
+            max=9,
+            help="Deflate level of the saved DOCX, 0 (none) to 9 (smallest)",
+        ),
+    ] = None,
     bibliography: Annotated[
         str | None, typer.Option("--bibliography", "-b", help="Path to bibliography file (.bib)")
     ] = None,
@@ -254,7 +277,13 @@ def convert(
 
     # 5. Apply formatting
     logger.info("▸ Aplicando formato %s ...", style.upper())
-    cli_helpers._apply_formatting(style, output_docx, meta)
+    cli_helpers._apply_formatting(
+        style,
+        output_docx,
+        meta,
+        optimize=optimize_docx,
+        compression_level=compression_level,
+    )
     logger.info("✔ Generado con éxito: %s", output_docx.name)
 
     # 6. PDF generation
@@ -283,5 +312,126 @@ def convert(
     logger.info("\nDone!")
 
 
+@verify_app.command()
+def verify(
+    paths: Annotated[
+        list[str],
+        typer.Argument(help="PDF files, glob patterns (quoted) or directories to verify"),
+    ],
+    format: Annotated[
+        str, typer.Option("--format", "-f", help="Report format: jsonl, junit, or sarif")
+    ] = "jsonl",
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Write the report to a file instead of stdout"),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Worker processes")
+    ] = os.cpu_count() or 1,
+    apa_strict: Annotated[
+        bool,
+        typer.Option(
+            "--apa-strict/--no-apa-strict",
+            help="Use strict APA 7 validation; any detected warning is a failure",
+        ),
+    ] = True,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option("--cache-dir", help="Reuse extracted PDF/DOCX facts from this directory"),
+    ] = None,
+    pdf_backend: Annotated[
+        str,
+        typer.Option("--pdf-backend", help="PDF text extraction: pymupdf or pdfplumber"),
+    ] = "pymupdf",
+    checks: Annotated[
+        str | None,
+        typer.Option("--checks", help="Comma-separated checks to run (default: all)"),
+    ] = None,
+    skip_checks: Annotated[
+        str | None,
+        typer.Option("--skip-checks", help="Comma-separated checks to leave out"),
+    ] = None,
+    fail_fast: Annotated[
+        bool,
+        typer.Option(
+            "--fail-fast/--no-fail-fast",
+            help="Run cheap checks first and stop each PDF at its first error",
+        ),
+    ] = False,
+) -> None:
+    """
+    Verify already-exported PDFs against their DOCX sources in parallel.
+    """
+    from .verifier.apa_verifier import select_checks
+    from .verifier.batch import (
+        REPORT_FORMATS,
+        BatchSummary,
+        ReportFormat,
+        collect_pdfs,
+        render_report,
+        verify_many,
+    )
+    from .verifier.pdf_analyzer import TEXT_BACKENDS, TextBackend
+
+    formats: dict[str, ReportFormat] = {f: f for f in REPORT_FORMATS}
+    backends: dict[str, TextBackend] = {b: b for b in TEXT_BACKENDS}
+    report_format = formats.get(format)
+    backend = backends.get(pdf_backend)
+    if report_format is None or backend is None:
+        typer.echo(
+            f"Error: formato {format!r} o backend {pdf_backend!r} no soportado "
+            f"(formatos: {', '.join(REPORT_FORMATS)}; backends: {', '.join(TEXT_BACKENDS)}).",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    included = cli_helpers._split_names(checks)
+    excluded = cli_helpers._split_names(skip_checks)
+    try:
+        select_checks(included, excluded)
+        pdfs = collect_pdfs(paths)
+    except (ValueError, FileNotFoundError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=2) from e
+
+    start = time.perf_counter()
+    records = list(
+        verify_many(
+            pdfs,
+            workers=workers,
+            strict=apa_strict,
+            pdf_backend=backend,
+            cache_dir=cache_dir,
+            checks=included,
+            skip_checks=excluded,
+            fail_fast=fail_fast,
+        )
+    )
+    summary = BatchSummary.from_records(records, time.perf_counter() - start)
+
+    report = render_report(records, summary, report_format)
+    if output is None:
+        typer.echo(report, nl=False)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(report, encoding="utf-8")
+
+    typer.echo(
+        f"{summary.total} PDF: {summary.passed} aprobados, {summary.failed} con errores, "
+        f"{summary.errored} sin verificar (puntaje medio {summary.mean_score:.1f})",
+        err=True,
+    )
+    if not summary.ok:
+        raise typer.Exit(code=1)
+
+
+def main() -> None:
+    """Console entry point: ``normadocs verify ...`` or ``normadocs INPUT.md``."""
+    if sys.argv[1:2] == ["verify"]:
+        verify_app(args=sys.argv[2:], prog_name="normadocs verify")
+    else:
+        app()
+
+
 if __name__ == "__main__":
-    app()
+    main()
@@ -280,6 +280,9 @@ def _apply_formatting(
     style: str,
     output_docx: Path,
     meta: DocumentMetadata,
+    *,
+    optimize: bool = False,
+    compression_level: int | None = None,
 ) -> None:
     """
     Apply formatting to the generated DOCX document.
@@ -288,6 +291,8 @@ def _apply_formatting(
         style: Citation style (apa, icontec, etc.)
         output_docx: Path to the DOCX file
         meta: Document metadata extracted from markdown
+        optimize: Shrink the DOCX package on save
+        compression_level: Deflate level (0-9) of the saved DOCX
 
     Raises:
         SystemExit: If formatting fails
@@ -295,7 +300,7 @@ def _apply_formatting(
     try:
         formatter = get_formatter(style, str(output_docx))
         formatter.process(meta)
-        formatter.save(str(output_docx))
+        formatter.save(str(output_docx), optimize=optimize, compression_level=compression_level)
     except (ValueError, TypeError) as e:
         typer.echo(f"Error aplicando formato: {e}", err=True)
         traceback.print_exc()
@@ -367,6 +372,7 @@ def _verify_apa(
             docx_path=output_docx,
             meta=meta,
             strict=apa_strict,
+            pdf_processes=None,
         )
 
         result = verifier.verify_all()
@@ -403,6 +409,20 @@ def _verify_apa(
         return not apa_strict
 
 
+def _split_names(value: str | None) -> list[str] | None:
+    """Split a comma-separated option value into names.
+
+    Args:
+        value: The option value, e.g. ``"margins, fonts"``.
+
+    Returns:
+        The stripped, non-empty names, or None if the option was not given.
+    """
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
 def _cleanup_docker(
     docker_container: str | None,
     lt_keep_alive: bool,
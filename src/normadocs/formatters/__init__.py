@@ -5,6 +5,7 @@ Formatter factory with YAML-based standard support.
 from typing import Any
 
 from ..standards import StandardLoader, get_default_config, merge_with_defaults
+from ..utils.docx_package import DocxSource
 from .apa import APADocxFormatter
 from .base import DocumentFormatter
 from .icontec import IcontecFormatter
@@ -15,15 +16,25 @@ __all__ = [
     "DocumentFormatter",
     "IEEEDocxFormatter",
     "IcontecFormatter",
+    "get_default_config",
     "get_formatter",
     "list_available_standards",
     "load_standard_config",
+    "merge_with_defaults",
 ]
 
+_FORMATTERS: dict[str, type[APADocxFormatter | IcontecFormatter | IEEEDocxFormatter]] = {
+    "apa": APADocxFormatter,
+    "apa7": APADocxFormatter,
+    "apa7estudiante": APADocxFormatter,
+    "icontec": IcontecFormatter,
+    "ieee": IEEEDocxFormatter,
+}
+
 
 def get_formatter(
     style: str = "apa7estudiante",
-    doc_path: str = "",
+    doc_path: DocxSource = "",
     config: dict[str, Any] | None = None,
 ) -> APADocxFormatter | IcontecFormatter | IEEEDocxFormatter:
     """
@@ -31,36 +42,26 @@ def get_formatter(
 
     Args:
         style: The citation style ('apa7estudiante', 'apa', 'icontec', 'ieee').
-        doc_path: Path to the DOCX file to format.
+        doc_path: Path, bytes, binary stream or open Document to format.
         config: Optional config dict to override YAML defaults.
 
     Returns:
         An instance of a DocumentFormatter subclass.
+
+    Raises:
+        ValueError: If the style is not supported.
+        InvalidStandardError: If the merged configuration is invalid.
     """
     style = style.lower()
-    loader = StandardLoader()
-
-    try:
-        yaml_config = loader.load(style)
-    except FileNotFoundError:
-        yaml_config = get_default_config(style)
-
-    if config is not None:
-        final_config = merge_with_defaults(config, style)
-        deep_merge(yaml_config, config)
-    else:
-        final_config = yaml_config
-
-    if style in ("apa", "apa7", "apa7estudiante"):
-        return APADocxFormatter(doc_path, final_config)
-    elif style == "icontec":
-        return IcontecFormatter(doc_path, final_config)
-    elif style == "ieee":
-        return IEEEDocxFormatter(doc_path, final_config)
-    else:
+    formatter_class = _FORMATTERS.get(style)
+    if formatter_class is None:
         raise ValueError(
             f"Unsupported style: {style}. Available: apa, apa7estudiante, icontec, ieee"
         )
+    # Resolved and validated once per (style, YAML mtime, overrides) for the
+    # whole process; bad configs fail before the document is opened.
+    final_config, standard = StandardLoader().resolve(style, config)
+    return formatter_class(doc_path, final_config, standard)
 
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -2,39 +2,49 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 
 from ...models import DocumentMetadata
+from ...standards.compiled import StandardConfig, compiled_standard
 from ...utils.docx_helpers import paragraph_style, paragraph_style_name
+from ..fragments import BlockLine, block_paragraphs
 
 if TYPE_CHECKING:
     from docx.document import Document as DocType
 
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+}
+
 
 class APACoverHandler:
     """Handles creation of APA 7th Edition cover page."""
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APACoverHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
         self.doc = doc
         self.config = config if config is not None else {}
-
-    def _get_cover_config(self) -> dict[str, Any]:
-        """Get cover configuration from config with defaults."""
-        cover_config: dict[str, Any] = {"title_align": "center", "author_align": "center"}
-        return cast(dict[str, Any], self.config.get("cover", cover_config))
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
     def _get_spacing_line(self) -> str:
         """Get line spacing from config with default."""
-        spacing_config: dict[str, str] = {"line": "double"}
-        return cast(str, self.config.get("spacing", spacing_config).get("line", "double"))
+        return str(self.standard.spacing.line)
 
     def add_cover_page(self, meta: DocumentMetadata) -> None:
         """
@@ -51,18 +61,24 @@ class APACoverHandler:
         if self.doc.paragraphs:
             self.doc.paragraphs[0].insert_paragraph_before("")
 
-        content_lines: list[tuple[str, bool]] = [
-            (meta.title, True),  # Title: bold, centered
+        # (text, bold) lines; None texts are the per-document slots (title,
+        # subtitle, author, date) so cohorts share one cached cover block.
+        slots: list[str] = [meta.title]
+        content_lines: list[tuple[str | None, bool]] = [
+            (None, True),  # Title: bold, centered
         ]
 
         # Add subtitle if present
         subtitle = getattr(meta, "subtitle", None) or meta.extra.get("subtitle", "")
         if subtitle:
             content_lines.append(("", False))  # Blank line
-            content_lines.append((subtitle, False))  # Subtitle (not bold in APA 7)
+            content_lines.append((None, False))  # Subtitle (not bold in APA 7)
+            slots.append(subtitle)
 
         content_lines.append(("", False))  # Blank line
-        content_lines.append((meta.author or "", False))  # Author name
+        author_line = len(content_lines)
+        content_lines.append((None, False))  # Author name
+        slots.append(meta.author or "")
 
         # Add affiliation (combine with center if present)
         center = getattr(meta, "center", None) or ""
@@ -105,29 +121,43 @@ class APACoverHandler:
         date = meta.date or ""
         if date:
             content_lines.append(("", False))  # Blank line before date
-            content_lines.append((date, False))
+            content_lines.append((None, False))
+            slots.append(date)
 
         # Add spacers to position title in upper third of page
         n_spacers = 6
-        elements: list[tuple[str, bool]] = [("", False)] * n_spacers
+        elements: list[tuple[str | None, bool]] = [("", False)] * n_spacers
         elements.extend(content_lines)
 
-        ref_p = self.doc.paragraphs[0]
+        spacing_line = self._get_spacing_line()
+        if spacing_line == "double":
+            line_rule = WD_LINE_SPACING.DOUBLE
+        elif spacing_line == "1.5":
+            line_rule = WD_LINE_SPACING.ONE_POINT_FIVE
+        else:
+            line_rule = WD_LINE_SPACING.SINGLE
+        cover = self.standard.cover
+        alignments = {
+            n_spacers: _ALIGNMENTS[cover.title_align],
+            n_spacers + author_line: _ALIGNMENTS[cover.author_align],
+        }
+        lines = [
+            BlockLine(
+                text,
+                bold=is_bold,
+                alignment=alignments.get(index, WD_ALIGN_PARAGRAPH.CENTER),
+                line_spacing_rule=line_rule,
+            )
+            for index, (text, is_bold) in enumerate(elements)
+        ]
+        normal = paragraph_style(self.doc.styles, "Normal")
+        # Like ``p.style = normal``: the default paragraph style needs no pStyle.
+        default = self.doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        style_id = None if normal == default else normal.style_id
 
-        for text, is_bold in elements:
-            p = ref_p.insert_paragraph_before(text)
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p.style = paragraph_style(self.doc.styles, "Normal")
-            spacing_line = self._get_spacing_line()
-            if spacing_line == "double":
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-            elif spacing_line == "1.5":
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
-            else:
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-
-            if is_bold and text.strip() and p.runs:
-                p.runs[0].bold = True
+        ref_p = self.doc.paragraphs[0]
+        for p_el in block_paragraphs(lines, slots, style_id):
+            ref_p._p.addprevious(p_el)
 
         # Remove leftover reference paragraph
         ref_p._element.getparent().remove(ref_p._element)
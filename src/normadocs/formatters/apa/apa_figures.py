@@ -6,87 +6,57 @@ import re
 from typing import TYPE_CHECKING, Any, cast
 
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 from lxml.etree import Element
 
-from ...config import DEFAULT_BODY_FONT
+from ...standards.compiled import StandardConfig, compiled_standard
 from ...utils.docx_helpers import paragraph_style_name
+from ..images import downsample_images
+from .apa_fragments import ParagraphFormat, RunFormat, text_paragraph
 
 if TYPE_CHECKING:
     from docx.document import Document as DocType
     from docx.text.run import Run as RunType
 
 
-_W_RPR = "w:rPr"
-_W_VAL = "w:val"
-_XML_SPACE = "xml:space"
+# "Figura N." (bold) + title (italic) caption paragraph
+_CAPTION_FORMAT = ParagraphFormat(jc="left", after="0", line="480")
 
 
 class APAFiguresHandler:
     """Handles figure formatting and captions per APA 7th Edition."""
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         self.doc = doc
         self.config = config if config is not None else {}
-
-    def _get_figure_config(self) -> dict[str, Any]:
-        """Get figure configuration from config with defaults."""
-        default_config: dict[str, Any] = {
-            "caption_prefix": "Figure",
-            "title_above": True,
-            "nota_prefix": "Nota.",
-        }
-        return cast(dict[str, Any], self.config.get("figures", default_config))
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
     def _get_body_font(self) -> str:
         """Get body font name from config."""
-        fonts: dict[str, Any] = {}
-        return cast(
-            str, self.config.get("fonts", fonts).get("body", {}).get("name", DEFAULT_BODY_FONT)
-        )
+        return self.standard.body_font.name
 
     def _apply_font_style(self, run: RunType, bold: bool = False, italic: bool = False) -> None:
         """Apply font style to a run (helper for this handler)."""
         from .apa_styles import APAStylesHandler
 
-        handler = APAStylesHandler(self.doc)
+        handler = APAStylesHandler(self.doc, self.config, self.standard)
         handler._apply_font_style(run, bold=bold, italic=italic)
 
     def _make_figure_paragraph(
         self, text: str, bold: bool = False, italic: bool = False, space_after: str = "0"
     ) -> Element:
-        """Helper: create a Times New Roman 12pt paragraph for figure captions."""
-        p_el = OxmlElement("w:p")
-        p_pr = OxmlElement("w:pPr")
-        p_sp = OxmlElement("w:spacing")
-        p_sp.set(qn("w:after"), space_after)
-        p_sp.set(qn("w:line"), "480")
-        p_sp.set(qn("w:lineRule"), "auto")
-        p_pr.append(p_sp)
-        p_el.append(p_pr)
-
-        run = OxmlElement("w:r")
-        r_pr = OxmlElement("w:rPr")
-        if bold:
-            r_pr.append(OxmlElement("w:b"))
-        if italic:
-            r_pr.append(OxmlElement("w:i"))
-        rn = OxmlElement("w:rFonts")
-        rn.set(qn("w:ascii"), DEFAULT_BODY_FONT)
-        rn.set(qn("w:hAnsi"), DEFAULT_BODY_FONT)
-        r_pr.append(rn)
-        sz = OxmlElement("w:sz")
-        sz.set(qn("w:val"), "24")
-        r_pr.append(sz)
-        run.append(r_pr)
-        t = OxmlElement("w:t")
-        t.set(qn("xml:space"), "preserve")
-        t.text = text
-        run.append(t)
-        p_el.append(run)
-        return p_el
+        """Helper: create a body-font 12pt paragraph for figure captions."""
+        run_format = RunFormat(bold=bold, italic=italic, font=self._get_body_font())
+        return cast(
+            Element,
+            text_paragraph(ParagraphFormat(after=space_after, line="480"), [(text, run_format)]),
+        )
 
     def format_figures(self) -> None:
         """Add APA 7 figure captions: Label + Title ABOVE, Nota BELOW.
@@ -162,6 +132,17 @@ class APAFiguresHandler:
                         if old_cy > 0:
                             ext_el.set("cy", str(int(old_cy * scale)))
 
+    def downsample_images(self) -> int:
+        """Resample embedded images to ``figures.image_dpi`` at their final size.
+
+        Runs after :meth:`format_figures` so oversized figures are resampled
+        for the extent they were scaled down to.
+
+        Returns:
+            The number of images that were replaced.
+        """
+        return downsample_images(self.doc, self.standard.figures)
+
     def add_figure_captions(self) -> None:
         """Ensure every figure has an APA 7 caption: 'Figura N.' bold + title italic.
 
@@ -265,54 +246,12 @@ class APAFiguresHandler:
 
     def _build_caption_element(self, number: int, title: str) -> Element:
         """Build a 'Figura N' (bold) + title (italic) caption paragraph."""
-        prefix = cast(str, self._get_figure_config().get("caption_prefix", "Figure"))
-
-        p_el = OxmlElement("w:p")
-        p_pr = OxmlElement("w:pPr")
-        jc = OxmlElement("w:jc")
-        jc.set(qn("w:val"), "left")
-        p_pr.append(jc)
-        spacing = OxmlElement("w:spacing")
-        spacing.set(qn("w:after"), "0")
-        spacing.set(qn("w:line"), "480")
-        spacing.set(qn("w:lineRule"), "auto")
-        p_pr.append(spacing)
-        p_el.append(p_pr)
-
-        label_run = OxmlElement("w:r")
-        label_rpr = OxmlElement("w:rPr")
-        label_rpr.append(OxmlElement("w:b"))
-        self._append_font_props(label_rpr)
-        label_run.append(label_rpr)
-        label_t = OxmlElement("w:t")
-        label_t.set(qn("xml:space"), "preserve")
-        label_t.text = f"{prefix} {number}. "
-        label_run.append(label_t)
-        p_el.append(label_run)
-
+        prefix = self.standard.figures.caption_prefix
+        body_font = self._get_body_font()
+        runs = [(f"{prefix} {number}. ", RunFormat(bold=True, font=body_font))]
         if title:
-            title_run = OxmlElement("w:r")
-            title_rpr = OxmlElement("w:rPr")
-            title_rpr.append(OxmlElement("w:i"))
-            self._append_font_props(title_rpr)
-            title_run.append(title_rpr)
-            title_t = OxmlElement("w:t")
-            title_t.set(qn("xml:space"), "preserve")
-            title_t.text = title
-            title_run.append(title_t)
-            p_el.append(title_run)
-
-        return p_el
-
-    def _append_font_props(self, rpr: Element) -> None:
-        """Append Times New Roman 12pt run properties to a w:rPr element."""
-        font = OxmlElement("w:rFonts")
-        font.set(qn("w:ascii"), DEFAULT_BODY_FONT)
-        font.set(qn("w:hAnsi"), DEFAULT_BODY_FONT)
-        rpr.append(font)
-        sz = OxmlElement("w:sz")
-        sz.set(qn("w:val"), "24")
-        rpr.append(sz)
+            runs.append((title, RunFormat(italic=True, font=body_font)))
+        return cast(Element, text_paragraph(_CAPTION_FORMAT, runs))
 
     @staticmethod
     def _extract_alt_text(p: Any) -> str:
@@ -2,7 +2,6 @@
 
 from typing import Any, cast
 
-from docx import Document
 from docx.document import Document as DocumentObject
 from docx.oxml.table import CT_Tc
 from docx.section import Section
@@ -11,6 +10,9 @@ from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
 from ...models import DocumentMetadata
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_package import DocxSource, DocxTarget, open_document, save_document
+from ..rules import RuleEngine
 from .apa_citations import APACitationsHandler
 from .apa_cover import APACoverHandler
 from .apa_figures import APAFiguresHandler
@@ -29,29 +31,37 @@ class APADocxFormatter:
     paragraphs, tables, figures, and keywords.
 
     Args:
-        doc_path: Path to the DOCX file to format.
+        doc_path: Path, bytes, binary stream or open Document to format.
         config: Optional configuration dictionary to override defaults.
     """
 
-    def __init__(self, doc_path: str, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc_path: DocxSource,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize the formatter with document path and optional config.
 
         Args:
-            doc_path: Path to the DOCX file to format.
+            doc_path: Path, bytes, binary stream or open Document to format.
             config: Optional configuration dictionary to override defaults.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
-        self._doc: DocumentObject = Document(doc_path)
+        self._doc: DocumentObject = open_document(doc_path)
         self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
         # Initialize handlers with config
-        self._styles = APAStylesHandler(self._doc, self.config)
-        self._page = APAPageHandler(self._doc, self.config)
-        self._cover = APACoverHandler(self._doc, self.config)
-        self._paragraphs = APAParagraphsHandler(self._doc, self.config)
-        self._tables = APATablesHandler(self._doc, self.config)
-        self._figures = APAFiguresHandler(self._doc, self.config)
-        self._keywords = APAKeywordsHandler(self._doc, self.config)
-        self._citations = APACitationsHandler(self._doc, self.config)
+        self._styles = APAStylesHandler(self._doc, self.config, self.standard)
+        self._page = APAPageHandler(self._doc, self.config, self.standard)
+        self._cover = APACoverHandler(self._doc, self.config, self.standard)
+        self._paragraphs = APAParagraphsHandler(self._doc, self.config, self.standard)
+        self._tables = APATablesHandler(self._doc, self.config, self.standard)
+        self._figures = APAFiguresHandler(self._doc, self.config, self.standard)
+        self._keywords = APAKeywordsHandler(self._doc, self.config, self.standard)
+        self._citations = APACitationsHandler(self._doc, self.config, self.standard)
+        self._rules = RuleEngine(self._doc, self.config, self.standard)
 
     def process(self, meta: DocumentMetadata) -> None:
         """Run the full formatting pipeline.
@@ -76,6 +86,7 @@ class APADocxFormatter:
 
         self._figures.add_figure_captions()
         self._figures.format_figures()
+        self._figures.downsample_images()
         self._keywords.format_nota_italic()
         self._paragraphs.format_lists()
         self._paragraphs.apply_body_indent()
@@ -88,6 +99,9 @@ class APADocxFormatter:
 
         self._tables.add_table_header_bold()
         self._keywords.apply_foreign_word_italics()
+        # Rules declared in the standard's YAML (none for stock APA) refine
+        # the handlers' output in one extra walk.
+        self._rules.apply()
 
         # Persist cover metadata in the DOCX core properties so the document
         # carries title/author (the APA verifier's cover-page check and external
@@ -98,13 +112,24 @@ class APADocxFormatter:
         if meta.author:
             props.author = meta.author
 
-    def save(self, output_path: str) -> None:
+    def save(
+        self,
+        output_path: DocxTarget,
+        *,
+        optimize: bool = False,
+        compression_level: int | None = None,
+    ) -> None:
         """Save the formatted document to output_path.
 
         Args:
-            output_path: Path where the formatted DOCX will be saved.
+            output_path: Path or writable binary stream to save the DOCX to.
+            optimize: Whether to shrink the package (see ``optimize_package``).
+            compression_level: Deflate level from 0 to 9; None keeps the
+                default unless ``optimize`` is set.
         """
-        self._doc.save(str(output_path))
+        save_document(
+            self._doc, output_path, optimize=optimize, compression_level=compression_level
+        )
 
     @property
     def doc(self) -> DocumentObject:
@@ -118,15 +143,18 @@ class APADocxFormatter:
         # Initialize config if not already set (for tests using __new__)
         if not hasattr(self, "config"):
             self.config = {}
+        if not hasattr(self, "standard"):
+            self.standard = compiled_standard(self.config, "apa7")
         # Reinitialize handlers with the new document and same config
-        self._styles = APAStylesHandler(self._doc, self.config)
-        self._page = APAPageHandler(self._doc, self.config)
-        self._cover = APACoverHandler(self._doc, self.config)
-        self._paragraphs = APAParagraphsHandler(self._doc, self.config)
-        self._tables = APATablesHandler(self._doc, self.config)
-        self._figures = APAFiguresHandler(self._doc, self.config)
-        self._keywords = APAKeywordsHandler(self._doc, self.config)
-        self._citations = APACitationsHandler(self._doc, self.config)
+        self._styles = APAStylesHandler(self._doc, self.config, self.standard)
+        self._page = APAPageHandler(self._doc, self.config, self.standard)
+        self._cover = APACoverHandler(self._doc, self.config, self.standard)
+        self._paragraphs = APAParagraphsHandler(self._doc, self.config, self.standard)
+        self._tables = APATablesHandler(self._doc, self.config, self.standard)
+        self._figures = APAFiguresHandler(self._doc, self.config, self.standard)
+        self._keywords = APAKeywordsHandler(self._doc, self.config, self.standard)
+        self._citations = APACitationsHandler(self._doc, self.config, self.standard)
+        self._rules = RuleEngine(self._doc, self.config, self.standard)
 
     # ─────────────────── Delegate methods for backward compatibility ───────────────────
 
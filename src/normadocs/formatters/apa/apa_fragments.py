@@ -0,0 +1,243 @@
+"""Prebuilt WordprocessingML fragments for APA captions, notes and breaks.
+
+Captions, notes, page breaks and table-cell properties are inserted many
+times per document with identical structure. Each distinct fragment is
+built once (per font/size/format combination), cached, and stamped into
+the document with ``deepcopy``; only the text of the copy is filled in.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+_W_VAL = "w:val"
+_W_TYPE = "w:type"
+
+
+@dataclass(frozen=True)
+class RunFormat:
+    """Character formatting of one run in a fragment.
+
+    Args:
+        bold: Add ``w:b``.
+        italic: Add ``w:i``.
+        font: Font family for ``w:rFonts`` (omitted when None).
+        size: Font size in half-points for ``w:sz`` (omitted when None).
+    """
+
+    bold: bool = False
+    italic: bool = False
+    font: str | None = None
+    size: int | None = 24
+
+
+@dataclass(frozen=True)
+class ParagraphFormat:
+    """Paragraph formatting of a fragment.
+
+    Args:
+        jc: Alignment for ``w:jc`` (omitted when None).
+        after: ``w:spacing/@w:after`` in twips (omitted when None).
+        line: ``w:spacing/@w:line`` in 240ths of a line (omitted when None).
+    """
+
+    jc: str | None = None
+    after: str | None = None
+    line: str | None = None
+
+
+def _build_spacing(after: str | None, line: str | None, before: str | None = None) -> Any:
+    """Build a ``w:spacing`` element with the given attributes."""
+    spacing = OxmlElement("w:spacing")
+    if line is not None:
+        spacing.set(qn("w:line"), line)
+        spacing.set(qn("w:lineRule"), "auto")
+    if before is not None:
+        spacing.set(qn("w:before"), before)
+    if after is not None:
+        spacing.set(qn("w:after"), after)
+    return spacing
+
+
+@lru_cache(maxsize=64)
+def _paragraph_template(p_fmt: ParagraphFormat, runs: tuple[RunFormat, ...]) -> Any:
+    """Build (once) a paragraph with one empty text run per ``RunFormat``."""
+    p_el = OxmlElement("w:p")
+    p_pr = OxmlElement("w:pPr")
+    if p_fmt.jc is not None:
+        jc = OxmlElement("w:jc")
+        jc.set(qn(_W_VAL), p_fmt.jc)
+        p_pr.append(jc)
+    if p_fmt.after is not None or p_fmt.line is not None:
+        p_pr.append(_build_spacing(p_fmt.after, p_fmt.line))
+    p_el.append(p_pr)
+
+    for r_fmt in runs:
+        run = OxmlElement("w:r")
+        r_pr = OxmlElement("w:rPr")
+        if r_fmt.bold:
+            r_pr.append(OxmlElement("w:b"))
+        if r_fmt.italic:
+            r_pr.append(OxmlElement("w:i"))
+        if r_fmt.font is not None:
+            fonts = OxmlElement("w:rFonts")
+            fonts.set(qn("w:ascii"), r_fmt.font)
+            fonts.set(qn("w:hAnsi"), r_fmt.font)
+            r_pr.append(fonts)
+        if r_fmt.size is not None:
+            sz = OxmlElement("w:sz")
+            sz.set(qn(_W_VAL), str(r_fmt.size))
+            r_pr.append(sz)
+        run.append(r_pr)
+        t = OxmlElement("w:t")
+        t.set(qn("xml:space"), "preserve")
+        run.append(t)
+        p_el.append(run)
+    return p_el
+
+
+def text_paragraph(p_fmt: ParagraphFormat, runs: Sequence[tuple[str, RunFormat]]) -> Any:
+    """Return a new ``w:p`` element stamped from a cached template.
+
+    Args:
+        p_fmt: Paragraph formatting.
+        runs: ``(text, format)`` pairs, one per run, in order.
+
+    Returns:
+        A fresh, detached paragraph element.
+    """
+    template = _paragraph_template(p_fmt, tuple(fmt for _, fmt in runs))
+    p_el = deepcopy(template)
+    for t, (text, _) in zip(p_el.iter(qn("w:t")), runs, strict=True):
+        t.text = text
+    return p_el
+
+
+@lru_cache(maxsize=1)
+def _page_break_template() -> Any:
+    paragraph = OxmlElement("w:p")
+    run = OxmlElement("w:r")
+    br = OxmlElement("w:br")
+    br.set(qn(_W_TYPE), "page")
+    run.append(br)
+    paragraph.append(run)
+    return paragraph
+
+
+def page_break_paragraph() -> Any:
+    """Return a new paragraph holding a single page-break run.
+
+    A standalone ``w:br`` sibling of paragraphs is not valid
+    WordprocessingML and may be dropped by converters, so the break is
+    always wrapped in its own ``w:p``.
+    """
+    return deepcopy(_page_break_template())
+
+
+@lru_cache(maxsize=16)
+def _margins_template(tag: str, width: str) -> Any:
+    margins = OxmlElement(tag)
+    for side in ("top", "bottom", "start", "end"):
+        el = OxmlElement(f"w:{side}")
+        el.set(qn("w:w"), width)
+        el.set(qn(_W_TYPE), "dxa")
+        margins.append(el)
+    return margins
+
+
+def cell_margins(tag: str, width: str) -> Any:
+    """Return a new ``w:tblCellMar``/``w:tcMar`` with equal margins.
+
+    Args:
+        tag: ``"w:tblCellMar"`` or ``"w:tcMar"``.
+        width: Margin on every side, in twips (dxa).
+    """
+    return deepcopy(_margins_template(tag, width))
+
+
+_BORDER_EDGES = ("start", "top", "end", "bottom", "insideH", "insideV")
+
+
+@lru_cache(maxsize=32)
+def _borders_template(edges: tuple[tuple[str, tuple[tuple[str, str], ...]], ...]) -> Any:
+    tc_borders = OxmlElement("w:tcBorders")
+    by_name = dict(edges)
+    for edge_name in _BORDER_EDGES:
+        if edge_name in by_name:
+            el = OxmlElement(f"w:{edge_name}")
+            for attr, val in by_name[edge_name]:
+                el.set(qn(f"w:{attr}"), val)
+            tc_borders.append(el)
+    return tc_borders
+
+
+def cell_borders(**edges: dict[str, Any]) -> Any:
+    """Return a new ``w:tcBorders`` element.
+
+    Args:
+        **edges: Edge name (``top``, ``bottom``, ...) mapped to its
+            attributes, e.g. ``top={"val": "single", "sz": "12"}``. An empty
+            mapping emits the bare edge element.
+    """
+    key = tuple(
+        sorted(
+            (name, tuple(sorted((attr, str(val)) for attr, val in attrs.items())))
+            for name, attrs in edges.items()
+        )
+    )
+    return deepcopy(_borders_template(key))
+
+
+@lru_cache(maxsize=32)
+def _valued_template(tag: str, value: str | None) -> Any:
+    el = OxmlElement(tag)
+    if value is not None:
+        el.set(qn(_W_VAL), value)
+    return el
+
+
+def valued_element(tag: str, value: str | None = None) -> Any:
+    """Return a new single element such as ``<w:vAlign w:val="top"/>``.
+
+    Args:
+        tag: Qualified tag, e.g. ``"w:vAlign"``.
+        value: ``w:val`` attribute, omitted when None.
+    """
+    return deepcopy(_valued_template(tag, value))
+
+
+@lru_cache(maxsize=16)
+def _spacing_template(line: str | None, before: str | None, after: str | None) -> Any:
+    return _build_spacing(after, line, before)
+
+
+def spacing_element(
+    line: str | None = None, before: str | None = None, after: str | None = None
+) -> Any:
+    """Return a new ``w:spacing`` element.
+
+    Args:
+        line: Line spacing in 240ths of a line (sets ``lineRule`` auto).
+        before: Space before, in twips.
+        after: Space after, in twips.
+    """
+    return deepcopy(_spacing_template(line, before, after))
+
+
+__all__ = [
+    "ParagraphFormat",
+    "RunFormat",
+    "cell_borders",
+    "cell_margins",
+    "page_break_paragraph",
+    "spacing_element",
+    "text_paragraph",
+    "valued_element",
+]
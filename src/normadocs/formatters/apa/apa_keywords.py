@@ -3,20 +3,54 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from copy import deepcopy
 from typing import TYPE_CHECKING, Any, cast
 
+from docx.oxml.ns import qn
 from docx.shared import Inches
 
-from ...utils.docx_helpers import paragraph_style_name
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_helpers import force_run_italic, paragraph_style_name, set_run_text
+from ...utils.term_matcher import TermMatcher, compile_terms, trie_pattern
+from .apa_citations import REFERENCE_HEADINGS
+from .apa_fragments import page_break_paragraph
 
 _NOTA_PREFIX = "Nota."
 
+# Terms that mark special sections of an APA paper, matched as substrings
+# of the lowercased paragraph text.
+SECTION_TERMS: dict[str, tuple[str, ...]] = {
+    "abstract": ("resumen", "abstract"),
+    "toc": ("contenido", "index"),
+    "keywords": ("palabras clave", "keywords"),
+}
+
+_SECTION_RE = re.compile(
+    "|".join(f"(?P<{kind}>{trie_pattern(terms)})" for kind, terms in SECTION_TERMS.items())
+)
+
+# Paragraph and character styles whose text is never italicized (code).
+_CODE_STYLES = frozenset(("Source Code", "VerbatimChar"))
+
 if TYPE_CHECKING:
     from docx.document import Document as DocType
     from docx.text.paragraph import Paragraph as ParagraphType
     from docx.text.run import Run as RunType
 
 
+def section_kinds(text_lower: str) -> frozenset[str]:
+    """Return the section kinds (see ``SECTION_TERMS``) mentioned in a text.
+
+    Args:
+        text_lower: Lowercased paragraph text.
+
+    Returns:
+        The kinds whose terms occur in the text, found in a single scan.
+    """
+    return frozenset(m.lastgroup for m in _SECTION_RE.finditer(text_lower) if m.lastgroup)
+
+
 def _clear_paragraph(p: ParagraphType) -> ParagraphType:
     """Clear a paragraph's content while preserving formatting."""
     cast(Any, p._p).clear_content()
@@ -34,34 +68,33 @@ class APAKeywordsHandler:
         config: Optional configuration dictionary.
     """
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APAKeywordsHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
         self.doc = doc
         self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
-    def _get_keywords_config(self) -> dict[str, Any]:
-        """Get keywords configuration from config with defaults.
-
-        Returns:
-            Keywords configuration dictionary.
-        """
-        default_config: dict[str, Any] = {
-            "caption_prefix": "Figure",
-            "title_above": True,
-            "nota_prefix": _NOTA_PREFIX,
-        }
-        return cast(dict[str, Any], self.config.get("figures", default_config))
+    def _get_foreign_words_matcher(self) -> TermMatcher:
+        """Return the compiled foreign-word matcher for this standard."""
+        foreign_words = self.standard.foreign_words
+        return compile_terms(foreign_words.terms, ignore_case=foreign_words.ignore_case)
 
     def _apply_font_style(self, run: RunType, italic: bool | None = None) -> None:
         """Apply font style to a run (helper for this handler)."""
         from .apa_styles import APAStylesHandler
 
-        handler = APAStylesHandler(self.doc)
+        handler = APAStylesHandler(self.doc, self.config, self.standard)
         handler._apply_font_style(run, italic=italic)
 
     def format_keywords(self) -> None:
@@ -75,8 +108,7 @@ class APAKeywordsHandler:
         found_kw = False
 
         for p in self.doc.paragraphs:
-            text_lower = p.text.lower()
-            if "palabras clave" in text_lower or "keywords" in text_lower:
+            if "keywords" in section_kinds(p.text.lower()):
                 found_kw = True
 
                 full = p.text.strip()
@@ -101,9 +133,6 @@ class APAKeywordsHandler:
 
         APA 7: After keywords, the introduction starts on a new page.
         """
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-
         from .apa_page import APAPageHandler
 
         for p in self.doc.paragraphs:
@@ -112,13 +141,7 @@ class APAKeywordsHandler:
                 if "introducción" in text or "introduction" in text:
                     if APAPageHandler._has_page_break_before(p):
                         break
-                    break_paragraph = OxmlElement("w:p")
-                    break_run = OxmlElement("w:r")
-                    page_break = OxmlElement("w:br")
-                    page_break.set(qn("w:type"), "page")
-                    break_run.append(page_break)
-                    break_paragraph.append(break_run)
-                    p._element.addprevious(break_paragraph)
+                    p._element.addprevious(page_break_paragraph())
                     break
 
     def format_nota_italic(self) -> None:
@@ -159,51 +182,71 @@ class APAKeywordsHandler:
     def apply_foreign_word_italics(self) -> None:
         """Apply italics to foreign words per APA 7 (Backend, Frontend, etc.).
 
-        APA 7 requires that foreign words used as nouns be italicized on first use.
-        This method searches for these terms in table cells and applies italics.
+        APA 7 requires that foreign words used as nouns be italicized. The
+        lexicon comes from ``foreign_words.terms`` in the standard config and
+        is compiled once into a single matcher, which scans body and table
+        text. Only the matched words become italic; headings, code and the
+        reference list are left untouched.
         """
-        foreign_words = [
-            "Backend",
-            "Frontend",
-            "backend",
-            "frontend",
-            "PostgreSQL",
-            "Redis",
-            "Django",
-            "React",
-            "Next.js",
-            "JavaScript",
-            "Python",
-            "Celery",
-            "Docker",
-            "Wompi",
-            "WhatsApp",
-            "iPhone",
-            "iOS",
-            "DDoS",
-            "SSL",
-            "PCI DSS",
-            "RESTful",
-            "API",
-            "APIs",
-            "SQL",
-            "ORM",
-            "CDN",
-            "CEO",
-        ]
-
+        matcher = self._get_foreign_words_matcher()
+        if not matcher:
+            return
+        for p in self._iter_prose_paragraphs():
+            for run in list(p.runs):
+                text = run.text
+                if not text or run.italic or self._is_code_run(run):
+                    continue
+                spans = matcher.spans(text)
+                if spans:
+                    self._italicize_spans(run, spans)
+
+    def _iter_prose_paragraphs(self) -> Iterator[ParagraphType]:
+        """Yield body paragraphs before the reference list, then table cells."""
+        for p in self.doc.paragraphs:
+            style_name = paragraph_style_name(p)
+            if style_name.startswith("Heading"):
+                if p.text.strip().lower().rstrip(".") in REFERENCE_HEADINGS:
+                    break
+                continue
+            if style_name not in _CODE_STYLES:
+                yield p
         for table in self.doc.tables:
             for row in table.rows:
                 for cell in row.cells:
-                    for p in cell.paragraphs:
-                        runs = list(p.runs)
-                        for run in runs:
-                            if not run.text:
-                                continue
-                            text = run.text
-                            has_foreign = any(fw in text for fw in foreign_words)
-                            if not has_foreign:
-                                continue
-                            if run.italic:
-                                continue
-                            run.italic = True
+                    yield from cell.paragraphs
+
+    @staticmethod
+    def _is_code_run(run: RunType) -> bool:
+        """Return whether a run uses a code character style."""
+        r_pr = run._element.rPr
+        r_style = r_pr.rStyle if r_pr is not None else None
+        return r_style is not None and r_style.val in _CODE_STYLES
+
+    @staticmethod
+    def _italicize_spans(run: RunType, spans: list[tuple[int, int]]) -> None:
+        """Split a run so that each ``(start, end)`` span becomes an italic run."""
+        text = run.text
+        r = run._element
+        plain = all(child.tag in (qn("w:rPr"), qn("w:t")) for child in r)
+        if spans == [(0, len(text))] or not plain:
+            # Tabs and breaks cannot be split safely: italicize the whole run
+            run.italic = True
+            return
+        if r.getparent() is None:
+            return
+        chunks: list[tuple[str, bool]] = []
+        pos = 0
+        for start, end in spans:
+            chunks.append((text[pos:start], False))
+            chunks.append((text[start:end], True))
+            pos = end
+        chunks.append((text[pos:], False))
+        for chunk, italic in chunks:
+            if not chunk:
+                continue
+            new_r = deepcopy(r)
+            set_run_text(new_r, chunk)
+            if italic:
+                force_run_italic(new_r)
+            r.addprevious(new_r)
+        r.getparent().remove(r)
@@ -5,22 +5,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-from docx.shared import Cm, Inches, Pt
+from docx.shared import Cm, Inches
 
 from ...config import DEFAULT_BODY_FONT
+from ...standards.compiled import StandardConfig, compiled_standard
 from ...utils.docx_helpers import paragraph_style_name
+from ..fragments import page_field_runs, running_head_fragment
+from .apa_fragments import page_break_paragraph
 
 if TYPE_CHECKING:
     from docx.document import Document as DocType
     from docx.section import Section as SectionType
 
 
-_FLD_CHAR = "w:fldChar"
-_FLD_CHAR_TYPE = "w:fldCharType"
-
-
 class APAPageHandler:
     """Handles page layout and page numbers per APA 7th Edition.
 
@@ -32,25 +30,32 @@ class APAPageHandler:
         config: Optional configuration dictionary.
     """
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APAPageHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
         self.doc = doc
         self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
-    def _get_margins(self) -> dict[str, float]:
+    def _get_margins(self) -> dict[str, float | str]:
         """Get margins from config with defaults."""
-        margins = self.config.get("margins", {})
+        margins = self.standard.margins
         return {
-            "top": margins.get("top", 1.0),
-            "bottom": margins.get("bottom", 1.0),
-            "left": margins.get("left", 1.0),
-            "right": margins.get("right", 1.0),
-            "unit": margins.get("unit", "inches"),
+            "top": margins.top,
+            "bottom": margins.bottom,
+            "left": margins.left,
+            "right": margins.right,
+            "unit": margins.unit,
         }
 
     def _margin_to_inches(self, value: float, unit: str) -> Inches | Cm:
@@ -69,16 +74,15 @@ class APAPageHandler:
 
     def setup_page_layout(self) -> None:
         """Set margins and add page numbers top-right."""
-        margins = self._get_margins()
-        unit = str(margins["unit"])
+        margins = self.standard.margins
 
         for section in self.doc.sections:
             section.page_height = Inches(11)
             section.page_width = Inches(8.5)
-            section.left_margin = self._margin_to_inches(margins["left"], unit)
-            section.right_margin = self._margin_to_inches(margins["right"], unit)
-            section.top_margin = self._margin_to_inches(margins["top"], unit)
-            section.bottom_margin = self._margin_to_inches(margins["bottom"], unit)
+            section.left_margin = margins.left_emu
+            section.right_margin = margins.right_emu
+            section.top_margin = margins.top_emu
+            section.bottom_margin = margins.bottom_emu
 
             # Enable separate first-page header/footer so the cover can show
             # only its page number while later pages may use a running head.
@@ -119,41 +123,9 @@ class APAPageHandler:
         hp = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
         hp.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
-        # Build PAGE field with begin/separate/end sequence
-        # (LibreOffice requires the 'separate' marker to render page numbers)
-        run_begin = hp.add_run()
-        fld_begin = OxmlElement(_FLD_CHAR)
-        fld_begin.set(qn(_FLD_CHAR_TYPE), "begin")
-        run_begin._r.append(fld_begin)
-        run_begin.font.name = DEFAULT_BODY_FONT
-        run_begin.font.size = Pt(12)
-
-        run_instr = hp.add_run()
-        instr = OxmlElement("w:instrText")
-        instr.set(qn("xml:space"), "preserve")
-        instr.text = " PAGE "
-        run_instr._r.append(instr)
-        run_instr.font.name = DEFAULT_BODY_FONT
-        run_instr.font.size = Pt(12)
-
-        run_sep = hp.add_run()
-        fld_sep = OxmlElement(_FLD_CHAR)
-        fld_sep.set(qn(_FLD_CHAR_TYPE), "separate")
-        run_sep._r.append(fld_sep)
-        run_sep.font.name = DEFAULT_BODY_FONT
-        run_sep.font.size = Pt(12)
-
-        # Placeholder text (will be replaced by actual page number)
-        run_num = hp.add_run("1")
-        run_num.font.name = DEFAULT_BODY_FONT
-        run_num.font.size = Pt(12)
-
-        run_end = hp.add_run()
-        fld_end = OxmlElement(_FLD_CHAR)
-        fld_end.set(qn(_FLD_CHAR_TYPE), "end")
-        run_end._r.append(fld_end)
-        run_end.font.name = DEFAULT_BODY_FONT
-        run_end.font.size = Pt(12)
+        # PAGE field with begin/separate/end sequence, stamped from a cached
+        # fragment (LibreOffice requires the 'separate' marker).
+        hp._p.extend(page_field_runs(DEFAULT_BODY_FONT, 12))
 
         # Strip excessive paragraphs in header
         while len(header.paragraphs) > 1:
@@ -201,16 +173,7 @@ class APAPageHandler:
                     if heading_text.lower() == section.lower():
                         if self._has_page_break_before(p):
                             break
-                        # Create a valid WordprocessingML paragraph containing
-                        # the page-break run. A standalone w:br sibling is not
-                        # valid WordprocessingML and may be dropped by converters.
-                        break_paragraph = OxmlElement("w:p")
-                        break_run = OxmlElement("w:r")
-                        br = OxmlElement("w:br")
-                        br.set(qn("w:type"), "page")
-                        break_run.append(br)
-                        break_paragraph.append(break_run)
-                        p._element.addprevious(break_paragraph)
+                        p._element.addprevious(page_break_paragraph())
                         break
 
     def setup_running_head(self, short_title: str | None = None) -> None:
@@ -235,12 +198,12 @@ class APAPageHandler:
             return
 
         # Check if running head is enabled in config (default True)
-        enabled = self.config.get("running_head", {}).get("enabled", True)
-        if not enabled:
+        running_head = self.standard.running_head
+        if not running_head.enabled:
             return
 
         # Get max length from config, default to 50
-        max_length = int(self.config.get("running_head", {}).get("max_length", 50))
+        max_length = running_head.max_length
 
         # Truncate if necessary
         display_title = short_title.upper()
@@ -272,75 +235,15 @@ class APAPageHandler:
             # Get or create the header paragraph
             hp = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
 
-            # Set tab stops for left and right content
-            p_pr = hp._p.find(qn("w:pPr"))
-            if p_pr is None:
-                p_pr = OxmlElement("w:pPr")
-                hp._p.insert(0, p_pr)
-
-            # Add tab stop at center for left/right separation
-            tabs = OxmlElement("w:tabs")
-            # Tab at 3.25 inches (center of 6.5 inch text width) - right-aligned
-            tab1 = OxmlElement("w:tab")
-            tab1.set(qn("w:val"), "center")
-            tab1.set(qn("w:pos"), "4680")  # 3.25 inches in twips (4680)
-            tabs.append(tab1)
-            # Tab at right margin for page number
-            tab2 = OxmlElement("w:tab")
-            tab2.set(qn("w:val"), "right")
-            tab2.set(qn("w:pos"), "9360")  # 6.5 inches in twips
-            tabs.append(tab2)
-
-            # Remove existing tabs if any
+            # Tab stops, uppercase short title, two tabs and the PAGE field
+            # are stamped from a fragment cached per font and size.
+            p_pr = hp._p.get_or_add_pPr()
             existing_tabs = p_pr.find(qn("w:tabs"))
             if existing_tabs is not None:
                 p_pr.remove(existing_tabs)
+            tabs, runs = running_head_fragment(display_title, DEFAULT_BODY_FONT, 12)
             p_pr.append(tabs)
-
-            # Add the short title (left-aligned, uppercase)
-            title_run = hp.add_run(display_title)
-            title_run.font.name = DEFAULT_BODY_FONT
-            title_run.font.size = Pt(12)
-
-            # Add tab to center
-            hp.add_run("\t")
-
-            # Add another tab to right (for page number alignment)
-            hp.add_run("\t")
-
-            # Build PAGE field with begin/separate/end sequence
-            run_begin = hp.add_run()
-            fld_begin = OxmlElement(_FLD_CHAR)
-            fld_begin.set(qn(_FLD_CHAR_TYPE), "begin")
-            run_begin._r.append(fld_begin)
-            run_begin.font.name = DEFAULT_BODY_FONT
-            run_begin.font.size = Pt(12)
-
-            run_instr = hp.add_run()
-            instr = OxmlElement("w:instrText")
-            instr.set(qn("xml:space"), "preserve")
-            instr.text = " PAGE "
-            run_instr._r.append(instr)
-            run_instr.font.name = DEFAULT_BODY_FONT
-            run_instr.font.size = Pt(12)
-
-            run_sep = hp.add_run()
-            fld_sep = OxmlElement(_FLD_CHAR)
-            fld_sep.set(qn(_FLD_CHAR_TYPE), "separate")
-            run_sep._r.append(fld_sep)
-            run_sep.font.name = DEFAULT_BODY_FONT
-            run_sep.font.size = Pt(12)
-
-            run_num = hp.add_run("1")
-            run_num.font.name = DEFAULT_BODY_FONT
-            run_num.font.size = Pt(12)
-
-            run_end = hp.add_run()
-            fld_end = OxmlElement(_FLD_CHAR)
-            fld_end.set(qn(_FLD_CHAR_TYPE), "end")
-            run_end._r.append(fld_end)
-            run_end.font.name = DEFAULT_BODY_FONT
-            run_end.font.size = Pt(12)
+            hp._p.extend(runs)
 
             # Strip excessive paragraphs
             while len(header.paragraphs) > 1:
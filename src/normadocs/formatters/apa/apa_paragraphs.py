@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 from docx.enum.text import (
@@ -14,10 +16,15 @@ from docx.enum.text import (
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
+from docx.text.paragraph import Paragraph
 
 from ...config import DEFAULT_BODY_FONT
-from ...utils.docx_helpers import paragraph_style_name
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.citations import CitationEdit, splice_runs
+from ..visitor import BodyVisitor, StyleNames, iter_body_blocks
 from .apa_citations import REFERENCE_HEADINGS
+from .apa_keywords import section_kinds
+from .apa_styles import APAStylesHandler
 
 if TYPE_CHECKING:
     from docx.document import Document as DocType
@@ -27,6 +34,11 @@ _HEADING_1 = "Heading 1"
 _HEADING_5 = "Heading 5"
 _RUN_IN_HEADINGS = ("Heading 4", _HEADING_5)
 
+# "(García y López, 2020)" — two-author citation joined with Spanish "y"
+_Y_CITATION = re.compile(
+    r"\(([A-ZÁ-Ú][a-záéíóúñ]+(?:\s+et\s+al\.)?)\s+y\s+([A-ZÁ-Ú][a-záéíóúñ]+),\s*(\d{4})\)"
+)
+
 
 def _is_references_heading(stripped_lower: str) -> bool:
     """Return whether a stripped, lowercased heading title starts the references."""
@@ -41,30 +53,60 @@ def _clear_paragraph(p: ParagraphType) -> ParagraphType:
     return p
 
 
-class APAParagraphsHandler:
-    """Handles paragraph processing, formatting, and cleanup per APA 7th Edition."""
+@dataclass(slots=True)
+class _SectionState:
+    """Section flags carried from paragraph to paragraph by ``process``."""
+
+    heading_levels: dict[str, int]
+    in_references: bool = False
+    in_toc: bool = False
+    in_abstract: bool = False
+    just_left_abstract: bool = False
+    # APA 7: the first paragraph after a heading has no indent
+    first_paragraph_after_heading: bool = False
+    first_heading_seen: bool = False
+
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+class APAParagraphsHandler(BodyVisitor):
+    """Handles paragraph processing, formatting, and cleanup per APA 7th Edition.
+
+    :meth:`process` is a single :class:`BodyVisitor` walk; the later passes
+    iterate the body paragraphs with their style names resolved through one
+    :class:`StyleNames` table.
+    """
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APAParagraphsHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
-        self.doc = doc
-        self.config = config if config is not None else {}
+        super().__init__(doc, config)
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
+        self._styles = APAStylesHandler(doc, self.config, self.standard)
+        self._state = _SectionState({})
+
+    def _body_paragraphs(self) -> Iterator[tuple[ParagraphType, str]]:
+        """Yield the top-level body paragraphs with their style names."""
+        names = StyleNames(self.doc)
+        for block in iter_body_blocks(self.doc):
+            if isinstance(block, Paragraph):
+                yield block, names.of(block)
 
     def _get_spacing_line(self) -> str:
         """Get line spacing from config with default."""
-        spacing: dict[str, str] = {"line": "double"}
-        return cast(str, self.config.get("spacing", spacing).get("line", "double"))
+        return str(self.standard.spacing.line)
 
     def _get_body_font(self) -> str:
         """Get body font name from config."""
-        fonts: dict[str, Any] = {}
-        return cast(
-            str, self.config.get("fonts", fonts).get("body", {}).get("name", DEFAULT_BODY_FONT)
-        )
+        return self.standard.body_font.name
 
     @staticmethod
     def _has_page_break_before(paragraph: ParagraphType) -> bool:
@@ -93,7 +135,7 @@ class APAParagraphsHandler:
             paragraph.paragraph_format.page_break_before = True
 
     def process(self) -> None:
-        """Iterate through paragraphs to apply APA 7 formatting.
+        """Walk the body paragraphs once to apply APA 7 formatting.
 
         APA 7 requires:
         - RESUMEN (Abstract): Title centered, bold, text without indent
@@ -101,182 +143,176 @@ class APAParagraphsHandler:
         - First paragraph after any heading: No indent
         - References: Hanging indent (0.5 inches)
         """
-        from .apa_styles import APAStylesHandler
-
-        styles_handler = APAStylesHandler(self.doc)
-
-        in_references = False
-        in_toc = False
-        in_abstract = False
-        just_left_abstract = False
-        first_paragraph_after_heading = False  # APA 7: first paragraph has no indent
-        first_heading_seen = False
-        heading_levels = self._build_heading_level_map()
-
-        for p in self.doc.paragraphs:
-            style_name = paragraph_style_name(p)
-            styles_handler._apply_font_to_paragraph(p)
-
-            text_lower = p.text.lower()
-
-            # Detect sections
-            if style_name.startswith("Heading"):
-                # Strict detection: only a heading that IS the references
-                # section (exact title or starts with it) enables reference
-                # mode. A heading merely containing the word "references"
-                # (e.g. "Slide 4 — Well-being, teamwork and references")
-                # must NOT trigger it.
-                heading_stripped = text_lower.strip().rstrip(".")
-                is_references_heading = _is_references_heading(heading_stripped)
-                if is_references_heading:
-                    in_references = True
-                    in_toc = False
-                    in_abstract = False
-                    self._set_page_break_before(p)
-                    first_paragraph_after_heading = True
-                elif "resumen" in text_lower or "abstract" in text_lower:
-                    # APA 7: RESUMEN title is centered and bold
-                    in_abstract = True
-                    in_toc = False
-                    in_references = False
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in p.runs:
-                        run.bold = True
-                    p.paragraph_format.first_line_indent = Inches(0)
-                elif "contenido" in text_lower or "index" in text_lower:
-                    in_toc = True
-                    in_references = False
-                    self._set_page_break_before(p)
-                else:
-                    # APA 7 does not require every Level 1 heading to start a
-                    # new page. The cover handler and explicit section breaks
-                    # handle pages that must be separated; ordinary headings
-                    # should flow with their following content.
-                    if style_name == _HEADING_1:
-                        # Clear stale page-break formatting inherited from a
-                        # previously formatted DOCX, except for the first
-                        # content heading used to separate the cover page.
-                        if first_heading_seen:
-                            p.paragraph_format.page_break_before = False
-                        else:
-                            first_heading_seen = True
-                        first_paragraph_after_heading = True
-                    # If leaving abstract section, force page break on any heading
-                    if in_abstract or just_left_abstract:
-                        self._set_page_break_before(p)
-                        just_left_abstract = False
-                    # Leaving the references section: reset the flag
-                    in_references = False
-                    in_abstract = False
-                    in_toc = False
-
-                # Explicit APA heading alignment and emphasis on every heading
-                if style_name == _HEADING_1:
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in p.runs:
-                        run.bold = True
-                elif style_name == "Heading 2":
-                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    for run in p.runs:
-                        run.bold = True
-                        run.italic = False
-                elif style_name == "Heading 3":
-                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    for run in p.runs:
-                        run.bold = True
-                        run.italic = True
-                elif style_name in _RUN_IN_HEADINGS:
-                    self._format_run_in_heading(p, italic=(style_name == _HEADING_5))
-
-                # Strip numbering property from headings (APA 7 doesn't use numbered headings)
-                p_pr = p._element.find(qn("w:pPr"))
-                if p_pr is not None:
-                    num_pr = p_pr.find(qn("w:numPr"))
-                    if num_pr is not None:
-                        p_pr.remove(num_pr)
-                # Levels 4-5 keep their 0.5" run-in indent (APA 7)
-                if style_name not in _RUN_IN_HEADINGS:
-                    p.paragraph_format.first_line_indent = Inches(0)
-
-            # Line spacing
-            spacing_line = self._get_spacing_line()
-            if spacing_line == "double":
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-            elif spacing_line == "1.5":
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
+        self._state = _SectionState(self._build_heading_level_map())
+        self.walk()
+
+    def visit_paragraph(self, paragraph: ParagraphType, style_name: str) -> None:
+        """Format one top-level paragraph during :meth:`process`."""
+        p = paragraph
+        state = self._state
+        self._styles._apply_font_to_paragraph(p)
+
+        text_lower = p.text.lower()
+
+        # Detect sections
+        if style_name.startswith("Heading"):
+            # Strict detection: only a heading that IS the references
+            # section (exact title or starts with it) enables reference
+            # mode. A heading merely containing the word "references"
+            # (e.g. "Slide 4 — Well-being, teamwork and references")
+            # must NOT trigger it.
+            heading_stripped = text_lower.strip().rstrip(".")
+            is_references_heading = _is_references_heading(heading_stripped)
+            kinds = section_kinds(text_lower)
+            if is_references_heading:
+                state.in_references = True
+                state.in_toc = False
+                state.in_abstract = False
+                self._set_page_break_before(p)
+                state.first_paragraph_after_heading = True
+            elif "abstract" in kinds:
+                # APA 7: RESUMEN title is centered and bold
+                state.in_abstract = True
+                state.in_toc = False
+                state.in_references = False
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in p.runs:
+                    run.bold = True
+                p.paragraph_format.first_line_indent = Inches(0)
+            elif "toc" in kinds:
+                state.in_toc = True
+                state.in_references = False
+                self._set_page_break_before(p)
             else:
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
-
-            # APA 7: Widow/orphan control (minimum 2 lines together)
-            # and keep paragraph lines together
-            self._apply_paragraph_spacing_control(p)
-
-            # APA 7: Keep heading with next paragraph
-            if style_name.startswith("Heading"):
-                self._apply_keep_with_next(p)
+                # APA 7 does not require every Level 1 heading to start a
+                # new page. The cover handler and explicit section breaks
+                # handle pages that must be separated; ordinary headings
+                # should flow with their following content.
+                if style_name == _HEADING_1:
+                    # Clear stale page-break formatting inherited from a
+                    # previously formatted DOCX, except for the first
+                    # content heading used to separate the cover page.
+                    if state.first_heading_seen:
+                        p.paragraph_format.page_break_before = False
+                    else:
+                        state.first_heading_seen = True
+                    state.first_paragraph_after_heading = True
+                # If leaving abstract section, force page break on any heading
+                if state.in_abstract or state.just_left_abstract:
+                    self._set_page_break_before(p)
+                    state.just_left_abstract = False
+                # Leaving the references section: reset the flag
+                state.in_references = False
+                state.in_abstract = False
+                state.in_toc = False
 
-            # Special section handling
-            if in_toc and not style_name.startswith("Heading"):
-                self._format_toc_entry(p, heading_levels)
-                continue
+            # Explicit APA heading alignment and emphasis on every heading
+            if style_name == _HEADING_1:
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in p.runs:
+                    run.bold = True
+            elif style_name == "Heading 2":
+                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+                for run in p.runs:
+                    run.bold = True
+                    run.italic = False
+            elif style_name == "Heading 3":
+                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+                for run in p.runs:
+                    run.bold = True
+                    run.italic = True
+            elif style_name in _RUN_IN_HEADINGS:
+                self._format_run_in_heading(p, italic=(style_name == _HEADING_5))
+
+            # Strip numbering property from headings (APA 7 doesn't use numbered headings)
+            p_pr = p._element.find(qn("w:pPr"))
+            if p_pr is not None:
+                num_pr = p_pr.find(qn("w:numPr"))
+                if num_pr is not None:
+                    p_pr.remove(num_pr)
+            # Levels 4-5 keep their 0.5" run-in indent (APA 7)
+            if style_name not in _RUN_IN_HEADINGS:
+                p.paragraph_format.first_line_indent = Inches(0)
+
+        # Line spacing
+        spacing_line = self._get_spacing_line()
+        if spacing_line == "double":
+            p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
+        elif spacing_line == "1.5":
+            p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
+        else:
+            p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
+        p.paragraph_format.space_before = Pt(0)
+        p.paragraph_format.space_after = Pt(0)
+
+        # APA 7: Widow/orphan control (minimum 2 lines together)
+        # and keep paragraph lines together
+        self._apply_paragraph_spacing_control(p)
+
+        # APA 7: Keep heading with next paragraph
+        if style_name.startswith("Heading"):
+            self._apply_keep_with_next(p)
+
+        # Special section handling
+        if state.in_toc and not style_name.startswith("Heading"):
+            self._format_toc_entry(p, state.heading_levels)
+            return
 
-            # Indentation logic
-            if (
-                not style_name.startswith("Heading")
-                and "List" not in style_name
-                and "Caption" not in style_name
-            ):
-                text_strip = p.text.strip()
-
-                # Remove purely numeric paragraphs (Pandoc page numbers injected as text)
-                if text_strip.isdigit():
-                    p._element.getparent().remove(p._element)
-                    continue
-
-                if in_references:
-                    if text_strip:
-                        p.paragraph_format.left_indent = Inches(0.5)
-                        p.paragraph_format.first_line_indent = Inches(-0.5)
-                        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                        # Force XML tag to prevent tag dropping
-                        p_pr = p._element.get_or_add_pPr()
-                        jc = p_pr.get_or_add_jc()
-                        jc.set(qn("w:val"), "left")
-                elif in_abstract:
-                    if p.text.strip():
-                        # Abstract block format (no indent per APA 7)
-                        p.paragraph_format.first_line_indent = Inches(0)
-                    # End abstract after keywords paragraph
-                    if text_strip.lower().startswith(("palabras clave", "keywords")):
-                        in_abstract = False
-                        just_left_abstract = True
-                elif (
-                    style_name in ("Body Text", "Normal", "First Paragraph", "Compact")
-                    and text_strip
-                    and p.paragraph_format.alignment != WD_ALIGN_PARAGRAPH.CENTER
-                ):
-                    # Force page break on first paragraph after abstract/keywords
-                    if just_left_abstract:
-                        self._set_page_break_before(p)
-                        just_left_abstract = False
-                    # APA 8.27: quotations of 40+ words become block quotes
-                    if self._is_block_quote(text_strip):
-                        self._convert_block_quote(p, text_strip)
-                    elif first_paragraph_after_heading:
-                        p.paragraph_format.first_line_indent = Inches(0)
-                        first_paragraph_after_heading = False
-                    else:
-                        p.paragraph_format.first_line_indent = Inches(0.5)
+        # Indentation logic
+        if (
+            not style_name.startswith("Heading")
+            and "List" not in style_name
+            and "Caption" not in style_name
+        ):
+            text_strip = p.text.strip()
+
+            # Remove purely numeric paragraphs (Pandoc page numbers injected as text)
+            if text_strip.isdigit():
+                p._element.getparent().remove(p._element)
+                return
+
+            if state.in_references:
+                if text_strip:
+                    p.paragraph_format.left_indent = Inches(0.5)
+                    p.paragraph_format.first_line_indent = Inches(-0.5)
                     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
                     # Force XML tag to prevent tag dropping
                     p_pr = p._element.get_or_add_pPr()
                     jc = p_pr.get_or_add_jc()
                     jc.set(qn("w:val"), "left")
+            elif state.in_abstract:
+                if p.text.strip():
+                    # Abstract block format (no indent per APA 7)
+                    p.paragraph_format.first_line_indent = Inches(0)
+                # End abstract after keywords paragraph
+                if text_strip.lower().startswith(("palabras clave", "keywords")):
+                    state.in_abstract = False
+                    state.just_left_abstract = True
+            elif (
+                style_name in ("Body Text", "Normal", "First Paragraph", "Compact")
+                and text_strip
+                and p.paragraph_format.alignment != WD_ALIGN_PARAGRAPH.CENTER
+            ):
+                # Force page break on first paragraph after abstract/keywords
+                if state.just_left_abstract:
+                    self._set_page_break_before(p)
+                    state.just_left_abstract = False
+                # APA 8.27: quotations of 40+ words become block quotes
+                if self._is_block_quote(text_strip):
+                    self._convert_block_quote(p, text_strip)
+                elif state.first_paragraph_after_heading:
+                    p.paragraph_format.first_line_indent = Inches(0)
+                    state.first_paragraph_after_heading = False
+                else:
+                    p.paragraph_format.first_line_indent = Inches(0.5)
+                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+                # Force XML tag to prevent tag dropping
+                p_pr = p._element.get_or_add_pPr()
+                jc = p_pr.get_or_add_jc()
+                jc.set(qn("w:val"), "left")
 
-            # Fix citations (y -> &)
-            self._fix_citations(p)
+        # Fix citations (y -> &)
+        self._fix_citations(p)
 
     def _apply_paragraph_spacing_control(self, p: ParagraphType) -> None:
         """Apply widow/orphan control per APA 7.
@@ -348,11 +384,6 @@ class APAParagraphsHandler:
             p._element.append(run._element)
         next_el.getparent().remove(next_el)
 
-    def _get_block_quote_config(self) -> dict[str, Any]:
-        """Get block-quote configuration with APA defaults."""
-        default_config: dict[str, Any] = {"min_words": 40, "indent_inches": 0.5}
-        return cast(dict[str, Any], self.config.get("block_quote", default_config))
-
     def _is_block_quote(self, text: str) -> bool:
         """Return whether a quoted paragraph qualifies as an APA block quote.
 
@@ -361,8 +392,7 @@ class APAParagraphsHandler:
         """
         if not text or text[:1] not in ('"', "\u201c", "\u00ab"):
             return False
-        min_words = cast(int, self._get_block_quote_config().get("min_words", 40))
-        return len(text.split()) >= min_words
+        return len(text.split()) >= self.standard.block_quote.min_words
 
     def _convert_block_quote(self, p: ParagraphType, text: str) -> None:
         """Convert a long quotation into an APA 8.27 block quote.
@@ -371,8 +401,7 @@ class APAParagraphsHandler:
         0.5" from the left (no first-line indent), and moves the final
         punctuation before the closing citation parenthesis.
         """
-        indent = cast(float, self._get_block_quote_config().get("indent_inches", 0.5))
-        p.paragraph_format.left_indent = Inches(indent)
+        p.paragraph_format.left_indent = self.standard.block_quote.indent
         p.paragraph_format.first_line_indent = Inches(0)
 
         stripped = text.strip()
@@ -421,18 +450,23 @@ class APAParagraphsHandler:
         Args:
             p: The paragraph to process.
         """
-        citation_re = re.compile(
-            r"\(([A-ZÁ-Ú][a-záéíóúñ]+(?:\s+et\s+al\.)?)\s+y\s+([A-ZÁ-Ú][a-záéíóúñ]+),\s*(\d{4})\)"
-        )
-        for run in p.runs:
-            if " y " in run.text and "(" in run.text:
-                run.text = citation_re.sub(r"(\1 & \2, \3)", run.text)
+        runs = p.runs
+        texts = [run.text for run in runs]
+        full = "".join(texts)
+        if " y " not in full or "(" not in full:
+            return
+        edits = [
+            CitationEdit(m.start(), m.end(), m.expand(r"(\1 & \2, \3)"))
+            for m in _Y_CITATION.finditer(full)
+        ]
+        if not edits:
+            return
+        for run, old, new in zip(runs, texts, splice_runs(texts, edits), strict=True):
+            if new != old:
+                run.text = new
 
     def _format_toc_entry(self, p: ParagraphType, heading_levels: dict[str, int]) -> None:
         """Format Table of Contents entries with correct indentation."""
-        from .apa_styles import APAStylesHandler
-
-        styles_handler = APAStylesHandler(self.doc)
 
         text = p.text.strip()
         if not text:
@@ -488,7 +522,7 @@ class APAParagraphsHandler:
         )
 
         run = p.add_run(title)
-        styles_handler._apply_font_style(run)
+        self._styles._apply_font_style(run)
 
         # Prevent Word/LibreOffice from auto-formatting "1. " as a numbered list
         # which breaks the tab leader layout during PDF conversion
@@ -496,16 +530,15 @@ class APAParagraphsHandler:
             run.text = "\u200b" + run.text
 
         run = p.add_run("\t")
-        styles_handler._apply_font_style(run)
+        self._styles._apply_font_style(run)
 
         run = p.add_run(page_num)
-        styles_handler._apply_font_style(run)
+        self._styles._apply_font_style(run)
 
     def _build_heading_level_map(self) -> dict[str, int]:
         """Build a map of heading text -> heading level from the document."""
         levels = {}
-        for p in self.doc.paragraphs:
-            style_name = paragraph_style_name(p)
+        for p, style_name in self._body_paragraphs():
             if style_name.startswith("Heading"):
                 parts = style_name.split()
                 if len(parts) >= 2 and parts[-1].isdigit():
@@ -521,14 +554,10 @@ class APAParagraphsHandler:
         Regular bullet lists: bullet at 0.5in, text at 0.75in, hanging indent.
         Reference entries: no bullet, hanging indent at 0.5in (APA 7 standard).
         """
-        from .apa_styles import APAStylesHandler
-
-        styles_handler = APAStylesHandler(self.doc)
         in_references = False
 
-        for p in self.doc.paragraphs:
+        for p, style_name in self._body_paragraphs():
             # Track sections via headings
-            style_name = paragraph_style_name(p)
             if style_name == _HEADING_1:
                 text_lower = p.text.lower().strip().rstrip(".")
                 in_references = _is_references_heading(text_lower)
@@ -566,7 +595,7 @@ class APAParagraphsHandler:
                         first_run.text = "\u2022\t" + first_run.text
                     else:
                         run = p.add_run("\u2022\t")
-                        styles_handler._apply_font_style(run)
+                        self._styles._apply_font_style(run)
 
     def apply_body_indent(self) -> None:
         """Final pass: apply first-line indent to all body paragraphs.
@@ -577,22 +606,22 @@ class APAParagraphsHandler:
         in_references = False
         in_toc = False
         in_abstract = False
-        for p in self.doc.paragraphs:
-            style_name = paragraph_style_name(p)
+        for p, style_name in self._body_paragraphs():
             text = p.text.strip()
 
             # Track References, TOC, and Abstract sections
             if style_name.startswith("Heading"):
                 text_lower = text.lower().strip().rstrip(".")
+                kinds = section_kinds(text_lower)
                 if _is_references_heading(text_lower):
                     in_references = True
                     in_toc = False
                     in_abstract = False
-                elif "contenido" in text_lower or "index" in text_lower:
+                elif "toc" in kinds:
                     in_toc = True
                     in_references = False
                     in_abstract = False
-                elif "resumen" in text_lower or "abstract" in text_lower:
+                elif "abstract" in kinds:
                     in_abstract = True
                     in_toc = False
                     in_references = False
@@ -656,8 +685,8 @@ class APAParagraphsHandler:
 
     def fix_text_spacing_global(self) -> None:
         """Run merge_and_clean on all paragraphs."""
-        for p in self.doc.paragraphs:
-            if not paragraph_style_name(p).startswith("Heading"):
+        for p, style_name in self._body_paragraphs():
+            if not style_name.startswith("Heading"):
                 self._merge_and_clean_paragraph(p)
                 # Enforce left align
                 if p.paragraph_format.alignment != WD_ALIGN_PARAGRAPH.CENTER:
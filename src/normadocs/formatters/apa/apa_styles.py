@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt, RGBColor
 
-from ...config import DEFAULT_BODY_FONT
+from ...standards.compiled import StandardConfig, compiled_standard
 from ...utils.docx_helpers import paragraph_style
 
 if TYPE_CHECKING:
@@ -28,15 +28,22 @@ class APAStylesHandler:
         config: Optional configuration dictionary.
     """
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APAStylesHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
         self.doc = doc
         self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
     def _get_font_name(self, key: str = "body") -> str:
         """Get the body font name from config.
@@ -44,19 +51,15 @@ class APAStylesHandler:
         Returns:
             Font name (APA default is Times New Roman).
         """
-        fonts: dict[str, Any] = {}
-        return cast(
-            str, self.config.get("fonts", fonts).get(key, {}).get("name", DEFAULT_BODY_FONT)
-        )
+        return self.standard.font(key).name
 
-    def _get_font_size(self, key: str = "body") -> int:
+    def _get_font_size(self, key: str = "body") -> float:
         """Get the body font size from config.
 
         Returns:
-            Font size in half-points (APA default is 24 = 12pt).
+            Font size in points (APA default is 12).
         """
-        fonts: dict[str, Any] = {}
-        return cast(int, self.config.get("fonts", fonts).get(key, {}).get("size", 12))
+        return self.standard.font(key).size
 
     def _get_spacing_line(self) -> str:
         """Get line spacing from config.
@@ -64,8 +67,7 @@ class APAStylesHandler:
         Returns:
             Line spacing value (APA default is double).
         """
-        spacing: dict[str, str] = {"line": "double"}
-        return cast(str, self.config.get("spacing", spacing).get("line", "double"))
+        return str(self.standard.spacing.line)
 
     def create_styles(self) -> None:
         """
@@ -245,13 +247,12 @@ class APAStylesHandler:
                     style_el.remove(old_r_pr)
                 r_pr = OxmlElement("w:rPr")
                 r_fonts = OxmlElement("w:rFonts")
-                r_fonts.set(qn("w:ascii"), self._get_font_name("body"))
-                r_fonts.set(qn("w:hAnsi"), self._get_font_name("body"))
+                body = self.standard.body_font
+                r_fonts.set(qn("w:ascii"), body.name)
+                r_fonts.set(qn("w:hAnsi"), body.name)
                 r_pr.append(r_fonts)
                 sz = OxmlElement("w:sz")
-                sz.set(
-                    qn("w:val"), str(self._get_font_size("body") * 2)
-                )  # body_size in points, stored as half-points
+                sz.set(qn("w:val"), str(body.half_points))
                 r_pr.append(sz)
                 style_el.append(r_pr)
 
@@ -271,7 +272,7 @@ class APAStylesHandler:
         self,
         style_or_run: Any,
         font_name: str | None = None,
-        size: int | None = None,
+        size: float | None = None,
         bold: bool | None = None,
         italic: bool | None = None,
         color_rgb: tuple[int, int, int] | None = None,
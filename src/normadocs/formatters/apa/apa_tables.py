@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Inches
 
-from ...config import DEFAULT_BODY_FONT
+from ...standards.compiled import StandardConfig, compiled_standard
 from ...utils.docx_helpers import paragraph_style_name
+from ...utils.font_metrics import get_font_metrics
+from .apa_fragments import (
+    ParagraphFormat,
+    RunFormat,
+    cell_borders,
+    cell_margins,
+    spacing_element,
+    text_paragraph,
+    valued_element,
+)
 
 if TYPE_CHECKING:
     from docx.document import Document as DocType
@@ -22,51 +33,87 @@ if TYPE_CHECKING:
 
 PAGE_CONTENT_WIDTH = 6.5
 
+# Horizontal cell padding (inches) added to the longest word of a column
+_CELL_PADDING = 0.08
+
 _W_VAL = "w:val"
 _W_TYPE = "w:type"
-_W_SPACING = "w:spacing"
-_W_LINE = "w:line"
-_W_LINE_RULE = "w:lineRule"
-_W_AFTER = "w:after"
-_W_PPR = "w:pPr"
-_W_RPR = "w:rPr"
 
 
+# Fragment formats for "Tabla N" captions, italic titles and "Nota." lines
+_CAPTION_FORMAT = ParagraphFormat(jc="left", after="0", line="240")
+_TITLE_FORMAT = ParagraphFormat(jc="left", after="120", line="240")
+_NOTE_FORMAT = ParagraphFormat(after="0")
+_NOTE_LABEL_RUN = RunFormat(italic=True)
+_NOTE_RUN = RunFormat()
+
 COMPANY_KEYWORDS = frozenset(["mackroph", "tecnoshop", "devsoft"])
 
 _SOURCE_CAPTION_RE = re.compile(r"^(?:Tabla|Table|Cuadro)\s+(\d+)\s*[.:\u2014\u2013-]?\s*(.*)$")
 
 
+def solve_column_widths(
+    content_widths: np.ndarray,
+    word_widths: np.ndarray,
+    min_col: float,
+    avail: float = PAGE_CONTENT_WIDTH,
+) -> np.ndarray:
+    """Allocate column widths (inches) that sum exactly to ``avail``.
+
+    Each column first gets room for its longest word (never below
+    ``min_col``); leftover space is shared in proportion to the widest
+    cell of each column. When the minimums do not fit, widths become
+    proportional to content with ``min_col`` as a floor.
+
+    Args:
+        content_widths: Widest cell text per column, in inches.
+        word_widths: Widest single word per column, in inches.
+        min_col: Minimum column width in inches.
+        avail: Total width to distribute.
+
+    Returns:
+        Column widths in inches, normalized to ``avail``.
+    """
+    content = np.asarray(content_widths, dtype=float)
+    min_widths = np.maximum(np.asarray(word_widths, dtype=float) + _CELL_PADDING, min_col)
+    total_content = content.sum() or 1.0
+    total_min = min_widths.sum()
+
+    widths: np.ndarray
+    if total_min <= avail:
+        widths = min_widths + (avail - total_min) * (content / total_content)
+    else:
+        widths = np.maximum(avail * (content / total_content), min_col)
+
+    total = widths.sum()
+    if total > 0 and abs(total - avail) > 0.01:
+        widths = widths * (avail / total)
+    return widths
+
+
 class APATablesHandler:
     """Handles table formatting, borders, captions, and notes per APA 7th Edition."""
 
-    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
         """Initialize APATablesHandler.
 
         Args:
             doc: The python-docx Document object.
             config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
         """
         self.doc = doc
         self.config = config if config is not None else {}
-
-    def _get_table_config(self) -> dict[str, Any]:
-        """Get table configuration from config with defaults."""
-        default_config: dict[str, Any] = {
-            "borders": "horizontal_only",
-            "caption_prefix": "Table",
-            "caption_above": True,
-            "note_suffix": "Elaboración propia.",
-            "vertical_align": "top",
-        }
-        return cast(dict[str, Any], self.config.get("tables", default_config))
+        self.standard = standard if standard is not None else compiled_standard(self.config, "apa7")
 
     def _get_body_font(self) -> str:
         """Get body font name from config."""
-        fonts: dict[str, Any] = {}
-        return cast(
-            str, self.config.get("fonts", fonts).get("body", {}).get("name", DEFAULT_BODY_FONT)
-        )
+        return self.standard.body_font.name
 
     def _apply_font_style(
         self,
@@ -87,7 +134,7 @@ class APATablesHandler:
         """
         from .apa_styles import APAStylesHandler
 
-        handler = APAStylesHandler(self.doc)
+        handler = APAStylesHandler(self.doc, self.config, self.standard)
         handler._apply_font_style(element, font_name=font_name, size=size, bold=bold, italic=italic)
 
     def format_tables(self) -> None:
@@ -119,13 +166,7 @@ class APATablesHandler:
                 existing_tblcm = tbl_pr.find(qn("w:tblCellMar"))
                 if existing_tblcm is not None:
                     tbl_pr.remove(existing_tblcm)
-                tbl_cell_mar = OxmlElement("w:tblCellMar")
-                for side in ("top", "bottom", "start", "end"):
-                    el = OxmlElement(f"w:{side}")
-                    el.set(qn("w:w"), "57")  # ~1mm padding
-                    el.set(qn(_W_TYPE), "dxa")
-                    tbl_cell_mar.append(el)
-                tbl_pr.append(tbl_cell_mar)
+                tbl_pr.append(cell_margins("w:tblCellMar", "57"))  # ~1mm padding
 
             # Reduce cell margins, set vertical top-alignment and left-alignment
             for _row_idx, row in enumerate(table.rows):
@@ -139,21 +180,13 @@ class APATablesHandler:
                     existing_valign = tc_pr.find(qn("w:vAlign"))
                     if existing_valign is not None:
                         tc_pr.remove(existing_valign)
-                    v_align = OxmlElement("w:vAlign")
-                    v_align.set(qn(_W_VAL), "top")
-                    tc_pr.append(v_align)
+                    tc_pr.append(valued_element("w:vAlign", "top"))
 
                     # Remove existing margins
                     existing_mar = tc_pr.find(qn("w:tcMar"))
                     if existing_mar is not None:
                         tc_pr.remove(existing_mar)
-                    tc_mar = OxmlElement("w:tcMar")
-                    for side in ("top", "bottom", "start", "end"):
-                        el = OxmlElement(f"w:{side}")
-                        el.set(qn("w:w"), "28")  # small margin (~0.5mm)
-                        el.set(qn(_W_TYPE), "dxa")
-                        tc_mar.append(el)
-                    tc_pr.append(tc_mar)
+                    tc_pr.append(cell_margins("w:tcMar", "28"))  # small margin (~0.5mm)
 
                     # Left-align all cell paragraphs (APA 7 for text content)
                     for p in cell.paragraphs:
@@ -162,15 +195,12 @@ class APATablesHandler:
                         jc = p_pr.get_or_add_jc()
                         jc.set(qn(_W_VAL), "left")
                         # Prevent word breaking in paragraphs - set overflow behavior
-                        overflow = OxmlElement("w:overflow")
-                        overflow.set(qn(_W_VAL), "continue")
-                        p_pr.append(overflow)
+                        p_pr.append(valued_element("w:overflow", "continue"))
 
                     # Add noWrap to cell properties to prevent LibreOffice from breaking words
                     existing_no_wrap = tc_pr.find(qn("w:noWrap"))
                     if existing_no_wrap is None:
-                        no_wrap = OxmlElement("w:noWrap")
-                        tc_pr.append(no_wrap)
+                        tc_pr.append(valued_element("w:noWrap"))
 
             # Scale font size based on column count (min 12pt per APA 7)
             num_cols = len(table.columns)
@@ -181,70 +211,28 @@ class APATablesHandler:
             else:
                 font_size = 12  # APA 7 requires 12pt minimum
 
-            # Set proportional column widths based on content
+            # Set proportional column widths based on measured content
             if num_cols >= 2:
-                # Calculate max content length per column (across all rows)
-                max_content_len = [0] * num_cols
-                max_word_len = [0] * num_cols
-                for row in table.rows:
-                    for ci, cell in enumerate(row.cells):
-                        if ci < num_cols:
-                            text = cell.text.strip()
-                            max_content_len[ci] = max(max_content_len[ci], len(text))
-                            for word in text.split():
-                                max_word_len[ci] = max(max_word_len[ci], len(word))
-
-                # Char width estimate per font size (includes ~0.05in padding)
-                cw_map = {9: 0.08, 10: 0.09, 11: 0.10, 12: 0.10}
-                cw = cw_map.get(font_size, 0.09)
-
-                # Minimum column width: fit longest word with small padding
-                # Use smaller minimum for tables with many columns
-                min_col = max(0.8, 6.0 / num_cols)
-                min_widths = [max(w * cw + 0.08, min_col) for w in max_word_len]
-                total_min = sum(min_widths)
-
-                avail = PAGE_CONTENT_WIDTH
-                col_widths_inches = []
-                if total_min <= avail:
-                    remaining = avail - total_min
-                    total_content = sum(max_content_len) or 1
-                    for ci in range(num_cols):
-                        extra = remaining * (max_content_len[ci] / total_content)
-                        col_widths_inches.append(min_widths[ci] + extra)
-                else:
-                    # Proportional fallback with floor
-                    total_content = sum(max_content_len) or 1
-                    floor_w = min_col
-                    for ci in range(num_cols):
-                        proportion = max_content_len[ci] / total_content
-                        col_widths_inches.append(max(avail * proportion, floor_w))
-
-                # CRITICAL: Normalize total to exactly PAGE_CONTENT_WIDTH
-                current_total = sum(col_widths_inches)
-                if current_total > 0 and abs(current_total - avail) > 0.01:
-                    scale = avail / current_total
-                    col_widths_inches = [w * scale for w in col_widths_inches]
+                col_widths_inches = self._solve_table_widths(table, num_cols, font_size)
 
                 # Apply widths to columns, cells, AND gridCol elements
                 tbl_grid = table._tbl.find(qn("w:tblGrid"))
                 grid_cols = tbl_grid.findall(qn("w:gridCol")) if tbl_grid is not None else []
+                col_widths = [Inches(w) for w in col_widths_inches]
                 for ci, col in enumerate(table.columns):
-                    col_width = Inches(col_widths_inches[ci])
-                    col.width = col_width
+                    col.width = col_widths[ci]
                     # Update gridCol (authoritative for LibreOffice)
                     if ci < len(grid_cols):
                         grid_cols[ci].set(qn("w:w"), str(int(col_widths_inches[ci] * 1440)))
-                    # Update each cell width
-                    for row in table.rows:
-                        if ci < len(row.cells):
-                            row.cells[ci].width = col_width
+                # Update each cell width
+                for row in table.rows:
+                    for cell, col_width in zip(row.cells, col_widths, strict=False):
+                        cell.width = col_width
 
             # Repeat table headers across pages
             if len(table.rows) > 0:
                 tr = table.rows[0]._tr
-                tbl_header = OxmlElement("w:tblHeader")
-                tr.get_or_add_trPr().append(tbl_header)
+                tr.get_or_add_trPr().append(valued_element("w:tblHeader"))
 
             # Prevent table rows from being split across pages
             # w:cantSplit: la fila completa debe estar en una página (no se corta a mitad)
@@ -255,9 +243,7 @@ class APATablesHandler:
                 if existing is not None:
                     tr_pr.remove(existing)
                 # Add cantSplit with value "1" (true - row cannot be split)
-                cant_split = OxmlElement("w:cantSplit")
-                cant_split.set(qn(_W_VAL), "1")
-                tr_pr.append(cant_split)
+                tr_pr.append(valued_element("w:cantSplit", "1"))
 
             # Add table-level properties to prevent table splitting
             tbl_pr_elem = table._tbl.tblPr
@@ -266,12 +252,9 @@ class APATablesHandler:
                 table._tbl.insert(0, tbl_pr_elem)
 
             # Add tblLook element to control widow/orphan behavior at table level
-            tbl_look = OxmlElement("w:tblLook")
-            tbl_look.set(qn(_W_VAL), "04A0")
-            tbl_look.set(qn("w:first"), "1")
-            tbl_look.set(qn("w:last"), "1")
-            tbl_look.set(qn("w:hBand"), "1")
-            tbl_look.set(qn("w:vBand"), "1")
+            tbl_look = valued_element("w:tblLook", "04A0")
+            for flag in ("w:first", "w:last", "w:hBand", "w:vBand"):
+                tbl_look.set(qn(flag), "1")
             tbl_pr_elem.append(tbl_look)
 
             # Add table-level property to prevent row splitting at page boundary
@@ -279,9 +262,7 @@ class APATablesHandler:
             existing_split = tbl_pr_elem.find(qn("w:tblSplit"))
             if existing_split is not None:
                 tbl_pr_elem.remove(existing_split)
-            tbl_split = OxmlElement("w:tblSplit")
-            tbl_split.set(qn(_W_VAL), "0")  # 0 = don't split rows
-            tbl_pr_elem.append(tbl_split)
+            tbl_pr_elem.append(valued_element("w:tblSplit", "0"))  # 0 = don't split rows
 
             # Clean and merge cell text
             for row in table.rows:
@@ -352,45 +333,50 @@ class APATablesHandler:
                         old_jc = p_pr.find(qn("w:jc"))
                         if old_jc is not None:
                             p_pr.remove(old_jc)
-                        new_jc = OxmlElement("w:jc")
-                        new_jc.set(qn(_W_VAL), "left")
-                        p_pr.append(new_jc)
+                        p_pr.append(valued_element("w:jc", "left"))
 
                         # --- Single line spacing (APA 7 exception for tables) ---
                         old_spacing = p_pr.find(qn("w:spacing"))
                         if old_spacing is not None:
                             p_pr.remove(old_spacing)
-                        spacing_el = OxmlElement(_W_SPACING)
-                        spacing_el.set(qn(_W_LINE), "240")  # single spacing
-                        spacing_el.set(qn(_W_LINE_RULE), "auto")
-                        spacing_el.set(qn("w:before"), "0")
-                        spacing_el.set(qn(_W_AFTER), "40")  # tiny gap between rows
-                        p_pr.append(spacing_el)
+                        # single spacing, tiny gap between rows
+                        p_pr.append(spacing_element(line="240", before="0", after="40"))
 
                         # --- Widow/Orphan control: prevent single lines at page break ---
                         old_widow = p_pr.find(qn("w:widowControl"))
                         if old_widow is not None:
                             p_pr.remove(old_widow)
-                        widow_ctrl = OxmlElement("w:widowControl")
-                        p_pr.append(widow_ctrl)
+                        p_pr.append(valued_element("w:widowControl"))
 
                         # --- Keep lines together in paragraph (prevent line splitting) ---
                         old_keep_lines = p_pr.find(qn("w:keepLines"))
                         if old_keep_lines is not None:
                             p_pr.remove(old_keep_lines)
-                        keep_lines_el = OxmlElement("w:keepLines")
-                        p_pr.append(keep_lines_el)
+                        p_pr.append(valued_element("w:keepLines"))
 
             # Add spacing paragraph after table (APA 7: double-space gap)
-            table_element = table._tbl
-            spacing_p = OxmlElement("w:p")
-            spacing_p_pr = OxmlElement(_W_PPR)
-            spacing_spacing = OxmlElement(_W_SPACING)
-            spacing_spacing.set(qn(_W_LINE), "480")
-            spacing_spacing.set(qn(_W_LINE_RULE), "auto")
-            spacing_p_pr.append(spacing_spacing)
-            spacing_p.append(spacing_p_pr)
-            table_element.addnext(spacing_p)
+            table._tbl.addnext(text_paragraph(ParagraphFormat(line="480"), ()))
+
+    def _solve_table_widths(self, table: TableType, num_cols: int, font_size: int) -> list[float]:
+        """Measure every cell of a table and solve its column widths.
+
+        Cell text is measured with the body font's real metrics (see
+        :mod:`normadocs.utils.font_metrics`) and gathered into
+        ``(rows, cols)`` arrays before the vectorized allocation.
+        """
+        metrics = get_font_metrics(self._get_body_font())
+        content = np.zeros((len(table.rows), num_cols))
+        words = np.zeros_like(content)
+        for ri, row in enumerate(table.rows):
+            for ci, cell in enumerate(row.cells[:num_cols]):
+                text = cell.text.strip()
+                content[ri, ci] = metrics.text_width(text, font_size)
+                words[ri, ci] = metrics.longest_word_width(text, font_size)
+
+        # Smaller minimum for tables with many columns
+        min_col = max(0.8, 6.0 / num_cols)
+        widths = solve_column_widths(content.max(axis=0), words.max(axis=0), min_col)
+        return [float(w) for w in widths]
 
     def _apply_apa_table_borders(self, table: TableType) -> None:
         """
@@ -437,14 +423,7 @@ class APATablesHandler:
         # Remove any existing cell borders
         for old in tc_pr.findall(qn("w:tcBorders")):
             tc_pr.remove(old)
-        tc_borders = OxmlElement("w:tcBorders")
-        for edge_name in ("start", "top", "end", "bottom", "insideH", "insideV"):
-            if edge_name in kwargs:
-                el = OxmlElement(f"w:{edge_name}")
-                for attr, val in kwargs[edge_name].items():
-                    el.set(qn(f"w:{attr}"), str(val))
-                tc_borders.append(el)
-        tc_pr.append(tc_borders)
+        tc_pr.append(cell_borders(**kwargs))
 
     def add_table_captions(self) -> None:
         """Add APA 7 captions to tables: 'Tabla N' (bold) + title (italic).
@@ -477,6 +456,11 @@ class APATablesHandler:
         for p_idx, p in enumerate(self.doc.paragraphs):
             para_by_pos[p_idx] = p
 
+        caption_prefix = self.standard.tables.caption_prefix
+        body_font = self._get_body_font()
+        label_format = RunFormat(bold=True, font=body_font)
+        title_format = RunFormat(italic=True, font=body_font)
+
         # Insert captions - offset tracks insertions/removals relative to the
         # original body children positions
         offset = 0
@@ -511,83 +495,15 @@ class APATablesHandler:
             if not title_text:
                 title_text = self._extract_table_title(docx_table)
 
-            # Create caption paragraph with "Tabla N" (bold)
-            caption_p = OxmlElement("w:p")
-            caption_p_pr = OxmlElement(_W_PPR)
-
-            # Left alignment
-            jc = OxmlElement("w:jc")
-            jc.set(qn(_W_VAL), "left")
-            caption_p_pr.append(jc)
-
-            # No space after
-            spacing = OxmlElement(_W_SPACING)
-            spacing.set(qn(_W_AFTER), "0")
-            spacing.set(qn(_W_LINE), "240")
-            spacing.set(qn(_W_LINE_RULE), "auto")
-            caption_p_pr.append(spacing)
-
-            caption_p.append(caption_p_pr)
-
-            # Run with "Tabla N" bold
-            run = OxmlElement("w:r")
-            r_pr = OxmlElement(_W_RPR)
-            bold = OxmlElement("w:b")
-            r_pr.append(bold)
-            # Font
-            font = OxmlElement("w:rFonts")
-            font.set(qn("w:ascii"), DEFAULT_BODY_FONT)
-            font.set(qn("w:hAnsi"), DEFAULT_BODY_FONT)
-            r_pr.append(font)
-            sz = OxmlElement("w:sz")
-            sz.set(qn(_W_VAL), "24")  # 12pt
-            r_pr.append(sz)
-            run.append(r_pr)
-            t = OxmlElement("w:t")
-            table_config = self._get_table_config()
-            caption_prefix = table_config.get("caption_prefix", "Table")
-            t.text = f"{caption_prefix} {table_num}"
-            run.append(t)
-            caption_p.append(run)
-
-            # Insert caption before table
+            # "Tabla N" (bold) paragraph, then the title (italic) paragraph
+            caption_p = text_paragraph(
+                _CAPTION_FORMAT, [(f"{caption_prefix} {table_num}", label_format)]
+            )
             body.insert(current_pos, caption_p)
             offset += 1
 
-            # If we have a title, add a second paragraph with the title in italics
             if title_text:
-                title_p = OxmlElement("w:p")
-                title_p_pr = OxmlElement(_W_PPR)
-                jc2 = OxmlElement("w:jc")
-                jc2.set(qn(_W_VAL), "left")
-                title_p_pr.append(jc2)
-                spacing2 = OxmlElement(_W_SPACING)
-                spacing2.set(qn(_W_AFTER), "120")
-                spacing2.set(qn(_W_LINE), "240")
-                spacing2.set(qn(_W_LINE_RULE), "auto")
-                title_p_pr.append(spacing2)
-                title_p.append(title_p_pr)
-
-                # Run with title in italics
-                title_run = OxmlElement("w:r")
-                title_r_pr = OxmlElement(_W_RPR)
-                italic = OxmlElement("w:i")
-                title_r_pr.append(italic)
-                font2 = OxmlElement("w:rFonts")
-                font2.set(qn("w:ascii"), DEFAULT_BODY_FONT)
-                font2.set(qn("w:hAnsi"), DEFAULT_BODY_FONT)
-                title_r_pr.append(font2)
-                sz2 = OxmlElement("w:sz")
-                sz2.set(qn(_W_VAL), "24")
-                title_r_pr.append(sz2)
-                title_run.append(title_r_pr)
-                title_t = OxmlElement("w:t")
-                title_t.text = title_text
-                title_t.set(qn("xml:space"), "preserve")
-                title_run.append(title_t)
-                title_p.append(title_run)
-
-                # Insert title after caption
+                title_p = text_paragraph(_TITLE_FORMAT, [(title_text, title_format)])
                 body.insert(current_pos + 1, title_p)
                 offset += 1
 
@@ -850,54 +766,20 @@ class APATablesHandler:
 
             table_descriptions.append(desc)
 
+        note_suffix = self.standard.tables.note_suffix
         for i, table in enumerate(tables_list):
             parent = table._tbl.getparent()
             if parent is None:
                 continue
             table_idx = parent.index(table._tbl)
-            nota_p = OxmlElement("w:p")
-            nota_p_pr = OxmlElement(_W_PPR)
-            nota_spacing = OxmlElement(_W_SPACING)
-            nota_spacing.set(qn(_W_AFTER), "0")
-            nota_p_pr.append(nota_spacing)
-            nota_p.append(nota_p_pr)
-
-            nota_r1 = OxmlElement("w:r")
-            nota_r_pr1 = OxmlElement(_W_RPR)
-            nota_i1 = OxmlElement("w:i")
-            nota_r_pr1.append(nota_i1)
-            nota_sz1 = OxmlElement("w:sz")
-            nota_sz1.set(qn(_W_VAL), "24")
-            nota_r_pr1.append(nota_sz1)
-            nota_r1.append(nota_r_pr1)
-            nota_t1 = OxmlElement("w:t")
-            nota_t1.text = "Nota. "
-            nota_r1.append(nota_t1)
-            nota_p.append(nota_r1)
-
-            nota_r2 = OxmlElement("w:r")
-            nota_r_pr2 = OxmlElement(_W_RPR)
-            nota_sz2 = OxmlElement("w:sz")
-            nota_sz2.set(qn(_W_VAL), "24")
-            nota_r_pr2.append(nota_sz2)
-            nota_r2.append(nota_r_pr2)
-            nota_t2 = OxmlElement("w:t")
-            nota_t2.text = table_descriptions[i] if i < len(table_descriptions) else ""
-            nota_r2.append(nota_t2)
-            nota_p.append(nota_r2)
-
-            nota_r3 = OxmlElement("w:r")
-            nota_r_pr3 = OxmlElement(_W_RPR)
-            nota_sz3 = OxmlElement("w:sz")
-            nota_sz3.set(qn(_W_VAL), "24")
-            nota_r_pr3.append(nota_sz3)
-            nota_r3.append(nota_r_pr3)
-            nota_t3 = OxmlElement("w:t")
-            table_config = self._get_table_config()
-            note_suffix = table_config.get("note_suffix", " Author's elaboration.")
-            nota_t3.text = f" {note_suffix}"
-            nota_r3.append(nota_t3)
-            nota_p.append(nota_r3)
+            nota_p = text_paragraph(
+                _NOTE_FORMAT,
+                [
+                    ("Nota. ", _NOTE_LABEL_RUN),
+                    (table_descriptions[i] if i < len(table_descriptions) else "", _NOTE_RUN),
+                    (f" {note_suffix}", _NOTE_RUN),
+                ],
+            )
 
             parent.insert(table_idx + 1, nota_p)
 
@@ -7,24 +7,24 @@ the process() and save() methods.
 from abc import ABC, abstractmethod
 from typing import Any
 
-from docx import Document
 from docx.table import Table
 
 from ..models import DocumentMetadata
+from ..utils.docx_package import DocxSource, DocxTarget, open_document
 
 
 class DocumentFormatter(ABC):
     """Abstract base class for all document formatters (APA, ICONTEC, IEEE)."""
 
-    def __init__(self, doc_path: str, config: dict[str, Any] | None = None) -> None:
+    def __init__(self, doc_path: DocxSource, config: dict[str, Any] | None = None) -> None:
         """Initialize DocumentFormatter.
 
         Args:
-            doc_path: Path to the DOCX file to format.
+            doc_path: Path, bytes, binary stream or open Document to format.
             config: Optional configuration dictionary.
         """
         self.doc_path = doc_path
-        self.doc = Document(doc_path)
+        self.doc = open_document(doc_path)
         self.config = config if config is not None else {}
 
     def get_config(self, *keys: str, default: Any = None) -> Any:
@@ -49,8 +49,21 @@ class DocumentFormatter(ABC):
         pass
 
     @abstractmethod
-    def save(self, output_path: str) -> None:
-        """Save the formatted document."""
+    def save(
+        self,
+        output_path: DocxTarget,
+        *,
+        optimize: bool = False,
+        compression_level: int | None = None,
+    ) -> None:
+        """Save the formatted document.
+
+        Args:
+            output_path: Path or writable binary stream to save the DOCX to.
+            optimize: Whether to shrink the package (see ``optimize_package``).
+            compression_level: Deflate level from 0 to 9; None keeps the
+                default unless ``optimize`` is set.
+        """
         pass
 
     def _format_table_caption(self, table: Table, number: int, title: str) -> None:
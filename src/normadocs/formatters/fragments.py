@@ -0,0 +1,188 @@
+"""Prebuilt cover-page and page-header fragments shared by the formatters.
+
+A batch of documents for one cohort shares the standard and most cover
+metadata (institution, program, instructor...). Cover blocks and header
+runs are therefore built once per (standard settings, metadata shape),
+cached, and stamped into each document with ``deepcopy``; only the
+per-document values (title, author, date, short title) are filled in.
+Templates are built through the python-docx API, so stamped fragments are
+identical to paragraphs and runs built one by one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, cast
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import CT_P
+from docx.oxml.text.run import CT_R
+from docx.shared import Pt
+from docx.text.font import Font
+from docx.text.parfmt import ParagraphFormat
+
+_FLD_CHAR = "w:fldChar"
+_FLD_CHAR_TYPE = "w:fldCharType"
+
+
+@dataclass(frozen=True, slots=True)
+class BlockLine:
+    """One paragraph of a prebuilt block.
+
+    Args:
+        text: Literal text shared by every document, or None for a slot
+            filled per document (a slot left empty gets no run).
+        bold: Make the line's run bold.
+        alignment: Paragraph alignment (omitted when None).
+        line_spacing_rule: Paragraph line spacing rule (omitted when None).
+        space_after: Space after the paragraph in points (omitted when None).
+    """
+
+    text: str | None
+    bold: bool = False
+    alignment: WD_ALIGN_PARAGRAPH | None = WD_ALIGN_PARAGRAPH.CENTER
+    line_spacing_rule: WD_LINE_SPACING | None = None
+    space_after: float | None = None
+
+
+@lru_cache(maxsize=64)
+def _block_template(lines: tuple[BlockLine, ...], style_id: str | None) -> tuple[Any, ...]:
+    """Build (once) the detached paragraphs of a block; slots hold an empty run."""
+    template = []
+    for line in lines:
+        p_el = cast(CT_P, OxmlElement("w:p"))
+        if style_id is not None:
+            p_el.style = style_id
+        p_format = ParagraphFormat(p_el)
+        if line.alignment is not None:
+            p_format.alignment = line.alignment
+        if line.line_spacing_rule is not None:
+            p_format.line_spacing_rule = line.line_spacing_rule
+        if line.space_after is not None:
+            p_format.space_after = Pt(line.space_after)
+        if line.text is None or line.text:
+            run = p_el.add_r()
+            if line.text:
+                run.text = line.text
+            if line.bold:
+                Font(run).bold = True
+        template.append(p_el)
+    return tuple(template)
+
+
+def block_paragraphs(
+    lines: Sequence[BlockLine], values: Sequence[str] = (), style_id: str | None = None
+) -> list[Any]:
+    """Return fresh paragraph elements stamped from a cached block.
+
+    Args:
+        lines: The block's lines, in order.
+        values: One value per slot line (``text=None``), in order.
+        style_id: Paragraph style id applied to every line (None keeps
+            the default paragraph style).
+
+    Returns:
+        Detached ``w:p`` elements, ready to be inserted in a document.
+    """
+    template = _block_template(tuple(lines), style_id)
+    fill = iter(values)
+    paragraphs = []
+    for line, p_template in zip(lines, template, strict=True):
+        p_el = deepcopy(p_template)
+        if line.text is None:
+            value = next(fill)
+            run = p_el.r_lst[0]
+            if value:
+                run.text = value
+            else:
+                p_el.remove(run)
+        paragraphs.append(p_el)
+    return paragraphs
+
+
+def _font_run(font: str, size_pt: float) -> CT_R:
+    run = cast(CT_R, OxmlElement("w:r"))
+    run_font = Font(run)
+    run_font.name = font
+    run_font.size = Pt(size_pt)
+    return run
+
+
+@lru_cache(maxsize=16)
+def _page_field_template(font: str, size_pt: float) -> tuple[Any, ...]:
+    """Build (once) the runs of a PAGE field: begin, instr, separate, "1", end."""
+    runs = []
+    for kind in ("begin", "instr", "separate", "text", "end"):
+        run = _font_run(font, size_pt)
+        if kind == "instr":
+            instr = OxmlElement("w:instrText")
+            instr.set(qn("xml:space"), "preserve")
+            instr.text = " PAGE "
+            run.append(instr)
+        elif kind == "text":
+            # Placeholder text (will be replaced by the actual page number)
+            run.text = "1"
+        else:
+            fld_char = OxmlElement(_FLD_CHAR)
+            fld_char.set(qn(_FLD_CHAR_TYPE), kind)
+            run.append(fld_char)
+        runs.append(run)
+    return tuple(runs)
+
+
+def page_field_runs(font: str, size_pt: float) -> list[Any]:
+    """Return fresh runs holding a PAGE field.
+
+    The begin/separate/end sequence is complete because LibreOffice needs
+    the ``separate`` marker to render the page number.
+
+    Args:
+        font: Font family of every run.
+        size_pt: Font size in points.
+    """
+    return [deepcopy(run) for run in _page_field_template(font, size_pt)]
+
+
+@lru_cache(maxsize=16)
+def _running_head_template(font: str, size_pt: float) -> tuple[Any, tuple[Any, ...]]:
+    tabs = OxmlElement("w:tabs")
+    # Tab at 3.25 inches (center of 6.5 inch text width) and at the right
+    # margin (6.5 inches) for the page number, in twips.
+    for align, pos in (("center", "4680"), ("right", "9360")):
+        tab = OxmlElement("w:tab")
+        tab.set(qn("w:val"), align)
+        tab.set(qn("w:pos"), pos)
+        tabs.append(tab)
+    title = _font_run(font, size_pt)
+    tab_runs = []
+    for _ in range(2):
+        tab_run = cast(CT_R, OxmlElement("w:r"))
+        tab_run.text = "\t"
+        tab_runs.append(tab_run)
+    return tabs, (title, *tab_runs, *_page_field_template(font, size_pt))
+
+
+def running_head_fragment(title: str, font: str, size_pt: float) -> tuple[Any, list[Any]]:
+    """Return fresh tab stops and runs for a running head with a page number.
+
+    Args:
+        title: The running-head text (left-aligned).
+        font: Font family of the title and page number.
+        size_pt: Font size in points.
+
+    Returns:
+        The ``w:tabs`` element for the paragraph properties, and the runs:
+        title, two tabs and the PAGE field.
+    """
+    tabs, runs = _running_head_template(font, size_pt)
+    stamped = [deepcopy(run) for run in runs]
+    stamped[0].text = title
+    return deepcopy(tabs), stamped
+
+
+__all__ = ["BlockLine", "block_paragraphs", "page_field_runs", "running_head_fragment"]
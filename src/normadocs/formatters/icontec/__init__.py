@@ -0,0 +1,5 @@
+"""ICONTEC NTC 1486 formatter module."""
+
+from .icontec_formatter import IcontecFormatter
+
+__all__ = ["IcontecFormatter"]
@@ -0,0 +1,68 @@
+"""ICONTEC cover page."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from docx.enum.style import WD_STYLE_TYPE
+
+from ...models import DocumentMetadata
+from ...utils.docx_helpers import paragraph_style
+from ..fragments import BlockLine, block_paragraphs
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+
+class IcontecCoverHandler:
+    """Handles the ICONTEC (NTC 1486) cover page."""
+
+    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+        """Initialize IcontecCoverHandler.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+
+    def add_cover_page(self, meta: DocumentMetadata) -> None:
+        """
+        ICONTEC Cover Page:
+        - Title (Centered, Vertical align top approx)
+        - Author (Centered, vertical align middle)
+        - Legend (Institution, Faculty, etc. at bottom)
+        - City, Year (Bottom)
+        """
+        # Simplistic implementation: Insert at top
+        self.doc.add_paragraph()
+        if self.doc.paragraphs:
+            self.doc.paragraphs[0].insert_paragraph_before("")
+
+        ref_p = self.doc.paragraphs[0]
+        normal = paragraph_style(self.doc.styles, "Normal")
+
+        default = self.doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        style_id = None if normal == default else normal.style_id
+
+        # Title and author are slots; the legend (institution, program) is
+        # shared by a cohort, so the block is cached per legend.
+        lines = [
+            BlockLine(None, bold=True, space_after=120),  # Title (approx space)
+            BlockLine(None, space_after=200),  # Author
+            BlockLine((meta.institution or "Institution Name").upper(), space_after=0),
+        ]
+        if meta.program:
+            lines.append(BlockLine(meta.program.upper(), space_after=0))
+        lines.append(BlockLine(None, space_after=0))  # City, Year
+
+        city = meta.extra.get("city", "City")
+        year = meta.date or "2024"
+        values = (meta.title.upper(), meta.author or "Author Name", f"{city.upper()}, {year}")
+        for p_el in block_paragraphs(lines, values, style_id):
+            ref_p._p.addprevious(p_el)
+
+        # Page Break
+        pb_p = ref_p.insert_paragraph_before()
+        pb_p.add_run().add_break()
@@ -0,0 +1,117 @@
+"""ICONTEC NTC 1486 formatter for academic documents.
+
+Applies ICONTEC formatting standards including Arial 12pt font,
+1.5 line spacing, and specific margin requirements.
+"""
+
+from typing import Any
+
+from docx.document import Document as DocumentObject
+from docx.shared import Cm, Inches
+
+from ...models import DocumentMetadata
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_package import DocxSource, DocxTarget, save_document
+from ..base import DocumentFormatter
+from ..images import downsample_images
+from ..rules import RuleEngine
+from .icontec_cover import IcontecCoverHandler
+from .icontec_page import IcontecPageHandler
+from .icontec_styles import IcontecStylesHandler
+
+
+class IcontecFormatter(DocumentFormatter):
+    """
+    Applies ICONTEC (NTC 1486) formatting to a DOCX file.
+    """
+
+    def __init__(
+        self,
+        doc_path: DocxSource,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize ICONTEC formatter.
+
+        Args:
+            doc_path: Path, bytes, binary stream or open Document to format.
+            config: Optional configuration dictionary to override defaults.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        super().__init__(doc_path, config)
+        self.standard = (
+            standard if standard is not None else compiled_standard(self.config, "icontec")
+        )
+        self._init_handlers(self.doc)
+
+    def _init_handlers(self, doc: DocumentObject) -> None:
+        """Create the handlers for ``doc`` with the formatter config."""
+        self._page = IcontecPageHandler(doc, self.config, self.standard)
+        self._styles = IcontecStylesHandler(doc, self.config, self.standard)
+        self._cover = IcontecCoverHandler(doc, self.config)
+        self._body = RuleEngine(doc, self.config, self.standard)
+
+    def process(self, meta: DocumentMetadata) -> None:
+        """Run the ICONTEC formatting pipeline."""
+        self._page.setup_page_layout()
+        self._styles.create_styles()
+        self._cover.add_cover_page(meta)
+        self._body.apply()
+        downsample_images(self.doc, self.standard.figures)
+        # Tables and Citations logic can be added later/adapted
+        # For now, we focus on layout and text style.
+
+    def save(
+        self,
+        output_path: DocxTarget,
+        *,
+        optimize: bool = False,
+        compression_level: int | None = None,
+    ) -> None:
+        """Save the formatted document.
+
+        Args:
+            output_path: Path or writable binary stream to save the DOCX to.
+            optimize: Whether to shrink the package (see ``optimize_package``).
+            compression_level: Deflate level from 0 to 9; None keeps the
+                default unless ``optimize`` is set.
+        """
+        save_document(self.doc, output_path, optimize=optimize, compression_level=compression_level)
+
+    # ─────────────────── Delegate methods for backward compatibility ───────────────────
+
+    def _get_margins(self) -> dict[str, float | str]:
+        """Get margin settings from config."""
+        return self._page.get_margins()
+
+    def _get_font_name(self, key: str = "body") -> str:
+        """Get the font name from config."""
+        return self._styles.get_font_name(key)
+
+    def _get_font_size(self, key: str = "body") -> float:
+        """Get the font size from config."""
+        return self._styles.get_font_size(key)
+
+    def _get_spacing_line(self) -> float:
+        """Get line spacing from config."""
+        return self._styles.get_spacing_line()
+
+    def _margin_to_unit(self, value: float, unit: str) -> Cm | Inches:
+        """Convert margin value based on unit."""
+        return self._page.margin_to_unit(value, unit)
+
+    def _setup_page_layout(self) -> None:
+        """NTC 1486 Margins from config."""
+        self._page.setup_page_layout()
+
+    def _create_styles(self) -> None:
+        """Font and spacing from config."""
+        self._styles.create_styles()
+
+    def _add_cover_page(self, meta: DocumentMetadata) -> None:
+        """Delegate to IcontecCoverHandler to add the cover page."""
+        self._cover.add_cover_page(meta)
+
+    def _process_paragraphs(self) -> None:
+        """Justify body paragraphs (fonts are inherited from the styles)."""
+        self._body.apply()
@@ -0,0 +1,76 @@
+"""ICONTEC page layout: NTC 1486 margins."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from docx.shared import Cm, Inches
+
+from ...standards.compiled import StandardConfig, compiled_standard
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+
+class IcontecPageHandler:
+    """Handles ICONTEC page margins."""
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize IcontecPageHandler.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+        self.standard = (
+            standard if standard is not None else compiled_standard(self.config, "icontec")
+        )
+
+    def get_margins(self) -> dict[str, float | str]:
+        """Get margin settings from config.
+
+        Returns:
+            Dictionary with margin values (top, bottom, left, right).
+        """
+        margins = self.standard.margins
+        return {
+            "top": margins.top,
+            "bottom": margins.bottom,
+            "left": margins.left,
+            "right": margins.right,
+            "unit": margins.unit,
+        }
+
+    @staticmethod
+    def margin_to_unit(value: float, unit: str) -> Cm | Inches:
+        """Convert margin value based on unit.
+
+        Args:
+            value: The margin value.
+            unit: The unit type ("inches" or "cm").
+
+        Returns:
+            The converted value in the appropriate unit.
+        """
+        if unit == "inches":
+            return Inches(value)
+        return Cm(value)
+
+    def setup_page_layout(self) -> None:
+        """
+        NTC 1486 Margins from config.
+        """
+        margins = self.standard.margins
+        for section in self.doc.sections:
+            section.top_margin = margins.top_emu
+            section.bottom_margin = margins.bottom_emu
+            section.left_margin = margins.left_emu
+            section.right_margin = margins.right_emu
@@ -0,0 +1,113 @@
+"""ICONTEC text styles: Arial 12pt, 1.5 line spacing."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.shared import Pt, RGBColor
+
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_helpers import paragraph_style, set_default_run_font
+from ..styles import BODY_STYLES
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+
+class IcontecStylesHandler:
+    """Handles ICONTEC document styles.
+
+    Fonts are set once on the document defaults and on the paragraph styles
+    instead of on every run, so body runs inherit them.
+    """
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize IcontecStylesHandler.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+        self.standard = (
+            standard if standard is not None else compiled_standard(self.config, "icontec")
+        )
+
+    def get_font_name(self, key: str = "body") -> str:
+        """Get the font name from config.
+
+        Returns:
+            Font name string (e.g., "Arial").
+        """
+        return self.standard.font(key).name
+
+    def get_font_size(self, key: str = "body") -> float:
+        """Get the font size from config.
+
+        Returns:
+            Font size in points (e.g., 12).
+        """
+        return self.standard.font(key).size
+
+    def get_spacing_line(self) -> float:
+        """Get line spacing from config.
+
+        Returns:
+            Line spacing value (e.g., 1.5 or 1.0).
+        """
+        return self.standard.spacing.line_multiple
+
+    def create_styles(self) -> None:
+        """
+        Font and spacing from config.
+        """
+        styles = self.doc.styles
+        body_font = self.get_font_name("body")
+        body_size = self.get_font_size("body")
+        spacing_line = self.get_spacing_line()
+        line_spacing = (
+            WD_LINE_SPACING.ONE_POINT_FIVE
+            if math.isclose(spacing_line, 1.5)
+            else WD_LINE_SPACING.SINGLE
+        )
+
+        set_default_run_font(styles, body_font, body_size)
+
+        # Normal
+        normal = paragraph_style(styles, "Normal")
+        font = normal.font
+        font.name = body_font
+        font.size = Pt(body_size)
+        font.color.rgb = RGBColor(0, 0, 0)
+
+        pf = normal.paragraph_format
+        pf.line_spacing_rule = line_spacing
+        pf.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        pf.space_after = Pt(0)
+        pf.space_before = Pt(0)
+
+        for name in BODY_STYLES:
+            if name in styles:
+                style = paragraph_style(styles, name)
+                style.font.name = body_font
+                style.font.size = Pt(body_size)
+
+        # Headings
+        # Heading 1: Centered, Bold, Uppercase (handled in text)
+        if "Heading 1" in styles:
+            h1 = paragraph_style(styles, "Heading 1")
+            h1.font.name = body_font
+            h1.font.size = Pt(body_size)
+            h1.font.bold = True
+            h1.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            h1.paragraph_format.space_before = Pt(12)  # Space before title
+            h1.paragraph_format.space_after = Pt(12)
@@ -0,0 +1,5 @@
+"""IEEE 8th Edition formatter module."""
+
+from .ieee_formatter import IEEEDocxFormatter
+
+__all__ = ["IEEEDocxFormatter"]
@@ -0,0 +1,123 @@
+"""
+IEEE 8th Edition formatter for academic documents.
+
+Applies IEEE formatting standards to DOCX files.
+"""
+
+from typing import Any
+
+from docx.document import Document as DocumentObject
+
+from ...models import DocumentMetadata
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_package import DocxSource, DocxTarget, save_document
+from ..base import DocumentFormatter
+from ..images import downsample_images
+from ..rules import RuleEngine
+from .ieee_page import IEEEPageHandler
+from .ieee_styles import IEEEStylesHandler
+
+
+class IEEEDocxFormatter(DocumentFormatter):
+    """
+    Applies IEEE 8th Edition formatting to a DOCX file.
+
+    IEEE 8th Edition requirements:
+    - Times New Roman 10pt for body text
+    - Single spacing throughout
+    - 1 inch margins on all sides
+    - Page numbers in header, top right
+    - Centered, bold headings (Level 1)
+    - Tables with full borders
+    - Figures: "Fig." caption prefix
+    """
+
+    def __init__(
+        self,
+        doc_path: DocxSource,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize IEEE formatter.
+
+        Args:
+            doc_path: Path, bytes, binary stream or open Document to format.
+            config: Optional configuration dictionary to override defaults.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        super().__init__(doc_path, config)
+        self.standard = standard if standard is not None else compiled_standard(self.config, "ieee")
+        self._init_handlers(self.doc)
+
+    def _init_handlers(self, doc: DocumentObject) -> None:
+        """Create the handlers for ``doc`` with the formatter config."""
+        self._page = IEEEPageHandler(doc, self.config, self.standard)
+        self._styles = IEEEStylesHandler(doc, self.config, self.standard)
+        self._body = RuleEngine(doc, self.config, self.standard)
+
+    def process(self, meta: DocumentMetadata) -> None:
+        """Run the IEEE formatting pipeline."""
+        self._page.setup_page_layout()
+        self._setup_headers()
+        self._styles.create_styles()
+        self._body.apply()
+        downsample_images(self.doc, self.standard.figures)
+
+    def save(
+        self,
+        output_path: DocxTarget,
+        *,
+        optimize: bool = False,
+        compression_level: int | None = None,
+    ) -> None:
+        """Save the formatted document.
+
+        Args:
+            output_path: Path or writable binary stream to save the DOCX to.
+            optimize: Whether to shrink the package (see ``optimize_package``).
+            compression_level: Deflate level from 0 to 9; None keeps the
+                default unless ``optimize`` is set.
+        """
+        save_document(self.doc, output_path, optimize=optimize, compression_level=compression_level)
+
+    # ─────────────────── Delegate methods for backward compatibility ───────────────────
+
+    def _get_margins(self) -> dict[str, float | str]:
+        """Get margins from config with IEEE defaults (1 inch all sides)."""
+        return self._page.get_margins()
+
+    def _get_font_name(self, key: str = "body") -> str:
+        """Get font name from config."""
+        return self._styles.get_font_name(key)
+
+    def _get_font_size(self, key: str = "body") -> float:
+        """Get font size from config (IEEE default is 10pt)."""
+        return self._styles.get_font_size(key)
+
+    def _get_spacing_line(self) -> str:
+        """Get line spacing from config (IEEE default is single)."""
+        return self._styles.get_spacing_line()
+
+    def _setup_page_layout(self) -> None:
+        """Set 1 inch margins on all sides."""
+        self._page.setup_page_layout()
+
+    def _setup_headers(self) -> None:
+        """Add page numbers in header, top right."""
+        self._page.setup_headers(self._get_font_name(), self._get_font_size())
+
+    def _create_styles(self) -> None:
+        """Apply IEEE text styles: Times New Roman 10pt, single spacing."""
+        self._styles.create_styles()
+
+    def _format_paragraphs(self) -> None:
+        """Format paragraphs: justify text, single spacing."""
+        self._body.apply(frozenset(("paragraphs",)))
+
+    def _format_tables(self) -> None:
+        """Format tables with full borders."""
+        self._body.apply(frozenset(("tables",)))
+
+    def _format_figures(self) -> None:
+        """Format figure captions: centered, italic."""
+        self._body.apply(frozenset(("figures",)))
@@ -0,0 +1,87 @@
+"""IEEE page layout: margins and the page-number header."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt
+
+from ...standards.compiled import StandardConfig, compiled_standard
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+
+class IEEEPageHandler:
+    """Handles IEEE page layout: 1 inch margins and page numbers top right."""
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize IEEEPageHandler.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "ieee")
+
+    def get_margins(self) -> dict[str, float | str]:
+        """Get margins from config with IEEE defaults (1 inch all sides)."""
+        margins = self.standard.margins
+        return {
+            "top": margins.top,
+            "bottom": margins.bottom,
+            "left": margins.left,
+            "right": margins.right,
+            "unit": margins.unit,
+        }
+
+    def setup_page_layout(self) -> None:
+        """Set 1 inch margins on all sides."""
+        margins = self.standard.margins
+        for section in self.doc.sections:
+            section.top_margin = margins.top_emu
+            section.bottom_margin = margins.bottom_emu
+            section.left_margin = margins.left_emu
+            section.right_margin = margins.right_emu
+
+    def setup_headers(self, font_name: str, font_size: float) -> None:
+        """Add page numbers in header, top right.
+
+        Args:
+            font_name: Font of the page-number run.
+            font_size: Size in points of the page-number run.
+        """
+        for section in self.doc.sections:
+            header = section.header
+            header.is_linked_to_previous = False
+            header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
+            header_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+            run = header_para.add_run()
+
+            fld_char1 = OxmlElement("w:fldChar")
+            fld_char1.set(qn("w:fldCharType"), "begin")
+            run._r.append(fld_char1)
+
+            instr_text = OxmlElement("w:instrText")
+            instr_text.set(qn("xml:space"), "preserve")
+            instr_text.text = "PAGE"
+            run._r.append(instr_text)
+
+            fld_char2 = OxmlElement("w:fldChar")
+            fld_char2.set(qn("w:fldCharType"), "end")
+            run._r.append(fld_char2)
+
+            run.font.name = font_name
+            run.font.size = Pt(font_size)
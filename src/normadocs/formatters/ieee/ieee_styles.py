@@ -0,0 +1,96 @@
+"""IEEE text styles: Times New Roman 10pt, single spacing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.shared import Pt, RGBColor
+
+from ...standards.compiled import StandardConfig, compiled_standard
+from ...utils.docx_helpers import paragraph_style, set_default_run_font
+from ..styles import BODY_STYLES
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+
+class IEEEStylesHandler:
+    """Handles IEEE document styles.
+
+    Fonts are set once on the document defaults and on the paragraph styles
+    instead of on every run, so body runs inherit them.
+    """
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize IEEEStylesHandler.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+        self.standard = standard if standard is not None else compiled_standard(self.config, "ieee")
+
+    def get_font_name(self, key: str = "body") -> str:
+        """Get font name from config."""
+        return self.standard.font(key).name
+
+    def get_font_size(self, key: str = "body") -> float:
+        """Get font size from config (IEEE default is 10pt)."""
+        return self.standard.font(key).size
+
+    def get_spacing_line(self) -> str:
+        """Get line spacing from config (IEEE default is single)."""
+        return str(self.standard.spacing.line)
+
+    def create_styles(self) -> None:
+        """Apply IEEE text styles: Times New Roman 10pt, single spacing."""
+        styles = self.doc.styles
+        body_font = self.get_font_name()
+        body_size = self.get_font_size()
+        line_spacing = WD_LINE_SPACING.SINGLE
+
+        set_default_run_font(styles, body_font, body_size)
+
+        normal = paragraph_style(styles, "Normal")
+        normal.font.name = body_font
+        normal.font.size = Pt(body_size)
+        normal.font.color.rgb = RGBColor(0, 0, 0)
+        normal.paragraph_format.line_spacing_rule = line_spacing
+        normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        normal.paragraph_format.space_after = Pt(0)
+        normal.paragraph_format.space_before = Pt(0)
+
+        for name in BODY_STYLES:
+            if name in styles:
+                style = paragraph_style(styles, name)
+                style.font.name = body_font
+                style.font.size = Pt(body_size)
+
+        if "Heading 1" in styles:
+            h1 = paragraph_style(styles, "Heading 1")
+            h1.font.name = body_font
+            h1.font.size = Pt(body_size)
+            h1.font.bold = True
+            h1.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            h1.paragraph_format.space_before = Pt(12)
+            h1.paragraph_format.space_after = Pt(12)
+            h1.paragraph_format.line_spacing_rule = line_spacing
+
+        if "Heading 2" in styles:
+            h2 = paragraph_style(styles, "Heading 2")
+            h2.font.name = body_font
+            h2.font.size = Pt(body_size)
+            h2.font.bold = True
+            h2.font.italic = True
+            h2.paragraph_format.space_before = Pt(12)
+            h2.paragraph_format.space_after = Pt(6)
+            h2.paragraph_format.line_spacing_rule = line_spacing
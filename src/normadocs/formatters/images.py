@@ -0,0 +1,220 @@
+"""Resampling of embedded figure images to their displayed size.
+
+Pandoc embeds images with their original pixels, so a 40 MP phone photo
+shown 6 inches wide is decoded in full by every DOCX/PDF consumer. This
+module resamples each JPEG/PNG media part to ``image_dpi`` pixels per inch
+of the largest extent it is displayed at, re-encoding JPEGs at
+``jpeg_quality`` and optimizing PNGs. Images are processed in a thread
+pool (Pillow releases the GIL while decoding and resizing), and results
+are cached per process by image hash, target size and quality, up to
+64 MiB of re-encoded data. Images Pillow cannot decode (SVG, EMF, corrupt
+or oversized data) are left untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import docx
+from docx.oxml.ns import qn
+from PIL import Image, UnidentifiedImageError
+
+from ..standards.compiled import FigureSpec
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+    from docx.parts.image import ImagePart
+
+__all__ = ["clear_image_cache", "downsample_images", "resample_image"]
+
+logger = logging.getLogger("normadocs")
+
+EMU_PER_INCH = 914400
+# Upper bound on the re-encoded image data kept by the resampling cache.
+_RESAMPLE_CACHE_BYTES = 64 * 1024 * 1024
+
+_FORMATS = ("JPEG", "PNG")
+_EXTENT_PARENTS = (qn("wp:inline"), qn("wp:anchor"))
+# ImagePart has no public way to replace its data; _replace_blob writes the
+# private fields python-docx 1.x reads on save and for the image header.
+_DOCX_MAJOR_WITH_BLOB_FIELDS = 1
+
+
+class _BlobCache:
+    """A thread-safe LRU cache of resampling results bounded by total bytes.
+
+    A None result ("keep the original") costs nothing, so unchanged images
+    stay cached however large they are.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Hashable, bytes | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], bytes | None]) -> bytes | None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = factory()
+        cost = len(value) if value is not None else 0
+        with self._lock:
+            if key in self._entries or cost > self.max_bytes:
+                return value
+            self._entries[key] = value
+            self.size += cost
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted) if evicted is not None else 0
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Resampled blobs (None: keep the original) keyed by
+# (sha256 of the original, width, height, jpeg_quality).
+_RESAMPLED = _BlobCache(_RESAMPLE_CACHE_BYTES)
+
+
+def clear_image_cache() -> None:
+    """Drop every cached resampling result."""
+    _RESAMPLED.clear()
+
+
+def resample_image(blob: bytes, width: int, height: int, jpeg_quality: int = 90) -> bytes | None:
+    """Downsample a JPEG or PNG so it covers ``width`` x ``height`` pixels.
+
+    The aspect ratio is kept, so the result is at least as large as the
+    target in both dimensions.
+
+    Args:
+        blob: The encoded image.
+        width: Minimum width in pixels.
+        height: Minimum height in pixels.
+        jpeg_quality: Encoder quality for JPEG images (1-95).
+
+    Returns:
+        The re-encoded image, or None if the image is not JPEG/PNG, cannot
+        be decoded, is already small enough, or re-encoding would not make
+        it smaller.
+    """
+    try:
+        with Image.open(io.BytesIO(blob)) as image:
+            if image.format not in _FORMATS:
+                return None
+            scale = max(width / image.width, height / image.height)
+            if scale >= 1:
+                return None
+            size = (
+                max(1, math.ceil(image.width * scale)),
+                max(1, math.ceil(image.height * scale)),
+            )
+            image_format = image.format
+            info = image.info
+            # JPEG decoders can scale by 1/2..1/8 while decoding (never below size).
+            image.draft(image.mode, size)
+            source = image.convert("RGBA") if image.mode in ("P", "1", "LA") else image
+            resized = source.resize(size, Image.Resampling.LANCZOS)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        logger.debug("Image left as is, Pillow cannot decode it: %s", e)
+        return None
+
+    out = io.BytesIO()
+    options: dict[str, object] = {"optimize": True}
+    for key in ("icc_profile", "exif"):
+        if info.get(key):
+            options[key] = info[key]
+    if image_format == "JPEG":
+        resized.save(out, "JPEG", quality=jpeg_quality, **options)
+    else:
+        resized.save(out, "PNG", **options)
+    data = out.getvalue()
+    return data if len(data) < len(blob) else None
+
+
+def _cached_resample(part: ImagePart, size: tuple[int, int], jpeg_quality: int) -> bytes | None:
+    blob = part.blob
+    key = (hashlib.sha256(blob).digest(), *size, jpeg_quality)
+    return _RESAMPLED.get_or_create(key, lambda: resample_image(blob, *size, jpeg_quality))
+
+
+def _replace_blob(part: ImagePart, blob: bytes) -> bool:
+    """Swap the data of an image part; returns False if python-docx cannot."""
+    major = int(docx.__version__.split(".", 1)[0])
+    if major != _DOCX_MAJOR_WITH_BLOB_FIELDS or not hasattr(part, "_image"):
+        logger.warning("Images not resampled: unsupported python-docx %s", docx.__version__)
+        return False
+    # The blob is what save() writes; the cached header (pixel size, DPI) is
+    # rebuilt from it on the next access.
+    part._blob = blob
+    part._image = None
+    return True
+
+
+def _displayed_sizes(doc: DocType, dpi: int) -> dict[ImagePart, tuple[int, int]]:
+    """Map each body image part to the pixels its largest display needs."""
+    sizes: dict[ImagePart, tuple[int, int]] = {}
+    for blip in doc.element.body.iter(qn("a:blip")):
+        r_id = blip.get(qn("r:embed"))
+        drawing = next((a for a in blip.iterancestors(*_EXTENT_PARENTS)), None)
+        extent = drawing.find(qn("wp:extent")) if drawing is not None else None
+        if not r_id or extent is None or r_id not in doc.part.related_parts:
+            continue
+        cx, cy = int(extent.get("cx", 0)), int(extent.get("cy", 0))
+        if cx <= 0 or cy <= 0:
+            continue
+        part = doc.part.related_parts[r_id]
+        width = math.ceil(cx / EMU_PER_INCH * dpi)
+        height = math.ceil(cy / EMU_PER_INCH * dpi)
+        seen = sizes.get(part, (0, 0))
+        sizes[part] = (max(seen[0], width), max(seen[1], height))
+    return sizes
+
+
+def downsample_images(doc: DocType, figures: FigureSpec, max_workers: int | None = None) -> int:
+    """Resample the document's images to ``figures.image_dpi`` at their final extent.
+
+    Call this after the figure extents are final (e.g. after scaling
+    oversized figures to the page).
+
+    Args:
+        doc: The python-docx Document object.
+        figures: Figure settings providing ``image_dpi`` and ``jpeg_quality``.
+        max_workers: Thread pool size; None uses the executor default.
+
+    Returns:
+        The number of media parts that were replaced.
+    """
+    if figures.image_dpi <= 0:
+        return 0
+    sizes = _displayed_sizes(doc, figures.image_dpi)
+    if not sizes:
+        return 0
+    parts = list(sizes)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(
+            pool.map(lambda part: _cached_resample(part, sizes[part], figures.jpeg_quality), parts)
+        )
+    replaced = 0
+    for part, blob in zip(parts, results, strict=True):
+        if blob is not None:
+            if not _replace_blob(part, blob):
+                break
+            replaced += 1
+    return replaced
@@ -0,0 +1,201 @@
+"""Single-traversal engine for a standard's declarative body rules.
+
+The rules of a :class:`~normadocs.standards.StandardConfig` are compiled
+into one dispatch table keyed by (rule groups, style name, roles): the
+first element with a given key resolves the matching rules, merges their
+properties and compiles them into a tuple of setters; every later element
+with that key reuses the setters. All rules are applied during a single
+:class:`~normadocs.formatters.visitor.BodyVisitor` walk, however many
+rules or groups a standard declares.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+
+from ..standards.compiled import StandardConfig, compiled_standard
+from ..standards.rules import RuleProperties
+from .visitor import BodyVisitor
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+ParagraphAction = Callable[["Paragraph"], None]
+
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+_LINE_RULES = {
+    1.0: WD_LINE_SPACING.SINGLE,
+    1.5: WD_LINE_SPACING.ONE_POINT_FIVE,
+    2.0: WD_LINE_SPACING.DOUBLE,
+}
+
+_HEADING = frozenset(("paragraph", "heading"))
+_BODY = frozenset(("paragraph", "body"))
+_CAPTION = frozenset(("paragraph", "body", "caption"))
+_CELL = frozenset(("table_cell",))
+_TABLE = frozenset(("table",))
+
+
+def compile_actions(properties: RuleProperties) -> tuple[ParagraphAction, ...]:
+    """Compile merged rule properties into paragraph setters.
+
+    Args:
+        properties: The merged properties of every rule matching an element.
+
+    Returns:
+        One setter per property that is set, in a fixed order.
+    """
+    actions: list[ParagraphAction] = []
+    if properties.alignment is not None:
+        alignment = _ALIGNMENTS[properties.alignment]
+
+        def set_alignment(p: Paragraph) -> None:
+            p.paragraph_format.alignment = alignment
+
+        actions.append(set_alignment)
+    if properties.line_spacing is not None:
+        multiple = properties.line_spacing
+        line_rule = _LINE_RULES.get(multiple)
+
+        def set_line_spacing(p: Paragraph) -> None:
+            if line_rule is not None:
+                p.paragraph_format.line_spacing_rule = line_rule
+            else:
+                p.paragraph_format.line_spacing = multiple
+
+        actions.append(set_line_spacing)
+    for name in ("space_before", "space_after", "first_line_indent", "left_indent"):
+        length = getattr(properties, name)
+        if length is not None:
+            actions.append(_length_setter(name, length))
+    if properties.bold is not None or properties.italic is not None:
+        bold, italic = properties.bold, properties.italic
+
+        def set_runs(p: Paragraph) -> None:
+            for run in p.runs:
+                if bold is not None:
+                    run.bold = bold
+                if italic is not None:
+                    run.italic = italic
+
+        actions.append(set_runs)
+    return tuple(actions)
+
+
+def _length_setter(name: str, length: Any) -> ParagraphAction:
+    def set_length(p: Paragraph) -> None:
+        setattr(p.paragraph_format, name, length)
+
+    return set_length
+
+
+class RuleEngine(BodyVisitor):
+    """Applies a standard's declarative rules in one body traversal.
+
+    Args:
+        doc: The python-docx Document object.
+        config: Optional configuration dictionary.
+        standard: Compiled standard whose ``rules`` are applied.
+    """
+
+    def __init__(
+        self,
+        doc: DocType,
+        config: dict[str, Any] | None = None,
+        standard: StandardConfig | None = None,
+    ) -> None:
+        """Initialize RuleEngine.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+            standard: Compiled standard; compiled from ``config`` if omitted.
+        """
+        super().__init__(doc, config)
+        self.standard = standard if standard is not None else compiled_standard(self.config)
+        self.rules = self.standard.rules
+        self._caption_prefix = self.standard.figures.caption_prefix
+        self._detect_captions = any("caption" in rule.roles for rule in self.rules)
+        self._groups: frozenset[str] | None = None
+        self._dispatch: dict[
+            tuple[frozenset[str] | None, str, frozenset[str]], tuple[ParagraphAction, ...]
+        ] = {}
+        self._table_styles: dict[frozenset[str] | None, str | None] = {}
+
+    @property
+    def groups(self) -> frozenset[str]:
+        """The rule group names declared by the standard."""
+        return frozenset(rule.name for rule in self.rules)
+
+    def apply(self, groups: frozenset[str] | None = None) -> None:
+        """Apply the rules (optionally only the named groups) in one walk.
+
+        Args:
+            groups: Rule names to apply; None applies every rule.
+        """
+        if not self.rules:
+            return
+        self._groups = groups
+        try:
+            self.walk()
+        finally:
+            self._groups = None
+
+    def _merged(self, roles: frozenset[str], style_name: str) -> RuleProperties:
+        merged = RuleProperties()
+        for rule in self.rules:
+            if self._groups is not None and rule.name not in self._groups:
+                continue
+            if rule.matches(roles, style_name):
+                merged = merged.merged(rule.properties)
+        return merged
+
+    def _actions(self, roles: frozenset[str], style_name: str) -> tuple[ParagraphAction, ...]:
+        key = (self._groups, style_name, roles)
+        actions = self._dispatch.get(key)
+        if actions is None:
+            actions = compile_actions(self._merged(roles, style_name))
+            self._dispatch[key] = actions
+        return actions
+
+    def _roles(self, paragraph: Paragraph, style_name: str) -> frozenset[str]:
+        if style_name.startswith("Heading") or style_name == "Title":
+            return _HEADING
+        if self._detect_captions:
+            text = paragraph.text.strip()
+            if text.startswith(self._caption_prefix) and "." in text:
+                return _CAPTION
+        return _BODY
+
+    def visit_paragraph(self, paragraph: Paragraph, style_name: str) -> None:
+        """Apply the actions of a top-level paragraph's roles and style."""
+        for action in self._actions(self._roles(paragraph, style_name), style_name):
+            action(paragraph)
+
+    def visit_table(self, table: Table) -> None:
+        """Apply the table style selected by ``role: table`` rules."""
+        if self._groups not in self._table_styles:
+            self._table_styles[self._groups] = self._merged(_TABLE, "").table_style
+        name = self._table_styles[self._groups]
+        if name is not None and name in self.doc.styles:
+            # The python-docx stub types Table.style as _TableStyle only;
+            # the runtime setter also accepts the looked-up style object.
+            table.style = cast(Any, self.doc.styles[name])
+
+    def visit_cell_paragraph(self, paragraph: Paragraph, style_name: str) -> None:
+        """Apply the actions of ``role: table_cell`` rules."""
+        for action in self._actions(_CELL, style_name):
+            action(paragraph)
+
+
+__all__ = ["RuleEngine", "compile_actions"]
@@ -0,0 +1,6 @@
+"""Paragraph style names shared by the formatters."""
+
+# Pandoc paragraph styles that carry body text and must inherit the body font.
+BODY_STYLES = ("Body Text", "First Paragraph", "Compact", "Image Caption", "Table Caption")
+
+__all__ = ["BODY_STYLES"]
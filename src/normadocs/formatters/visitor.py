@@ -0,0 +1,121 @@
+"""Single-traversal body visitor shared by the formatters.
+
+Formatters that apply several independent rules to body paragraphs (fonts,
+alignment, captions, table cells) subclass :class:`BodyVisitor` and walk
+the document once, instead of running one ``doc.paragraphs`` loop per rule.
+Paragraph style names are resolved through a per-document lookup table,
+avoiding python-docx's per-call scan of the style table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocType
+
+_W_P = qn("w:p")
+_W_TBL = qn("w:tbl")
+
+
+class StyleNames:
+    """Resolve paragraph style names with one lookup table per document.
+
+    Args:
+        doc: The python-docx Document whose styles are resolved.
+    """
+
+    def __init__(self, doc: DocType) -> None:
+        """Initialize StyleNames.
+
+        Args:
+            doc: The python-docx Document object.
+        """
+        self._by_id: dict[str, str] = {}
+        self._default = ""
+        for style in doc.styles:
+            if style.type != WD_STYLE_TYPE.PARAGRAPH:
+                continue
+            name = style.name or ""
+            self._by_id[style.style_id] = name
+            if style.element.default:
+                self._default = name
+
+    def of(self, paragraph: Paragraph) -> str:
+        """Return the paragraph's style UI name ("" when unresolvable)."""
+        style_id = paragraph._p.style
+        if style_id is None:
+            return self._default
+        return self._by_id.get(style_id, self._default)
+
+
+def iter_body_blocks(doc: DocType) -> Iterator[Paragraph | Table]:
+    """Yield the top-level paragraphs and tables of the body in order.
+
+    The blocks are listed up front, like ``doc.paragraphs``, so callers may
+    remove or merge blocks while iterating; blocks removed before their turn
+    are skipped.
+    """
+    body = doc.element.body
+    parent: Any = doc._body
+    for child in list(body.iterchildren()):
+        if child.getparent() is not body:
+            continue
+        if child.tag == _W_P:
+            yield Paragraph(child, parent)
+        elif child.tag == _W_TBL:
+            yield Table(child, parent)
+
+
+class BodyVisitor:
+    """Walk every body paragraph and table cell in a single traversal.
+
+    Subclasses override the ``visit_*`` hooks they need; the defaults do
+    nothing. Table cells are visited after ``visit_table`` for their table.
+
+    Args:
+        doc: The python-docx Document object.
+        config: Optional configuration dictionary.
+    """
+
+    def __init__(self, doc: DocType, config: dict[str, Any] | None = None) -> None:
+        """Initialize BodyVisitor.
+
+        Args:
+            doc: The python-docx Document object.
+            config: Optional configuration dictionary.
+        """
+        self.doc = doc
+        self.config = config if config is not None else {}
+
+    def walk(self) -> None:
+        """Visit the whole body once, in document order."""
+        names = StyleNames(self.doc)
+        for block in iter_body_blocks(self.doc):
+            if isinstance(block, Paragraph):
+                self.visit_paragraph(block, names.of(block))
+                continue
+            self.visit_table(block)
+            # Iterating the XML visits each cell paragraph once, even when
+            # merged cells make ``row.cells`` repeat the same cell.
+            for p_el in block._tbl.iter(_W_P):
+                p = Paragraph(p_el, block)
+                self.visit_cell_paragraph(p, names.of(p))
+
+    def visit_paragraph(self, paragraph: Paragraph, style_name: str) -> None:
+        """Handle one top-level body paragraph."""
+
+    def visit_table(self, table: Table) -> None:
+        """Handle one top-level table before its cells are visited."""
+
+    def visit_cell_paragraph(self, paragraph: Paragraph, style_name: str) -> None:
+        """Handle one paragraph inside a table cell."""
+
+
+__all__ = ["BodyVisitor", "StyleNames", "iter_body_blocks"]
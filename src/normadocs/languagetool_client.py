@@ -2,6 +2,7 @@
 LanguageTool client for grammar and spell checking.
 """
 
+import asyncio
 import ipaddress
 import time
 from dataclasses import dataclass
@@ -159,6 +160,18 @@ class LanguageToolClient:
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"LanguageTool request failed: {e}") from e
 
+    async def check_async(self, text: str) -> list[LanguageToolError]:
+        """
+        Non-blocking check(): the HTTP request runs in a worker thread.
+
+        Args:
+            text: The text to check.
+
+        Returns:
+            List of LanguageToolError objects.
+        """
+        return await asyncio.to_thread(self.check, text)
+
     def _parse_errors(self, data: dict[str, Any]) -> list[LanguageToolError]:
         """Parse LanguageTool API response into LanguageToolError objects."""
         errors: list[LanguageToolError] = []
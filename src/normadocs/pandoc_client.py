@@ -2,11 +2,18 @@
 Module for running Pandoc conversions.
 """
 
-import sys
+import logging
 import tempfile
 from pathlib import Path
 
-from .utils.subprocess import CommandFailedError, get_command_path, run_command
+from .utils.subprocess import (
+    CommandFailedError,
+    get_command_path,
+    run_command,
+    run_command_async,
+)
+
+logger = logging.getLogger("normadocs")
 
 
 class PandocRunner:
@@ -20,6 +27,47 @@ class PandocRunner:
         """
         self.pandoc_path = pandoc_path
 
+    def _resolve_path(self) -> str | None:
+        """Return the Pandoc executable, or None (logged) if it is missing."""
+        if "/" in self.pandoc_path:
+            return self.pandoc_path
+        try:
+            return get_command_path(self.pandoc_path)
+        except FileNotFoundError:
+            logger.error("  ✗ Error: Pandoc no encontrado en el sistema.")
+            return None
+
+    @staticmethod
+    def _command(
+        resolved_path: str,
+        output_path: Path,
+        bibliography: str | None,
+        csl: str | None,
+        resource_path: str | None,
+    ) -> list[str]:
+        """Build the Pandoc command; without an input file Pandoc reads stdin."""
+        cmd = [
+            resolved_path,
+            "-f",
+            "markdown+raw_attribute",
+            "-t",
+            "docx",
+            "-o",
+            str(output_path.absolute()),
+            "--standalone",
+        ]
+
+        if resource_path:
+            cmd.extend([f"--resource-path={resource_path}"])
+
+        if bibliography:
+            cmd.extend([f"--bibliography={bibliography}", "--citeproc"])
+
+        if csl:
+            cmd.extend([f"--csl={csl}"])
+
+        return cmd
+
     def run(
         self,
         md_text: str,
@@ -44,14 +92,9 @@ class PandocRunner:
             FileNotFoundError: If Pandoc executable is not found.
             CommandFailedError: If Pandoc returns a non-zero exit code.
         """
-        if "/" in self.pandoc_path:
-            resolved_path = self.pandoc_path
-        else:
-            try:
-                resolved_path = get_command_path(self.pandoc_path)
-            except FileNotFoundError:
-                print("  ✗ Error: Pandoc no encontrado en el sistema.", file=sys.stderr)
-                return False
+        resolved_path = self._resolve_path()
+        if resolved_path is None:
+            return False
 
         path_obj = Path(output_path)
 
@@ -61,28 +104,10 @@ class PandocRunner:
             tmp.write(md_text)
             tmp_path = tmp.name
 
-        cmd = [
-            resolved_path,
-            tmp_path,
-            "-f",
-            "markdown+raw_attribute",
-            "-t",
-            "docx",
-            "-o",
-            str(path_obj.absolute()),
-            "--standalone",
-        ]
-
-        if resource_path:
-            cmd.extend([f"--resource-path={resource_path}"])
-
-        if bibliography:
-            cmd.extend([f"--bibliography={bibliography}", "--citeproc"])
-
-        if csl:
-            cmd.extend([f"--csl={csl}"])
+        cmd = self._command(resolved_path, path_obj, bibliography, csl, resource_path)
+        cmd.insert(1, tmp_path)
 
-        print(f"  ▸ Ejecutando Pandoc -> {path_obj.name}")
+        logger.info("  ▸ Ejecutando Pandoc -> %s", path_obj.name)
 
         try:
             run_command(cmd)
@@ -90,11 +115,54 @@ class PandocRunner:
             return True
 
         except CommandFailedError as e:
-            print(f"  ✗ Error de Pandoc:\n{e.stderr}", file=sys.stderr)
+            logger.error("  ✗ Error de Pandoc:\n%s", e.stderr)
             Path(tmp_path).unlink(missing_ok=True)
             return False
 
         except FileNotFoundError:
-            print("  ✗ Error: Pandoc no encontrado en el sistema.", file=sys.stderr)
+            logger.error("  ✗ Error: Pandoc no encontrado en el sistema.")
             Path(tmp_path).unlink(missing_ok=True)
             return False
+
+    async def run_async(
+        self,
+        md_text: str,
+        output_path: str,
+        bibliography: str | None = None,
+        csl: str | None = None,
+        resource_path: str | None = None,
+    ) -> bool:
+        """Convert Markdown to DOCX without blocking the event loop.
+
+        Same as run(), but Pandoc is started as an asyncio subprocess and
+        reads the Markdown from stdin (no temporary file).
+
+        Args:
+            md_text: The Markdown content to convert.
+            output_path: Path for the output DOCX file.
+            bibliography: Optional BibTeX file for citations.
+            csl: Optional CSL style file for citation formatting.
+            resource_path: Optional path for image resources.
+
+        Returns:
+            True if conversion succeeded, False otherwise.
+        """
+        resolved_path = self._resolve_path()
+        if resolved_path is None:
+            return False
+
+        path_obj = Path(output_path)
+        cmd = self._command(resolved_path, path_obj, bibliography, csl, resource_path)
+        logger.info("  ▸ Ejecutando Pandoc -> %s", path_obj.name)
+
+        try:
+            await run_command_async(cmd, input_data=md_text)
+            return True
+
+        except CommandFailedError as e:
+            logger.error("  ✗ Error de Pandoc:\n%s", e.stderr)
+            return False
+
+        except FileNotFoundError:
+            logger.error("  ✗ Error: Pandoc no encontrado en el sistema.")
+            return False
@@ -2,16 +2,30 @@
 Module for generating PDFs from DOCX or Markdown.
 """
 
-import sys
+import logging
+from pathlib import Path
 
-from .utils.subprocess import CommandFailedError, get_command_path, run_command
+from .utils.subprocess import (
+    CommandFailedError,
+    get_command_path,
+    run_command,
+    run_command_async,
+)
+
+logger = logging.getLogger("normadocs")
 
 
 class PDFGenerator:
     """Handles conversion to PDF."""
 
     @staticmethod
-    def convert(docx_path: str, output_dir: str, md_content: str, output_path: str) -> bool:
+    def convert(
+        docx_path: str,
+        output_dir: str,
+        md_content: str,
+        output_path: str,
+        profile_dir: str | None = None,
+    ) -> bool:
         """Convert DOCX to PDF with automatic backend selection.
 
         Attempts conversion with LibreOffice first, falls back to WeasyPrint
@@ -22,21 +36,46 @@ class PDFGenerator:
             output_dir: Directory for the output PDF.
             md_content: Markdown content for styling reference.
             output_path: Path for the output PDF file.
+            profile_dir: Optional LibreOffice user profile directory.
 
         Returns:
             True if conversion succeeded, False otherwise.
         """
-        if PDFGenerator.convert_with_libreoffice(docx_path, output_dir):
+        if PDFGenerator.convert_with_libreoffice(docx_path, output_dir, profile_dir):
             return True
         return PDFGenerator.convert_with_weasyprint(md_content, output_path)
 
     @staticmethod
-    def convert_with_libreoffice(docx_path: str, output_dir: str) -> bool:
+    def _libreoffice_command(
+        libreoffice_path: str, docx_path: str, output_dir: str, profile_dir: str | None
+    ) -> list[str]:
+        cmd = [
+            libreoffice_path,
+            "--headless",
+            "--convert-to",
+            "pdf",
+            "--outdir",
+            str(output_dir),
+            str(docx_path),
+        ]
+        if profile_dir:
+            cmd.insert(1, f"-env:UserInstallation={Path(profile_dir).resolve().as_uri()}")
+        return cmd
+
+    @staticmethod
+    def convert_with_libreoffice(
+        docx_path: str, output_dir: str, profile_dir: str | None = None
+    ) -> bool:
         """Convert DOCX to PDF using LibreOffice.
 
+        Instances sharing a user profile hand their work to the first one
+        (or fail), so concurrent conversions need one ``profile_dir`` each.
+
         Args:
             docx_path: Path to the source DOCX file.
             output_dir: Directory for the output PDF.
+            profile_dir: Optional LibreOffice user profile directory
+                (defaults to the user's profile).
 
         Returns:
             True if conversion succeeded, False otherwise.
@@ -48,29 +87,23 @@ class PDFGenerator:
         try:
             libreoffice_path = get_command_path("libreoffice")
         except FileNotFoundError:
-            print("  ✗ LibreOffice no encontrado.", file=sys.stderr)
+            logger.error("  ✗ LibreOffice no encontrado.")
             return False
 
-        cmd = [
-            libreoffice_path,
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(output_dir),
-            str(docx_path),
-        ]
-        print("  ▸ Generando PDF con LibreOffice...")
+        cmd = PDFGenerator._libreoffice_command(
+            libreoffice_path, docx_path, output_dir, profile_dir
+        )
+        logger.info("  ▸ Generando PDF con LibreOffice...")
         try:
             run_command(cmd)
             return True
 
         except CommandFailedError as e:
-            print(f"  ✗ Error de LibreOffice:\n{e.stderr}", file=sys.stderr)
+            logger.error("  ✗ Error de LibreOffice:\n%s", e.stderr)
             return False
 
         except FileNotFoundError:
-            print("  ✗ LibreOffice no encontrado.", file=sys.stderr)
+            logger.error("  ✗ LibreOffice no encontrado.")
             return False
 
     @staticmethod
@@ -93,7 +126,7 @@ class PDFGenerator:
         try:
             from weasyprint import CSS, HTML
         except ImportError:
-            print("  ✗ WeasyPrint no instalado.")
+            logger.error("  ✗ WeasyPrint no instalado.")
             return False
 
         pandoc_path = get_command_path("pandoc")
@@ -120,9 +153,46 @@ class PDFGenerator:
             return False
 
         except FileNotFoundError:
-            print("  ✗ Pandoc no encontrado para WeasyPrint.", file=sys.stderr)
+            logger.error("  ✗ Pandoc no encontrado para WeasyPrint.")
             return False
 
         except Exception as e:
-            print(f"  ✗ Error en WeasyPrint: {e}")
+            logger.error("  ✗ Error en WeasyPrint: %s", e)
+            return False
+
+    @staticmethod
+    async def convert_with_libreoffice_async(
+        docx_path: str, output_dir: str, profile_dir: str | None = None
+    ) -> bool:
+        """Convert DOCX to PDF using LibreOffice without blocking the event loop.
+
+        Args:
+            docx_path: Path to the source DOCX file.
+            output_dir: Directory for the output PDF.
+            profile_dir: Optional LibreOffice user profile directory
+                (defaults to the user's profile).
+
+        Returns:
+            True if conversion succeeded, False otherwise.
+        """
+        try:
+            libreoffice_path = get_command_path("libreoffice")
+        except FileNotFoundError:
+            logger.error("  ✗ LibreOffice no encontrado.")
+            return False
+
+        cmd = PDFGenerator._libreoffice_command(
+            libreoffice_path, docx_path, output_dir, profile_dir
+        )
+        logger.info("  ▸ Generando PDF con LibreOffice...")
+        try:
+            await run_command_async(cmd)
+            return True
+
+        except CommandFailedError as e:
+            logger.error("  ✗ Error de LibreOffice:\n%s", e.stderr)
+            return False
+
+        except FileNotFoundError:
+            logger.error("  ✗ LibreOffice no encontrado.")
             return False
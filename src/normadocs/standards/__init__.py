@@ -1,20 +1,33 @@
 """Citation standards configuration module with YAML-based standards."""
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, cast
 
 import yaml
 
-from .schema import get_default_config, merge_with_defaults
-
-_STANDARDS_DIR = Path(__file__).parent
-
-
-def _load_yaml(name: str) -> dict[str, Any]:
-    """Load a YAML standard configuration file."""
-    path = _STANDARDS_DIR / f"{name}.yaml"
-    with open(path, encoding="utf-8") as f:
-        return cast(dict[str, Any], yaml.safe_load(f))
+from .cache import ConfigCache, freeze, override_digest, thaw
+from .compiled import (
+    InvalidStandardError,
+    StandardConfig,
+    clear_compiled_cache,
+    compile_config,
+    compiled_standard,
+)
+from .schema import (
+    DEFAULT_ICONTEC_CONFIG,
+    DEFAULT_IEEE_CONFIG,
+    YamlLoader,
+    deep_copy,
+    get_default_config,
+    load_standard_file,
+    merge_with_defaults,
+)
+
+# Parsed YAML files keyed by (path, mtime_ns), and resolved configurations
+# keyed by (path, mtime_ns, override digest). Both hold frozen values only.
+_PARSED: ConfigCache[Mapping[str, Any]] = ConfigCache()
+_RESOLVED: ConfigCache[tuple[Mapping[str, Any], StandardConfig]] = ConfigCache()
 
 
 def _get_style_key(style: str) -> str:
@@ -25,13 +38,19 @@ def _get_style_key(style: str) -> str:
     return style_lower
 
 
-APA7_CONFIG = _load_yaml("apa7")
-ICONTEC_CONFIG = _load_yaml("icontec")
-IEEE_CONFIG = _load_yaml("ieee")
+APA7_CONFIG = load_standard_file("apa7")
+ICONTEC_CONFIG = deep_copy(DEFAULT_ICONTEC_CONFIG)
+IEEE_CONFIG = deep_copy(DEFAULT_IEEE_CONFIG)
 
 
 class StandardLoader:
-    """Loads and validates citation standard configurations from YAML files."""
+    """Loads and validates citation standard configurations from YAML files.
+
+    Parsed files and resolved configurations are cached for the whole
+    process, keyed by file path and modification time (and by the override
+    digest for :meth:`resolve`), so editing a YAML file invalidates its
+    entries. Cached values are frozen; every call returns fresh dicts.
+    """
 
     def __init__(self, standards_dir: Path | None = None) -> None:
         """Initialize StandardLoader.
@@ -44,24 +63,96 @@ class StandardLoader:
             standards_dir = Path(__file__).parent
         self.standards_dir = standards_dir
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached parse, resolved and compiled configuration."""
+        _PARSED.clear()
+        _RESOLVED.clear()
+        clear_compiled_cache()
+
+    def _path(self, name: str) -> Path:
+        return self.standards_dir / f"{_get_style_key(name)}.yaml"
+
+    def _require(self, name: str) -> int:
+        """Return the mtime of the standard's file, raising if it does not exist."""
+        path = self._path(name)
+        mtime = self._mtime(path)
+        if mtime is None:
+            raise FileNotFoundError(f"Standard '{name}' not found at {path}")
+        return mtime
+
+    @staticmethod
+    def _mtime(path: Path) -> int | None:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _parsed(self, name: str) -> Mapping[str, Any]:
+        """Return the frozen, cached YAML of ``name``."""
+        path = self._path(name)
+        mtime = self._require(name)
+
+        def parse() -> Mapping[str, Any]:
+            with open(path, encoding="utf-8") as f:
+                return cast(Mapping[str, Any], freeze(yaml.load(f, Loader=YamlLoader) or {}))
+
+        return _PARSED.get_or_create((str(path), mtime), parse)
+
+    def resolve(
+        self, name: str, overrides: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], StandardConfig]:
+        """Resolve a standard (plus optional overrides) to a config and its compiled form.
+
+        Overrides are merged onto the style defaults. Without overrides the
+        YAML file is merged onto the defaults, or the defaults alone are used
+        when the style has no YAML file.
+
+        Args:
+            name: The standard name (e.g., "apa", "icontec").
+            overrides: Optional configuration overriding the defaults.
+
+        Returns:
+            A fresh configuration dict and the shared compiled configuration.
+
+        Raises:
+            InvalidStandardError: If the resolved configuration is invalid.
+        """
+        key = _get_style_key(name)
+        path = self._path(name)
+        mtime = self._mtime(path)
+
+        def build() -> tuple[Mapping[str, Any], StandardConfig]:
+            if overrides is not None:
+                merged = merge_with_defaults(overrides, key)
+            elif mtime is None:
+                merged = merge_with_defaults({}, key)
+            else:
+                merged = merge_with_defaults(thaw(self._parsed(name)), key)
+            return freeze(merged), compile_config(merged, key)
+
+        cache_key = (str(path), mtime, override_digest(overrides))
+        frozen, standard = _RESOLVED.get_or_create(cache_key, build)
+        return cast(dict[str, Any], thaw(frozen)), standard
+
     def load(self, name: str) -> dict[str, Any]:
         """Load a standard configuration by name, merged with defaults."""
-        key = _get_style_key(name)
-        path = self.standards_dir / f"{key}.yaml"
-        if not path.exists():
-            raise FileNotFoundError(f"Standard '{name}' not found at {path}")
-        with open(path, encoding="utf-8") as f:
-            yaml_config = cast(dict[str, Any], yaml.safe_load(f))
-        return merge_with_defaults(yaml_config, key)
+        self._require(name)
+        return self.resolve(name)[0]
+
+    def load_compiled(self, name: str) -> StandardConfig:
+        """Load a standard and compile it into a validated, immutable config.
+
+        Raises:
+            FileNotFoundError: If the standard does not exist.
+            InvalidStandardError: If the YAML contains invalid settings.
+        """
+        self._require(name)
+        return self.resolve(name)[1]
 
     def load_raw(self, name: str) -> dict[str, Any]:
         """Load raw YAML config without merging defaults."""
-        key = _get_style_key(name)
-        path = self.standards_dir / f"{key}.yaml"
-        if not path.exists():
-            raise FileNotFoundError(f"Standard '{name}' not found at {path}")
-        with open(path, encoding="utf-8") as f:
-            return cast(dict[str, Any], yaml.safe_load(f))
+        return cast(dict[str, Any], thaw(self._parsed(name)))
 
     def list_available(self) -> list[str]:
         """List all available standard names."""
@@ -77,7 +168,11 @@ __all__ = [
     "APA7_CONFIG",
     "ICONTEC_CONFIG",
     "IEEE_CONFIG",
+    "InvalidStandardError",
+    "StandardConfig",
     "StandardLoader",
+    "compile_config",
+    "compiled_standard",
     "get_default_config",
     "merge_with_defaults",
 ]
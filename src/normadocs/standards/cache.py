@@ -0,0 +1,110 @@
+"""Process-wide cache for parsed and resolved standard configurations.
+
+Entries are stored frozen (nested ``MappingProxyType`` and tuples) so that
+no caller can mutate a cached configuration; callers that need a mutable
+dictionary get a fresh copy from :func:`thaw`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Callable, Hashable, Mapping
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply immutable copy of a YAML-like value.
+
+    Args:
+        value: A dict/list/scalar tree as produced by YAML or JSON.
+
+    Returns:
+        The same tree with mappings as ``MappingProxyType`` and lists as tuples.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a fresh mutable copy of a value produced by :func:`freeze`.
+
+    Args:
+        value: A frozen tree.
+
+    Returns:
+        The same tree with plain dicts and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def override_digest(overrides: Mapping[str, Any] | None) -> str:
+    """Return a stable digest of an override dictionary ("" for no overrides).
+
+    Args:
+        overrides: The user overrides, or None.
+
+    Returns:
+        A hex digest that is equal for equal override trees.
+    """
+    if overrides is None:
+        return ""
+    canonical = json.dumps(overrides, sort_keys=True, default=repr, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ConfigCache(Generic[T]):
+    """A bounded, thread-safe cache of immutable entries.
+
+    The oldest entry is evicted once ``maxsize`` entries are stored. Values
+    must be immutable (frozen trees, frozen dataclasses) because they are
+    shared between all callers.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Initialize ConfigCache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+        """
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, T] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the entry for ``key``, building it with ``factory`` on a miss.
+
+        Args:
+            key: The cache key.
+            factory: Builds the entry; called outside the lock.
+
+        Returns:
+            The cached or newly built entry.
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        value = factory()
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                del self._entries[next(iter(self._entries))]
+            return self._entries.setdefault(key, value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,460 @@
+"""Compiled, immutable standard configurations.
+
+:func:`compile_config` validates a merged standard dictionary once and turns
+it into a tree of frozen, slotted dataclasses carrying the derived values the
+formatters need (margins as EMU lengths, paragraph spacing in twips, font
+sizes as ``Pt``). Handlers read plain attributes instead of walking nested
+dictionaries with defaults on every call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from docx.shared import Cm, Inches, Length, Pt
+
+from .cache import ConfigCache, override_digest
+from .rules import Rule, parse_rules
+from .schema import get_default_config, merge_with_defaults
+from .units import line_multiple
+
+MARGIN_UNITS = ("inches", "cm")
+ALIGNMENTS = ("left", "center", "right")
+
+
+class InvalidStandardError(ValueError):
+    """Raised when a standard configuration fails validation.
+
+    Attributes:
+        style: The standard that was being compiled.
+        problems: One message per invalid setting, as ``"section.key: reason"``.
+    """
+
+    def __init__(self, style: str, problems: list[str]) -> None:
+        """Initialize InvalidStandardError.
+
+        Args:
+            style: The standard that was being compiled.
+            problems: The validation messages.
+        """
+        self.style = style
+        self.problems = tuple(problems)
+        super().__init__(f"Invalid '{style}' standard: " + "; ".join(problems))
+
+
+@dataclass(frozen=True, slots=True)
+class FontSpec:
+    """A font name and size with its precomputed python-docx lengths."""
+
+    name: str
+    size: float
+    pt: Length
+    half_points: int
+
+
+@dataclass(frozen=True, slots=True)
+class MarginSpec:
+    """Page margins in their configured unit and as EMU lengths."""
+
+    unit: str
+    top: float
+    bottom: float
+    left: float
+    right: float
+    top_emu: Length
+    bottom_emu: Length
+    left_emu: Length
+    right_emu: Length
+
+
+@dataclass(frozen=True, slots=True)
+class SpacingSpec:
+    """Line and paragraph spacing.
+
+    ``line`` keeps the configured value (``"single"``, ``"double"`` or a
+    number); ``line_multiple`` is its numeric multiple of single spacing.
+    """
+
+    line: str | float
+    line_multiple: float
+    before: Length
+    after: Length
+    before_twips: int
+    after_twips: int
+
+
+@dataclass(frozen=True, slots=True)
+class TableSpec:
+    """Table borders and caption settings."""
+
+    borders: str
+    caption_prefix: str
+    caption_above: bool
+    note_suffix: str
+    vertical_align: str
+
+
+@dataclass(frozen=True, slots=True)
+class FigureSpec:
+    """Figure caption and embedded-image settings (``image_dpi`` 0 keeps pixels)."""
+
+    caption_prefix: str
+    caption_above: bool
+    title_above: bool
+    nota_prefix: str
+    image_dpi: int
+    jpeg_quality: int
+
+
+@dataclass(frozen=True, slots=True)
+class CitationSpec:
+    """In-text citation rules."""
+
+    et_al_min_authors: int
+    ampersand: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceSpec:
+    """Reference-list rules."""
+
+    sort: bool
+    italicize_journals: bool
+    locale: str
+
+
+@dataclass(frozen=True, slots=True)
+class BlockQuoteSpec:
+    """Block-quote threshold and indent."""
+
+    min_words: int
+    indent_inches: float
+    indent: Length
+
+
+@dataclass(frozen=True, slots=True)
+class RunningHeadSpec:
+    """Running-head settings."""
+
+    enabled: bool
+    max_length: int
+
+
+@dataclass(frozen=True, slots=True)
+class CoverSpec:
+    """Cover-page alignment of the title and author lines."""
+
+    title_align: str
+    author_align: str
+
+
+@dataclass(frozen=True, slots=True)
+class ForeignWordSpec:
+    """Terms italicized as foreign words, matched as whole words."""
+
+    terms: tuple[str, ...]
+    ignore_case: bool
+
+
+@dataclass(frozen=True, slots=True)
+class StandardConfig:
+    """A validated, immutable standard configuration.
+
+    Attributes:
+        style: The style key the configuration was compiled for.
+        fonts: Font specs by config key (``"body"``, ``"headings"``, ...).
+        default_font: The style's default body font, used for unknown keys.
+        rules: The declarative body rules (see :mod:`normadocs.standards.rules`).
+    """
+
+    style: str
+    name: str
+    citation_style: str
+    fonts: Mapping[str, FontSpec]
+    default_font: FontSpec
+    margins: MarginSpec
+    spacing: SpacingSpec
+    tables: TableSpec
+    figures: FigureSpec
+    citations: CitationSpec
+    references: ReferenceSpec
+    block_quote: BlockQuoteSpec
+    running_head: RunningHeadSpec
+    cover: CoverSpec
+    foreign_words: ForeignWordSpec
+    rules: tuple[Rule, ...] = ()
+
+    @property
+    def body_font(self) -> FontSpec:
+        """The body text font."""
+        return self.font("body")
+
+    def font(self, key: str = "body") -> FontSpec:
+        """Return the font spec for ``key``, or the style default if unset."""
+        return self.fonts.get(key, self.default_font)
+
+
+class _Section:
+    """Typed reads from one config section, recording validation problems."""
+
+    def __init__(self, config: Mapping[str, Any], name: str, problems: list[str]) -> None:
+        value = config.get(name, {})
+        if not isinstance(value, Mapping):
+            problems.append(f"{name}: expected a mapping, got {type(value).__name__}")
+            value = {}
+        self.values: Mapping[str, Any] = value
+        self.name = name
+        self.problems = problems
+
+    def child(self, key: str) -> _Section:
+        """Return the nested section ``key`` (reported as ``name.key``)."""
+        section = _Section(self.values, key, self.problems)
+        section.name = f"{self.name}.{key}"
+        return section
+
+    def _fail(self, key: str, reason: str) -> None:
+        self.problems.append(f"{self.name}.{key}: {reason}")
+
+    def text(self, key: str, default: str) -> str:
+        value = self.values.get(key, default)
+        if not isinstance(value, str) or not value.strip():
+            self._fail(key, f"expected a non-empty string, got {value!r}")
+            return default
+        return value
+
+    def flag(self, key: str, default: bool) -> bool:
+        value = self.values.get(key, default)
+        if not isinstance(value, bool):
+            self._fail(key, f"expected true or false, got {value!r}")
+            return default
+        return value
+
+    def number(self, key: str, default: float, *, positive: bool = False) -> float:
+        value = self.values.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            self._fail(key, f"expected a number, got {value!r}")
+            return default
+        if value < 0 or (positive and value == 0):
+            self._fail(key, f"must be {'positive' if positive else 'non-negative'}, got {value}")
+            return default
+        return value
+
+    def integer(
+        self, key: str, default: int, *, minimum: int = 0, maximum: int | None = None
+    ) -> int:
+        value = self.values.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            self._fail(key, f"expected an integer >= {minimum}, got {value!r}")
+            return default
+        if maximum is not None and value > maximum:
+            self._fail(key, f"expected an integer <= {maximum}, got {value!r}")
+            return default
+        return value
+
+    def strings(self, key: str, default: tuple[str, ...]) -> tuple[str, ...]:
+        value = self.values.get(key, list(default))
+        if not isinstance(value, list | tuple) or not all(
+            isinstance(item, str) and item.strip() for item in value
+        ):
+            self._fail(key, f"expected a list of non-empty strings, got {value!r}")
+            return default
+        return tuple(value)
+
+    def choice(self, key: str, default: str, choices: tuple[str, ...]) -> str:
+        value = self.values.get(key, default)
+        if value not in choices:
+            self._fail(key, f"expected one of {', '.join(choices)}, got {value!r}")
+            return default
+        return str(value)
+
+
+def _font(font: _Section, default: FontSpec) -> FontSpec:
+    name = font.text("name", default.name)
+    size = font.number("size", default.size, positive=True)
+    return FontSpec(name, size, Pt(size), round(size * 2))
+
+
+def _default_font(style: str) -> FontSpec:
+    body = get_default_config(style)["fonts"]["body"]
+    size = body["size"]
+    return FontSpec(body["name"], size, Pt(size), round(size * 2))
+
+
+def _margins(config: Mapping[str, Any], problems: list[str]) -> MarginSpec:
+    section = _Section(config, "margins", problems)
+    unit = section.choice("unit", "inches", MARGIN_UNITS)
+    to_length = Cm if unit == "cm" else Inches
+    top, bottom, left, right = (
+        section.number(side, 1.0) for side in ("top", "bottom", "left", "right")
+    )
+    return MarginSpec(
+        unit,
+        top,
+        bottom,
+        left,
+        right,
+        to_length(top),
+        to_length(bottom),
+        to_length(left),
+        to_length(right),
+    )
+
+
+def _spacing(config: Mapping[str, Any], problems: list[str]) -> SpacingSpec:
+    section = _Section(config, "spacing", problems)
+    line: str | float = section.values.get("line", "single")
+    multiple = line_multiple(line)
+    if multiple is None:
+        section._fail("line", f"expected single, double or a positive number, got {line!r}")
+        line, multiple = "single", 1.0
+    before = Pt(section.number("paragraph_before", 0))
+    after = Pt(section.number("paragraph_after", 0))
+    return SpacingSpec(line, multiple, before, after, before.twips, after.twips)
+
+
+def compile_config(config: Mapping[str, Any], style: str = "apa7") -> StandardConfig:
+    """Validate ``config`` and compile it into an immutable :class:`StandardConfig`.
+
+    ``config`` is merged with the defaults of ``style`` first, so partial
+    overrides compile to complete configurations.
+
+    Args:
+        config: A standard configuration dictionary (merged or partial).
+        style: The style whose defaults fill missing values.
+
+    Returns:
+        The compiled configuration.
+
+    Raises:
+        InvalidStandardError: If any setting has the wrong type or range.
+    """
+    merged = merge_with_defaults(dict(config), style)
+    problems: list[str] = []
+
+    default_font = _default_font(style)
+    font_section = _Section(merged, "fonts", problems)
+    fonts = {
+        key: _font(font_section.child(key), default_font)
+        for key, entry in font_section.values.items()
+        if isinstance(entry, Mapping)
+    }
+
+    tables = _Section(merged, "tables", problems)
+    figures = _Section(merged, "figures", problems)
+    citations = _Section(merged, "citations", problems)
+    references = _Section(merged, "references", problems)
+    block_quote = _Section(merged, "block_quote", problems)
+    running_head = _Section(merged, "running_head", problems)
+    cover = _Section(merged, "cover", problems)
+    foreign_words = _Section(merged, "foreign_words", problems)
+    indent_inches = block_quote.number("indent_inches", 0.5)
+
+    compiled = StandardConfig(
+        style=style,
+        name=str(merged.get("name", style)),
+        citation_style=str(merged.get("citation_style", style)),
+        fonts=MappingProxyType(fonts),
+        default_font=default_font,
+        margins=_margins(merged, problems),
+        spacing=_spacing(merged, problems),
+        tables=TableSpec(
+            borders=tables.choice("borders", "full", ("full", "horizontal_only")),
+            caption_prefix=tables.text("caption_prefix", "Table"),
+            caption_above=tables.flag("caption_above", True),
+            note_suffix=tables.text("note_suffix", "Elaboración propia."),
+            vertical_align=tables.choice("vertical_align", "top", ("top", "center", "bottom")),
+        ),
+        figures=FigureSpec(
+            caption_prefix=figures.text("caption_prefix", "Figure"),
+            caption_above=figures.flag("caption_above", True),
+            title_above=figures.flag("title_above", True),
+            nota_prefix=figures.text("nota_prefix", "Nota."),
+            image_dpi=figures.integer("image_dpi", 300),
+            jpeg_quality=figures.integer("jpeg_quality", 90, minimum=1, maximum=95),
+        ),
+        citations=CitationSpec(
+            et_al_min_authors=citations.integer("et_al_min_authors", 3, minimum=2),
+            ampersand=citations.flag("ampersand", True),
+        ),
+        references=ReferenceSpec(
+            sort=references.flag("sort", True),
+            italicize_journals=references.flag("italicize_journals", True),
+            locale=references.text("locale", "es"),
+        ),
+        block_quote=BlockQuoteSpec(
+            min_words=block_quote.integer("min_words", 40),
+            indent_inches=indent_inches,
+            indent=Inches(indent_inches),
+        ),
+        running_head=RunningHeadSpec(
+            enabled=running_head.flag("enabled", True),
+            max_length=running_head.integer("max_length", 50, minimum=1),
+        ),
+        cover=CoverSpec(
+            title_align=cover.choice("title_align", "center", ALIGNMENTS),
+            author_align=cover.choice("author_align", "center", ALIGNMENTS),
+        ),
+        foreign_words=ForeignWordSpec(
+            terms=foreign_words.strings("terms", ()),
+            ignore_case=foreign_words.flag("ignore_case", False),
+        ),
+        rules=parse_rules(merged.get("rules"), problems),
+    )
+    if problems:
+        raise InvalidStandardError(style, problems)
+    return compiled
+
+
+# Compiled configurations keyed by (style, config digest), for handlers
+# created without a compiled standard.
+_COMPILED: ConfigCache[StandardConfig] = ConfigCache()
+
+
+def compiled_standard(config: Mapping[str, Any], style: str = "apa7") -> StandardConfig:
+    """Return ``compile_config(config, style)``, compiled once per process.
+
+    Handlers built without a ``standard`` use this, so a formatter's
+    handlers share one compilation of the same configuration.
+
+    Args:
+        config: A standard configuration dictionary (merged or partial).
+        style: The style whose defaults fill missing values.
+
+    Returns:
+        The shared compiled configuration.
+
+    Raises:
+        InvalidStandardError: If any setting has the wrong type or range.
+    """
+    return _COMPILED.get_or_create(
+        (style, override_digest(config)), lambda: compile_config(config, style)
+    )
+
+
+def clear_compiled_cache() -> None:
+    """Drop every configuration cached by :func:`compiled_standard`."""
+    _COMPILED.clear()
+
+
+__all__ = [
+    "ALIGNMENTS",
+    "BlockQuoteSpec",
+    "CitationSpec",
+    "CoverSpec",
+    "FigureSpec",
+    "FontSpec",
+    "ForeignWordSpec",
+    "InvalidStandardError",
+    "MarginSpec",
+    "ReferenceSpec",
+    "RunningHeadSpec",
+    "SpacingSpec",
+    "StandardConfig",
+    "TableSpec",
+    "clear_compiled_cache",
+    "compile_config",
+    "compiled_standard",
+]
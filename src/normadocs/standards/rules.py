@@ -0,0 +1,178 @@
+"""Declarative body-formatting rules of a standard.
+
+A standard may declare an ordered ``rules`` list of selector → property
+rules in its YAML::
+
+    rules:
+      - name: figures
+        select: {role: caption}
+        apply: {alignment: center, italic: true}
+
+Every body element carries a set of roles:
+
+- top-level paragraphs are ``paragraph`` plus ``heading`` (``Heading N``
+  and ``Title`` styles) or ``body``, and also ``caption`` when their text is
+  a figure caption;
+- paragraphs inside tables are ``table_cell``;
+- tables are ``table``.
+
+A rule matches an element when it shares one of the selected roles and,
+if ``style`` is given, the element's paragraph style is one of them.
+Matching rules are applied in order, later properties overriding earlier
+ones. The rule ``name`` groups rules so a pipeline can apply a subset.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+
+from docx.shared import Length
+
+from .units import line_multiple, parse_length
+
+ROLES = ("paragraph", "body", "heading", "caption", "table", "table_cell")
+ALIGNMENTS = ("left", "center", "right", "justify")
+_TABLE_ROLES = frozenset(("table",))
+_PARAGRAPH_ROLES = frozenset(ROLES) - _TABLE_ROLES
+_SELECT_KEYS = ("role", "style")
+_LENGTH_PROPERTIES = ("space_before", "space_after", "first_line_indent", "left_indent")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleProperties:
+    """Properties set by a rule; None leaves the document value untouched.
+
+    ``line_spacing`` is a multiple of single spacing; lengths are
+    precomputed from their YAML form (``"0.5in"``, ``"1cm"``, points).
+    """
+
+    alignment: str | None = None
+    line_spacing: float | None = None
+    space_before: Length | None = None
+    space_after: Length | None = None
+    first_line_indent: Length | None = None
+    left_indent: Length | None = None
+    bold: bool | None = None
+    italic: bool | None = None
+    table_style: str | None = None
+
+    def merged(self, other: RuleProperties) -> RuleProperties:
+        """Return these properties overridden by the values set in ``other``."""
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        for f in fields(other):
+            value = getattr(other, f.name)
+            if value is not None:
+                values[f.name] = value
+        return RuleProperties(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """One compiled selector → properties rule."""
+
+    name: str
+    roles: frozenset[str]
+    styles: frozenset[str]
+    properties: RuleProperties
+
+    def matches(self, roles: frozenset[str], style_name: str) -> bool:
+        """Return whether this rule selects an element with ``roles`` and style."""
+        if self.roles.isdisjoint(roles):
+            return False
+        return not self.styles or style_name in self.styles
+
+
+def _names(value: Any) -> list[Any]:
+    return list(value) if isinstance(value, list | tuple) else [value]
+
+
+def _parse_properties(where: str, apply: Mapping[str, Any], problems: list[str]) -> RuleProperties:
+    values: dict[str, Any] = {}
+    for key, value in apply.items():
+        if key == "alignment":
+            if value not in ALIGNMENTS:
+                problems.append(f"{where}.alignment: expected one of {', '.join(ALIGNMENTS)}")
+                continue
+            values[key] = value
+        elif key == "line_spacing":
+            multiple = line_multiple(value)
+            if multiple is None:
+                problems.append(f"{where}.line_spacing: expected single, double or a number")
+                continue
+            values[key] = multiple
+        elif key in _LENGTH_PROPERTIES:
+            length = parse_length(value)
+            if length is None:
+                problems.append(f"{where}.{key}: expected a length such as 12pt, 1cm or 0.5in")
+                continue
+            values[key] = length
+        elif key in ("bold", "italic"):
+            if not isinstance(value, bool):
+                problems.append(f"{where}.{key}: expected true or false")
+                continue
+            values[key] = value
+        elif key == "table_style":
+            if not isinstance(value, str) or not value:
+                problems.append(f"{where}.table_style: expected a style name")
+                continue
+            values[key] = value
+        else:
+            problems.append(f"{where}.{key}: unknown property")
+    return RuleProperties(**values)
+
+
+def _parse_rule(index: int, raw: Any, problems: list[str]) -> Rule | None:
+    where = f"rules[{index}]"
+    if not isinstance(raw, Mapping):
+        problems.append(f"{where}: expected a mapping with select and apply")
+        return None
+    select = raw.get("select", {})
+    apply = raw.get("apply", {})
+    if not isinstance(select, Mapping) or not isinstance(apply, Mapping):
+        problems.append(f"{where}: select and apply must be mappings")
+        return None
+    for key in select:
+        if key not in _SELECT_KEYS:
+            problems.append(f"{where}.select.{key}: unknown selector")
+
+    roles = frozenset(_names(select.get("role", [])))
+    unknown = sorted(str(role) for role in roles - set(ROLES))
+    if unknown:
+        problems.append(f"{where}.select.role: unknown role {', '.join(unknown)}")
+    if not roles:
+        roles = _PARAGRAPH_ROLES
+    styles = frozenset(str(style) for style in _names(select.get("style", [])))
+
+    properties = _parse_properties(f"{where}.apply", apply, problems)
+    if "table" in roles and roles != _TABLE_ROLES:
+        problems.append(f"{where}.select.role: table cannot be combined with other roles")
+    elif roles == _TABLE_ROLES:
+        if properties != RuleProperties(table_style=properties.table_style):
+            problems.append(f"{where}.apply: role table rules only accept table_style")
+    elif properties.table_style is not None:
+        problems.append(f"{where}.apply.table_style: only valid for role table")
+    return Rule(str(raw.get("name", f"rule{index}")), roles, styles, properties)
+
+
+def parse_rules(raw: Any, problems: list[str]) -> tuple[Rule, ...]:
+    """Validate and compile the ``rules`` list of a standard.
+
+    Args:
+        raw: The YAML ``rules`` value (None when the standard has none).
+        problems: Receives one message per invalid setting.
+
+    Returns:
+        The compiled rules, in declaration order.
+    """
+    if raw is None:
+        return ()
+    if not isinstance(raw, list | tuple):
+        problems.append("rules: expected a list")
+        return ()
+    rules = (_parse_rule(index, item, problems) for index, item in enumerate(raw))
+    return tuple(rule for rule in rules if rule is not None)
+
+
+__all__ = ["ALIGNMENTS", "ROLES", "Rule", "RuleProperties", "parse_rules"]
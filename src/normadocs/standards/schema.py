@@ -1,13 +1,37 @@
 """
 Configuration schema for citation standards.
 
-Defines the structure and default values for all supported standards.
+Defines the structure and default values for all supported standards. The
+ICONTEC and IEEE defaults are their built-in YAML files, so those rules are
+declared in one place.
 """
 
+from pathlib import Path
 from typing import Any, cast
 
+import yaml
+
 from ..config import DEFAULT_BODY_FONT
 
+_STANDARDS_DIR = Path(__file__).parent
+
+# libyaml's C loader parses several times faster when PyYAML was built with it.
+YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_standard_file(name: str) -> dict[str, Any]:
+    """Parse a built-in standard file.
+
+    Args:
+        name: The file stem (e.g., "apa7", "icontec").
+
+    Returns:
+        The YAML contents as a dictionary.
+    """
+    with open(_STANDARDS_DIR / f"{name}.yaml", encoding="utf-8") as f:
+        return cast(dict[str, Any], yaml.load(f, Loader=YamlLoader) or {})
+
+
 DEFAULT_APA7_CONFIG: dict[str, Any] = {
     "name": "APA 7th Edition",
     "version": "7.0",
@@ -46,66 +70,47 @@ DEFAULT_APA7_CONFIG: dict[str, Any] = {
         "title_align": "center",
         "author_align": "center",
     },
-}
-
-
-DEFAULT_ICONTEC_CONFIG: dict[str, Any] = {
-    "name": "ICONTEC (NTC 1486)",
-    "version": "1.0",
-    "citation_style": "icontec",
-    "fonts": {
-        "body": {"name": "Arial", "size": 12},
-        "headings": {
-            "name": "Arial",
-            "level1": {"alignment": "center", "bold": True, "uppercase": True},
-        },
-    },
-    "margins": {"unit": "cm", "top": 3.0, "bottom": 2.0, "left": 3.0, "right": 2.0},
-    "spacing": {"line": 1.5, "paragraph_before": 0, "paragraph_after": 0},
-    "page_setup": {"page_numbers": True, "header": False, "first_page_number": 1},
-    "tables": {
-        "borders": "full",
-        "caption_prefix": "Tabla",
-        "caption_above": True,
-    },
-    "figures": {
-        "caption_prefix": "Figura",
-    },
-    "cover": {
-        "title_align": "center",
-        "author_align": "center",
+    # Terms italicized in body and table text (matched as whole words). The
+    # APA profiles share this lexicon; a YAML file only lists ``terms`` to
+    # replace it.
+    "foreign_words": {
+        "ignore_case": False,
+        "terms": [
+            "Backend",
+            "Frontend",
+            "backend",
+            "frontend",
+            "PostgreSQL",
+            "Redis",
+            "Django",
+            "React",
+            "Next.js",
+            "JavaScript",
+            "Python",
+            "Celery",
+            "Docker",
+            "Wompi",
+            "WhatsApp",
+            "iPhone",
+            "iOS",
+            "DDoS",
+            "SSL",
+            "PCI DSS",
+            "RESTful",
+            "API",
+            "APIs",
+            "SQL",
+            "ORM",
+            "CDN",
+            "CEO",
+        ],
     },
 }
 
 
-DEFAULT_IEEE_CONFIG: dict[str, Any] = {
-    "name": "IEEE 8th Edition",
-    "version": "8.0",
-    "citation_style": "ieee",
-    "fonts": {
-        "body": {"name": DEFAULT_BODY_FONT, "size": 10},
-        "headings": {
-            "name": DEFAULT_BODY_FONT,
-            "level1": {"alignment": "center", "bold": True},
-        },
-    },
-    "margins": {"unit": "inches", "top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
-    "spacing": {"line": "single", "paragraph_before": 0, "paragraph_after": 0},
-    "page_setup": {"page_numbers": True, "header": False, "first_page_number": 1},
-    "tables": {
-        "borders": "full",
-        "caption_prefix": "Table",
-        "caption_above": True,
-    },
-    "figures": {
-        "caption_prefix": "Fig",
-        "title_above": True,
-    },
-    "cover": {
-        "title_align": "center",
-        "author_align": "left",
-    },
-}
+DEFAULT_ICONTEC_CONFIG: dict[str, Any] = load_standard_file("icontec")
+
+DEFAULT_IEEE_CONFIG: dict[str, Any] = load_standard_file("ieee")
 
 
 def get_default_config(style: str) -> dict[str, Any]:
@@ -161,15 +166,11 @@ def deep_copy(obj: Any) -> Any:
     Returns:
         A deep copy of the object.
     """
+    if isinstance(obj, list):
+        return [deep_copy(item) for item in obj]
     if not isinstance(obj, dict):
         return obj
-    result = {}
-    for key, value in obj.items():
-        if isinstance(value, dict):
-            result[key] = deep_copy(value)
-        else:
-            result[key] = value
-    return result
+    return {key: deep_copy(value) for key, value in obj.items()}
 
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -0,0 +1,59 @@
+"""Parsing of spacing and length values written in standard YAML files."""
+
+from __future__ import annotations
+
+import re
+
+from docx.shared import Cm, Inches, Length, Mm, Pt
+
+NAMED_LINE_SPACING = {"single": 1.0, "double": 2.0}
+
+_LENGTH_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(cm|mm|in|pt)?\s*$")
+_LENGTH_UNITS = {"cm": Cm, "mm": Mm, "in": Inches, "pt": Pt}
+
+
+def line_multiple(line: object) -> float | None:
+    """Return the multiple of single spacing for a configured line spacing.
+
+    Args:
+        line: ``"single"``, ``"double"``, a positive number or a numeric
+            string such as ``"1.5"``.
+
+    Returns:
+        The multiple (e.g. 2.0 for ``"double"``), or None if ``line`` is invalid.
+    """
+    if isinstance(line, str):
+        if line in NAMED_LINE_SPACING:
+            return NAMED_LINE_SPACING[line]
+        try:
+            line = float(line)
+        except ValueError:
+            return None
+    if isinstance(line, bool) or not isinstance(line, int | float) or not line > 0:
+        return None
+    return float(line)
+
+
+def parse_length(value: object) -> Length | None:
+    """Parse a length such as ``"0.5in"``, ``"1.27cm"`` or ``12`` (points).
+
+    Args:
+        value: A number of points or a string with a cm/mm/in/pt suffix.
+
+    Returns:
+        The length, or None if ``value`` is not a valid length.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return Pt(value)
+    if not isinstance(value, str):
+        return None
+    match = _LENGTH_RE.match(value)
+    if match is None:
+        return None
+    number, unit = match.groups()
+    return _LENGTH_UNITS[unit or "pt"](float(number))
+
+
+__all__ = ["NAMED_LINE_SPACING", "line_multiple", "parse_length"]
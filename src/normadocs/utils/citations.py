@@ -0,0 +1,225 @@
+"""
+Paragraph-level scanner for APA 7 in-text citations.
+
+The scanner works on the full text of a paragraph, so citations split
+across several runs are seen whole. It reports rule violations (used by
+the verifier) and the text edits that fix them (used by the formatter).
+Edits are spliced back into the original runs by :func:`splice_runs`,
+touching only the runs an edit overlaps and keeping their formatting.
+
+Scans are memoized by paragraph text, so boilerplate repeated across a
+document (or across documents in one process) is analysed once.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+AUTHOR = r"[A-ZÁÉÍÓÚÑ][\wáéíóúñ\-]+"
+
+_AUTHOR_RE = re.compile(AUTHOR)
+_AUTHOR_SEPARATOR = re.compile(r"\s*,\s*|\s+[y&]\s+")
+
+# "(A, B y C, 2020)" — parenthetical citation content
+_PAREN_FULL = re.compile(r"\(([^()]+)\)")
+
+# trailing ", 2020" of one citation segment inside parentheses
+_YEAR_TAIL = re.compile(r",\s*(\d{4}[a-z]?)\s*$")
+
+# "A, B y C (2020)" — narrative citation with its author list
+_NARRATIVE_CITATION = re.compile(
+    rf"({AUTHOR}(?:\s*,\s*{AUTHOR})*(?:\s+(?:y|&)\s+{AUTHOR})?)\s*\((\d{{4}}[a-z]?)\)"
+)
+
+ET_AL = "et al."
+
+
+@dataclass(frozen=True)
+class CitationIssue:
+    """One APA citation rule violation found in a paragraph.
+
+    Args:
+        rule: ``"ampersand"`` (APA 8.10) or ``"et_al"`` (APA 8.17).
+        form: ``"narrative"`` or ``"parenthetical"``.
+        authors: The author list as written.
+        segment: The whole citation segment (authors and year).
+        count: Number of cited authors.
+    """
+
+    rule: str
+    form: str
+    authors: str
+    segment: str
+    count: int
+
+
+@dataclass(frozen=True)
+class CitationEdit:
+    """Replace ``text[start:end]`` of a paragraph with ``replacement``."""
+
+    start: int
+    end: int
+    replacement: str
+
+
+@dataclass(frozen=True)
+class CitationScan:
+    """Issues and fixing edits found in one paragraph's text."""
+
+    issues: tuple[CitationIssue, ...]
+    edits: tuple[CitationEdit, ...]
+
+    def apply(self, text: str) -> str:
+        """Return ``text`` with every edit applied."""
+        for edit in reversed(self.edits):
+            text = text[: edit.start] + edit.replacement + text[edit.end :]
+        return text
+
+
+def author_count(segment: str) -> int:
+    """Count author-like tokens in a citation segment.
+
+    Tokens that are not capitalized words (e.g. "p < 0.05") make the
+    segment non-authorish, returning 0 so it is never rewritten.
+    """
+    tokens = _AUTHOR_SEPARATOR.split(segment.strip())
+    matched = [t for t in tokens if _AUTHOR_RE.fullmatch(t)]
+    return len(matched) if tokens and len(matched) == len(tokens) else 0
+
+
+def _minimal_edit(start: int, old: str, new: str) -> CitationEdit:
+    """Return the edit turning ``old`` (at ``start``) into ``new``.
+
+    The common prefix and suffix are trimmed so the edit only covers the
+    characters that change, leaving runs around it (e.g. an italic first
+    author) untouched when spliced.
+    """
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return CitationEdit(start + prefix, start + len(old) - suffix, new[prefix : len(new) - suffix])
+
+
+def _first_author(authors: str) -> str:
+    return _AUTHOR_SEPARATOR.split(authors.strip())[0].strip()
+
+
+def _scan_segment(segment: str, min_authors: int, issues: list[CitationIssue]) -> str:
+    """Record issues of one parenthetical segment and return its fixed text."""
+    year = _YEAR_TAIL.search(segment)
+    if year is None:
+        return segment
+    authors = segment[: year.start()].strip()
+    year_text = year.group(1)
+    if ET_AL in authors:
+        return f"{authors}, {year_text}"
+    count = author_count(authors)
+    if count >= 2 and " y " in authors:
+        issues.append(CitationIssue("ampersand", "parenthetical", authors, segment, count))
+    if count >= min_authors:
+        issues.append(CitationIssue("et_al", "parenthetical", authors, segment, count))
+        return f"{_first_author(authors)} et al., {year_text}"
+    if count == 2 and " y " in authors:
+        return f"{authors.replace(' y ', ' & ')}, {year_text}"
+    return segment
+
+
+@lru_cache(maxsize=4096)
+def scan_citations(text: str, min_authors: int = 3) -> CitationScan:
+    """Scan a paragraph's full text for citation issues and their fixes.
+
+    - Three or more cited authors are truncated to "Primer Autor et al."
+      in both parenthetical and narrative citations (APA 8.17).
+    - Spanish "y" between two parenthetically cited authors becomes "&"
+      (APA 8.10).
+
+    Args:
+        text: Concatenated text of every run of the paragraph.
+        min_authors: Author count from which "et al." is required.
+
+    Returns:
+        The issues found and the non-overlapping edits that fix them.
+    """
+    issues: list[CitationIssue] = []
+    edits: list[CitationEdit] = []
+    if "(" not in text:
+        return CitationScan((), ())
+
+    for match in _NARRATIVE_CITATION.finditer(text):
+        authors = match.group(1)
+        count = author_count(authors)
+        if count < min_authors:
+            continue
+        segment = match.group(0)
+        issues.append(CitationIssue("et_al", "narrative", authors, segment, count))
+        replacement = f"{_first_author(authors)} et al. ({match.group(2)})"
+        edits.append(_minimal_edit(match.start(), segment, replacement))
+
+    for match in _PAREN_FULL.finditer(text):
+        segments = [s.strip() for s in match.group(1).split(";")]
+        fixed = f"({'; '.join(_scan_segment(s, min_authors, issues) for s in segments)})"
+        if fixed == match.group(0):
+            continue
+        if any(e.start < match.end() and match.start() < e.end for e in edits):
+            continue
+        edits.append(_minimal_edit(match.start(), match.group(0), fixed))
+
+    edits.sort(key=lambda e: e.start)
+    return CitationScan(tuple(issues), tuple(edits))
+
+
+def splice_runs(run_texts: Sequence[str], edits: Sequence[CitationEdit]) -> list[str]:
+    """Apply paragraph-level edits to the texts of the runs that hold them.
+
+    Each replacement is written into the first run the edited span
+    touches; the rest of the span is removed from the following runs, so
+    untouched runs (and the formatting of every run) are preserved.
+
+    Args:
+        run_texts: Text of each run, in order; their concatenation is the
+            text the edits were computed on.
+        edits: Non-overlapping edits sorted by start offset.
+
+    Returns:
+        The new text of every run.
+    """
+    texts = list(run_texts)
+    bounds: list[tuple[int, int]] = []
+    offset = 0
+    for t in texts:
+        bounds.append((offset, offset + len(t)))
+        offset += len(t)
+
+    # Later edits first: offsets of earlier edits stay valid while splicing.
+    for edit in reversed(edits):
+        placed = False
+        for i, (run_start, run_end) in enumerate(bounds):
+            if run_end <= edit.start:
+                continue
+            if placed and run_start >= edit.end:
+                break
+            local_start = max(edit.start - run_start, 0)
+            local_end = min(edit.end, run_end) - run_start
+            replacement = "" if placed else edit.replacement
+            texts[i] = texts[i][:local_start] + replacement + texts[i][local_end:]
+            placed = True
+    return texts
+
+
+__all__ = [
+    "AUTHOR",
+    "ET_AL",
+    "CitationEdit",
+    "CitationIssue",
+    "CitationScan",
+    "author_count",
+    "scan_citations",
+    "splice_runs",
+]
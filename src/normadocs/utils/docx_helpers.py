@@ -10,11 +10,20 @@ from __future__ import annotations
 
 from typing import cast
 
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.xmlchemy import BaseOxmlElement
 from docx.styles.style import ParagraphStyle
 from docx.styles.styles import Styles
 from docx.text.paragraph import Paragraph
 
-__all__ = ["paragraph_style", "paragraph_style_name"]
+__all__ = [
+    "force_run_italic",
+    "paragraph_style",
+    "paragraph_style_name",
+    "set_default_run_font",
+    "set_run_text",
+]
 
 
 def paragraph_style(styles: Styles, name: str) -> ParagraphStyle:
@@ -50,3 +59,101 @@ def paragraph_style_name(paragraph: Paragraph) -> str:
     if style is None:
         return ""
     return style.name or ""
+
+
+def set_run_text(r: BaseOxmlElement, text: str) -> None:
+    """Replace the text of a ``w:r`` element, dropping extra ``w:t`` children.
+
+    Args:
+        r: The run element.
+        text: The new run text; leading or trailing spaces are preserved.
+    """
+    t_elements = r.findall(qn("w:t"))
+    if not t_elements:
+        t = OxmlElement("w:t")
+        r.append(t)
+        t_elements = [t]
+    for extra in t_elements[1:]:
+        r.remove(extra)
+    t_elements[0].text = text
+    if text != text.strip():
+        t_elements[0].set(qn("xml:space"), "preserve")
+
+
+def force_run_italic(r: BaseOxmlElement) -> None:
+    """Force italics on a ``w:r`` element, overriding any previous setting.
+
+    Args:
+        r: The run element.
+    """
+    r_pr = r.find(qn("w:rPr"))
+    if r_pr is None:
+        r_pr = OxmlElement("w:rPr")
+        r.insert(0, r_pr)
+    for old in r_pr.findall(qn("w:i")):
+        r_pr.remove(old)
+    r_pr.append(OxmlElement("w:i"))
+
+
+_AFTER_SZ = frozenset(
+    qn(f"w:{tag}")
+    for tag in (
+        "highlight",
+        "u",
+        "effect",
+        "bdr",
+        "shd",
+        "fitText",
+        "vertAlign",
+        "rtl",
+        "cs",
+        "em",
+        "lang",
+        "eastAsianLayout",
+        "specVanish",
+        "oMath",
+    )
+)
+
+
+def set_default_run_font(styles: Styles, name: str, size_pt: float) -> None:
+    """Set the document-wide default run font (``w:docDefaults``).
+
+    Runs and styles that specify no font inherit the defaults, so setting
+    them once replaces stamping ``run.font`` on every run of the document.
+
+    Args:
+        styles: The document styles collection.
+        name: Font family for every script (ascii, hAnsi, eastAsia, cs).
+        size_pt: Font size in points.
+    """
+    styles_el = styles.element
+    doc_defaults = styles_el.find(qn("w:docDefaults"))
+    if doc_defaults is None:
+        doc_defaults = OxmlElement("w:docDefaults")
+        styles_el.insert(0, doc_defaults)
+    r_pr_default = doc_defaults.find(qn("w:rPrDefault"))
+    if r_pr_default is None:
+        r_pr_default = OxmlElement("w:rPrDefault")
+        doc_defaults.insert(0, r_pr_default)
+    r_pr = r_pr_default.find(qn("w:rPr"))
+    if r_pr is None:
+        r_pr = OxmlElement("w:rPr")
+        r_pr_default.append(r_pr)
+    for tag in ("w:rFonts", "w:sz", "w:szCs"):
+        for old in r_pr.findall(qn(tag)):
+            r_pr.remove(old)
+    fonts = OxmlElement("w:rFonts")
+    for attr in ("w:ascii", "w:hAnsi", "w:eastAsia", "w:cs"):
+        fonts.set(qn(attr), name)
+    r_pr.insert(0, fonts)
+    half_points = str(round(size_pt * 2))
+    # w:sz/w:szCs must precede these siblings in the rPr sequence.
+    successor = next((c for c in r_pr if c.tag in _AFTER_SZ), None)
+    for tag in ("w:sz", "w:szCs"):
+        el = OxmlElement(tag)
+        el.set(qn("w:val"), half_points)
+        if successor is None:
+            r_pr.append(el)
+        else:
+            successor.addprevious(el)
@@ -0,0 +1,546 @@
+"""Opening, saving and size optimization of DOCX (OPC) packages.
+
+:func:`open_document` and :func:`save_document` accept paths, bytes and
+binary streams, so DOCX files can be formatted entirely in memory.
+
+python-docx writes back every part Pandoc and the formatters left in the
+package. :func:`optimize_package` rewrites the zip in one pass:
+
+- identical media parts are stored once and every relationship pointing at
+  a duplicate is redirected to the kept copy;
+- relationships whose id is referenced nowhere in their source part are
+  dropped, and so are parts no longer reachable from the package root;
+- styles no content or settings part uses (directly or through
+  ``basedOn``/``next``/``link``) and numbering definitions no paragraph or
+  style uses are pruned;
+  the built-in styles Word applies when it updates fields (``TOC 1``-``9``,
+  ``Caption``, ``Hyperlink``, ...) and styles named in field codes are kept;
+- adjacent plain-text runs with identical attributes and run properties are
+  merged, and empty ``w:rPr`` elements are removed;
+- the zip is rewritten with the requested deflate level.
+
+Every step only removes information the rendered document never reads, so
+the optimized package formats and renders exactly like the original.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import posixpath
+import re
+import zipfile
+from collections import Counter
+from os import PathLike
+from pathlib import Path
+from typing import IO, TypeAlias
+
+import docx
+import lxml.etree as etree
+from docx.document import Document as DocType
+
+__all__ = [
+    "DEFAULT_COMPRESSION_LEVEL",
+    "DocxSource",
+    "DocxTarget",
+    "open_document",
+    "optimize_package",
+    "repack",
+    "save_document",
+]
+
+# Anything a formatter can be built from, and anything it can save to.
+DocxSource: TypeAlias = str | PathLike[str] | bytes | bytearray | memoryview | IO[bytes] | DocType
+DocxTarget: TypeAlias = str | PathLike[str] | IO[bytes]
+
+logger = logging.getLogger("normadocs")
+
+DEFAULT_COMPRESSION_LEVEL = 6
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+_CONTENT_TYPES = "[Content_Types].xml"
+_ROOT_RELS = "_rels/.rels"
+
+_W_VAL = f"{{{_W}}}val"
+_W_R = f"{{{_W}}}r"
+_W_T = f"{{{_W}}}t"
+_W_RPR = f"{{{_W}}}rPr"
+_W_STYLE = f"{{{_W}}}style"
+_W_STYLE_ID = f"{{{_W}}}styleId"
+_W_NAME = f"{{{_W}}}name"
+_W_INSTR = f"{{{_W}}}instr"
+_W_INSTR_TEXT = f"{{{_W}}}instrText"
+_W_FLD_SIMPLE = f"{{{_W}}}fldSimple"
+_W_DEFAULT = f"{{{_W}}}default"
+_W_NUM = f"{{{_W}}}num"
+_W_NUM_ID = f"{{{_W}}}numId"
+_W_ABSTRACT_NUM = f"{{{_W}}}abstractNum"
+_W_ABSTRACT_NUM_ID = f"{{{_W}}}abstractNumId"
+# Elements whose w:val names a style, in content parts, settings and numbering.
+_STYLE_REFS = frozenset(
+    f"{{{_W}}}{tag}"
+    for tag in (
+        "pStyle",
+        "rStyle",
+        "tblStyle",
+        "numStyleLink",
+        "styleLink",
+        "defaultTableStyle",
+        "clickAndTypeStyle",
+    )
+)
+# Elements inside a style naming another style it depends on.
+_STYLE_LINKS = frozenset(f"{{{_W}}}{tag}" for tag in ("basedOn", "next", "link"))
+_ABSTRACT_LINKS = frozenset(f"{{{_W}}}{tag}" for tag in ("numStyleLink", "styleLink"))
+# Built-in styles Word applies when it updates TOC, caption, index and
+# hyperlink fields, matched on the case-folded w:name.
+_FIELD_STYLE_NAMES = frozenset(
+    {"caption", "hyperlink", "followedhyperlink", "toc heading", "table of figures"}
+    | {"index heading"}
+    | {f"{kind} {level}" for kind in ("toc", "index") for level in range(1, 10)}
+)
+# Quoted field-code arguments, e.g. STYLEREF "Heading 1" or TOC \t "Title,1".
+_QUOTED = re.compile(r'"([^"]*)"')
+
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+
+def _check_level(compression_level: int) -> None:
+    if not 0 <= compression_level <= 9:
+        raise ValueError(f"compression_level must be between 0 and 9, got {compression_level}")
+
+
+def _rels_name(part: str) -> str:
+    """Return the relationships part name of ``part`` ("" is the package root)."""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def _source_of(rels_name: str) -> str:
+    """Return the part owning the relationships part ``rels_name``."""
+    directory, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(directory), name[: -len(".rels")])
+
+
+def _resolve(source: str, target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+def _relative(source: str, part: str) -> str:
+    return posixpath.relpath(part, posixpath.dirname(source) or ".")
+
+
+class _Package:
+    """The parts of a zipped OPC package, with lazily parsed XML trees."""
+
+    def __init__(self, data: bytes) -> None:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            self.infos = {info.filename: info for info in archive.infolist()}
+            self.parts = {name: archive.read(name) for name in self.infos}
+        self._trees: dict[str, etree._Element] = {}
+        self.dirty: set[str] = set()
+        self.stats: Counter[str] = Counter()
+
+    def xml(self, name: str) -> etree._Element | None:
+        """Return the parsed root of part ``name`` (None if absent or not XML)."""
+        if name not in self._trees:
+            if name not in self.parts or not name.endswith((".xml", ".rels")):
+                return None
+            self._trees[name] = etree.fromstring(self.parts[name], _PARSER)
+        return self._trees[name]
+
+    def xml_parts(self) -> list[str]:
+        return [name for name in self.parts if name.endswith(".xml") and name != _CONTENT_TYPES]
+
+    def relationships(self, rels_name: str) -> list[etree._Element]:
+        root = self.xml(rels_name)
+        return [] if root is None else list(root.iter(f"{{{_REL}}}Relationship"))
+
+    def internal_targets(self, rels_name: str) -> list[tuple[etree._Element, str]]:
+        source = _source_of(rels_name)
+        return [
+            (rel, _resolve(source, rel.get("Target", "")))
+            for rel in self.relationships(rels_name)
+            if rel.get("TargetMode") != "External"
+        ]
+
+    def main_document(self) -> str | None:
+        for rel, target in self.internal_targets(_ROOT_RELS):
+            if rel.get("Type", "").endswith("/officeDocument"):
+                return target
+        return None
+
+    def related(self, source: str, kind: str) -> str | None:
+        """Return the part ``source`` relates to with a type ending in ``/kind``."""
+        for rel, target in self.internal_targets(_rels_name(source)):
+            if rel.get("Type", "").endswith(f"/{kind}") and target in self.parts:
+                return target
+        return None
+
+    def drop(self, name: str) -> None:
+        del self.parts[name]
+        self._trees.pop(name, None)
+        self.dirty.discard(name)
+
+    def serialize(self, compression_level: int) -> bytes:
+        out = io.BytesIO()
+        method = zipfile.ZIP_STORED if compression_level == 0 else zipfile.ZIP_DEFLATED
+        names = sorted(self.parts, key=lambda name: name != _CONTENT_TYPES)
+        level = compression_level or None
+        with zipfile.ZipFile(out, "w", method, compresslevel=level) as zf:
+            for name in names:
+                data = self.parts[name]
+                if name in self.dirty:
+                    data = etree.tostring(
+                        self._trees[name], xml_declaration=True, encoding="UTF-8", standalone=True
+                    )
+                info = zipfile.ZipInfo(name, date_time=self.infos[name].date_time)
+                info.compress_type = method
+                # The ZipFile level only applies to string arcnames, not ZipInfo.
+                zf.writestr(info, data, compresslevel=level)
+        return out.getvalue()
+
+
+def _dedupe_media(package: _Package) -> None:
+    canonical: dict[bytes, str] = {}
+    aliases: dict[str, str] = {}
+    for name, data in package.parts.items():
+        if "/media/" not in f"/{name}":
+            continue
+        digest = hashlib.sha256(data).digest()
+        kept = canonical.setdefault(digest, name)
+        if kept != name:
+            aliases[name] = kept
+    if not aliases:
+        return
+    for rels_name in [name for name in package.parts if name.endswith(".rels")]:
+        source = _source_of(rels_name)
+        for rel, target in package.internal_targets(rels_name):
+            if target in aliases:
+                rel.set("Target", _relative(source, aliases[target]))
+                package.dirty.add(rels_name)
+    for name in aliases:
+        package.drop(name)
+    package.stats["media"] += len(aliases)
+
+
+def _prune_relationships(package: _Package) -> None:
+    """Drop relationships whose id no attribute of their source part mentions."""
+    for rels_name in [name for name in package.parts if name.endswith(".rels")]:
+        source = _source_of(rels_name)
+        if source == "" or source not in package.parts:
+            continue
+        root = package.xml(source)
+        if root is None:
+            continue
+        referenced = {value for el in root.iter() for value in el.attrib.values()}
+        for rel in package.relationships(rels_name):
+            if rel.get("Id") not in referenced and _is_explicit(rel.get("Type", "")):
+                rel.getparent().remove(rel)
+                package.dirty.add(rels_name)
+                package.stats["relationships"] += 1
+
+
+def _is_explicit(rel_type: str) -> bool:
+    """Return whether a relationship type is only used through an explicit r:id."""
+    return rel_type.rsplit("/", 1)[-1] in ("image", "hyperlink", "header", "footer", "oleObject")
+
+
+def _prune_unreachable(package: _Package) -> None:
+    """Drop parts not reachable from the package root through relationships."""
+    reachable: set[str] = set()
+    pending = [""]
+    while pending:
+        source = pending.pop()
+        for _, target in package.internal_targets(_rels_name(source)):
+            if target in package.parts and target not in reachable:
+                reachable.add(target)
+                pending.append(target)
+    keep = {_CONTENT_TYPES, _ROOT_RELS} | reachable | {_rels_name(name) for name in reachable}
+    orphans = [name for name in package.parts if name not in keep]
+    for name in orphans:
+        package.drop(name)
+    package.stats["parts"] += len(orphans)
+
+    types = package.xml(_CONTENT_TYPES)
+    if types is None:
+        return
+    for override in list(types.iter(f"{{{_CT}}}Override")):
+        if override.get("PartName", "").lstrip("/") not in package.parts:
+            types.remove(override)
+            package.dirty.add(_CONTENT_TYPES)
+
+
+def _values(root: etree._Element, tags: frozenset[str] | str) -> set[str]:
+    names = tuple(tags) if isinstance(tags, frozenset) else (tags,)
+    return {el.get(_W_VAL, "") for el in root.iter(*names)}
+
+
+def _field_style_names(root: etree._Element) -> set[str]:
+    """Return the case-folded style names quoted in the field codes of a part."""
+    codes = [el.text or "" for el in root.iter(_W_INSTR_TEXT)]
+    codes += [el.get(_W_INSTR, "") for el in root.iter(_W_FLD_SIMPLE)]
+    return {
+        name.strip().casefold()
+        for argument in _QUOTED.findall(" ".join(codes))
+        for name in argument.split(",")
+        if name.strip()
+    }
+
+
+def _prune_styles_and_numbering(package: _Package, document: str) -> None:
+    """Prune styles and list definitions nothing in the content uses.
+
+    Styles and numbering reference each other (a list style names its
+    numbering instance, a list level names its paragraph style), so both
+    keep sets are grown together from what the content parts use. Styles
+    that only appear once Word updates a field are kept as well.
+    """
+    # Word 2010 keeps a second copy of the style sheet in stylesWithEffects.
+    sheets = [
+        (part, root)
+        for kind in ("styles", "stylesWithEffects")
+        if (part := package.related(document, kind)) is not None
+        and (root := package.xml(part)) is not None
+    ]
+    numbering_part = package.related(document, "numbering")
+    numbering = package.xml(numbering_part) if numbering_part is not None else None
+    special = {part for part, _ in sheets} | {numbering_part}
+
+    used_styles: set[str] = set()
+    used_nums: set[str] = set()
+    field_names = set(_FIELD_STYLE_NAMES)
+    for name in package.xml_parts():
+        root = package.xml(name) if name not in special else None
+        if root is not None:
+            used_styles |= _values(root, _STYLE_REFS)
+            used_nums |= _values(root, _W_NUM_ID)
+            field_names |= _field_style_names(root)
+
+    styles: dict[str, list[etree._Element]] = {}
+    for _, sheet in sheets:
+        for style in sheet.iter(_W_STYLE):
+            styles.setdefault(style.get(_W_STYLE_ID, ""), []).append(style)
+            names = {name.casefold() for name in _values(style, _W_NAME)}
+            if style.get(_W_DEFAULT) in ("1", "true", "on") or names & field_names:
+                used_styles.add(style.get(_W_STYLE_ID, ""))
+    nums = {} if numbering is None else {n.get(_W_NUM_ID): n for n in numbering.iter(_W_NUM)}
+    abstracts = (
+        {}
+        if numbering is None
+        else {a.get(_W_ABSTRACT_NUM_ID): a for a in numbering.iter(_W_ABSTRACT_NUM)}
+    )
+
+    while True:
+        keep_styles: set[str] = set()
+        pending = list(used_styles)
+        while pending:
+            style_id = pending.pop()
+            if style_id in keep_styles or style_id not in styles:
+                continue
+            keep_styles.add(style_id)
+            for style in styles[style_id]:
+                pending.extend(_values(style, _STYLE_LINKS))
+        keep_nums = used_nums.union(
+            *(_values(s, _W_NUM_ID) for i in keep_styles for s in styles[i])
+        )
+        keep_abstracts = {
+            abstract_id
+            for abstract_id, abstract in abstracts.items()
+            if _values(abstract, _ABSTRACT_LINKS) & keep_styles
+        }
+        for num_id in keep_nums & nums.keys():
+            keep_abstracts |= _values(nums[num_id], _W_ABSTRACT_NUM_ID)
+        numbering_styles = set().union(
+            *(_values(abstracts[a], _STYLE_REFS) for a in keep_abstracts & abstracts.keys())
+        )
+        if numbering_styles <= used_styles:
+            break
+        used_styles |= numbering_styles
+
+    for part, sheet in sheets:
+        for style in list(sheet.iter(_W_STYLE)):
+            if style.get(_W_STYLE_ID, "") not in keep_styles:
+                sheet.remove(style)
+                package.stats["styles"] += 1
+                package.dirty.add(part)
+    if numbering is None or numbering_part is None:
+        return
+    unused = [n for i, n in nums.items() if i not in keep_nums]
+    unused += [a for i, a in abstracts.items() if i not in keep_abstracts]
+    for element in unused:
+        numbering.remove(element)
+    if unused:
+        package.stats["numbering"] += len(unused)
+        package.dirty.add(numbering_part)
+
+
+def _plain_run_key(run: etree._Element) -> bytes | None:
+    """Return the attributes and run properties of a text-only run.
+
+    Runs that differ in any attribute (revision ids such as ``w:rsidR``
+    included) get different keys; any run with content other than text
+    returns None.
+    """
+    key = repr(sorted(run.attrib.items())).encode()
+    for child in run:
+        if child.tag == _W_RPR:
+            key += etree.tostring(child)
+        elif child.tag != _W_T:
+            return None
+    return key
+
+
+def _collapse_runs(package: _Package, name: str) -> None:
+    root = package.xml(name)
+    if root is None or not root.tag.startswith(f"{{{_W}}}"):
+        return
+    changed = False
+    for r_pr in list(root.iter(_W_RPR)):
+        if len(r_pr) == 0 and not r_pr.attrib:
+            r_pr.getparent().remove(r_pr)
+            changed = True
+    for run in list(root.iter(_W_R)):
+        parent = run.getparent()
+        if parent is None:
+            continue  # merged into a preceding run
+        key = _plain_run_key(run)
+        if key is None:
+            continue
+        texts = [t.text or "" for t in run.findall(_W_T)]
+        following = run.getnext()
+        merged = 0
+        while following is not None and following.tag == _W_R and _plain_run_key(following) == key:
+            texts.extend(t.text or "" for t in following.findall(_W_T))
+            after = following.getnext()
+            parent.remove(following)
+            following = after
+            merged += 1
+        if not merged:
+            continue
+        elements = run.findall(_W_T)
+        first = elements[0] if elements else etree.SubElement(run, _W_T)
+        for extra in elements[1:]:
+            run.remove(extra)
+        first.text = "".join(texts)
+        if first.text != first.text.strip():
+            first.set(_XML_SPACE, "preserve")
+        package.stats["runs"] += merged
+        changed = True
+    if changed:
+        package.dirty.add(name)
+
+
+def optimize_package(data: bytes, compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> bytes:
+    """Return a smaller, equivalent copy of a DOCX package.
+
+    Args:
+        data: The bytes of a saved DOCX file.
+        compression_level: Deflate level from 0 (stored) to 9 (smallest).
+
+    Returns:
+        The optimized DOCX bytes.
+
+    Raises:
+        ValueError: If ``compression_level`` is out of range.
+    """
+    _check_level(compression_level)
+    package = _Package(data)
+    _dedupe_media(package)
+    _prune_relationships(package)
+    _prune_unreachable(package)
+    document = package.main_document()
+    if document is not None:
+        _prune_styles_and_numbering(package, document)
+        for name in package.xml_parts():
+            if name.startswith(posixpath.dirname(document) + "/"):
+                _collapse_runs(package, name)
+    optimized = package.serialize(compression_level)
+    logger.debug(
+        "Optimized DOCX %d -> %d bytes (%s)",
+        len(data),
+        len(optimized),
+        ", ".join(f"{count} {what}" for what, count in sorted(package.stats.items())) or "no-op",
+    )
+    return optimized
+
+
+def repack(data: bytes, compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> bytes:
+    """Rewrite a DOCX package unchanged with another deflate level.
+
+    Args:
+        data: The bytes of a saved DOCX file.
+        compression_level: Deflate level from 0 (stored) to 9 (smallest).
+
+    Returns:
+        The repacked DOCX bytes.
+
+    Raises:
+        ValueError: If ``compression_level`` is out of range.
+    """
+    _check_level(compression_level)
+    return _Package(data).serialize(compression_level)
+
+
+def open_document(source: DocxSource) -> DocType:
+    """Open a DOCX from a path, its bytes, a binary stream or a Document.
+
+    Args:
+        source: A file path, the DOCX bytes, a readable binary stream, or
+            an already open Document (returned as is).
+
+    Returns:
+        The python-docx Document.
+    """
+    if isinstance(source, DocType):
+        return source
+    if isinstance(source, bytes | bytearray | memoryview):
+        return docx.Document(io.BytesIO(bytes(source)))
+    if isinstance(source, str | PathLike):
+        return docx.Document(str(source))
+    if not source.seekable():
+        # The zip reader seeks to the central directory at the end.
+        return docx.Document(io.BytesIO(source.read()))
+    return docx.Document(source)
+
+
+def save_document(
+    doc: DocType,
+    target: DocxTarget,
+    *,
+    optimize: bool = False,
+    compression_level: int | None = None,
+) -> None:
+    """Save a python-docx document, optionally optimizing the package.
+
+    Args:
+        doc: The document to save.
+        target: Destination path, or a writable binary stream (written at
+            its current position and left open).
+        optimize: Whether to run :func:`optimize_package` on the output.
+        compression_level: Deflate level from 0 to 9; None keeps the
+            python-docx default unless ``optimize`` is set.
+
+    Raises:
+        ValueError: If ``compression_level`` is out of range.
+    """
+    if not optimize and compression_level is None:
+        doc.save(target if not isinstance(target, PathLike) else str(target))
+        return
+    level = DEFAULT_COMPRESSION_LEVEL if compression_level is None else compression_level
+    _check_level(level)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    data = buffer.getvalue()
+    data = optimize_package(data, level) if optimize else repack(data, level)
+    if isinstance(target, str | PathLike):
+        Path(target).write_bytes(data)
+    else:
+        target.write(data)
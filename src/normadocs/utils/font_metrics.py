@@ -0,0 +1,140 @@
+"""
+Text measurement with real font metrics.
+
+Widths are measured with Pillow's ``ImageFont.getlength`` against the
+TrueType file of the requested family. Glyph advances are cached per font
+in em units, so a string is measured by summing cached advances and
+scaling by the point size — every glyph is rasterized at most once per
+process.
+
+When no TrueType file can be found for a family (e.g. Times New Roman on
+a bare Linux server), measurement falls back to a per-character estimate
+so that callers always receive a usable width.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import ImageFont
+
+# Font size (in pixels) used to sample glyph advances. Advances are stored
+# divided by this value, i.e. in em units independent of the point size.
+_SAMPLE_SIZE = 1000
+
+# Codepoints below this bound are looked up in a dense NumPy table; the
+# range covers ASCII, Latin-1 and Latin Extended-A/B (Spanish, Portuguese,
+# French and German text).
+_DENSE_RANGE = 0x250
+
+# Average advance (em) used when the family has no TrueType file on disk.
+_FALLBACK_EM = 0.5
+
+# File names tried for common document families, in order. Liberation
+# fonts are metric-compatible replacements shipped by most Linux distros.
+_FAMILY_FILES: dict[str, tuple[str, ...]] = {
+    "times new roman": (
+        "times.ttf",
+        "Times New Roman.ttf",
+        "LiberationSerif-Regular.ttf",
+    ),
+    "arial": ("arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf"),
+    "calibri": ("calibri.ttf", "Calibri.ttf", "Carlito-Regular.ttf"),
+    "cambria": ("cambria.ttc", "Cambria.ttf", "Caladea-Regular.ttf"),
+    "courier new": ("cour.ttf", "Courier New.ttf", "LiberationMono-Regular.ttf"),
+}
+
+
+class FontMetrics:
+    """Cached glyph advances for one font family.
+
+    Args:
+        font: A loaded Pillow font sampled at ``_SAMPLE_SIZE`` pixels, or
+            None to use the fallback per-character estimate.
+    """
+
+    def __init__(self, font: ImageFont.FreeTypeFont | None) -> None:
+        """Initialize FontMetrics.
+
+        Args:
+            font: Pillow font used to measure glyphs (None for fallback).
+        """
+        self._font = font
+        self._dense = np.full(_DENSE_RANGE, np.nan)
+        self._sparse: dict[str, float] = {}
+
+    @property
+    def is_fallback(self) -> bool:
+        """Whether widths come from the estimate instead of a real font."""
+        return self._font is None
+
+    def _advance(self, char: str) -> float:
+        """Return the advance of one character in em units."""
+        if self._font is None:
+            return _FALLBACK_EM
+        return float(self._font.getlength(char)) / _SAMPLE_SIZE
+
+    def advances(self, text: str) -> np.ndarray:
+        """Return the advance of every character of ``text`` in em units."""
+        if not text:
+            return np.zeros(0)
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        dense = codes < _DENSE_RANGE
+        widths = np.empty(len(codes))
+
+        dense_codes = codes[dense]
+        missing = np.unique(dense_codes[np.isnan(self._dense[dense_codes])])
+        for code in missing:
+            self._dense[code] = self._advance(chr(code))
+        widths[dense] = self._dense[dense_codes]
+
+        if not dense.all():
+            for i in np.flatnonzero(~dense):
+                char = text[i]
+                if char not in self._sparse:
+                    self._sparse[char] = self._advance(char)
+                widths[i] = self._sparse[char]
+        return widths
+
+    def text_width(self, text: str, size_pt: float) -> float:
+        """Return the rendered width of ``text`` in inches."""
+        return float(self.advances(text).sum()) * size_pt / 72
+
+    def longest_word_width(self, text: str, size_pt: float) -> float:
+        """Return the width in inches of the widest whitespace-separated word."""
+        words = text.split()
+        if not words:
+            return 0.0
+        return max(float(self.advances(w).sum()) for w in words) * size_pt / 72
+
+
+def _candidate_files(family: str) -> tuple[str, ...]:
+    """Return TrueType file names to try for a font family."""
+    key = family.strip().casefold()
+    compact = family.replace(" ", "")
+    return (*_FAMILY_FILES.get(key, ()), f"{family}.ttf", f"{compact}.ttf", f"{key}.ttf")
+
+
+@lru_cache(maxsize=32)
+def get_font_metrics(family: str) -> FontMetrics:
+    """Return the shared, cached metrics for a font family.
+
+    Pillow resolves bare file names against the platform font
+    directories, so the first candidate that loads wins.
+
+    Args:
+        family: Font family name as written in the document (e.g. "Arial").
+
+    Returns:
+        FontMetrics for the family; a fallback instance if no file loads.
+    """
+    for candidate in _candidate_files(family):
+        try:
+            return FontMetrics(ImageFont.truetype(candidate, _SAMPLE_SIZE))
+        except OSError:
+            continue
+    return FontMetrics(None)
+
+
+__all__ = ["FontMetrics", "get_font_metrics"]
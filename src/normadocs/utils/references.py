@@ -0,0 +1,169 @@
+"""
+Sort keys, collation and duplicate detection for reference lists.
+
+Every helper here works on the plain text of one reference entry and is
+shared by the APA formatter (which sorts the list) and the verifier
+(which checks the order), so both agree on what "alphabetical" means.
+Keys are computed once per entry, so sorting a bibliography of a few
+thousand entries costs one regex pass per entry rather than one per
+comparison.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+# "(2020)", "(2020a)", "(s. f.)", "(n.d.)" — publication date of an entry
+_DATE = re.compile(r"\((s\.\s*f\.|n\.\s*d\.|\d{4})[a-z]?\)", re.IGNORECASE)
+_UNDATED = frozenset(("s. f.", "n. d.", "s.f.", "n.d."))
+
+# Title: text after "(date). " up to the next sentence-ending period
+_TITLE = re.compile(r"^\s*\.?\s*([^.?!]+)")
+_NON_WORD = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+# Words of the title kept in the near-duplicate fingerprint
+_TITLE_WORDS = 8
+
+# Sorts after every other letter, so "ñ" collates between "n" and "o".
+_AFTER_N = "n\U0010ffff"
+
+
+def collation_key(text: str, locale: str = "es") -> str:
+    """Return a locale-aware, accent-insensitive collation key.
+
+    Case and diacritics are ignored (``Álvarez`` sorts with ``Alvarez``);
+    with the Spanish locale ``ñ`` is its own letter after ``n``.
+
+    Args:
+        text: Text to collate.
+        locale: Language code; ``"es"`` enables the Spanish ``ñ`` rule.
+
+    Returns:
+        A string whose plain ordering follows the locale's collation.
+    """
+    folded = text.casefold()
+    if locale.startswith("es"):
+        folded = folded.replace("ñ", _AFTER_N)
+    decomposed = unicodedata.normalize("NFD", folded)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def reference_year(reference: str) -> int:
+    """Return the publication year of an entry, 0 for undated (s. f./n.d.)."""
+    match = _DATE.search(reference)
+    if match is None or match.group(1).casefold() in _UNDATED:
+        return 0
+    return int(match.group(1))
+
+
+def sort_key(reference: str, locale: str = "es") -> tuple[str, int, str]:
+    """Return an APA-aware ordering key for a reference entry.
+
+    APA orders works alphabetically by author, then chronologically for
+    works by the same author. Undated works (``s. f.``/``n.d.``) precede
+    dated works, which a plain lexical comparison does not implement.
+
+    Args:
+        reference: Plain text of the entry.
+        locale: Collation locale (see :func:`collation_key`).
+
+    Returns:
+        ``(author, year, full text)`` collation key.
+    """
+    author = reference.split("(", 1)[0].strip()
+    return (
+        collation_key(author, locale),
+        reference_year(reference),
+        collation_key(reference, locale),
+    )
+
+
+def _normalized(text: str) -> str:
+    """Collapse punctuation, spacing, case and accents for comparisons."""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", collation_key(text, "en"))).strip()
+
+
+def identity_key(reference: str) -> tuple[str, int, str]:
+    """Return the author/year/title fingerprint of a reference entry.
+
+    Two entries with the same fingerprint describe the same work even if
+    their punctuation, capitalization, accents or trailing details (DOI,
+    pages) differ.
+
+    Args:
+        reference: Plain text of the entry.
+
+    Returns:
+        ``(first author surname, year, first title words)``.
+    """
+    head, _, tail = reference.partition("(")
+    surname = _normalized(head.split(",", 1)[0])
+    date = _DATE.search(reference)
+    title = ""
+    if date is not None:
+        title_match = _TITLE.match(reference[date.end() :])
+        if title_match is not None:
+            title = " ".join(_normalized(title_match.group(1)).split()[:_TITLE_WORDS])
+    elif tail:
+        title = " ".join(_normalized(tail).split()[:_TITLE_WORDS])
+    return surname, reference_year(reference), title
+
+
+@dataclass(frozen=True)
+class DuplicateReference:
+    """An entry that repeats an earlier one in the reference list.
+
+    Args:
+        index: Position of the repeated entry (0-based).
+        original: Position of the first entry it repeats.
+        exact: True when both texts match after whitespace/case folding;
+            False when only author, year and title coincide.
+    """
+
+    index: int
+    original: int
+    exact: bool
+
+
+def find_duplicates(references: Sequence[str]) -> list[DuplicateReference]:
+    """Flag exact and near-duplicate entries with hashed indexes.
+
+    Each entry is looked up once in an exact-text index and once in an
+    author-year-title index, so the cost is linear in the list length.
+
+    Args:
+        references: Plain text of every entry, in document order.
+
+    Returns:
+        One DuplicateReference per repeated entry, in document order.
+    """
+    exact_index: dict[str, int] = {}
+    identity_index: dict[tuple[str, int, str], int] = {}
+    duplicates: list[DuplicateReference] = []
+    for i, reference in enumerate(references):
+        text_key = _SPACES.sub(" ", reference.strip().casefold())
+        if text_key in exact_index:
+            duplicates.append(DuplicateReference(i, exact_index[text_key], True))
+            continue
+        exact_index[text_key] = i
+        identity = identity_key(reference)
+        if identity[0] and identity[2]:
+            if identity in identity_index:
+                duplicates.append(DuplicateReference(i, identity_index[identity], False))
+                continue
+            identity_index[identity] = i
+    return duplicates
+
+
+__all__ = [
+    "DuplicateReference",
+    "collation_key",
+    "find_duplicates",
+    "identity_key",
+    "reference_year",
+    "sort_key",
+]
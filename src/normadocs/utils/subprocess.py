@@ -9,6 +9,7 @@ This module provides a safe wrapper around subprocess.run() that:
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import subprocess
 
@@ -219,6 +220,74 @@ def run_command(
     return result
 
 
+async def run_command_async(
+    cmd: list[str],
+    check: bool = True,
+    timeout: float | None = None,
+    input_data: str | None = None,
+    encoding: str = "utf-8",
+    cwd: str | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run a command without blocking the event loop.
+
+    The asyncio counterpart of run_command(): the process is started with
+    asyncio.create_subprocess_exec (no shell) and its output is captured
+    and decoded. The process is killed if the timeout expires or the
+    awaiting task is cancelled.
+
+    Args:
+        cmd: Command and arguments as a list. Commands are resolved to full paths.
+        check: If True (default), raises CommandFailedError on non-zero exit.
+        timeout: Optional timeout in seconds.
+        input_data: Optional input string to pass via stdin.
+        encoding: Encoding of stdin and of the captured output.
+        cwd: Optional working directory.
+
+    Returns:
+        CompletedProcess instance with returncode, stdout, stderr.
+
+    Raises:
+        FileNotFoundError: If the executable does not exist.
+        subprocess.TimeoutExpired: If the timeout expires.
+        CommandFailedError: If check=True and returncode != 0.
+    """
+    resolved_cmd = _resolve_command_paths(cmd)
+    process = await asyncio.create_subprocess_exec(
+        *resolved_cmd,
+        stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+    data = input_data.encode(encoding) if input_data is not None else None
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(data), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        if isinstance(e, asyncio.TimeoutError):
+            raise subprocess.TimeoutExpired(resolved_cmd, timeout or 0) from None
+        raise
+
+    returncode = process.returncode if process.returncode is not None else -1
+    result = subprocess.CompletedProcess(
+        resolved_cmd,
+        returncode,
+        stdout.decode(encoding, errors="replace"),
+        stderr.decode(encoding, errors="replace"),
+    )
+    if check and returncode != 0:
+        raise CommandFailedError(
+            returncode=returncode,
+            cmd=resolved_cmd,
+            stdout=result.stdout,
+            stderr=result.stderr,
+        )
+    return result
+
+
 def _no_shell_popen(
     cmd: list[str],
     stdout: int,
@@ -273,4 +342,5 @@ __all__ = [
     "get_command_path",
     "run_background_command",
     "run_command",
+    "run_command_async",
 ]
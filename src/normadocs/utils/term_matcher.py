@@ -0,0 +1,115 @@
+"""
+Multi-term matching with a single compiled regular expression.
+
+A lexicon is folded into a character trie and emitted as one regex
+(``Python|PostgreSQL`` becomes ``P(?:ostgreSQL|ython)``), so matching
+cost grows with the length of the scanned text rather than with the
+number of terms. Compiled matchers are cached per lexicon.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Trie key marking the end of a term (terms never contain empty chars).
+_END = ""
+
+_Trie = dict[str, "_Trie"]
+
+
+def trie_pattern(terms: Iterable[str]) -> str:
+    """Return a regex source matching any of ``terms`` (longest first)."""
+    trie: _Trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+
+    def build(node: _Trie) -> str:
+        branches: list[str] = []
+        singles: list[str] = []
+        for char in sorted(k for k in node if k != _END):
+            child = node[char]
+            sub = build(child)
+            if sub:
+                branches.append(re.escape(char) + sub)
+            else:
+                singles.append(re.escape(char))
+        if singles:
+            branches.append(singles[0] if len(singles) == 1 else f"[{''.join(singles)}]")
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if _END in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class TermMatcher:
+    """Find occurrences of any term of a lexicon in one regex pass.
+
+    Args:
+        terms: Terms to match; empty strings are ignored.
+        whole_word: Only match terms not surrounded by word characters.
+        ignore_case: Match regardless of letter case.
+    """
+
+    def __init__(
+        self, terms: Iterable[str], whole_word: bool = True, ignore_case: bool = False
+    ) -> None:
+        """Initialize TermMatcher.
+
+        Args:
+            terms: Terms to match.
+            whole_word: Require word boundaries around every match.
+            ignore_case: Compile the pattern case-insensitively.
+        """
+        self.terms = tuple(sorted({t for t in terms if t}))
+        pattern = trie_pattern(self.terms)
+        if whole_word:
+            pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+        flags = re.IGNORECASE if ignore_case else 0
+        self._regex: re.Pattern[str] | None = re.compile(pattern, flags) if self.terms else None
+
+    def __bool__(self) -> bool:
+        """Return whether the lexicon has any term."""
+        return self._regex is not None
+
+    def search(self, text: str) -> bool:
+        """Return whether ``text`` contains any term."""
+        return self._regex is not None and self._regex.search(text) is not None
+
+    def spans(self, text: str) -> list[tuple[int, int]]:
+        """Return the ``(start, end)`` offsets of every non-overlapping match."""
+        if self._regex is None:
+            return []
+        return [m.span() for m in self._regex.finditer(text)]
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(terms: tuple[str, ...], whole_word: bool, ignore_case: bool) -> TermMatcher:
+    return TermMatcher(terms, whole_word=whole_word, ignore_case=ignore_case)
+
+
+def compile_terms(
+    terms: Iterable[str], whole_word: bool = True, ignore_case: bool = False
+) -> TermMatcher:
+    """Return a shared matcher for a lexicon, compiling it on first use.
+
+    Args:
+        terms: Terms to match.
+        whole_word: Require word boundaries around every match.
+        ignore_case: Match regardless of letter case.
+
+    Returns:
+        A cached TermMatcher for the given lexicon and options.
+    """
+    return _cached_matcher(tuple(sorted(set(terms))), whole_word, ignore_case)
+
+
+__all__ = ["TermMatcher", "compile_terms", "trie_pattern"]
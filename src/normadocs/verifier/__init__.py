@@ -7,6 +7,7 @@ standards using multiple analysis techniques (pdfplumber, PyMuPDF, python-docx).
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -14,6 +15,7 @@ from typing import TYPE_CHECKING, Any, Literal
 __all__ = [
     "APAVerifier",
     "CheckCategory",
+    "CheckCost",
     "VerificationIssue",
     "VerificationResult",
 ]
@@ -37,7 +39,12 @@ class VerificationIssue:
 
 @dataclass
 class VerificationResult:
-    """Result of a complete APA verification run."""
+    """Result of a complete APA verification run.
+
+    ``timings`` maps each check category to its run time in seconds, in
+    check order. ``skipped`` lists the selected checks that did not run
+    because ``fail_fast`` stopped the run.
+    """
 
     passed: bool
     score: float
@@ -47,6 +54,8 @@ class VerificationResult:
     errors: list[VerificationIssue] = field(default_factory=list)
     pdf_path: Path | None = None
     docx_path: Path | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
 
     @property
     def all_issues(self) -> list[VerificationIssue]:
@@ -71,6 +80,19 @@ class CheckCategory:
     CITATIONS = "citations"
 
 
+class CheckCost:
+    """Cost classes of APA checks, cheapest first.
+
+    The verifier runs cheaper classes first, so ``fail_fast`` can stop
+    before parsing the PDF.
+    """
+
+    DOCX = 0
+    """Reads only the DOCX snapshot."""
+    PDF_TEXT = 1
+    """Also reads extracted PDF text."""
+
+
 def is_apa_caption_or_table_title(text: str) -> bool:
     """Detect APA caption/table-title paragraphs that may be single-spaced.
 
@@ -97,7 +119,7 @@ def is_apa_caption_or_table_title(text: str) -> bool:
     return stripped.startswith(". ")
 
 
-def caption_and_title_indexes(paragraphs_info: list[Any]) -> set[int]:
+def caption_and_title_indexes(paragraphs_info: Sequence[Any]) -> set[int]:
     """Return indexes of caption paragraphs and their following title lines.
 
     APA 7 allows single spacing in table/figure captions and titles. The
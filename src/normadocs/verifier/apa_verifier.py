@@ -5,6 +5,10 @@ Orchestrates all verification checks and provides comprehensive reporting.
 
 from __future__ import annotations
 
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
@@ -25,12 +29,15 @@ from .checks import (
     StructureCheck,
     TablesCheck,
 )
-from .docx_analyzer import DOCXAnalyzer
-from .pdf_analyzer import PDFAnalyzer
+from .docx_analyzer import DOCXAnalyzer, DOCXSnapshot
+from .fact_cache import FactCache
+from .pdf_analyzer import PDFAnalyzer, TextBackend
 
 if TYPE_CHECKING:
     from ..models import DocumentMetadata
 
+logger = logging.getLogger("normadocs")
+
 
 @dataclass
 class VerificationContext:
@@ -40,16 +47,73 @@ class VerificationContext:
     docx: DOCXAnalyzer
     meta: DocumentMetadata
     strict: bool = True
+    reference_locale: str = "es"
+
+    @property
+    def snapshot(self) -> DOCXSnapshot:
+        """The DOCX snapshot shared by all checks, memoized by the analyzer."""
+        return self.docx.snapshot()
 
 
 class VerificationCheck(Protocol):
-    """Protocol defining the interface for APA verification checks."""
+    """Protocol defining the interface for APA verification checks.
+
+    ``cost`` is the check's ``CheckCost`` class.
+    """
+
+    cost: int
 
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run verification check and return list of issues found."""
         ...
 
 
+CheckOutcome = tuple[list[VerificationIssue], VerificationIssue | None, float]
+
+_CHECK_TYPES: tuple[tuple[str, type[VerificationCheck]], ...] = (
+    (CheckCategory.PAGE_SETUP, PageSetupCheck),
+    (CheckCategory.MARGINS, MarginsCheck),
+    (CheckCategory.FONTS, FontsCheck),
+    (CheckCategory.RUNNING_HEAD, RunningHeadCheck),
+    (CheckCategory.SPACING, SpacingCheck),
+    (CheckCategory.PARAGRAPHS, ParagraphsCheck),
+    (CheckCategory.HEADINGS, HeadingsCheck),
+    (CheckCategory.COVER_PAGE, CoverPageCheck),
+    (CheckCategory.TABLES, TablesCheck),
+    (CheckCategory.STRUCTURE, StructureCheck),
+    (CheckCategory.FIGURES, FiguresCheck),
+    (CheckCategory.REFERENCES, ReferencesCheck),
+    (CheckCategory.CITATIONS, CitationsCheck),
+)
+
+CHECK_NAMES: tuple[str, ...] = tuple(category for category, _ in _CHECK_TYPES)
+
+
+def select_checks(
+    checks: Iterable[str] | None = None, skip_checks: Iterable[str] | None = None
+) -> tuple[str, ...]:
+    """Resolve a check selection to check categories in run order.
+
+    Args:
+        checks: Categories to run; None runs every check.
+        skip_checks: Categories to leave out.
+
+    Returns:
+        The selected categories, in ``CHECK_NAMES`` order.
+
+    Raises:
+        ValueError: If a category is unknown.
+    """
+    included = set(CHECK_NAMES if checks is None else checks)
+    excluded = set(skip_checks or ())
+    unknown = sorted((included | excluded) - set(CHECK_NAMES))
+    if unknown:
+        raise ValueError(
+            f"Unknown checks: {', '.join(unknown)}. Available: {', '.join(CHECK_NAMES)}"
+        )
+    return tuple(name for name in CHECK_NAMES if name in included - excluded)
+
+
 class APAVerifier:
     """Main APA 7th Edition verifier.
 
@@ -63,6 +127,14 @@ class APAVerifier:
         docx_path: str | Path | None = None,
         meta: DocumentMetadata | None = None,
         strict: bool = True,
+        pdf_backend: TextBackend = "pymupdf",
+        max_workers: int | None = None,
+        cache_dir: str | Path | None = None,
+        checks: Iterable[str] | None = None,
+        skip_checks: Iterable[str] | None = None,
+        fail_fast: bool = False,
+        pdf_processes: int | None = 1,
+        reference_locale: str = "es",
     ) -> None:
         """Initialize the APA verifier.
 
@@ -72,15 +144,44 @@ class APAVerifier:
                       If not provided, will look for same-named DOCX.
             meta: Optional document metadata for enhanced verification.
             strict: If True, warnings are treated as errors.
+            pdf_backend: PDF text extraction library, "pymupdf" (fast) or
+                "pdfplumber".
+            max_workers: Threads running the checks; None uses the executor
+                default and 1 runs them sequentially.
+            cache_dir: Optional ``FactCache`` directory. Facts extracted
+                from the PDF and DOCX are stored there and reused while the
+                files are unchanged.
+            checks: Check categories to run (see ``CHECK_NAMES``); None
+                runs every check.
+            skip_checks: Check categories to leave out.
+            fail_fast: Run the checks one at a time, cheapest first, and
+                stop at the first error (any warning in strict mode). The
+                checks that were not run are listed in
+                ``VerificationResult.skipped``.
+            pdf_processes: Processes extracting long PDFs, in page shards;
+                None uses one per CPU and 1 extracts in this process.
+            reference_locale: Collation locale the reference list is expected
+                to be sorted in, as the standard's ``references.locale``.
+
+        Raises:
+            ValueError: If a check category is unknown.
         """
         self.pdf_path = Path(pdf_path)
         self.docx_path = self._find_docx(docx_path) if docx_path is None else Path(docx_path)
         self.meta = meta
         self.strict = strict
+        self.pdf_backend: TextBackend = pdf_backend
+        self.max_workers = max_workers
+        self.fact_cache = FactCache(cache_dir) if cache_dir is not None else None
+        self.selected_checks = select_checks(checks, skip_checks)
+        self.fail_fast = fail_fast
+        self.pdf_processes = pdf_processes
+        self.reference_locale = reference_locale
 
         self._pdf_analyzer: PDFAnalyzer | None = None
         self._docx_analyzer: DOCXAnalyzer | None = None
-        self._checks: list[tuple[str, object]] = []
+        self._pdf_cached = False
+        self._docx_cached = False
 
     def _find_docx(self, docx_path: Path | None) -> Path | None:
         """Find DOCX file with same base name as PDF."""
@@ -103,11 +204,24 @@ class APAVerifier:
 
     @property
     def pdf(self) -> PDFAnalyzer:
-        """Get or create PDF analyzer."""
+        """Get or create PDF analyzer.
+
+        Cached facts are looked up (hashing the PDF) only once a check
+        queries the analyzer.
+        """
         if self._pdf_analyzer is None:
-            self._pdf_analyzer = PDFAnalyzer(self.pdf_path)
+            self._pdf_analyzer = PDFAnalyzer(
+                self.pdf_path,
+                backend=self.pdf_backend,
+                processes=self.pdf_processes,
+                facts_loader=self._load_pdf_facts if self.fact_cache is not None else None,
+            )
         return self._pdf_analyzer
 
+    def _load_pdf_facts(self, analyzer: PDFAnalyzer) -> None:
+        if self.fact_cache is not None:
+            self._pdf_cached = self.fact_cache.load_pdf(analyzer)
+
     @property
     def docx(self) -> DOCXAnalyzer:
         """Get or create DOCX analyzer."""
@@ -116,32 +230,84 @@ class APAVerifier:
                 raise FileNotFoundError(
                     "DOCX file not found for verification. Provide docx_path explicitly."
                 )
-            self._docx_analyzer = DOCXAnalyzer(self.docx_path)
+            snapshot = None
+            if self.fact_cache is not None:
+                snapshot = self.fact_cache.load_docx(self.docx_path)
+            self._docx_cached = snapshot is not None
+            self._docx_analyzer = DOCXAnalyzer(self.docx_path, snapshot=snapshot)
         return self._docx_analyzer
 
     def _init_checks(self) -> list[tuple[str, VerificationCheck]]:
-        """Initialize all verification checks."""
+        """Initialize the selected verification checks."""
         return [
-            (CheckCategory.PAGE_SETUP, PageSetupCheck()),
-            (CheckCategory.MARGINS, MarginsCheck()),
-            (CheckCategory.FONTS, FontsCheck()),
-            (CheckCategory.RUNNING_HEAD, RunningHeadCheck()),
-            (CheckCategory.SPACING, SpacingCheck()),
-            (CheckCategory.PARAGRAPHS, ParagraphsCheck()),
-            (CheckCategory.HEADINGS, HeadingsCheck()),
-            (CheckCategory.COVER_PAGE, CoverPageCheck()),
-            (CheckCategory.TABLES, TablesCheck()),
-            (CheckCategory.STRUCTURE, StructureCheck()),
-            (CheckCategory.FIGURES, FiguresCheck()),
-            (CheckCategory.REFERENCES, ReferencesCheck()),
-            (CheckCategory.CITATIONS, CitationsCheck()),
+            (category, check_type())
+            for category, check_type in _CHECK_TYPES
+            if category in self.selected_checks
         ]
 
+    @staticmethod
+    def _run_check(
+        category: str, check: VerificationCheck, ctx: VerificationContext
+    ) -> CheckOutcome:
+        """Run one check, returning its issues, a failure issue and its duration."""
+        start = time.perf_counter()
+        try:
+            issues, failure = check.run(ctx), None
+        except Exception as e:
+            issues = []
+            failure = VerificationIssue(
+                check=f"{category}.check_failed",
+                severity="error",
+                expected="Check to run successfully",
+                actual=str(e),
+                evidence=f"Check '{category}' failed with exception",
+            )
+        return issues, failure, time.perf_counter() - start
+
+    def _fails(self, outcome: CheckOutcome) -> bool:
+        """Return whether a check outcome fails the run on its own."""
+        issues, failure, _ = outcome
+        failing = {"error", "warning"} if self.strict else {"error"}
+        return failure is not None or any(issue.severity in failing for issue in issues)
+
+    def _run_checks(
+        self, checks: list[tuple[str, VerificationCheck]], ctx: VerificationContext
+    ) -> dict[int, CheckOutcome]:
+        """Run checks cheapest cost class first, keyed by their index in ``checks``.
+
+        With ``fail_fast`` (or ``max_workers=1``) the checks run one at a
+        time in cost order, and a failure stops the run before any further
+        check starts. Otherwise they are submitted to a thread pool in cost
+        order.
+        """
+        by_cost = sorted(range(len(checks)), key=lambda i: checks[i][1].cost)
+        outcomes: dict[int, CheckOutcome] = {}
+        if self.fail_fast or self.max_workers == 1:
+            for index in by_cost:
+                outcomes[index] = self._run_check(*checks[index], ctx)
+                if self.fail_fast and self._fails(outcomes[index]):
+                    break
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                index: pool.submit(self._run_check, *checks[index], ctx) for index in by_cost
+            }
+            for index, future in futures.items():
+                outcomes[index] = future.result()
+        return outcomes
+
     def verify_all(self) -> VerificationResult:
         """Run all verification checks.
 
+        The DOCX snapshot is extracted first; the checks then only read it
+        (and the thread-safe PDF analyzer) and run concurrently, cheapest
+        ``CheckCost`` class first (one at a time with ``fail_fast``). Issues
+        are collected in check order, so the result does not depend on
+        scheduling.
+
         Returns:
-            VerificationResult with all issues found.
+            VerificationResult with all issues found and per-check timings.
         """
         if self.docx_path is None:
             raise FileNotFoundError("DOCX path is required for verification")
@@ -152,46 +318,54 @@ class APAVerifier:
             docx=self.docx,
             meta=meta,
             strict=self.strict,
+            reference_locale=self.reference_locale,
         )
+        # Extract the DOCX once, up front, instead of once per check.
+        snapshot = self.docx.snapshot()
+        if self.fact_cache is not None and not self._docx_cached:
+            self.fact_cache.store_docx(self.docx_path, snapshot)
+            self._docx_cached = True
+
+        checks = self._init_checks()
+        outcomes = self._run_checks(checks, ctx)
 
         all_issues: list[VerificationIssue] = []
         warnings: list[VerificationIssue] = []
         errors: list[VerificationIssue] = []
         infos: list[VerificationIssue] = []
-
-        for category, check in self._init_checks():
-            try:
-                issues = check.run(ctx)
-                for issue in issues:
-                    if "." not in issue.check:
-                        issue.check = f"{category}.{issue.check.split('.')[-1]}"
-                    all_issues.append(issue)
-
-                    # Strict APA validation promotes every warning to a hard
-                    # failure. Keep the issue in ``all_issues`` with its
-                    # original wording while exposing it consistently in the
-                    # result's error collection.
-                    if self.strict and issue.severity == "warning":
-                        issue.severity = "error"
-
-                    if issue.severity == "error":
-                        errors.append(issue)
-                    elif issue.severity == "warning":
-                        warnings.append(issue)
-                    else:
-                        infos.append(issue)
-            except Exception as e:
-                errors.append(
-                    VerificationIssue(
-                        check=f"{category}.check_failed",
-                        severity="error",
-                        expected="Check to run successfully",
-                        actual=str(e),
-                        evidence=f"Check '{category}' failed with exception",
-                    )
-                )
-
-        total_checks = len(self._init_checks())
+        timings: dict[str, float] = {}
+        ran = sorted(outcomes)
+        skipped = [category for index, (category, _) in enumerate(checks) if index not in outcomes]
+
+        for index in ran:
+            category = checks[index][0]
+            issues, failure, elapsed = outcomes[index]
+            timings[category] = elapsed
+            if failure is not None:
+                errors.append(failure)
+                continue
+            for issue in issues:
+                if "." not in issue.check:
+                    issue.check = f"{category}.{issue.check.split('.')[-1]}"
+                all_issues.append(issue)
+
+                # Strict APA validation promotes every warning to a hard
+                # failure. Keep the issue in ``all_issues`` with its
+                # original wording while exposing it consistently in the
+                # result's error collection.
+                if self.strict and issue.severity == "warning":
+                    issue.severity = "error"
+
+                if issue.severity == "error":
+                    errors.append(issue)
+                elif issue.severity == "warning":
+                    warnings.append(issue)
+                else:
+                    infos.append(issue)
+
+        self._store_pdf_facts()
+
+        total_checks = len(ran)
         errors_count = len(errors)
         warnings_count = len(warnings)
 
@@ -214,20 +388,39 @@ class APAVerifier:
             errors=errors,
             pdf_path=self.pdf_path,
             docx_path=self.docx_path,
+            timings=timings,
+            skipped=skipped,
         )
 
         return result
 
+    def _store_pdf_facts(self) -> None:
+        """Write the PDF facts to the fact cache unless they came from it.
+
+        Nothing is written unless the checks extracted every page, so
+        caching never parses pages no check read.
+        """
+        analyzer = self._pdf_analyzer
+        if self.fact_cache is None or self._pdf_cached or analyzer is None:
+            return
+        if not analyzer.fully_extracted:
+            return
+        try:
+            self.fact_cache.store_pdf(analyzer)
+        except (RuntimeError, ValueError, OSError) as e:
+            # An unreadable PDF has already been reported by the checks.
+            logger.debug("PDF facts not cached for %s: %s", self.pdf_path, e)
+            return
+        self._pdf_cached = True
+
     def _extract_meta_from_docx(self) -> DocumentMetadata:
         """Extract metadata from DOCX document."""
         from ..models import DocumentMetadata
 
-        doc = self.docx.doc
-        core_props = doc.core_properties
-
+        snapshot = self.docx.snapshot()
         return DocumentMetadata(
-            title=core_props.title or "Untitled",
-            author=core_props.author,
+            title=snapshot.title or "Untitled",
+            author=snapshot.author,
         )
 
     def generate_report(self, result: VerificationResult, format: str = "text") -> str:
@@ -256,6 +449,8 @@ class APAVerifier:
         lines.append(f"\nFile: {result.pdf_path}")
         lines.append(f"Score: {result.score:.1f}/100")
         lines.append(f"Status: {'PASSED' if result.passed else 'FAILED'}")
+        if result.skipped:
+            lines.append(f"Skipped (fail-fast): {', '.join(result.skipped)}")
 
         if result.errors:
             lines.append(f"\nErrors ({len(result.errors)}):")
@@ -289,6 +484,8 @@ class APAVerifier:
         lines.append(f"**File**: `{result.pdf_path}`")
         lines.append(f"**Score**: {result.score:.1f}/100")
         lines.append(f"**Status**: {'✅ PASSED' if result.passed else '❌ FAILED'}")
+        if result.skipped:
+            lines.append(f"**Skipped (fail-fast)**: {', '.join(result.skipped)}")
         lines.append("")
 
         if result.errors:
@@ -0,0 +1,357 @@
+"""Batch verification of exported PDFs.
+
+Collects PDFs from files, glob patterns and directories, pairs each with its
+DOCX source the way ``APAVerifier`` does, verifies them across a process pool
+and renders the records as JSON Lines, JUnit XML or SARIF with an aggregated
+summary.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from .. import __version__
+from . import VerificationIssue
+
+if TYPE_CHECKING:
+    from .pdf_analyzer import TextBackend
+
+RecordStatus = Literal["passed", "failed", "error"]
+ReportFormat = Literal["jsonl", "junit", "sarif"]
+
+REPORT_FORMATS: tuple[ReportFormat, ...] = ("jsonl", "junit", "sarif")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+
+@dataclass
+class VerificationRecord:
+    """Outcome of verifying one PDF.
+
+    Attributes:
+        pdf: The verified PDF.
+        docx: The paired DOCX, None when none was found.
+        status: "passed", "failed" (issues found) or "error" (could not verify).
+        score: Verification score (0 on error).
+        issues: Every issue, including promoted warnings and check failures.
+        error: Why the PDF could not be verified.
+        duration: Seconds spent on this PDF.
+        skipped: Checks not run because ``fail_fast`` stopped early.
+    """
+
+    pdf: Path
+    docx: Path | None
+    status: RecordStatus
+    score: float = 0.0
+    issues: list[VerificationIssue] = field(default_factory=list)
+    error: str | None = None
+    duration: float = 0.0
+    skipped: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as JSON-compatible data."""
+        counts = {"error": 0, "warning": 0, "info": 0}
+        for issue in self.issues:
+            counts[issue.severity] += 1
+        return {
+            "pdf": str(self.pdf),
+            "docx": str(self.docx) if self.docx is not None else None,
+            "status": self.status,
+            "score": round(self.score, 2),
+            "errors": counts["error"],
+            "warnings": counts["warning"],
+            "infos": counts["info"],
+            "issues": [asdict(issue) for issue in self.issues],
+            "error": self.error,
+            "duration": round(self.duration, 4),
+            "skipped": self.skipped,
+        }
+
+
+@dataclass
+class BatchSummary:
+    """Aggregated counts over a batch of verification records."""
+
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    errored: int = 0
+    mean_score: float = 0.0
+    duration: float = 0.0
+
+    @classmethod
+    def from_records(cls, records: Sequence[VerificationRecord], duration: float) -> BatchSummary:
+        """Summarize records; the mean score only covers verified PDFs."""
+        verified = [r.score for r in records if r.status != "error"]
+        return cls(
+            total=len(records),
+            passed=sum(r.status == "passed" for r in records),
+            failed=sum(r.status == "failed" for r in records),
+            errored=sum(r.status == "error" for r in records),
+            mean_score=round(sum(verified) / len(verified), 2) if verified else 0.0,
+            duration=round(duration, 4),
+        )
+
+    @property
+    def ok(self) -> bool:
+        """True when every PDF was verified and passed."""
+        return self.passed == self.total
+
+
+def collect_pdfs(inputs: Iterable[str | Path]) -> list[Path]:
+    """Expand files, glob patterns and directories into a list of PDFs.
+
+    Directories are searched recursively for ``*.pdf``. Duplicates are
+    dropped and the first occurrence wins, so the order follows the inputs.
+
+    Args:
+        inputs: PDF paths, glob patterns (``**`` allowed) or directories.
+
+    Returns:
+        The PDF paths.
+
+    Raises:
+        FileNotFoundError: If an input matches nothing.
+    """
+    found: dict[Path, None] = {}
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.suffix.lower() == ".pdf")
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(
+                Path(p) for p in glob.glob(str(item), recursive=True) if p.lower().endswith(".pdf")
+            )
+            if not matches:
+                raise FileNotFoundError(f"No PDF matches {item}")
+        for match in matches:
+            found.setdefault(match, None)
+    return list(found)
+
+
+def verify_pdf(
+    pdf_path: Path,
+    strict: bool = True,
+    pdf_backend: TextBackend = "pymupdf",
+    cache_dir: Path | None = None,
+    checks: Sequence[str] | None = None,
+    skip_checks: Sequence[str] | None = None,
+    fail_fast: bool = False,
+) -> VerificationRecord:
+    """Verify one PDF against its DOCX source; never raises.
+
+    The DOCX is found by ``APAVerifier`` (same stem, or the stem without the
+    ``_APA``/``_ICONTEC``/``_IEEE`` suffix). Checks run sequentially, since
+    batches are parallelized across processes. An unknown check name is
+    reported as an error record.
+    """
+    from .apa_verifier import APAVerifier
+
+    start = time.perf_counter()
+    try:
+        verifier = APAVerifier(
+            pdf_path,
+            strict=strict,
+            pdf_backend=pdf_backend,
+            max_workers=1,
+            cache_dir=cache_dir,
+            checks=checks,
+            skip_checks=skip_checks,
+            fail_fast=fail_fast,
+        )
+    except ValueError as e:
+        return VerificationRecord(
+            pdf_path, None, "error", error=str(e), duration=time.perf_counter() - start
+        )
+    try:
+        if verifier.docx_path is None:
+            return VerificationRecord(
+                pdf_path,
+                None,
+                "error",
+                error="No DOCX source found next to the PDF",
+                duration=time.perf_counter() - start,
+            )
+        result = verifier.verify_all()
+    except Exception as e:
+        return VerificationRecord(
+            pdf_path,
+            verifier.docx_path,
+            "error",
+            error=f"{type(e).__name__}: {e}",
+            duration=time.perf_counter() - start,
+        )
+    finally:
+        verifier.close()
+
+    check_failures = [i for i in result.errors if i not in result.issues]
+    return VerificationRecord(
+        pdf_path,
+        verifier.docx_path,
+        "passed" if result.passed else "failed",
+        score=result.score,
+        issues=result.issues + check_failures,
+        duration=time.perf_counter() - start,
+        skipped=result.skipped,
+    )
+
+
+def verify_many(
+    pdfs: Sequence[Path],
+    workers: int = 1,
+    strict: bool = True,
+    pdf_backend: TextBackend = "pymupdf",
+    cache_dir: Path | None = None,
+    checks: Sequence[str] | None = None,
+    skip_checks: Sequence[str] | None = None,
+    fail_fast: bool = False,
+) -> Iterator[VerificationRecord]:
+    """Verify PDFs across a process pool, yielding records in input order.
+
+    Args:
+        pdfs: PDFs to verify.
+        workers: Worker processes; 1 verifies in the calling process.
+        strict: Strict APA validation (warnings fail).
+        pdf_backend: PDF text extraction library.
+        cache_dir: Optional shared ``FactCache`` directory.
+        checks: Check categories to run; None runs every check.
+        skip_checks: Check categories to leave out.
+        fail_fast: Stop verifying a PDF at its first error.
+    """
+    verify = partial(
+        verify_pdf,
+        strict=strict,
+        pdf_backend=pdf_backend,
+        cache_dir=cache_dir,
+        checks=checks,
+        skip_checks=skip_checks,
+        fail_fast=fail_fast,
+    )
+    if workers <= 1 or len(pdfs) <= 1:
+        yield from map(verify, pdfs)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(pdfs))) as pool:
+        yield from pool.map(verify, pdfs)
+
+
+def to_jsonl(records: Sequence[VerificationRecord], summary: BatchSummary) -> str:
+    """One JSON object per PDF, then a ``{"summary": ...}`` line."""
+    lines = [json.dumps(r.to_dict(), ensure_ascii=False) for r in records]
+    lines.append(json.dumps({"summary": asdict(summary)}))
+    return "\n".join(lines) + "\n"
+
+
+def to_junit(records: Sequence[VerificationRecord], summary: BatchSummary) -> str:
+    """A JUnit XML test suite with one test case per PDF."""
+    suite = ET.Element(
+        "testsuite",
+        name="normadocs.verify",
+        tests=str(summary.total),
+        failures=str(summary.failed),
+        errors=str(summary.errored),
+        time=f"{summary.duration:.3f}",
+    )
+    properties = ET.SubElement(suite, "properties")
+    ET.SubElement(properties, "property", name="mean_score", value=str(summary.mean_score))
+    for record in records:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="normadocs.verify",
+            name=str(record.pdf),
+            time=f"{record.duration:.3f}",
+        )
+        if record.status == "error":
+            ET.SubElement(case, "error", message=record.error or "").text = record.error
+        elif record.status == "failed":
+            errors = [i for i in record.issues if i.severity == "error"]
+            failure = ET.SubElement(
+                case,
+                "failure",
+                message=f"{len(errors)} APA errors (score {record.score:.1f})",
+            )
+            failure.text = "\n".join(
+                f"[{i.severity.upper()}] {i.check}: expected {i.expected}; got {i.actual}"
+                for i in record.issues
+                if i.severity != "info"
+            )
+    ET.indent(suite)
+    return ET.tostring(suite, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def to_sarif(records: Sequence[VerificationRecord], summary: BatchSummary) -> str:
+    """A SARIF 2.1.0 log with one result per issue."""
+    rule_ids: dict[str, int] = {}
+    results: list[dict[str, Any]] = []
+    notifications: list[dict[str, Any]] = []
+
+    for record in records:
+        location = {"physicalLocation": {"artifactLocation": {"uri": record.pdf.as_posix()}}}
+        if record.status == "error":
+            notifications.append(
+                {"level": "error", "message": {"text": record.error}, "locations": [location]}
+            )
+            continue
+        for issue in record.issues:
+            index = rule_ids.setdefault(issue.check, len(rule_ids))
+            text = f"Expected {issue.expected}; got {issue.actual}."
+            if issue.evidence:
+                text += f" {issue.evidence}"
+            result: dict[str, Any] = {
+                "ruleId": issue.check,
+                "ruleIndex": index,
+                "level": _SARIF_LEVELS[issue.severity],
+                "message": {"text": text},
+                "locations": [location],
+            }
+            if issue.page is not None:
+                result["properties"] = {"page": issue.page}
+            results.append(result)
+
+    log = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "normadocs",
+                        "version": __version__,
+                        "rules": [{"id": rule_id} for rule_id in rule_ids],
+                    }
+                },
+                "invocations": [
+                    {
+                        "executionSuccessful": summary.errored == 0,
+                        "toolExecutionNotifications": notifications,
+                    }
+                ],
+                "results": results,
+                "properties": {"summary": asdict(summary)},
+            }
+        ],
+    }
+    return json.dumps(log, ensure_ascii=False, indent=2) + "\n"
+
+
+def render_report(
+    records: Sequence[VerificationRecord], summary: BatchSummary, fmt: ReportFormat
+) -> str:
+    """Render records in one of ``REPORT_FORMATS``."""
+    if fmt == "junit":
+        return to_junit(records, summary)
+    if fmt == "sarif":
+        return to_sarif(records, summary)
+    return to_jsonl(records, summary)
@@ -9,32 +9,23 @@ Verifies body citations meet APA 7th Edition requirements:
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
-from .. import CheckCategory, VerificationIssue
+from ...utils.citations import scan_citations
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
 
-_AUTHOR = r"[A-ZÁÉÍÓÚÑ][\wáéíóúñ\-]+"
-
-_PAREN_FULL = re.compile(r"\(([^()]+)\)")
-_YEAR_TAIL = re.compile(r",\s*(\d{4}[a-z]?)\s*$")
-_NARRATIVE_CITATION = re.compile(
-    rf"({_AUTHOR}(?:\s*,\s*{_AUTHOR})*(?:\s+(?:y|&)\s+{_AUTHOR})?)\s*\(\d{{4}}[a-z]?\)"
-)
-
 QUOTE_OPEN = ('"', "\u201c", "\u00ab")
 BLOCK_QUOTE_MIN_WORDS = 40
 
 
-_ET_AL = "et al."
-
-
 class CitationsCheck:
     """Check in-text citations against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run citations verification.
 
@@ -46,7 +37,7 @@ class CitationsCheck:
         """
         issues: list[VerificationIssue] = []
 
-        for p_info in ctx.docx.get_paragraphs_info():
+        for p_info in ctx.snapshot.paragraphs:
             text = p_info.text
             if not text.strip():
                 continue
@@ -67,74 +58,47 @@ class CitationsCheck:
             if style_name in ("Source Code", "Source", "Code", "Preformatted", "HTMLPre"):
                 continue
 
-            self._check_ampersand(text, issues)
-            self._check_et_al(text, ctx.strict, issues)
+            self._check_citations(text, ctx.strict, issues)
             self._check_block_quote(text, ctx.strict, issues)
 
         return issues
 
-    def _check_ampersand(self, text: str, issues: list[VerificationIssue]) -> None:
-        """Flag parenthetical citations joined with the Spanish 'y'."""
-        for match in _PAREN_FULL.finditer(text):
-            for segment in match.group(1).split(";"):
-                segment = segment.strip()
-                year = _YEAR_TAIL.search(segment)
-                if year is None:
-                    continue
-                authors = segment[: year.start()].strip()
-                if _ET_AL in authors or " y " not in authors:
-                    continue
-                if self._author_count(authors) >= 2:
-                    issues.append(
-                        VerificationIssue(
-                            check=f"{CheckCategory.CITATIONS}.ampersand",
-                            severity="error",
-                            expected="Authors joined with '&' inside parentheses",
-                            actual=f"'{authors}' joined with 'y'",
-                            evidence=(
-                                f"Citation '({segment})' must use '&' before the last author"
-                            ),
-                        )
-                    )
+    def _check_citations(self, text: str, strict: bool, issues: list[VerificationIssue]) -> None:
+        """Flag 'y'-joined and non-truncated citations found by the shared scanner.
 
-    def _check_et_al(self, text: str, strict: bool, issues: list[VerificationIssue]) -> None:
-        """Flag citations listing three or more authors without 'et al.'."""
-        for match in _NARRATIVE_CITATION.finditer(text):
-            authors = match.group(1)
-            if _ET_AL in authors:
-                continue
-            count = self._author_count(authors)
-            if count >= 3:
+        Uses the same memoized paragraph scan as the formatter, so every
+        citation the verifier reports is one the formatter rewrites.
+        """
+        scan = scan_citations(text)
+        for found in scan.issues:
+            if found.rule == "ampersand":
                 issues.append(
                     VerificationIssue(
-                        check=f"{CheckCategory.CITATIONS}.et_al",
-                        severity="error" if strict else "warning",
-                        expected="First author followed by 'et al.' for 3+ authors",
-                        actual=f"'{authors}' lists {count} authors",
-                        evidence=f"Narrative citation '{authors} (…)' should use 'et al.'",
+                        check=f"{CheckCategory.CITATIONS}.ampersand",
+                        severity="error",
+                        expected="Authors joined with '&' inside parentheses",
+                        actual=f"'{found.authors}' joined with 'y'",
+                        evidence=(
+                            f"Citation '({found.segment})' must use '&' before the last author"
+                        ),
                     )
                 )
-
-        for match in _PAREN_FULL.finditer(text):
-            for segment in match.group(1).split(";"):
-                segment = segment.strip()
-                year = _YEAR_TAIL.search(segment)
-                if year is None:
-                    continue
-                authors = segment[: year.start()].strip()
-                if _ET_AL in authors:
-                    continue
-                count = self._author_count(authors)
-                if count >= 3:
-                    issues.append(
-                        VerificationIssue(
-                            check=f"{CheckCategory.CITATIONS}.et_al",
-                            severity="error" if strict else "warning",
-                            expected="First author followed by 'et al.' for 3+ authors",
-                            actual=f"'{authors}' lists {count} authors",
-                            evidence=f"Citation '({segment})' should be truncated with 'et al.'",
-                        )
-                    )
+        for found in scan.issues:
+            if found.rule != "et_al":
+                continue
+            if found.form == "narrative":
+                evidence = f"Narrative citation '{found.authors} (…)' should use 'et al.'"
+            else:
+                evidence = f"Citation '({found.segment})' should be truncated with 'et al.'"
+            issues.append(
+                VerificationIssue(
+                    check=f"{CheckCategory.CITATIONS}.et_al",
+                    severity="error" if strict else "warning",
+                    expected="First author followed by 'et al.' for 3+ authors",
+                    actual=f"'{found.authors}' lists {found.count} authors",
+                    evidence=evidence,
+                )
+            )
 
     def _check_block_quote(self, text: str, strict: bool, issues: list[VerificationIssue]) -> None:
         """Flag 40+ word quotations still wrapped in quotation marks."""
@@ -150,10 +114,3 @@ class CitationsCheck:
                 evidence="Quotations of 40+ words must be freestanding block quotes (APA 8.27)",
             )
         )
-
-    @staticmethod
-    def _author_count(segment: str) -> int:
-        """Count author-like tokens in a citation segment."""
-        tokens = re.split(r"\s*,\s*|\s+[y&]\s+", segment.strip())
-        matched = [t for t in tokens if re.fullmatch(_AUTHOR, t)]
-        return len(matched) if tokens and len(matched) == len(tokens) else 0
@@ -14,7 +14,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Literal
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 class CoverPageCheck:
     """Check cover page formatting against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run cover page verification.
 
@@ -34,7 +36,7 @@ class CoverPageCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         if not paragraphs_info:
             issues.append(
@@ -175,7 +177,7 @@ class CoverPageCheck:
                 )
             )
 
-        first_page_header = " ".join(ctx.docx.get_header_text("first").split()).upper()
+        first_page_header = " ".join(ctx.snapshot.header_text("first").split()).upper()
         if not first_page_header or first_page_header not in {"PAGE", "1"}:
             issues.append(
                 VerificationIssue(
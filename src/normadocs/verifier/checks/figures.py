@@ -12,9 +12,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, TypedDict
 
-from docx.oxml.ns import qn
-
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 from ..docx_analyzer import DOCXParagraphInfo
 
 if TYPE_CHECKING:
@@ -32,6 +30,8 @@ class FigureCaption(TypedDict):
 class FiguresCheck:
     """Check figure formatting against APA 7th Edition requirements."""
 
+    cost = CheckCost.PDF_TEXT
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run figures verification.
 
@@ -43,7 +43,7 @@ class FiguresCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         figure_captions: list[FigureCaption] = []
         for i, p_info in enumerate(paragraphs_info):
@@ -94,19 +94,18 @@ class FiguresCheck:
         self._check_numbering_sequence(figure_captions, issues)
         self._check_caption_position(figure_captions, ctx, issues)
 
-        if not figure_captions:
-            text_by_page = ctx.pdf.extract_text_by_page()
-            all_text = " ".join(text for text in text_by_page.values())
-            if "figure" in all_text.lower() or "figura" in all_text.lower():
-                issues.append(
-                    VerificationIssue(
-                        check=f"{CheckCategory.FIGURES}.caption_format",
-                        severity="warning",
-                        expected="Figure captions properly formatted",
-                        actual="Potential figure references found without proper caption",
-                        evidence="Document may contain figures without APA-formatted captions",
-                    )
+        if not figure_captions and (
+            ctx.pdf.contains_text("figure") or ctx.pdf.contains_text("figura")
+        ):
+            issues.append(
+                VerificationIssue(
+                    check=f"{CheckCategory.FIGURES}.caption_format",
+                    severity="warning",
+                    expected="Figure captions properly formatted",
+                    actual="Potential figure references found without proper caption",
+                    evidence="Document may contain figures without APA-formatted captions",
                 )
+            )
 
         return issues
 
@@ -138,11 +137,7 @@ class FiguresCheck:
         issues: list[VerificationIssue],
     ) -> None:
         """Verify each caption sits above its figure image (APA 7)."""
-        image_indices = [
-            i
-            for i, p in enumerate(ctx.docx.paragraphs)
-            if p._element.findall(f".//{qn('w:drawing')}")
-        ]
+        image_indices = ctx.snapshot.image_paragraphs
         if not image_indices:
             return
 
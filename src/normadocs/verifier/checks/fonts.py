@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -23,6 +23,8 @@ FONT_SIZE_TOLERANCE = 1.0
 class FontsCheck:
     """Check fonts against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run fonts verification.
 
@@ -34,7 +36,7 @@ class FontsCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         body_fonts: dict[str, int] = {}
         body_font_sizes: dict[float, int] = {}
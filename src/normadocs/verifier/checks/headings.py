@@ -13,7 +13,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
 class HeadingsCheck:
     """Check heading formatting against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run headings verification.
 
@@ -38,7 +40,7 @@ class HeadingsCheck:
         for i in range(1, 6):
             headings_found[i] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
         for p_info in paragraphs_info:
             if p_info.style_name and p_info.style_name.startswith("Heading"):
                 try:
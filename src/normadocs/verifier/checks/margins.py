@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -24,6 +24,8 @@ APA_PAGE_HEIGHT = 11.0
 class MarginsCheck:
     """Check margins and page size against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run margins verification.
 
@@ -35,7 +37,7 @@ class MarginsCheck:
         """
         issues: list[VerificationIssue] = []
 
-        docx_info = ctx.docx.get_page_info()
+        docx_info = ctx.snapshot.page
         margins = docx_info.margins
         page_width = docx_info.page_width
         page_height = docx_info.page_height
@@ -104,13 +106,9 @@ class MarginsCheck:
         # A DOCX may contain multiple sections with independent page setup.
         # Strict validation checks every section rather than trusting section 1.
         if ctx.strict:
-            for section_index, section in enumerate(ctx.docx.doc.sections[1:], start=2):
-                section_margins = {
-                    "top": int(section.top_margin or 0) / 914400.0,
-                    "bottom": int(section.bottom_margin or 0) / 914400.0,
-                    "left": int(section.left_margin or 0) / 914400.0,
-                    "right": int(section.right_margin or 0) / 914400.0,
-                }
+            for section_index, section in enumerate(ctx.snapshot.sections[1:], start=2):
+                top, right, bottom, left = section.margins
+                section_margins = {"top": top, "bottom": bottom, "left": left, "right": right}
                 for margin_name, actual in section_margins.items():
                     if abs(actual - APA_MARGIN) > MARGIN_TOLERANCE:
                         issues.append(
@@ -124,8 +122,8 @@ class MarginsCheck:
                                 ),
                             )
                         )
-                section_width = int(section.page_width or 0) / 914400.0
-                section_height = int(section.page_height or 0) / 914400.0
+                section_width = section.page_width
+                section_height = section.page_height
                 if abs(section_width - APA_PAGE_WIDTH) > 0.1:
                     issues.append(
                         VerificationIssue(
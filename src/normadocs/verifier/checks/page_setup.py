@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 class PageSetupCheck:
     """Check page setup against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run page setup verification.
 
@@ -31,7 +33,7 @@ class PageSetupCheck:
         """
         issues: list[VerificationIssue] = []
 
-        docx_info = ctx.docx.get_page_info()
+        docx_info = ctx.snapshot.page
 
         if not docx_info.has_different_first_page_header_footer:
             issues.append(
@@ -44,7 +46,7 @@ class PageSetupCheck:
                 )
             )
 
-        default_header = " ".join(ctx.docx.get_header_text("default").split()).upper()
+        default_header = " ".join(ctx.snapshot.header_text("default").split()).upper()
         if ctx.strict:
             default_header_valid = default_header == "PAGE" or default_header.isdigit()
         else:
@@ -61,7 +63,7 @@ class PageSetupCheck:
             )
 
         if ctx.strict:
-            first_header = " ".join(ctx.docx.get_header_text("first").split()).upper()
+            first_header = " ".join(ctx.snapshot.header_text("first").split()).upper()
             if first_header != "PAGE" and not first_header.isdigit():
                 issues.append(
                     VerificationIssue(
@@ -76,9 +78,9 @@ class PageSetupCheck:
             footer_text = " ".join(
                 " ".join(
                     (
-                        ctx.docx.get_footer_text("default"),
-                        ctx.docx.get_footer_text("first"),
-                        ctx.docx.get_footer_text("even"),
+                        ctx.snapshot.footer_text("default"),
+                        ctx.snapshot.footer_text("first"),
+                        ctx.snapshot.footer_text("even"),
                     )
                 ).split()
             )
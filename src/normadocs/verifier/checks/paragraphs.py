@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 
 from .. import (
     CheckCategory,
+    CheckCost,
     VerificationIssue,
     caption_and_title_indexes,
     is_apa_caption_or_table_title,
@@ -30,6 +31,8 @@ INDENT_TOLERANCE = 0.1
 class ParagraphsCheck:
     """Check paragraph formatting against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run paragraphs verification.
 
@@ -41,7 +44,7 @@ class ParagraphsCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         # Track sections to exclude abstract and references from body indent check
         in_abstract = False
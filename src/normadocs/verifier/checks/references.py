@@ -3,7 +3,8 @@
 Verifies references section meets APA 7th Edition requirements:
 - Section titled "Referencias" or "References" at document end
 - Hanging indent (0.5 inches) on all references
-- Alphabetical order
+- Alphabetical order (collated for the context's ``reference_locale``)
+- No repeated entries
 - Proper APA 7th citation format
 - Double-spaced throughout
 """
@@ -13,7 +14,8 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from .. import CheckCategory, VerificationIssue
+from ...utils.references import find_duplicates, sort_key
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -22,21 +24,7 @@ if TYPE_CHECKING:
 class ReferencesCheck:
     """Check references formatting against APA 7th Edition requirements."""
 
-    @staticmethod
-    def _sort_key(reference: str) -> tuple[str, int, str]:
-        """Return an APA-aware ordering key for a reference entry.
-
-        APA orders works alphabetically by author, then chronologically for
-        works by the same author. Undated works (``s. f.``/``n.d.``) precede
-        dated works, which a plain lexical comparison does not implement.
-        """
-        author = reference.split("(", 1)[0].strip().casefold()
-        date_match = re.search(r"\((s\.\s*f\.|n\.\s*d\.|\d{4})\)", reference, re.IGNORECASE)
-        if date_match is None or date_match.group(1).casefold() in {"s. f.", "n. d."}:
-            year = 0
-        else:
-            year = int(date_match.group(1))
-        return author, year, reference.casefold()
+    cost = CheckCost.DOCX
 
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run references verification.
@@ -49,7 +37,7 @@ class ReferencesCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         ref_section_idx = None
         ref_keywords = ["referencias", "references", "bibliografía", "bibliography"]
@@ -137,8 +125,9 @@ class ReferencesCheck:
             )
 
         ref_texts = [p.text.strip() for p in ref_paragraphs]
+        keys = [sort_key(text, ctx.reference_locale) for text in ref_texts]
         for i in range(len(ref_texts) - 1):
-            if self._sort_key(ref_texts[i]) > self._sort_key(ref_texts[i + 1]):
+            if keys[i] > keys[i + 1]:
                 issues.append(
                     VerificationIssue(
                         check=f"{CheckCategory.REFERENCES}.alphabetical_order",
@@ -150,6 +139,21 @@ class ReferencesCheck:
                 )
                 break
 
+        for duplicate in find_duplicates(ref_texts):
+            kind = "Exact" if duplicate.exact else "Near"
+            issues.append(
+                VerificationIssue(
+                    check=f"{CheckCategory.REFERENCES}.duplicate",
+                    severity="warning",
+                    expected="Each work listed once",
+                    actual=f"'{ref_texts[duplicate.index]}'",
+                    evidence=(
+                        f"{kind} duplicate: reference {duplicate.index + 1} repeats "
+                        f"reference {duplicate.original + 1}"
+                    ),
+                )
+            )
+
         issues.extend(self._check_entry_format(ref_paragraphs))
 
         return issues
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 
 if TYPE_CHECKING:
     from ..apa_verifier import VerificationContext
@@ -23,6 +23,8 @@ MAX_RUNNING_HEAD_LENGTH = 50
 class RunningHeadCheck:
     """Check running head against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run running head verification.
 
@@ -34,7 +36,7 @@ class RunningHeadCheck:
         """
         issues: list[VerificationIssue] = []
 
-        docx_info = ctx.docx.get_page_info()
+        docx_info = ctx.snapshot.page
 
         if not docx_info.has_different_first_page_header_footer:
             issues.append(
@@ -47,8 +49,8 @@ class RunningHeadCheck:
                 )
             )
 
-        default_header = ctx.docx.get_header_text("default")
-        first_page_header = ctx.docx.get_header_text("first")
+        default_header = ctx.snapshot.header_text("default")
+        first_page_header = ctx.snapshot.header_text("first")
 
         if not default_header.strip():
             expected_header = (
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 from .. import (
     CheckCategory,
+    CheckCost,
     VerificationIssue,
     caption_and_title_indexes,
     is_apa_caption_or_table_title,
@@ -27,6 +28,8 @@ LINE_SPACING_TOLERANCE = 0.2
 class SpacingCheck:
     """Check line spacing against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run spacing verification.
 
@@ -38,7 +41,7 @@ class SpacingCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
+        paragraphs_info = ctx.snapshot.paragraphs
 
         # Indexes of caption paragraphs and their following title lines
         # (APA 7 allows single spacing in captions and titles).
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from itertools import pairwise
 from typing import TYPE_CHECKING, Literal
 
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 from ..docx_analyzer import DOCXParagraphInfo
 
 if TYPE_CHECKING:
@@ -44,6 +45,8 @@ KEYWORD_PREFIXES = ("palabras clave:", "keywords:")
 class StructureCheck:
     """Check the required structure of a general academic APA report."""
 
+    cost = CheckCost.DOCX
+
     @staticmethod
     def _normalize(text: str) -> str:
         """Normalize heading text for Spanish/English structural matching."""
@@ -94,7 +97,10 @@ class StructureCheck:
 
     @staticmethod
     def _has_content(
-        paragraphs: list[DOCXParagraphInfo], start: int, end: int, exclude_keywords: bool = False
+        paragraphs: Sequence[DOCXParagraphInfo],
+        start: int,
+        end: int,
+        exclude_keywords: bool = False,
     ) -> bool:
         """Return whether a section contains substantive non-empty paragraphs."""
         for paragraph in paragraphs[start:end]:
@@ -108,7 +114,7 @@ class StructureCheck:
 
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Validate report structure and section ordering."""
-        paragraphs = ctx.docx.get_paragraphs_info()
+        paragraphs = ctx.snapshot.paragraphs
         issues: list[VerificationIssue] = []
         nonempty = [
             (index, paragraph)
@@ -12,10 +12,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, TypedDict
 
-from docx.oxml.ns import qn
-
-from ...utils.docx_helpers import paragraph_style_name
-from .. import CheckCategory, VerificationIssue
+from .. import CheckCategory, CheckCost, VerificationIssue
 from ..docx_analyzer import DOCXParagraphInfo
 
 if TYPE_CHECKING:
@@ -33,6 +30,8 @@ class TableCaption(TypedDict):
 class TablesCheck:
     """Check table formatting against APA 7th Edition requirements."""
 
+    cost = CheckCost.DOCX
+
     def run(self, ctx: VerificationContext) -> list[VerificationIssue]:
         """Run tables verification.
 
@@ -44,8 +43,8 @@ class TablesCheck:
         """
         issues: list[VerificationIssue] = []
 
-        paragraphs_info = ctx.docx.get_paragraphs_info()
-        tables_info = ctx.docx.get_tables_info()
+        paragraphs_info = ctx.snapshot.paragraphs
+        tables_info = ctx.snapshot.tables
 
         table_numbers: list[TableCaption] = []
         for i, p_info in enumerate(paragraphs_info):
@@ -123,10 +122,8 @@ class TablesCheck:
                 )
 
             if ctx.strict and idx < len(table_numbers):
-                table_element = ctx.docx.tables[idx]._tbl
-                caption_element = ctx.docx.paragraphs[table_numbers[idx]["index"]]._element
-                body_children = list(ctx.docx.doc._body._element)
-                if body_children.index(caption_element) > body_children.index(table_element):
+                caption_position = ctx.snapshot.position("p", table_numbers[idx]["index"])
+                if caption_position > ctx.snapshot.position("tbl", idx):
                     issues.append(
                         VerificationIssue(
                             check=f"{CheckCategory.TABLES}.caption_position",
@@ -137,25 +134,16 @@ class TablesCheck:
                         )
                     )
 
-            if ctx.strict:
-                table_element = ctx.docx.tables[idx]._tbl
-                properties = table_element.tblPr
-                borders = properties.find(qn("w:tblBorders")) if properties is not None else None
-                vertical_edges = ("left", "right", "insideV")
-                if borders is not None and any(
-                    (edge := borders.find(qn(f"w:{name}"))) is not None
-                    and edge.get(qn("w:val")) not in {None, "nil", "none"}
-                    for name in vertical_edges
-                ):
-                    issues.append(
-                        VerificationIssue(
-                            check=f"{CheckCategory.TABLES}.vertical_borders",
-                            severity="error",
-                            expected="Horizontal borders only",
-                            actual="Vertical table border detected",
-                            evidence=f"Table {idx + 1} contains a vertical border",
-                        )
+            if ctx.strict and not tables_info[idx].has_horizontal_borders_only:
+                issues.append(
+                    VerificationIssue(
+                        check=f"{CheckCategory.TABLES}.vertical_borders",
+                        severity="error",
+                        expected="Horizontal borders only",
+                        actual="Vertical table border detected",
+                        evidence=f"Table {idx + 1} contains a vertical border",
                     )
+                )
 
         self._check_numbering_sequence(table_numbers, issues)
         self._check_table_notes(ctx, issues)
@@ -185,29 +173,25 @@ class TablesCheck:
 
     def _check_table_notes(self, ctx: VerificationContext, issues: list[VerificationIssue]) -> None:
         """Verify each table has an APA-formatted 'Nota.' below it."""
-        from docx.text.paragraph import Paragraph
+        snapshot = ctx.snapshot
 
-        body_children = list(ctx.docx.doc._body._element)
-
-        for t_idx, table in enumerate(ctx.docx.tables):
+        for t_idx in range(len(snapshot.tables)):
             try:
-                t_pos = body_children.index(table._tbl)
+                t_pos = snapshot.position("tbl", t_idx)
             except ValueError:
                 continue
 
-            note_para: Paragraph | None = None
-            for el in body_children[t_pos + 1 :]:
-                if el.tag == qn("w:tbl"):
+            note_para: DOCXParagraphInfo | None = None
+            for kind, index in snapshot.body_order[t_pos + 1 :]:
+                if kind == "tbl":
                     break
-                if el.tag != qn("w:p"):
-                    continue
-                para = Paragraph(el, ctx.docx.doc)
+                para = snapshot.paragraphs[index]
                 text = para.text.strip()
                 if not text:
                     continue
                 if re.match(r"^(Tabla|Table|Figura|Figure)\s+\d+", text):
                     break
-                style_name = paragraph_style_name(para)
+                style_name = para.style_name or ""
                 if style_name.startswith("Heading"):
                     break
                 if re.match(r"^Not[ae]\b", text):
@@ -241,9 +225,9 @@ class TablesCheck:
                     )
                 )
             nota_run = next(
-                (r for r in note_para.runs if r.text.strip().lower().startswith("nota")), None
+                (r for r in note_para.runs if r["text"].strip().lower().startswith("nota")), None
             )
-            if nota_run is not None and not nota_run.italic:
+            if nota_run is not None and not nota_run["italic"]:
                 issues.append(
                     VerificationIssue(
                         check=f"{CheckCategory.TABLES}.note_italic",
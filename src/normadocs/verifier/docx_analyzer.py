@@ -6,16 +6,27 @@ including styles, paragraphs, tables, headers, and footers.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, Literal, cast
 
 from docx import Document
+from docx.document import Document as DocumentObject
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml.ns import qn
+from docx.section import Section
 from docx.styles.style import BaseStyle, ParagraphStyle
 from docx.text.paragraph import Paragraph
 
+# Bump when the extracted facts change, so cached snapshots are discarded.
+DOCX_EXTRACTOR_VERSION = 1
+
 PageMargins = tuple[float, float, float, float]
+BodyElement = tuple[Literal["p", "tbl"], int]
+
+HEADER_FOOTER_TYPES = ("default", "first", "even")
 
 
 @dataclass
@@ -31,7 +42,7 @@ class DOCXStyleInfo:
     first_line_indent: float | None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DOCXPageInfo:
     """Information about page layout and headers."""
 
@@ -39,12 +50,16 @@ class DOCXPageInfo:
     page_height: float
     margins: PageMargins
     has_different_first_page_header_footer: bool = False
-    header_text_pages: dict[int, str] = field(default_factory=dict)
+    header_text_pages: Mapping[int, str] = field(default_factory=lambda: MappingProxyType({}))
 
 
-@dataclass
+@dataclass(frozen=True)
 class DOCXParagraphInfo:
-    """Detailed paragraph information."""
+    """Detailed paragraph information.
+
+    ``runs`` holds one read-only mapping per run (``text``, ``font_name``,
+    ``font_size``, ``bold``, ``italic``).
+    """
 
     text: str
     style_name: str | None
@@ -53,10 +68,10 @@ class DOCXParagraphInfo:
     space_before: float | None
     space_after: float | None
     line_spacing: float | None
-    runs: list[dict[str, Any]] = field(default_factory=list)
+    runs: tuple[Mapping[str, Any], ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True)
 class DOCXTableInfo:
     """Table information."""
 
@@ -67,6 +82,59 @@ class DOCXTableInfo:
     has_horizontal_borders_only: bool = True
 
 
+@dataclass(frozen=True, slots=True)
+class DOCXSnapshot:
+    """An immutable view of everything the checks read from a DOCX.
+
+    Built once per verification run by :meth:`DOCXAnalyzer.snapshot` so that
+    the checks share a single walk over paragraphs, runs and styles.
+
+    Attributes:
+        paragraphs: Paragraph details in document order (``Document.paragraphs``).
+        tables: Table details in document order (``Document.tables``).
+        sections: Page layout of every section, in document order.
+        headers: Header text of the first section by type
+            (``"default"``, ``"first"``, ``"even"``).
+        footers: Footer text of the first section by type.
+        body_order: Top-level body elements as ``("p", i)`` / ``("tbl", j)``,
+            indexing into ``paragraphs`` and ``tables``.
+        image_paragraphs: Indexes of paragraphs that contain a drawing.
+        title: Core-properties title.
+        author: Core-properties author.
+    """
+
+    paragraphs: tuple[DOCXParagraphInfo, ...] = ()
+    tables: tuple[DOCXTableInfo, ...] = ()
+    sections: tuple[DOCXPageInfo, ...] = ()
+    headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    footers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    body_order: tuple[BodyElement, ...] = ()
+    image_paragraphs: tuple[int, ...] = ()
+    title: str | None = None
+    author: str | None = None
+
+    @property
+    def page(self) -> DOCXPageInfo:
+        """Layout of the first section."""
+        return self.sections[0]
+
+    def header_text(self, header_type: str = "default") -> str:
+        """Return the header text of a type, empty when absent."""
+        return self.headers.get(header_type, "")
+
+    def footer_text(self, footer_type: str = "default") -> str:
+        """Return the footer text of a type, empty when absent."""
+        return self.footers.get(footer_type, "")
+
+    def position(self, kind: Literal["p", "tbl"], index: int) -> int:
+        """Return the body position of a paragraph or table.
+
+        Raises:
+            ValueError: If the element is not a top-level body element.
+        """
+        return self.body_order.index((kind, index))
+
+
 class DOCXAnalyzer:
     """Analyzes DOCX documents using python-docx.
 
@@ -74,14 +142,25 @@ class DOCXAnalyzer:
     and all APA-relevant elements.
     """
 
-    def __init__(self, docx_path: str | Path) -> None:
+    def __init__(self, docx_path: str | Path, snapshot: DOCXSnapshot | None = None) -> None:
         """Initialize the DOCX analyzer.
 
         Args:
             docx_path: Path to the DOCX file to analyze.
+            snapshot: Previously extracted facts, e.g. from a ``FactCache``.
+                The file is then only parsed if python-docx objects are
+                requested.
         """
         self.doc_path = Path(docx_path)
-        self.doc = Document(str(docx_path))
+        self._doc: DocumentObject | None = None
+        self._snapshot = snapshot
+
+    @property
+    def doc(self) -> DocumentObject:
+        """The python-docx document, parsed on first access."""
+        if self._doc is None:
+            self._doc = Document(str(self.doc_path))
+        return self._doc
 
     @property
     def paragraphs(self) -> list[Paragraph]:
@@ -104,7 +183,11 @@ class DOCXAnalyzer:
         Returns:
             DOCXPageInfo with all layout details.
         """
-        section = self.doc.sections[0]
+        return self._section_info(self.doc.sections[0])
+
+    @staticmethod
+    def _section_info(section: Section) -> DOCXPageInfo:
+        """Extract the page layout of a section."""
 
         def emu_to_inches(emu: Any) -> float:
             if emu is None:
@@ -186,10 +269,9 @@ class DOCXAnalyzer:
         paragraphs_info: list[DOCXParagraphInfo] = []
 
         for p in self.paragraphs:
-            runs_data: list[dict[str, Any]] = []
             style_font = p.style.font if p.style is not None else None
-            for run in p.runs:
-                runs_data.append(
+            runs_data = tuple(
+                MappingProxyType(
                     {
                         "text": run.text,
                         "font_name": run.font.name or (style_font.name if style_font else None),
@@ -198,6 +280,8 @@ class DOCXAnalyzer:
                         "italic": run.italic,
                     }
                 )
+                for run in p.runs
+            )
 
             alignment_value = p.alignment
             if alignment_value is None and p.style is not None:
@@ -228,6 +312,49 @@ class DOCXAnalyzer:
 
         return paragraphs_info
 
+    def snapshot(self) -> DOCXSnapshot:
+        """Return the memoized read-only snapshot of the document.
+
+        The first call extracts paragraphs, tables, headers, footers and the
+        body element order; later calls return the same object.
+
+        Returns:
+            The DOCXSnapshot shared by all verification checks.
+        """
+        if self._snapshot is None:
+            body_order: list[BodyElement] = []
+            counts = {"p": 0, "tbl": 0}
+            for child in self.doc.element.body.iterchildren():
+                kind: Literal["p", "tbl"]
+                if child.tag == qn("w:p"):
+                    kind = "p"
+                elif child.tag == qn("w:tbl"):
+                    kind = "tbl"
+                else:
+                    continue
+                body_order.append((kind, counts[kind]))
+                counts[kind] += 1
+
+            drawing = f".//{qn('w:drawing')}"
+            self._snapshot = DOCXSnapshot(
+                paragraphs=tuple(self.get_paragraphs_info()),
+                tables=tuple(self.get_tables_info()),
+                sections=tuple(self._section_info(section) for section in self.doc.sections),
+                headers=MappingProxyType(
+                    {kind: self.get_header_text(kind) for kind in HEADER_FOOTER_TYPES}
+                ),
+                footers=MappingProxyType(
+                    {kind: self.get_footer_text(kind) for kind in HEADER_FOOTER_TYPES}
+                ),
+                body_order=tuple(body_order),
+                image_paragraphs=tuple(
+                    i for i, p in enumerate(self.paragraphs) if p._element.findall(drawing)
+                ),
+                title=self.doc.core_properties.title,
+                author=self.doc.core_properties.author,
+            )
+        return self._snapshot
+
     def get_style_info(self, style_name: str) -> DOCXStyleInfo | None:
         """Get detailed information about a specific style.
 
@@ -272,12 +399,21 @@ class DOCXAnalyzer:
             caption = None
             caption_position = None
 
+            properties = table._tbl.tblPr
+            borders = properties.find(qn("w:tblBorders")) if properties is not None else None
+            vertical_borders = borders is not None and any(
+                (edge := borders.find(qn(f"w:{name}"))) is not None
+                and edge.get(qn("w:val")) not in {None, "nil", "none"}
+                for name in ("left", "right", "insideV")
+            )
+
             tables_info.append(
                 DOCXTableInfo(
                     rows=rows,
                     cols=cols,
                     caption=caption,
                     caption_position=caption_position,
+                    has_horizontal_borders_only=not vertical_borders,
                 )
             )
 
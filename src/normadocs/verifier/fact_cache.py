@@ -0,0 +1,256 @@
+"""On-disk cache of extracted verification facts.
+
+Re-verifying an unchanged PDF/DOCX pair (for example with another strictness
+or only to render a report in another format) can skip parsing both files.
+Facts are stored per input file, keyed by the SHA-256 of its content and by
+the extractor version, so editing the file or upgrading the extractor
+invalidates them.
+
+The files are meant to be readable without normadocs:
+
+- ``docx-v{version}-{sha256}.json``: the ``DOCXSnapshot`` as JSON. Lengths
+  (indents, spacing, run font sizes) are integers in EMU.
+- ``pdf-{backend}-v{version}-{sha256}.npz``: a NumPy archive (no pickles)
+  with ``glyphs`` (``GLYPH_DTYPE`` records of every page), ``texts`` (page
+  text, indexed by the glyph ``offset``), ``sizes`` (page width and height
+  in points) and ``fonts`` (font names, indexed by the glyph ``font_id``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import zipfile
+from dataclasses import asdict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+from docx.shared import Length
+
+from .docx_analyzer import (
+    DOCX_EXTRACTOR_VERSION,
+    DOCXPageInfo,
+    DOCXParagraphInfo,
+    DOCXSnapshot,
+    DOCXTableInfo,
+)
+from .pdf_analyzer import PDF_EXTRACTOR_VERSION, PDFAnalyzer
+
+logger = logging.getLogger("normadocs")
+
+_CHUNK_SIZE = 1 << 20
+_PDF_ARRAYS = ("glyphs", "texts", "sizes", "fonts")
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        while chunk := fh.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _emu(value: float | None) -> int | None:
+    # python-docx lengths are int subclasses (Twips, Pt, ...) whose
+    # constructors take other units, so they cannot be copied as-is.
+    return None if value is None else int(value)
+
+
+def _length(value: int | None) -> Length | None:
+    return None if value is None else Length(value)
+
+
+def _paragraph_to_dict(paragraph: DOCXParagraphInfo) -> dict[str, Any]:
+    return {
+        "text": paragraph.text,
+        "style_name": paragraph.style_name,
+        "alignment": paragraph.alignment,
+        "first_line_indent": _emu(paragraph.first_line_indent),
+        "space_before": _emu(paragraph.space_before),
+        "space_after": _emu(paragraph.space_after),
+        "line_spacing": paragraph.line_spacing,
+        "runs": [{**run, "font_size": _emu(run["font_size"])} for run in paragraph.runs],
+    }
+
+
+def _section_to_dict(section: DOCXPageInfo) -> dict[str, Any]:
+    return {
+        "page_width": section.page_width,
+        "page_height": section.page_height,
+        "margins": list(section.margins),
+        "has_different_first_page_header_footer": section.has_different_first_page_header_footer,
+        "header_text_pages": dict(section.header_text_pages),
+    }
+
+
+def snapshot_to_dict(snapshot: DOCXSnapshot) -> dict[str, Any]:
+    """Convert a DOCX snapshot to JSON-compatible data."""
+    return {
+        "paragraphs": [_paragraph_to_dict(p) for p in snapshot.paragraphs],
+        "tables": [asdict(t) for t in snapshot.tables],
+        "sections": [_section_to_dict(s) for s in snapshot.sections],
+        "headers": dict(snapshot.headers),
+        "footers": dict(snapshot.footers),
+        "body_order": [list(element) for element in snapshot.body_order],
+        "image_paragraphs": list(snapshot.image_paragraphs),
+        "title": snapshot.title,
+        "author": snapshot.author,
+    }
+
+
+def snapshot_from_dict(data: dict[str, Any]) -> DOCXSnapshot:
+    """Rebuild a DOCX snapshot from :func:`snapshot_to_dict` data."""
+    paragraphs = tuple(
+        DOCXParagraphInfo(
+            text=p["text"],
+            style_name=p["style_name"],
+            alignment=p["alignment"],
+            first_line_indent=_length(p["first_line_indent"]),
+            space_before=_length(p["space_before"]),
+            space_after=_length(p["space_after"]),
+            line_spacing=p["line_spacing"],
+            runs=tuple(
+                MappingProxyType({**run, "font_size": _length(run["font_size"])})
+                for run in p["runs"]
+            ),
+        )
+        for p in data["paragraphs"]
+    )
+    sections = tuple(
+        DOCXPageInfo(
+            page_width=s["page_width"],
+            page_height=s["page_height"],
+            margins=(s["margins"][0], s["margins"][1], s["margins"][2], s["margins"][3]),
+            has_different_first_page_header_footer=s["has_different_first_page_header_footer"],
+            header_text_pages=MappingProxyType(
+                {int(k): v for k, v in s["header_text_pages"].items()}
+            ),
+        )
+        for s in data["sections"]
+    )
+    return DOCXSnapshot(
+        paragraphs=paragraphs,
+        tables=tuple(DOCXTableInfo(**t) for t in data["tables"]),
+        sections=sections,
+        headers=MappingProxyType(dict(data["headers"])),
+        footers=MappingProxyType(dict(data["footers"])),
+        body_order=tuple((kind, index) for kind, index in data["body_order"]),
+        image_paragraphs=tuple(data["image_paragraphs"]),
+        title=data["title"],
+        author=data["author"],
+    )
+
+
+class FactCache:
+    """Directory of extracted DOCX snapshots and PDF page facts.
+
+    Unreadable or outdated entries count as misses. Entries are written
+    atomically, so concurrent verifiers may share a directory.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory; created on the first write.
+        """
+        self.directory = Path(directory)
+        self._digests: dict[tuple[Path, int, int], str] = {}
+
+    def _digest(self, path: Path) -> str:
+        """Return the file digest, memoized by path, size and mtime."""
+        stat = path.stat()
+        key = (path.resolve(), stat.st_size, stat.st_mtime_ns)
+        if key not in self._digests:
+            self._digests[key] = file_digest(path)
+        return self._digests[key]
+
+    def docx_entry(self, docx_path: str | Path) -> Path:
+        """Return the cache file holding the snapshot of a DOCX."""
+        digest = self._digest(Path(docx_path))
+        return self.directory / f"docx-v{DOCX_EXTRACTOR_VERSION}-{digest}.json"
+
+    def pdf_entry(self, pdf_path: str | Path, backend: str) -> Path:
+        """Return the cache file holding the page facts of a PDF."""
+        digest = self._digest(Path(pdf_path))
+        return self.directory / f"pdf-{backend}-v{PDF_EXTRACTOR_VERSION}-{digest}.npz"
+
+    def _write(self, entry: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{entry.name}.")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, entry)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def load_docx(self, docx_path: str | Path) -> DOCXSnapshot | None:
+        """Return the cached snapshot of a DOCX, or None on a miss.
+
+        A missing DOCX is a miss too.
+        """
+        try:
+            entry = self.docx_entry(docx_path)
+            return snapshot_from_dict(json.loads(entry.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            logger.debug("Ignoring unreadable fact cache entry for %s: %s", docx_path, e)
+            return None
+
+    def store_docx(self, docx_path: str | Path, snapshot: DOCXSnapshot) -> Path:
+        """Write the snapshot of a DOCX and return the cache file."""
+        entry = self.docx_entry(docx_path)
+        data = json.dumps(snapshot_to_dict(snapshot), ensure_ascii=False, separators=(",", ":"))
+        self._write(entry, data.encode("utf-8"))
+        return entry
+
+    def load_pdf(self, analyzer: PDFAnalyzer) -> bool:
+        """Restore cached page facts into an analyzer.
+
+        Returns:
+            True on a hit, False when the analyzer must extract the PDF
+            (also when the PDF does not exist).
+        """
+        try:
+            entry = self.pdf_entry(analyzer.pdf_path, analyzer.backend)
+            with np.load(entry, allow_pickle=False) as archive:
+                arrays = [archive[name] for name in _PDF_ARRAYS]
+            analyzer.load_facts(*arrays)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, IndexError, zipfile.BadZipFile) as e:
+            logger.debug("Ignoring unreadable fact cache entry for %s: %s", analyzer.pdf_path, e)
+            return False
+        return True
+
+    def store_pdf(self, analyzer: PDFAnalyzer) -> Path:
+        """Write the facts of an analyzer whose pages are all extracted.
+
+        Raises:
+            ValueError: If a page has not been extracted yet; storing never
+                parses the PDF.
+        """
+        if not analyzer.fully_extracted:
+            raise ValueError(f"Not every page of {analyzer.pdf_path} has been extracted")
+        entry = self.pdf_entry(analyzer.pdf_path, analyzer.backend)
+        buffer = io.BytesIO()
+        facts = analyzer.export_facts()
+        np.savez_compressed(
+            buffer,
+            glyphs=facts["glyphs"],
+            texts=facts["texts"],
+            sizes=facts["sizes"],
+            fonts=facts["fonts"],
+        )
+        self._write(entry, buffer.getvalue())
+        return entry
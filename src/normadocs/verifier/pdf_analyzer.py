@@ -1,20 +1,117 @@
-"""PDF analysis utilities using pdfplumber and PyMuPDF.
+"""PDF analysis utilities using PyMuPDF and, optionally, pdfplumber.
 
 Provides deep extraction of text, coordinates, fonts, and visual information
 from PDF documents for APA verification.
+
+Glyphs are stored column-wise: each page holds a NumPy structured array
+(``GLYPH_DTYPE``) plus its text, and font names are interned in a
+``FontTable``. Text blocks, margins, font histograms and baseline spacing
+are computed with vectorized operations, per page or over all pages at
+once.
+
+Long documents can be extracted by a process pool: pages are split into
+contiguous shards, each worker opens the PDF itself and returns the glyphs,
+text blocks and font counts of its shard (``PageShard``), and the shards
+are merged in page order into the same page table that sequential
+extraction builds.
+
+Text searches go through a ``TextIndex`` of every text block, built on the
+first search and shared by all later ones.
 """
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import fitz
+import numpy as np
+
+from .text_index import TextIndex
+
+# Bump when the extracted glyphs change, so cached facts are discarded.
+PDF_EXTRACTOR_VERSION = 2
 
 PDFBOX_DEFAULT_DPI = 72
+DEFAULT_RENDER_DPI = 150
+DEFAULT_RENDER_CACHE_SIZE = 8
 
 Margins = tuple[float, float, float, float]
+TextBackend = Literal["pymupdf", "pdfplumber"]
+
+TEXT_BACKENDS: tuple[TextBackend, ...] = ("pymupdf", "pdfplumber")
+
+# rawdict without image blocks (the verifier never reads their pixels) and
+# without the spaces PyMuPDF synthesizes between words placed apart, which
+# pdfplumber does not report and which would close BLOCK_GAP.
+_RAWDICT_FLAGS = (fitz.TEXTFLAGS_RAWDICT & ~fitz.TEXT_PRESERVE_IMAGES) | fitz.TEXT_INHIBIT_SPACES
+
+# One record per glyph. Boxes are in points from the top-left corner;
+# ``offset`` indexes the page text, ``span`` numbers runs of one font and
+# size, ``font_id`` indexes the FontTable (-1: unknown) and ``flags`` holds
+# PyMuPDF span flags (0 with pdfplumber).
+GLYPH_DTYPE = np.dtype(
+    [
+        ("page", np.int32),
+        ("span", np.int32),
+        ("offset", np.int32),
+        ("x0", np.float64),
+        ("y0", np.float64),
+        ("x1", np.float64),
+        ("y1", np.float64),
+        ("baseline", np.float64),
+        ("size", np.float64),
+        ("font_id", np.int32),
+        ("flags", np.int32),
+    ]
+)
+
+# Horizontal gap (points) that starts a new text block.
+BLOCK_GAP = 5.0
+
+# Fewest pages per worker process. Measured with
+# scripts/benchmark_pdf_shards.py on text-heavy pages: a spawned worker
+# takes ~0.37 s to start (imports, opening the PDF), a page 8-11 ms to
+# extract and ~0.5 ms to ship back, so two workers on two CPUs break even
+# at 75-115 pages. One worker per 100 pages stays clear of that.
+SHARD_MIN_PAGES = 100
+
+
+def _empty_glyphs() -> np.ndarray:
+    return np.empty(0, dtype=GLYPH_DTYPE)
+
+
+class FontTable:
+    """Interned font names; glyphs store an index into ``names``."""
+
+    def __init__(self) -> None:
+        """Initialize an empty FontTable."""
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, name: str | None) -> int:
+        """Return the id of ``name``, adding it on first use (-1 for None)."""
+        if not name:
+            return -1
+        font_id = self._ids.get(name)
+        if font_id is None:
+            font_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return font_id
+
+    def name(self, font_id: int) -> str | None:
+        """Return the font name of ``font_id`` (None for -1)."""
+        return self.names[font_id] if font_id >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 @dataclass
@@ -28,7 +125,52 @@ class PDFPageInfo:
     images: list[dict[str, Any]] = field(default_factory=list)
     lines: list[dict[str, Any]] = field(default_factory=list)
     fonts: dict[str, int] = field(default_factory=dict)
-    rendered_image: bytes | None = None
+    glyphs: np.ndarray = field(default_factory=_empty_glyphs)
+    text: str = ""
+
+
+@dataclass
+class PageShard:
+    """Facts of a set of pages, as returned by an extraction worker.
+
+    ``glyphs`` holds the pages' glyphs in page order, with ``font_id``
+    indexing this shard's ``fonts``; ``texts``, ``sizes`` (width, height),
+    ``blocks`` (text blocks) and ``font_counts`` (glyphs per font name)
+    follow ``pages``.
+    """
+
+    pages: list[int]
+    glyphs: np.ndarray
+    texts: list[str]
+    sizes: list[tuple[float, float]]
+    fonts: list[str]
+    blocks: list[list[TextBlock]]
+    font_counts: list[dict[str, int]]
+
+
+def _extract_shard(pdf_path: str, backend: TextBackend, pages: list[int]) -> PageShard:
+    """Extract the facts of ``pages`` in a worker process."""
+    analyzer = PDFAnalyzer(pdf_path, backend=backend)
+    try:
+        extracted = [analyzer._extract_page_info(page_num) for page_num in pages]
+    finally:
+        analyzer.close()
+    return PageShard(
+        pages=pages,
+        glyphs=np.concatenate([page.glyphs for page in extracted]),
+        texts=[page.text for page in extracted],
+        sizes=[(page.width, page.height) for page in extracted],
+        fonts=analyzer.fonts.names,
+        blocks=[page.text_blocks for page in extracted],
+        font_counts=[page.fonts for page in extracted],
+    )
+
+
+def _usable_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
 
 
 @dataclass
@@ -50,23 +192,71 @@ class TextBlock:
 
 
 class PDFAnalyzer:
-    """Analyzes PDF documents using pdfplumber and PyMuPDF.
+    """Analyzes PDF documents using PyMuPDF, or pdfplumber on request.
+
+    Text is extracted from PyMuPDF ``rawdict`` spans by default, which is
+    an order of magnitude faster than pdfplumber's per-character objects;
+    the ``pdfplumber`` backend builds the same ``TextBlock`` model. PyMuPDF
+    also renders pages.
+
+    Text queries never rasterize; pages are rendered on demand by
+    ``render_page`` and only the most recently used renders are kept.
+
+    An analyzer may be shared between threads: extraction and rendering,
+    which touch the underlying documents, are serialized by a lock.
 
-    Combines both libraries for maximum extraction capability:
-    - pdfplumber: Best text extraction with positions and metadata
-    - PyMuPDF: Best for rendering and visual analysis
+    With ``processes`` above 1, whole-document queries extract the missing
+    pages in worker processes, in shards of at least ``SHARD_MIN_PAGES``
+    pages and never more shards than usable CPUs; the page table is
+    identical to sequential extraction. Workers
+    are spawned, so scripts must guard their entry point with
+    ``if __name__ == "__main__":``.
     """
 
-    def __init__(self, pdf_path: str | Path) -> None:
+    def __init__(
+        self,
+        pdf_path: str | Path,
+        render_dpi: int = DEFAULT_RENDER_DPI,
+        render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE,
+        backend: TextBackend = "pymupdf",
+        processes: int | None = 1,
+        facts_loader: Callable[[PDFAnalyzer], object] | None = None,
+    ) -> None:
         """Initialize the PDF analyzer.
 
         Args:
             pdf_path: Path to the PDF file to analyze.
+            render_dpi: Default resolution of ``render_page``.
+            render_cache_size: Number of rendered pages kept (0 disables
+                the cache).
+            backend: Text extraction library, "pymupdf" or "pdfplumber".
+            processes: Worker processes extracting long documents; None
+                uses one per usable CPU and 1 extracts in this process.
+            facts_loader: Called once with the analyzer before the first
+                page query, e.g. to restore cached facts with
+                :meth:`load_facts`; an analyzer that is never queried never
+                calls it.
+
+        Raises:
+            ValueError: If the backend is unknown.
         """
+        if backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown PDF text backend: {backend}. Available: {TEXT_BACKENDS}")
         self.pdf_path = Path(pdf_path)
+        self.backend: TextBackend = backend
+        self.render_dpi = render_dpi
+        self.render_cache_size = render_cache_size
+        self.processes = processes if processes is not None else _usable_cpus()
         self._pdf_plumber: Any = None
         self._pdf_fitz: fitz.Document | None = None
-        self._pages: list[PDFPageInfo] = []
+        self.fonts = FontTable()
+        self._pages: list[PDFPageInfo | None] = []
+        self._page_count: int | None = None
+        self._all_glyphs: np.ndarray | None = None
+        self._text_index: TextIndex | None = None
+        self._renders: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        self._facts_loader = facts_loader
+        self._lock = threading.RLock()
 
     def _load_pdfplumber(self) -> Any:
         """Lazy load pdfplumber."""
@@ -82,10 +272,30 @@ class PDFAnalyzer:
             self._pdf_fitz = fitz.open(self.pdf_path)
         return self._pdf_fitz
 
+    def _load_facts_once(self) -> None:
+        with self._lock:
+            loader, self._facts_loader = self._facts_loader, None
+            if loader is not None:
+                loader(self)
+
     @property
     def page_count(self) -> int:
         """Get the number of pages in the PDF."""
-        return len(self._load_fitz())
+        self._load_facts_once()
+        if self._page_count is None:
+            self._page_count = len(self._load_fitz())
+        return self._page_count
+
+    @property
+    def fully_extracted(self) -> bool:
+        """Whether every page is extracted, so exporting the facts parses nothing."""
+        with self._lock:
+            pages = self._pages
+            return len(pages) == self._page_count and all(p is not None for p in pages)
+
+    def _check_page(self, page_num: int) -> None:
+        if page_num < 0 or page_num >= self.page_count:
+            raise IndexError(f"Page {page_num} out of range (0-{self.page_count - 1})")
 
     def get_page(self, page_num: int) -> PDFPageInfo:
         """Get comprehensive information for a specific page.
@@ -96,109 +306,274 @@ class PDFAnalyzer:
         Returns:
             PDFPageInfo with all extracted data.
         """
-        if page_num < 0 or page_num >= self.page_count:
-            raise IndexError(f"Page {page_num} out of range (0-{self.page_count - 1})")
-
-        if page_num < len(self._pages):
-            return self._pages[page_num]
-
-        page_info = self._extract_page_info(page_num)
-        while len(self._pages) <= page_num:
-            self._pages.append(
-                self._pages[-1] if self._pages else PDFPageInfo(page_number=-1, width=0, height=0)
+        with self._lock:
+            self._load_facts_once()
+            self._check_page(page_num)
+            if not self._pages:
+                self._pages = [None] * self.page_count
+
+            page_info = self._pages[page_num]
+            if page_info is None:
+                page_info = self._pages[page_num] = self._extract_page_info(page_num)
+            return page_info
+
+    def _extract_all_pages(self) -> None:
+        """Extract every missing page, sharded across processes if worthwhile."""
+        with self._lock:
+            self._load_facts_once()
+            if not self._pages:
+                self._pages = [None] * self.page_count
+            missing = [i for i, page in enumerate(self._pages) if page is None]
+            # On fewer CPUs than workers the start-up cost is never won back.
+            shards = min(self.processes, _usable_cpus(), len(missing) // SHARD_MIN_PAGES)
+            if shards < 2:
+                for page_num in missing:
+                    self.get_page(page_num)
+                return
+
+            chunks = [chunk.tolist() for chunk in np.array_split(missing, shards)]
+            with ProcessPoolExecutor(
+                max_workers=shards, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                futures = [
+                    pool.submit(_extract_shard, str(self.pdf_path), self.backend, chunk)
+                    for chunk in chunks
+                ]
+                # Merge in page order so fonts are interned as sequentially.
+                for future in futures:
+                    self._merge_shard(future.result())
+
+    def _merge_shard(self, shard: PageShard) -> None:
+        """Add the pages of a shard, whose blocks the worker built, to the page table."""
+        glyphs = self._remap_fonts(shard.glyphs, shard.fonts)
+        bounds = np.searchsorted(glyphs["page"], [*shard.pages, shard.pages[-1] + 1])
+        for i, page_num in enumerate(shard.pages):
+            width, height = shard.sizes[i]
+            self._pages[page_num] = PDFPageInfo(
+                page_number=page_num,
+                width=width,
+                height=height,
+                text_blocks=shard.blocks[i],
+                fonts=shard.font_counts[i],
+                glyphs=glyphs[bounds[i] : bounds[i + 1]],
+                text=shard.texts[i],
             )
-        self._pages[page_num] = page_info
-        return page_info
 
-    def _extract_page_info(self, page_num: int) -> PDFPageInfo:
-        """Extract all information from a page using both libraries."""
-        pp_page = self._load_pdfplumber().pages[page_num]
+    def _remap_fonts(self, glyphs: np.ndarray, fonts: Sequence[str]) -> np.ndarray:
+        """Return a copy of ``glyphs`` with font ids of ``fonts`` mapped to this table."""
+        font_ids = np.array([self.fonts.intern(str(name)) for name in fonts], dtype=np.int32)
+        glyphs = glyphs.astype(GLYPH_DTYPE)
+        known = glyphs["font_id"] >= 0
+        glyphs["font_id"][known] = font_ids[glyphs["font_id"][known]]
+        return glyphs
+
+    def _extract_glyphs(self, page_num: int) -> tuple[float, float, np.ndarray, str]:
+        """Return the width, height, glyphs and text of a page."""
+        if self.backend == "pdfplumber":
+            pp_page = self._load_pdfplumber().pages[page_num]
+            glyphs, text = self._plumber_glyphs(pp_page, page_num)
+            return float(pp_page.width), float(pp_page.height), glyphs, text
         fitz_page = self._load_fitz()[page_num]
+        glyphs, text = self._fitz_glyphs(fitz_page, page_num)
+        return float(fitz_page.rect.width), float(fitz_page.rect.height), glyphs, text
 
-        width = float(pp_page.width)
-        height = float(pp_page.height)
-
-        text_blocks = self._extract_text_blocks(pp_page)
-        fonts = self._aggregate_fonts(text_blocks)
-        rendered = self._render_page(fitz_page)
+    def _extract_page_info(self, page_num: int) -> PDFPageInfo:
+        """Extract the text and layout information of a page (no rendering)."""
+        return self._page_info(page_num, *self._extract_glyphs(page_num))
 
+    def _page_info(
+        self, page_num: int, width: float, height: float, glyphs: np.ndarray, text: str
+    ) -> PDFPageInfo:
+        """Build a page from its glyphs, whose font ids index ``fonts``."""
         return PDFPageInfo(
             page_number=page_num,
             width=width,
             height=height,
-            text_blocks=text_blocks,
-            fonts=fonts,
-            rendered_image=rendered,
+            text_blocks=self._build_text_blocks(glyphs, text),
+            fonts=self._aggregate_fonts(glyphs),
+            glyphs=glyphs,
+            text=text,
         )
 
-    def _extract_text_blocks(self, pp_page: Any) -> list[TextBlock]:
-        """Extract text blocks with positioning from pdfplumber."""
-        blocks: list[TextBlock] = []
-        chars = pp_page.chars if hasattr(pp_page, "chars") else []
+    def _fitz_glyphs(self, fitz_page: fitz.Page, page_num: int) -> tuple[np.ndarray, str]:
+        """Return the page's glyph records and text from PyMuPDF rawdict spans.
 
-        current_block: list[dict[str, Any]] = []
-        last_x0: float | None = None
+        Boxes are one font size tall with the bottom at the baseline plus the
+        font descent, as in pdfplumber, rather than PyMuPDF's ascender-to-
+        descender glyph boxes. Per-span values are broadcast to the glyphs
+        with ``np.repeat``, so the Python loop only collects coordinates.
+        """
+        boxes: list[tuple[float, float, float, float]] = []
+        baselines: list[float] = []
+        text: list[str] = []
+        spans: list[tuple[float, float, int, int, int]] = []
+        raw = cast(dict[str, Any], fitz_page.get_text("rawdict", flags=_RAWDICT_FLAGS))
+        for block in raw["blocks"]:
+            for line in block.get("lines", ()):
+                for span in line["spans"]:
+                    chars = span["chars"]
+                    if not chars:
+                        continue
+                    boxes.extend(c["bbox"] for c in chars)
+                    baselines.extend(c["origin"][1] for c in chars)
+                    text.extend(c["c"] for c in chars)
+                    spans.append(
+                        (
+                            span["size"],
+                            -span["descender"] * span["size"],
+                            self.fonts.intern(span["font"]),
+                            span["flags"],
+                            len(chars),
+                        )
+                    )
 
+        glyphs = np.empty(len(boxes), dtype=GLYPH_DTYPE)
+        if not boxes:
+            return glyphs, ""
+        box = np.array(boxes, dtype=np.float64)
+        size, descent, font_id, flags, counts = (np.array(c) for c in zip(*spans, strict=True))
+        baseline = np.array(baselines, dtype=np.float64)
+        bottom = baseline + np.repeat(descent, counts)
+
+        glyphs["page"] = page_num
+        glyphs["span"] = np.repeat(np.arange(len(spans)), counts)
+        # rawdict yields exactly one character per glyph.
+        glyphs["offset"] = np.arange(len(boxes))
+        glyphs["x0"] = box[:, 0]
+        glyphs["x1"] = box[:, 2]
+        glyphs["size"] = np.repeat(size, counts)
+        glyphs["y0"] = bottom - glyphs["size"]
+        glyphs["y1"] = bottom
+        glyphs["baseline"] = baseline
+        glyphs["font_id"] = np.repeat(font_id, counts)
+        glyphs["flags"] = np.repeat(flags, counts)
+        return glyphs, "".join(text)
+
+    def _plumber_glyphs(self, pp_page: Any, page_num: int) -> tuple[np.ndarray, str]:
+        """Return the page's glyph records and text from pdfplumber chars."""
+        chars = pp_page.chars if hasattr(pp_page, "chars") else []
+        height = float(pp_page.height)
+        rows: list[tuple[Any, ...]] = []
+        text: list[str] = []
+        offset = 0
+        span_index = -1
+        last_style: tuple[Any, Any] | None = None
         for char in chars:
-            if last_x0 is not None and char["x0"] > last_x0 + 5:
-                if current_block:
-                    blocks.append(self._build_text_block(current_block))
-                current_block = []
-            current_block.append(char)
-            last_x0 = char["x1"]
-
-        if current_block:
-            blocks.append(self._build_text_block(current_block))
-
-        return blocks
-
-    def _build_text_block(self, chars: list[dict[str, Any]]) -> TextBlock:
-        """Build a TextBlock from a list of characters."""
-
-        text = "".join(c["text"] for c in chars)
-        x0 = min(c["x0"] for c in chars)
-        y0 = min(c["top"] for c in chars)
-        x1 = max(c["x1"] for c in chars)
-        y1 = max(c["bottom"] for c in chars)
+            style = (char.get("fontname"), char.get("size"))
+            if style != last_style:
+                span_index += 1
+                last_style = style
+            matrix = char.get("matrix")
+            baseline = height - matrix[5] if matrix else char["bottom"]
+            rows.append(
+                (
+                    page_num,
+                    span_index,
+                    offset,
+                    char["x0"],
+                    char["top"],
+                    char["x1"],
+                    char["bottom"],
+                    baseline,
+                    char.get("size") or 0.0,
+                    self.fonts.intern(char.get("fontname")),
+                    0,
+                )
+            )
+            text.append(char["text"])
+            offset += len(char["text"])
+        return np.array(rows, dtype=GLYPH_DTYPE), "".join(text)
 
-        first_char = chars[0]
-        font_name = first_char.get("font_name")
-        font_size = first_char.get("size")
-        bold = "Bold" in str(font_name or "") or first_char.get("bold", False)
-        italic = "Italic" in str(font_name or "") or first_char.get("italic", False)
+    def _build_text_blocks(self, glyphs: np.ndarray, text: str) -> list[TextBlock]:
+        """Split glyphs into blocks wherever a horizontal gap exceeds BLOCK_GAP.
 
-        return TextBlock(
-            text=text,
-            x0=x0,
-            y0=y0,
-            x1=x1,
-            y1=y1,
-            font_name=font_name,
-            font_size=font_size,
-            bold=bold,
-            italic=italic,
+        Block boxes are reduced over each run of glyphs with
+        ``np.minimum.reduceat``/``np.maximum.reduceat``; the font, size and
+        style of a block are those of its first glyph.
+        """
+        if not len(glyphs):
+            return []
+        x0, x1 = glyphs["x0"], glyphs["x1"]
+        starts = np.concatenate(([0], np.flatnonzero(x0[1:] > x1[:-1] + BLOCK_GAP) + 1))
+        offsets = np.append(glyphs["offset"], len(text)).tolist()
+        ends = [*starts[1:].tolist(), len(glyphs)]
+        columns = zip(
+            starts.tolist(),
+            ends,
+            np.minimum.reduceat(x0, starts).tolist(),
+            np.minimum.reduceat(glyphs["y0"], starts).tolist(),
+            np.maximum.reduceat(x1, starts).tolist(),
+            np.maximum.reduceat(glyphs["y1"], starts).tolist(),
+            strict=True,
         )
 
-    def _aggregate_fonts(self, blocks: list[TextBlock]) -> dict[str, int]:
-        """Aggregate font usage counts from text blocks."""
-        fonts: dict[str, int] = {}
-        for block in blocks:
-            if block.font_name:
-                fonts[block.font_name] = fonts.get(block.font_name, 0) + len(block.text)
-        return fonts
+        blocks: list[TextBlock] = []
+        for start, end, bx0, by0, bx1, by1 in columns:
+            first = glyphs[start]
+            font_name = self.fonts.name(int(first["font_id"]))
+            flags = int(first["flags"])
+            blocks.append(
+                TextBlock(
+                    text=text[offsets[start] : offsets[end]],
+                    x0=bx0,
+                    y0=by0,
+                    x1=bx1,
+                    y1=by1,
+                    font_name=font_name,
+                    font_size=float(first["size"]),
+                    bold="Bold" in (font_name or "") or bool(flags & fitz.TEXT_FONT_BOLD),
+                    italic="Italic" in (font_name or "") or bool(flags & fitz.TEXT_FONT_ITALIC),
+                )
+            )
+        return blocks
 
-    def _render_page(self, fitz_page: fitz.Page, dpi: int = 150) -> bytes:
+    def _aggregate_fonts(self, glyphs: np.ndarray) -> dict[str, int]:
+        """Count glyphs per font name."""
+        font_ids = glyphs["font_id"]
+        counts = np.bincount(font_ids[font_ids >= 0], minlength=len(self.fonts))
+        return {self.fonts.names[i]: n for i, n in enumerate(counts.tolist()) if n}
+
+    def _render_page(self, fitz_page: fitz.Page, dpi: int = DEFAULT_RENDER_DPI) -> bytes:
         """Render a page to PNG image bytes."""
         mat = fitz.Matrix(dpi / PDFBOX_DEFAULT_DPI, dpi / PDFBOX_DEFAULT_DPI)
         pix = fitz_page.get_pixmap(matrix=mat)
         return cast(bytes, pix.tobytes("png"))
 
+    def render_page(self, page_num: int, dpi: int | None = None) -> bytes:
+        """Rasterize a page to PNG bytes, on demand.
+
+        Renders are cached per (page, DPI); once ``render_cache_size``
+        renders are stored, the least recently used one is dropped.
+
+        Args:
+            page_num: Zero-based page number.
+            dpi: Resolution; defaults to ``render_dpi``.
+
+        Returns:
+            The PNG image bytes.
+        """
+        with self._lock:
+            self._check_page(page_num)
+            key = (page_num, dpi or self.render_dpi)
+            cached = self._renders.get(key)
+            if cached is not None:
+                self._renders.move_to_end(key)
+                return cached
+
+            image = self._render_page(self._load_fitz()[page_num], key[1])
+            if self.render_cache_size > 0:
+                self._renders[key] = image
+                while len(self._renders) > self.render_cache_size:
+                    self._renders.popitem(last=False)
+            return image
+
     def extract_text_by_page(self) -> dict[int, str]:
         """Extract all text organized by page number.
 
         Returns:
             Dictionary mapping page number to text content.
         """
+        self._extract_all_pages()
         text_by_page: dict[int, str] = {}
         for i in range(self.page_count):
             page = self.get_page(i)
@@ -215,47 +590,166 @@ class PDFAnalyzer:
         Returns:
             List of dicts with page, text, and position info.
         """
-        results: list[dict[str, Any]] = []
-        for i in range(self.page_count):
-            page = self.get_page(i)
-            for block in page.text_blocks:
-                text = block.text if case_sensitive else block.text.lower()
-                term = search_term if case_sensitive else search_term.lower()
-                if term in text:
-                    results.append(
-                        {
-                            "page": i,
-                            "text": block.text,
-                            "x0": block.x0,
-                            "y0": block.y0,
-                            "x1": block.x1,
-                            "y1": block.y1,
-                        }
-                    )
-        return results
+        return [
+            {
+                "page": page,
+                "text": block.text,
+                "x0": block.x0,
+                "y0": block.y0,
+                "x1": block.x1,
+                "y1": block.y1,
+            }
+            for page, block in self.text_index().search(search_term, case_sensitive)
+        ]
+
+    def contains_text(self, search_term: str, case_sensitive: bool = False) -> bool:
+        """Return whether any text block contains ``search_term``.
+
+        Args:
+            search_term: Text to search for.
+            case_sensitive: Whether search should be case-sensitive.
+        """
+        return self.text_index().contains(search_term, case_sensitive)
+
+    def text_index(self) -> TextIndex:
+        """Return the index of every text block, built on first use."""
+        with self._lock:
+            if self._text_index is None:
+                self._extract_all_pages()
+                self._text_index = TextIndex(
+                    (i, block)
+                    for i in range(self.page_count)
+                    for block in self.get_page(i).text_blocks
+                )
+            return self._text_index
 
     def get_margins(self, page_num: int = 0) -> Margins:
         """Extract margins from a page.
 
-        Assumes the page uses standard 1-inch margins on Letter size (8.5x11).
+        The margins are the distances from the page edges to the extent of
+        its glyphs; a page without text reports 1-inch margins.
         Returns (top, right, bottom, left) in inches.
         """
         page = self.get_page(page_num)
-        page_width = page.width / 72.0
-        page_height = page.height / 72.0
+        glyphs = page.glyphs
+        if not len(glyphs):
+            return (1.0, 1.0, 1.0, 1.0)
 
-        left_margin = min(b.x0 for b in page.text_blocks) / 72.0
-        right_margin = max(b.x1 for b in page.text_blocks) / 72.0
-        top_margin = min(b.y0 for b in page.text_blocks) / 72.0
-        bottom_margin = max(b.y1 for b in page.text_blocks) / 72.0
+        top = float(glyphs["y0"].min())
+        right = page.width - float(glyphs["x1"].max())
+        bottom = page.height - float(glyphs["y1"].max())
+        left = float(glyphs["x0"].min())
+        return (top / 72.0, right / 72.0, bottom / 72.0, left / 72.0)
 
-        right_margin = page_width - right_margin
-        bottom_margin = page_height - bottom_margin
+    def glyphs(self) -> np.ndarray:
+        """Return the glyphs of every page as one ``GLYPH_DTYPE`` array.
 
-        if not page.text_blocks:
-            left_margin = right_margin = top_margin = bottom_margin = 1.0
+        Pages are extracted on first use; the concatenation is cached.
+        """
+        with self._lock:
+            if self._all_glyphs is None:
+                self._extract_all_pages()
+                pages = [self.get_page(i).glyphs for i in range(self.page_count)]
+                self._all_glyphs = np.concatenate(pages) if pages else _empty_glyphs()
+            return self._all_glyphs
+
+    def export_facts(self) -> dict[str, np.ndarray]:
+        """Return every extracted page fact as plain NumPy arrays.
+
+        All pages are extracted first. The arrays are ``glyphs`` (see
+        :meth:`glyphs`), ``texts`` (page text, indexed by ``offset``),
+        ``sizes`` (page width and height in points) and ``fonts`` (font
+        names indexed by ``font_id``); :meth:`load_facts` restores them.
+        """
+        glyphs = self.glyphs()
+        pages = [self.get_page(i) for i in range(self.page_count)]
+        return {
+            "glyphs": glyphs,
+            "texts": np.array([p.text for p in pages], dtype=np.str_),
+            "sizes": np.array([(p.width, p.height) for p in pages], dtype=np.float64).reshape(
+                -1, 2
+            ),
+            "fonts": np.array(self.fonts.names, dtype=np.str_),
+        }
+
+    def load_facts(
+        self, glyphs: np.ndarray, texts: np.ndarray, sizes: np.ndarray, fonts: np.ndarray
+    ) -> None:
+        """Restore page facts produced by :meth:`export_facts`.
+
+        The PDF itself is not opened: text blocks and font counts are
+        rebuilt from the glyph arrays.
+        """
+        with self._lock:
+            self._facts_loader = None
+            glyphs = self._remap_fonts(glyphs, [str(name) for name in fonts])
+
+            count = len(texts)
+            bounds = np.searchsorted(glyphs["page"], np.arange(count + 1))
+            self._pages = [
+                self._page_info(
+                    i,
+                    float(sizes[i][0]),
+                    float(sizes[i][1]),
+                    glyphs[bounds[i] : bounds[i + 1]],
+                    str(texts[i]),
+                )
+                for i in range(count)
+            ]
+            self._page_count = count
+            self._all_glyphs = glyphs
+            self._text_index = None
+
+    def margins_by_page(self) -> np.ndarray:
+        """Compute the margins of all pages at once.
 
-        return (top_margin, right_margin, bottom_margin, left_margin)
+        Returns:
+            A float array of shape (page_count, 4) with the (top, right,
+            bottom, left) margins in inches; pages without text get 1.0.
+        """
+        glyphs = self.glyphs()
+        count = self.page_count
+        pages = glyphs["page"]
+        pages_info = [self.get_page(i) for i in range(count)]
+        sizes = np.array([(p.width, p.height) for p in pages_info], dtype=np.float64)
+        sizes = sizes.reshape(count, 2)
+
+        top = np.full(count, np.inf)
+        left = np.full(count, np.inf)
+        right = np.full(count, -np.inf)
+        bottom = np.full(count, -np.inf)
+        np.minimum.at(top, pages, glyphs["y0"])
+        np.minimum.at(left, pages, glyphs["x0"])
+        np.maximum.at(right, pages, glyphs["x1"])
+        np.maximum.at(bottom, pages, glyphs["y1"])
+
+        margins = np.column_stack((top, sizes[:, 0] - right, sizes[:, 1] - bottom, left)) / 72.0
+        margins[np.bincount(pages, minlength=count) == 0] = 1.0
+        return margins
+
+    def font_histogram(self) -> dict[str, int]:
+        """Count glyphs per font name over the whole document."""
+        return self._aggregate_fonts(self.glyphs())
+
+    def baseline_spacing(self) -> np.ndarray:
+        """Return the gaps between consecutive text lines, in points.
+
+        Lines are the distinct baselines of each page (rounded to 0.1pt),
+        so the result holds one gap per pair of adjacent lines; a double-
+        spaced 12pt body yields gaps of about 24pt.
+        """
+        glyphs = self.glyphs()
+        if not len(glyphs):
+            return np.empty(0, dtype=np.float64)
+        pages = glyphs["page"]
+        baselines = np.round(glyphs["baseline"], 1)
+        order = np.lexsort((baselines, pages))
+        pages, baselines = pages[order], baselines[order]
+        # Distinct (page, baseline) pairs, in order.
+        new_line = np.ones(len(pages), dtype=bool)
+        new_line[1:] = (pages[1:] != pages[:-1]) | (baselines[1:] != baselines[:-1])
+        pages, baselines = pages[new_line], baselines[new_line]
+        return cast(np.ndarray, np.diff(baselines)[pages[1:] == pages[:-1]])
 
     def get_page_dimensions(self, page_num: int = 0) -> tuple[float, float]:
         """Get page dimensions in inches.
@@ -268,6 +762,9 @@ class PDFAnalyzer:
 
     def close(self) -> None:
         """Close all open resources."""
+        self._renders.clear()
+        self._all_glyphs = None
+        self._text_index = None
         if self._pdf_plumber is not None:
             self._pdf_plumber.close()
             self._pdf_plumber = None
@@ -0,0 +1,106 @@
+"""Inverted index over the text blocks of a PDF.
+
+Block texts are case-folded and split into word tokens (runs of ``\\w``
+characters); each token maps to the sorted ids of the blocks containing it.
+A substring query is answered by intersecting the postings of its own
+tokens and confirming the few remaining candidates, so repeated searches do
+not rescan every block of the document.
+
+Every word run of a query that lies inside the query must be a whole token
+of a matching block; the first run may be the end of a longer token, the
+last run its start, and a query of a single run any part of one. Prefix and
+suffix lookups bisect the sorted vocabulary. Results are exactly those of a
+linear scan with ``in``: the index only narrows down the blocks to check.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pdf_analyzer import TextBlock
+
+_WORD = re.compile(r"\w+")
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class TextIndex:
+    """Inverted index from case-folded word tokens to text blocks.
+
+    Blocks are numbered in the order given, normally page by page, and
+    lookups return them in that order. The index is read-only once built,
+    so it can be shared between threads.
+    """
+
+    def __init__(self, blocks: Iterable[tuple[int, TextBlock]]) -> None:
+        """Index text blocks.
+
+        Args:
+            blocks: (page number, block) pairs in document order.
+        """
+        self.blocks = list(blocks)
+        postings: dict[str, list[int]] = {}
+        for block_id, (_, block) in enumerate(self.blocks):
+            for token in dict.fromkeys(_WORD.findall(block.text.casefold())):
+                postings.setdefault(token, []).append(block_id)
+        self._postings = postings
+        self._tokens = sorted(postings)
+        self._reversed = sorted(token[::-1] for token in postings)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    @staticmethod
+    def _with_prefix(tokens: list[str], prefix: str) -> list[str]:
+        # U+10FFFF sorts after every character and never occurs in a token.
+        start = bisect.bisect_left(tokens, prefix)
+        return tokens[start : bisect.bisect_left(tokens, prefix + _MAX_CHAR, start)]
+
+    def _matching_tokens(self, part: str, at_start: bool, at_end: bool) -> list[str]:
+        """Return the tokens a query word run can fall on."""
+        if at_start and at_end:
+            return [token for token in self._tokens if part in token]
+        if at_start:
+            return [token[::-1] for token in self._with_prefix(self._reversed, part[::-1])]
+        if at_end:
+            return self._with_prefix(self._tokens, part)
+        return [part] if part in self._postings else []
+
+    def candidates(self, term: str) -> list[int]:
+        """Return the ids of the blocks that may contain ``term``, in order.
+
+        A term without word characters matches every block.
+        """
+        folded = term.casefold()
+        result: set[int] | None = None
+        for run in _WORD.finditer(folded):
+            tokens = self._matching_tokens(run.group(), run.start() == 0, run.end() == len(folded))
+            block_ids = {block_id for token in tokens for block_id in self._postings[token]}
+            result = block_ids if result is None else result & block_ids
+            if not result:
+                return []
+        return sorted(result) if result is not None else list(range(len(self.blocks)))
+
+    def _matches(self, term: str, case_sensitive: bool) -> Iterator[tuple[int, TextBlock]]:
+        needle = term if case_sensitive else term.lower()
+        for block_id in self.candidates(term):
+            page, block = self.blocks[block_id]
+            if needle in (block.text if case_sensitive else block.text.lower()):
+                yield page, block
+
+    def search(self, term: str, case_sensitive: bool = False) -> list[tuple[int, TextBlock]]:
+        """Return the (page number, block) pairs whose text contains ``term``.
+
+        Args:
+            term: Text to search for.
+            case_sensitive: Whether the search is case-sensitive; otherwise
+                both sides are lowercased.
+        """
+        return list(self._matches(term, case_sensitive))
+
+    def contains(self, term: str, case_sensitive: bool = False) -> bool:
+        """Return whether any block contains ``term``; stops at the first match."""
+        return next(self._matches(term, case_sensitive), None) is not None
@@ -0,0 +1,172 @@
+"""
+Tests for the programmatic conversion API.
+"""
+
+import asyncio
+import contextlib
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from docx import Document
+
+import normadocs
+from normadocs.api import ConversionError, ToolLimits, convert, convert_async
+from normadocs.languagetool_client import LanguageToolError
+
+MARKDOWN = """---
+title: "{title}"
+author: "Ana Pérez"
+---
+
+# Introducción
+
+Texto del documento.
+"""
+
+
+def _fake_pandoc(self, md_text, output_path, **kwargs):
+    """Stand-in for Pandoc: one paragraph per non-empty Markdown line."""
+    doc = Document()
+    for line in md_text.splitlines():
+        if line.strip():
+            doc.add_paragraph(line.lstrip("# "))
+    doc.save(output_path)
+    return True
+
+
+def _fake_pdf(docx_path, output_dir, md_content, output_path, profile_dir=None):
+    Path(output_path).write_bytes(b"%PDF-1.7 " + Path(docx_path).name.encode())
+    return True
+
+
+async def _fake_pandoc_async(self, md_text, output_path, **kwargs):
+    return _fake_pandoc(self, md_text, output_path)
+
+
+def _texts(data):
+    return [p.text for p in Document(io.BytesIO(data)).paragraphs]
+
+
+@patch("normadocs.api.PandocRunner.run", _fake_pandoc)
+class TestConvert(unittest.TestCase):
+    """Tests for normadocs.convert."""
+
+    def test_returns_docx_bytes_and_timings_without_printing(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            result = normadocs.convert(MARKDOWN.format(title="Informe"), style="ieee")
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertIn("Texto del documento.", _texts(result.docx))
+        self.assertIsNone(result.pdf)
+        self.assertEqual(result.metadata.title, "Informe")
+        self.assertEqual(set(result.timings), {"preprocess", "pandoc", "format", "total"})
+
+    @patch("normadocs.api.PDFGenerator.convert", side_effect=_fake_pdf)
+    def test_pdf_output_uses_a_private_libreoffice_profile(self, mock_pdf):
+        result = convert(MARKDOWN.format(title="Informe"), outputs={"docx", "pdf"})
+
+        self.assertTrue(result.pdf.startswith(b"%PDF"))
+        self.assertIn("pdf", result.timings)
+        self.assertTrue(mock_pdf.call_args.kwargs["profile_dir"].endswith("libreoffice"))
+
+    @patch("normadocs.api.PDFGenerator.convert", return_value=True)
+    def test_reported_export_without_a_pdf_raises(self, _):
+        with self.assertRaises(ConversionError):
+            convert(MARKDOWN.format(title="Informe"), outputs={"pdf"})
+
+    def test_language_errors_are_collected_per_stage(self):
+        error = LanguageToolError("Posible error", "ctx", "RULE", 0, 5, ["x"])
+        client = MagicMock()
+        client.check.return_value = [error]
+
+        result = convert(MARKDOWN.format(title="Informe"), language_tool=client)
+
+        stages = [stage for stage, _ in result.language_errors]
+        self.assertEqual(stages, ["Pre-conversión (Markdown)", "Post-conversión (DOCX)"])
+        self.assertIsNotNone(result.docx)
+
+    def test_concurrent_calls_do_not_share_state(self):
+        titles = [f"Documento {i}" for i in range(6)]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(lambda t: convert(MARKDOWN.format(title=t)), titles))
+
+        for title, result in zip(titles, results, strict=True):
+            texts = _texts(result.docx)
+            self.assertIn(title, texts)
+            self.assertFalse((set(titles) - {title}) & set(texts))
+
+    def test_invalid_requests_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            convert(MARKDOWN, outputs={"html"})
+        with self.assertRaises(ValueError):
+            convert(MARKDOWN, style="ieee", verify=True)
+
+    def test_pandoc_failure_raises(self):
+        with (
+            patch("normadocs.api.PandocRunner.run", return_value=False),
+            self.assertRaises(ConversionError),
+        ):
+            convert(MARKDOWN)
+
+
+@patch("normadocs.api.PandocRunner.run_async", _fake_pandoc_async)
+class TestConvertAsync(unittest.TestCase):
+    """Tests for normadocs.convert_async."""
+
+    def test_matches_the_sync_result(self):
+        markdown = MARKDOWN.format(title="Informe")
+        result = asyncio.run(convert_async(markdown, style="icontec"))
+
+        with patch("normadocs.api.PandocRunner.run", _fake_pandoc):
+            expected = convert(markdown, style="icontec")
+        self.assertEqual(_texts(result.docx), _texts(expected.docx))
+        self.assertEqual(set(result.timings), set(expected.timings))
+
+    def test_libreoffice_processes_are_capped(self):
+        in_flight = peak = 0
+
+        async def fake_libreoffice(docx_path, output_dir, profile_dir=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.3)
+            in_flight -= 1
+            _fake_pdf(docx_path, output_dir, "", str(Path(output_dir) / "document.pdf"))
+            return True
+
+        async def run_all():
+            limits = ToolLimits(libreoffice=2, workers=6)
+            return await asyncio.gather(
+                *(
+                    convert_async(MARKDOWN.format(title=f"Doc {i}"), outputs={"pdf"}, limits=limits)
+                    for i in range(6)
+                )
+            )
+
+        with patch("normadocs.api.PDFGenerator.convert_with_libreoffice_async", fake_libreoffice):
+            results = asyncio.run(run_all())
+
+        self.assertEqual(peak, 2)
+        self.assertTrue(all(r.pdf.startswith(b"%PDF") and r.docx is None for r in results))
+
+    def test_reported_export_without_a_pdf_raises(self):
+        async def no_file(*args, **kwargs):
+            return True
+
+        with (
+            patch("normadocs.api.PDFGenerator.convert_with_libreoffice_async", no_file),
+            self.assertRaises(ConversionError),
+        ):
+            asyncio.run(convert_async(MARKDOWN.format(title="Informe"), outputs={"pdf"}))
+
+    def test_limits_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ToolLimits(pandoc=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -400,35 +400,29 @@ class TestFormatParagraphs(unittest.TestCase):
                 f"Paragraph '{p.text}' is not justified",
             )
 
-    def test_body_font_is_times_new_roman(self):
-        """Body paragraph runs must have Times New Roman font set."""
+    def test_body_runs_inherit_times_new_roman(self):
+        """Body runs carry no direct font and inherit Times New Roman from their style."""
         formatter = IEEEDocxFormatter(str(self.docx_path))
+        formatter._create_styles()
         formatter._format_paragraphs()
         for p in formatter.doc.paragraphs:
             if p.style and p.style.name.startswith("Heading"):
                 continue
+            self.assertEqual(p.style.font.name, "Times New Roman")
             for run in p.runs:
-                if run.text.strip():
-                    self.assertEqual(
-                        run.font.name,
-                        "Times New Roman",
-                        f"Run '{run.text}' is not Times New Roman",
-                    )
+                self.assertIsNone(run.font.name, f"Run '{run.text}' has a direct font")
 
-    def test_body_font_size_is_10pt(self):
-        """Body paragraph runs must have 10pt font size."""
+    def test_body_runs_inherit_10pt(self):
+        """Body runs carry no direct size and inherit 10pt from their style."""
         formatter = IEEEDocxFormatter(str(self.docx_path))
+        formatter._create_styles()
         formatter._format_paragraphs()
         for p in formatter.doc.paragraphs:
             if p.style and p.style.name.startswith("Heading"):
                 continue
+            self.assertEqual(p.style.font.size, Pt(10))
             for run in p.runs:
-                if run.text.strip():
-                    self.assertEqual(
-                        run.font.size,
-                        Pt(10),
-                        f"Run '{run.text}' is not 10pt",
-                    )
+                self.assertIsNone(run.font.size, f"Run '{run.text}' has a direct size")
 
     def test_heading_paragraphs_are_not_modified(self):
         """Heading paragraphs should not be modified by _format_paragraphs."""
@@ -524,35 +518,17 @@ class TestFormatFigures(unittest.TestCase):
                         f"Figure caption run '{run.text}' is not italic",
                     )
 
-    def test_figure_caption_uses_times_new_roman(self):
-        """Figure caption runs must use Times New Roman."""
-        formatter = IEEEDocxFormatter(str(self.docx_path))
-        formatter._format_figures()
-        for p in formatter.doc.paragraphs:
-            text = p.text.strip()
-            if text.startswith("Fig"):
-                for run in p.runs:
-                    if run.text.strip():
-                        self.assertEqual(
-                            run.font.name,
-                            "Times New Roman",
-                            f"Figure caption run '{run.text}' is not Times New Roman",
-                        )
-
-    def test_figure_caption_uses_10pt(self):
-        """Figure caption runs must use 10pt font size."""
+    def test_figure_caption_inherits_body_font(self):
+        """Figure captions use the Times New Roman 10pt style font, not run fonts."""
         formatter = IEEEDocxFormatter(str(self.docx_path))
+        formatter._create_styles()
         formatter._format_figures()
         for p in formatter.doc.paragraphs:
-            text = p.text.strip()
-            if text.startswith("Fig"):
+            if p.text.strip().startswith("Fig"):
+                self.assertEqual(p.style.font.name, "Times New Roman")
+                self.assertEqual(p.style.font.size, Pt(10))
                 for run in p.runs:
-                    if run.text.strip():
-                        self.assertEqual(
-                            run.font.size,
-                            Pt(10),
-                            f"Figure caption run '{run.text}' is not 10pt",
-                        )
+                    self.assertIsNone(run.font.name)
 
     def test_non_figure_paragraphs_not_centered(self):
         """Non-figure paragraphs should not be centered."""
@@ -609,6 +585,17 @@ class TestProcessMethod(unittest.TestCase):
         normal = formatter.doc.styles["Normal"]
         self.assertEqual(normal.font.name, "Times New Roman")
 
+    def test_process_applies_rules_in_one_body_pass(self):
+        """process() justifies body text, centers captions and formats table cells."""
+        formatter = IEEEDocxFormatter(str(self.docx_path))
+        formatter.process(self.meta)
+        body = formatter.doc.paragraphs[0]
+        caption = formatter.doc.paragraphs[-1]
+        self.assertEqual(body.paragraph_format.alignment, WD_ALIGN_PARAGRAPH.JUSTIFY)
+        self.assertEqual(caption.alignment, WD_ALIGN_PARAGRAPH.CENTER)
+        cell_p = formatter.doc.tables[0].cell(0, 0).paragraphs[0]
+        self.assertEqual(cell_p.paragraph_format.space_after, Pt(0))
+
 
 class TestSaveMethod(unittest.TestCase):
     """Tests for the save method."""
@@ -94,6 +94,18 @@ class TestPDFGeneratorLibreOffice(unittest.TestCase):
             self.assertIn("pdf", cmd)
             self.assertIn("--outdir", cmd)
 
+    @patch("normadocs.pdf_generator.get_command_path")
+    @patch("normadocs.pdf_generator.run_command")
+    def test_libreoffice_profile_dir(self, mock_run_cmd, mock_get_path):
+        """A profile directory should be passed as the user installation."""
+        mock_get_path.return_value = "libreoffice"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            PDFGenerator.convert_with_libreoffice("in.docx", tmpdir, profile_dir=tmpdir)
+
+            cmd = mock_run_cmd.call_args[0][0]
+            self.assertEqual(cmd[1], f"-env:UserInstallation={Path(tmpdir).resolve().as_uri()}")
+
 
 class TestPDFGeneratorWeasyPrint(unittest.TestCase):
     """Tests for convert_with_weasyprint method."""
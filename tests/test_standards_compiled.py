@@ -0,0 +1,107 @@
+"""
+Tests for standards/compiled.py - validated, immutable standard configs.
+"""
+
+import dataclasses
+import unittest
+
+from docx.shared import Cm, Inches, Pt
+
+from normadocs.formatters import get_formatter
+from normadocs.standards import (
+    InvalidStandardError,
+    StandardConfig,
+    StandardLoader,
+    compile_config,
+    compiled_standard,
+)
+
+
+class TestCompileConfig(unittest.TestCase):
+    def test_load_compiled_precomputes_lengths(self):
+        standard = StandardLoader().load_compiled("apa")
+        self.assertIsInstance(standard, StandardConfig)
+        self.assertEqual(standard.style, "apa7")
+        self.assertEqual(standard.margins.top_emu, Inches(1))
+        self.assertEqual(standard.body_font.name, "Times New Roman")
+        self.assertEqual(standard.body_font.pt, Pt(12))
+        self.assertEqual(standard.body_font.half_points, 24)
+        self.assertEqual(standard.spacing.line_multiple, 2.0)
+        self.assertEqual(standard.spacing.after_twips, 0)
+        self.assertEqual(standard.references.locale, "es")
+
+    def test_icontec_margins_in_cm(self):
+        standard = StandardLoader().load_compiled("icontec")
+        self.assertEqual(standard.margins.unit, "cm")
+        self.assertEqual(standard.margins.top_emu, Cm(3))
+        self.assertEqual(standard.margins.right_emu, Cm(2))
+        self.assertEqual(standard.spacing.line_multiple, 1.5)
+
+    def test_partial_config_uses_style_defaults(self):
+        standard = compile_config({"fonts": {"body": {"name": "Arial"}}}, "ieee")
+        self.assertEqual(standard.body_font.name, "Arial")
+        self.assertEqual(standard.body_font.size, 10)
+        self.assertEqual(standard.font("caption"), standard.default_font)
+        self.assertEqual(standard.figures.caption_prefix, "Fig")
+
+    def test_numeric_string_line_spacing(self):
+        standard = compile_config({"spacing": {"line": "1.5"}})
+        self.assertEqual(standard.spacing.line, "1.5")
+        self.assertEqual(standard.spacing.line_multiple, 1.5)
+
+    def test_compiled_config_is_immutable(self):
+        standard = compile_config({})
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            standard.margins.top = 2.0  # type: ignore[misc]
+        with self.assertRaises(TypeError):
+            standard.fonts["body"] = standard.default_font  # type: ignore[index]
+        self.assertFalse(hasattr(standard.body_font, "__dict__"))
+
+    def test_invalid_config_reports_every_problem(self):
+        config = {
+            "margins": {"unit": "furlongs", "top": -1},
+            "fonts": {"body": {"size": "big"}},
+            "citations": {"et_al_min_authors": 1},
+            "figures": {"jpeg_quality": 100},
+        }
+        with self.assertRaises(InvalidStandardError) as ctx:
+            compile_config(config)
+        problems = ctx.exception.problems
+        self.assertEqual(len(problems), 5)
+        self.assertTrue(any(p.startswith("margins.unit") for p in problems))
+        self.assertTrue(any(p.startswith("fonts.body.size") for p in problems))
+        self.assertIn("figures.jpeg_quality: expected an integer <= 95, got 100", problems)
+        self.assertIsInstance(ctx.exception, ValueError)
+
+    def test_foreign_words_and_cover(self):
+        standard = StandardLoader().load_compiled("apa7estudiante")
+        self.assertIn("PostgreSQL", standard.foreign_words.terms)
+        self.assertFalse(standard.foreign_words.ignore_case)
+        self.assertEqual(standard.cover.title_align, "center")
+        self.assertEqual(compile_config({}, "ieee").foreign_words.terms, ())
+        self.assertEqual(compile_config({}, "ieee").cover.author_align, "left")
+
+    def test_null_foreign_words_terms_are_rejected(self):
+        config = {"foreign_words": {"terms": None}, "cover": {"title_align": "middle"}}
+        with self.assertRaises(InvalidStandardError) as ctx:
+            compile_config(config)
+        self.assertEqual(
+            ctx.exception.problems,
+            (
+                "cover.title_align: expected one of left, center, right, got 'middle'",
+                "foreign_words.terms: expected a list of non-empty strings, got None",
+            ),
+        )
+
+    def test_compiled_standard_is_shared(self):
+        config = {"fonts": {"body": {"name": "Arial"}}}
+        self.assertIs(compiled_standard(config, "ieee"), compiled_standard(dict(config), "ieee"))
+        self.assertIsNot(compiled_standard(config, "ieee"), compiled_standard(config, "apa7"))
+
+    def test_get_formatter_rejects_invalid_config_before_opening(self):
+        with self.assertRaises(InvalidStandardError):
+            get_formatter("ieee", "missing.docx", config={"spacing": {"line": "triple"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for standards/__init__.py - StandardLoader class.
 """
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -70,6 +71,12 @@ class TestStandardLoader(unittest.TestCase):
         self.assertEqual(config["citation_style"], "apa")
         self.assertIn("name", config)
 
+    def test_apa_profiles_share_default_foreign_words(self):
+        loader = StandardLoader()
+        terms = loader.load("apa7")["foreign_words"]["terms"]
+        self.assertIn("PostgreSQL", terms)
+        self.assertEqual(loader.load("apa7estudiante")["foreign_words"]["terms"], terms)
+
     def test_preloaded_configs_exist(self):
         self.assertIsInstance(APA7_CONFIG, dict)
         self.assertEqual(APA7_CONFIG["name"], "APA 7th Edition")
@@ -105,5 +112,42 @@ class TestStandardLoaderCustomDir(unittest.TestCase):
             self.assertIn("style2", available)
 
 
+class TestStandardLoaderCache(unittest.TestCase):
+    def setUp(self):
+        StandardLoader.clear_cache()
+
+    def test_resolve_shares_compiled_config_but_not_dicts(self):
+        loader = StandardLoader()
+        config1, standard1 = loader.resolve("apa")
+        config1["fonts"]["body"]["name"] = "Corrupted"
+        config1["foreign_words"]["terms"].append("Corrupted")
+        config2, standard2 = loader.resolve("apa7")
+        self.assertIs(standard1, standard2)
+        self.assertEqual(config2["fonts"]["body"]["name"], "Times New Roman")
+        self.assertNotIn("Corrupted", config2["foreign_words"]["terms"])
+
+    def test_resolve_keys_on_override_contents(self):
+        loader = StandardLoader()
+        _, arial = loader.resolve("ieee", {"fonts": {"body": {"name": "Arial"}}})
+        _, again = loader.resolve("ieee", {"fonts": {"body": {"name": "Arial"}}})
+        _, default = loader.resolve("ieee")
+        self.assertIs(arial, again)
+        self.assertEqual(arial.body_font.name, "Arial")
+        self.assertEqual(default.body_font.name, "Times New Roman")
+
+    def test_edited_yaml_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "custom.yaml"
+            path.write_text("fonts:\n  body:\n    size: 11\n", encoding="utf-8")
+            loader = StandardLoader(standards_dir=Path(tmpdir))
+            self.assertEqual(loader.load_compiled("custom").body_font.size, 11)
+
+            path.write_text("fonts:\n  body:\n    size: 13\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(loader.load_compiled("custom").body_font.size, 13)
+            self.assertEqual(loader.load_raw("custom")["fonts"]["body"]["size"], 13)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from normadocs.standards.schema import (
     deep_copy,
     deep_merge,
     get_default_config,
+    load_standard_file,
     merge_with_defaults,
 )
 
@@ -51,6 +52,10 @@ class TestGetDefaultConfig(unittest.TestCase):
         self.assertEqual(config["margins"]["unit"], "cm")
         self.assertEqual(config["margins"]["top"], 3.0)
 
+    def test_icontec_and_ieee_defaults_are_their_yaml_files(self):
+        for style in ("icontec", "ieee"):
+            self.assertEqual(get_default_config(style), load_standard_file(style))
+
     def test_ieee_config_single_spacing(self):
         config = get_default_config("ieee")
         self.assertEqual(config["spacing"]["line"], "single")
@@ -77,6 +82,12 @@ class TestDeepCopy(unittest.TestCase):
         result["fonts"]["body"]["name"] = "Times New Roman"
         self.assertEqual(original["fonts"]["body"]["name"], "Arial")
 
+    def test_lists_are_copied(self):
+        original = {"foreign_words": {"terms": ["API"]}}
+        result = deep_copy(original)
+        result["foreign_words"]["terms"].append("SQL")
+        self.assertEqual(original["foreign_words"]["terms"], ["API"])
+
 
 class TestDeepMerge(unittest.TestCase):
     def test_merge_simple_values(self):
@@ -0,0 +1,39 @@
+"""
+Tests for the subprocess helpers.
+"""
+
+import asyncio
+import subprocess
+import sys
+import unittest
+
+from normadocs.utils.subprocess import CommandFailedError, run_command_async
+
+
+class TestRunCommandAsync(unittest.TestCase):
+    """Tests for run_command_async."""
+
+    def test_captures_output_and_feeds_stdin(self):
+        cmd = [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"]
+        result = asyncio.run(run_command_async(cmd, input_data="ñandú"))
+
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.strip(), "ÑANDÚ")
+
+    def test_non_zero_exit_raises(self):
+        cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        with self.assertRaises(CommandFailedError) as ctx:
+            asyncio.run(run_command_async(cmd))
+        self.assertEqual((ctx.exception.returncode, ctx.exception.stderr), (3, "boom"))
+
+        result = asyncio.run(run_command_async(cmd, check=False))
+        self.assertEqual(result.returncode, 3)
+
+    def test_timeout_kills_the_process(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        with self.assertRaises(subprocess.TimeoutExpired):
+            asyncio.run(run_command_async(cmd, timeout=0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()
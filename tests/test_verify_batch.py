@@ -0,0 +1,209 @@
+"""
+Tests for batch verification and the ``normadocs verify`` command.
+"""
+
+import json
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+from docx import Document
+from typer.testing import CliRunner
+
+from normadocs import cli
+from normadocs.verifier import VerificationIssue
+from normadocs.verifier.batch import (
+    BatchSummary,
+    VerificationRecord,
+    collect_pdfs,
+    to_jsonl,
+    to_junit,
+    to_sarif,
+    verify_many,
+)
+
+runner = CliRunner()
+
+
+def _export(directory: Path, stem: str, docx: bool = True) -> Path:
+    """Write ``<stem>_APA.pdf`` and, optionally, its ``<stem>.docx`` source."""
+    if docx:
+        doc = Document()
+        doc.add_paragraph(f"Documento {stem}.")
+        doc.save(str(directory / f"{stem}.docx"))
+    pdf = fitz.open()
+    pdf.new_page(width=612, height=792).insert_text((72, 72), f"Documento {stem}.")
+    pdf_path = directory / f"{stem}_APA.pdf"
+    pdf.save(str(pdf_path))
+    pdf.close()
+    return pdf_path
+
+
+def _records():
+    issue = VerificationIssue("margins.top", "error", "1.00 inches", "0.50 inches", page=1)
+    info = VerificationIssue("tables.note_present", "info", "Nota.", "No table note found")
+    return [
+        VerificationRecord(Path("a.pdf"), Path("a.docx"), "failed", 40.0, [issue, info]),
+        VerificationRecord(Path("b.pdf"), Path("b.docx"), "passed", 100.0),
+        VerificationRecord(Path("c.pdf"), None, "error", error="No DOCX source found"),
+    ]
+
+
+class TestBatchVerification(unittest.TestCase):
+    """Tests for collect_pdfs and verify_many."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "sub").mkdir()
+        self.first = _export(self.root, "uno")
+        self.second = _export(self.root / "sub", "dos")
+        self.orphan = _export(self.root / "sub", "huerfano", docx=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_collects_files_globs_and_directories_once(self):
+        pdfs = collect_pdfs([self.first, str(self.root / "sub" / "*.pdf"), self.root])
+        self.assertEqual(pdfs, [self.first, self.second, self.orphan])
+        with self.assertRaises(FileNotFoundError):
+            collect_pdfs([str(self.root / "*.missing.pdf")])
+
+    def test_process_pool_matches_sequential_results(self):
+        pdfs = [self.first, self.second, self.orphan]
+        sequential = list(verify_many(pdfs, workers=1, strict=False))
+        parallel = list(verify_many(pdfs, workers=3, strict=False))
+
+        self.assertEqual([r.pdf for r in parallel], pdfs)
+        self.assertEqual(
+            [r.docx for r in parallel],
+            [self.root / "uno.docx", self.root / "sub" / "dos.docx", None],
+        )
+        self.assertEqual(parallel[2].status, "error")
+        for seq, par in zip(sequential, parallel, strict=True):
+            self.assertEqual((seq.status, seq.score), (par.status, par.score))
+            self.assertEqual([i.check for i in seq.issues], [i.check for i in par.issues])
+
+    def test_check_selection_and_fail_fast(self):
+        (record,) = verify_many([self.first], checks=["margins", "figures"], fail_fast=True)
+        self.assertEqual(record.status, "failed")
+        self.assertEqual(record.skipped, ["figures"])
+        self.assertEqual({i.check.split(".")[0] for i in record.issues}, {"margins"})
+        (record,) = verify_many([self.first], skip_checks=["margin"])
+        self.assertEqual(record.status, "error")
+        self.assertIn("Unknown checks: margin", record.error)
+
+
+class TestReportFormats(unittest.TestCase):
+    """Tests for the JSON Lines, JUnit and SARIF renderers."""
+
+    def setUp(self):
+        self.records = _records()
+        self.summary = BatchSummary.from_records(self.records, 1.5)
+
+    def test_summary_counts(self):
+        self.assertEqual(
+            (self.summary.total, self.summary.passed, self.summary.failed, self.summary.errored),
+            (3, 1, 1, 1),
+        )
+        self.assertEqual(self.summary.mean_score, 70.0)
+        self.assertFalse(self.summary.ok)
+
+    def test_jsonl_ends_with_the_summary(self):
+        lines = [json.loads(line) for line in to_jsonl(self.records, self.summary).splitlines()]
+        self.assertEqual(len(lines), 4)
+        self.assertEqual((lines[0]["errors"], lines[0]["infos"]), (1, 1))
+        self.assertEqual(lines[0]["issues"][0]["check"], "margins.top")
+        self.assertEqual(lines[3]["summary"]["errored"], 1)
+
+    def test_junit_has_a_test_case_per_pdf(self):
+        suite = ET.fromstring(to_junit(self.records, self.summary))
+        self.assertEqual(
+            (suite.get("tests"), suite.get("failures"), suite.get("errors")), ("3", "1", "1")
+        )
+        cases = suite.findall("testcase")
+        self.assertIn("margins.top", cases[0].find("failure").text)
+        self.assertIsNone(cases[1].find("failure"))
+        self.assertEqual(cases[2].find("error").get("message"), "No DOCX source found")
+
+    def test_sarif_results_and_rules(self):
+        log = json.loads(to_sarif(self.records, self.summary))
+        run = log["runs"][0]
+        self.assertEqual(log["version"], "2.1.0")
+        self.assertEqual(
+            [rule["id"] for rule in run["tool"]["driver"]["rules"]],
+            ["margins.top", "tables.note_present"],
+        )
+        self.assertEqual([r["level"] for r in run["results"]], ["error", "note"])
+        self.assertEqual(run["results"][0]["properties"]["page"], 1)
+        self.assertFalse(run["invocations"][0]["executionSuccessful"])
+        self.assertEqual(run["properties"]["summary"]["total"], 3)
+
+
+class TestVerifyCommand(unittest.TestCase):
+    """Tests for the ``normadocs verify`` command."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        _export(self.root, "uno")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writes_report_and_fails_on_issues(self):
+        output = self.root / "out" / "report.sarif"
+        result = runner.invoke(
+            cli.verify_app,
+            [str(self.root), "-f", "sarif", "-o", str(output), "-j", "1", "--no-apa-strict"],
+        )
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertIn("1 PDF", result.output)
+        self.assertEqual(
+            json.loads(output.read_text())["runs"][0]["tool"]["driver"]["name"], "normadocs"
+        )
+
+    def test_passing_batch_exits_zero(self):
+        record = VerificationRecord(self.root / "uno_APA.pdf", None, "passed", 100.0)
+        with patch("normadocs.verifier.batch.verify_pdf", return_value=record):
+            result = runner.invoke(cli.verify_app, [str(self.root), "-j", "1"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(json.loads(result.output.splitlines()[0])["status"], "passed")
+
+    def test_invalid_format_and_missing_inputs(self):
+        result = runner.invoke(cli.verify_app, [str(self.root), "-f", "xml"])
+        self.assertEqual(result.exit_code, 2)
+        result = runner.invoke(cli.verify_app, [str(self.root / "nada*.pdf")])
+        self.assertEqual(result.exit_code, 2)
+        result = runner.invoke(cli.verify_app, [str(self.root), "--checks", "margins,tipos"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("tipos", result.output)
+
+    def test_check_options_reach_the_verifier(self):
+        result = runner.invoke(
+            cli.verify_app,
+            [str(self.root), "-j", "1", "--checks", "margins, figures", "--fail-fast"],
+        )
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertEqual(json.loads(result.output.splitlines()[0])["skipped"], ["figures"])
+
+    def test_main_dispatches_verify(self):
+        with (
+            patch.object(cli, "verify_app") as verify_app,
+            patch.object(cli, "app") as app,
+            patch("sys.argv", ["normadocs", "verify", "exports/"]),
+        ):
+            cli.main()
+        verify_app.assert_called_once_with(args=["exports/"], prog_name="normadocs verify")
+        app.assert_not_called()
+
+        with patch.object(cli, "app") as app, patch("sys.argv", ["normadocs", "informe.md"]):
+            cli.main()
+        app.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,10 @@ from docx.shared import Inches, Pt
 from normadocs.models import DocumentMetadata
 from normadocs.verifier import CheckCategory, VerificationIssue, VerificationResult
 from normadocs.verifier.apa_verifier import APAVerifier, VerificationContext
+from normadocs.verifier.checks.citations import CitationsCheck
+from normadocs.verifier.checks.figures import FiguresCheck
 from normadocs.verifier.checks.paragraphs import ParagraphsCheck
+from normadocs.verifier.pdf_analyzer import PDFAnalyzer
 
 
 class TestAPAVerifier(unittest.TestCase):
@@ -388,6 +391,106 @@ class TestAPAVerifierEndToEnd(unittest.TestCase):
         finally:
             verifier.close()
 
+    def test_verify_all_records_check_timings_in_order(self) -> None:
+        """Each check's duration is recorded, keyed by category in check order."""
+        verifier = APAVerifier(
+            pdf_path=self._pdf_path(),
+            docx_path=self._create_compliant_docx(),
+            meta=DocumentMetadata(title="Test Document"),
+        )
+        try:
+            with patch.object(verifier, "_init_checks", wraps=verifier._init_checks) as init:
+                result = verifier.verify_all()
+            init.assert_called_once()
+            categories = [category for category, _ in verifier._init_checks()]
+            self.assertEqual(list(result.timings), categories)
+            self.assertTrue(all(t >= 0 for t in result.timings.values()))
+        finally:
+            verifier.close()
+
+    def test_parallel_issue_order_matches_sequential(self) -> None:
+        """Running checks concurrently does not change the issues or their order."""
+        docx_path = self._create_compliant_docx(justified=True)
+        results = []
+        for workers in (1, 8):
+            verifier = APAVerifier(
+                pdf_path=self._pdf_path(),
+                docx_path=docx_path,
+                meta=DocumentMetadata(title="Test Document"),
+                max_workers=workers,
+            )
+            try:
+                results.append(verifier.verify_all())
+            finally:
+                verifier.close()
+
+        sequential, parallel = results
+        self.assertTrue(sequential.issues)
+        for attribute in ("issues", "errors", "warnings", "infos"):
+            self.assertEqual(
+                [(i.check, i.severity, i.actual) for i in getattr(parallel, attribute)],
+                [(i.check, i.severity, i.actual) for i in getattr(sequential, attribute)],
+            )
+        self.assertEqual(parallel.score, sequential.score)
+
+    def _verify(self, **kwargs) -> VerificationResult:
+        verifier = APAVerifier(
+            pdf_path=self._pdf_path(),
+            docx_path=self._create_compliant_docx(justified=True),
+            meta=DocumentMetadata(title="Test Document"),
+            **kwargs,
+        )
+        try:
+            return verifier.verify_all()
+        finally:
+            verifier.close()
+
+    def test_check_selection(self) -> None:
+        """Only the selected checks run, and unknown names are rejected."""
+        result = self._verify(checks=["fonts", "margins", "figures"], skip_checks=["figures"])
+        self.assertEqual(list(result.timings), ["margins", "fonts"])
+        self.assertTrue(all(i.check.split(".")[0] in result.timings for i in result.issues))
+        self.assertEqual(result.skipped, [])
+        with self.assertRaises(ValueError):
+            self._verify(skip_checks=["margin"])
+
+    def test_checks_run_cheapest_cost_class_first(self) -> None:
+        """PDF-based checks run after every DOCX-only check."""
+        order: list[str] = []
+        with (
+            patch.object(
+                FiguresCheck, "run", autospec=True, side_effect=lambda *_: order.append("f") or []
+            ),
+            patch.object(
+                CitationsCheck, "run", autospec=True, side_effect=lambda *_: order.append("c") or []
+            ),
+        ):
+            result = self._verify(checks=["figures", "citations"], max_workers=1)
+        self.assertEqual(order, ["c", "f"])
+        self.assertEqual(list(result.timings), ["figures", "citations"])
+
+    def test_fail_fast_skips_pdf_checks_after_an_error(self) -> None:
+        """A DOCX-only error stops the run before the PDF is read."""
+        for workers in (None, 1):
+            with patch.object(PDFAnalyzer, "_extract_page_info") as extract:
+                result = self._verify(fail_fast=True, max_workers=workers)
+            extract.assert_not_called()
+            self.assertFalse(result.passed)
+            self.assertIn(CheckCategory.FIGURES, result.skipped)
+            self.assertNotIn(CheckCategory.FIGURES, result.timings)
+            self.assertEqual(len(result.timings) + len(result.skipped), 13)
+        self.assertEqual(self._verify(fail_fast=False).skipped, [])
+
+    def test_fail_fast_stops_at_the_first_failing_check(self) -> None:
+        """Checks of one cost class do not all run once one has failed."""
+        error = VerificationIssue(
+            check="paragraphs.broken", severity="error", expected="", actual="", evidence=""
+        )
+        with patch.object(ParagraphsCheck, "run", return_value=[error]):
+            result = self._verify(checks=["paragraphs", "citations", "figures"], fail_fast=True)
+        self.assertEqual(list(result.timings), ["paragraphs"])
+        self.assertEqual(result.skipped, [CheckCategory.FIGURES, CheckCategory.CITATIONS])
+
 
 class TestAPAVerifierReport(unittest.TestCase):
     """Tests for APAVerifier.generate_report across text/markdown/html formats."""
@@ -5,6 +5,7 @@ import unittest
 from docx import Document
 
 from normadocs.formatters.apa.apa_citations import APACitationsHandler
+from normadocs.utils.citations import CitationEdit, scan_citations, splice_runs
 
 
 class TestFixCitations(unittest.TestCase):
@@ -70,6 +71,42 @@ class TestFixCitations(unittest.TestCase):
         APACitationsHandler(doc).fix_citations()
         self.assertIn("García, A., López, B. y Silva, C. (2020)", doc.paragraphs[2].text)
 
+    def test_citation_split_across_runs_is_fixed(self):
+        """A citation spread over several runs is fixed; untouched runs keep formatting."""
+        doc = Document()
+        p = doc.add_paragraph("Según (")
+        p.add_run("García").italic = True
+        p.add_run(", López y Martínez, 2020")
+        p.add_run(") lo confirma.")
+        APACitationsHandler(doc).fix_citations()
+        runs = doc.paragraphs[0].runs
+        self.assertEqual(doc.paragraphs[0].text, "Según (García et al., 2020) lo confirma.")
+        self.assertEqual(runs[0].text, "Según (")
+        self.assertEqual(runs[1].text, "García")
+        self.assertTrue(runs[1].italic)
+
+
+class TestCitationScanner(unittest.TestCase):
+    """Tests for the shared paragraph-level citation scanner."""
+
+    def test_edits_rebuild_fixed_text(self):
+        """Applying the scan edits yields the fully corrected paragraph."""
+        text = "García, López y Martínez (2020) y otros (Pérez y Rojas, 2021)."
+        scan = scan_citations(text)
+        self.assertEqual(scan.apply(text), "García et al. (2020) y otros (Pérez & Rojas, 2021).")
+        self.assertEqual([i.rule for i in scan.issues], ["et_al", "ampersand"])
+
+    def test_scan_is_memoized_by_text(self):
+        """Repeated paragraphs reuse the cached scan."""
+        text = "Boilerplate (Ana, Beto y Carla, 2019)."
+        self.assertIs(scan_citations(text), scan_citations(text))
+
+    def test_splice_keeps_untouched_runs(self):
+        """Only runs overlapped by an edit change; the replacement goes first."""
+        runs = ["Intro ", "(A y ", "B, 2020)", " fin"]
+        edits = [CitationEdit(6, 19, "(A & B, 2020)")]
+        self.assertEqual(splice_runs(runs, edits), ["Intro ", "(A & B, 2020)", "", " fin"])
+
 
 class TestFormatReferences(unittest.TestCase):
     """Tests for format_references (reference-list formatting)."""
@@ -127,6 +164,33 @@ class TestFormatReferences(unittest.TestCase):
         APACitationsHandler(doc).format_references()
         self.assertTrue(doc.paragraphs[1].runs[0].italic)
 
+    def test_sorting_ignores_accents_and_places_enye_after_n(self):
+        """Collation is accent-insensitive and Spanish 'ñ' follows 'n'."""
+        doc = self._references_doc(
+            [
+                "Ñúñez, D. (2020). Cuarto.",
+                "Nuñez, C. (2020). Tercero.",
+                "Álvarez, B. (2020). Segundo.",
+                "Alonso, A. (2020). Primero.",
+            ]
+        )
+        APACitationsHandler(doc).format_references()
+        authors = [p.text.split(",")[0] for p in doc.paragraphs[1:]]
+        self.assertEqual(authors, ["Alonso", "Álvarez", "Nuñez", "Ñúñez"])
+
+    def test_duplicates_are_recorded(self):
+        """Exact repeats are recorded without removing any entry."""
+        entry = "García, A. (2023). Machine learning."
+        doc = self._references_doc([entry, "López, B. (2020). Otro.", entry])
+        handler = APACitationsHandler(doc)
+        with self.assertLogs("normadocs", level="WARNING") as logs:
+            handler.format_references()
+        self.assertEqual(len(doc.paragraphs), 4)
+        self.assertEqual(
+            [(d.index, d.original, d.exact) for d in handler.duplicates], [(2, 0, True)]
+        )
+        self.assertIn("reference 3 repeats reference 1", logs.output[0])
+
     def test_no_references_section_is_a_noop(self):
         """Documents without a references heading are left alone."""
         doc = Document()
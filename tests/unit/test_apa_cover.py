@@ -10,6 +10,7 @@ from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from normadocs.formatters.apa import APADocxFormatter
+from normadocs.formatters.apa.apa_cover import APACoverHandler
 from normadocs.models import DocumentMetadata
 
 
@@ -403,6 +404,21 @@ class TestAddCoverPage(unittest.TestCase):
             os.unlink(temp_path)
 
 
+class TestCoverAlignment(unittest.TestCase):
+    """The cover title and author lines follow the standard's cover spec."""
+
+    def test_author_alignment_comes_from_config(self):
+        doc = Document()
+        doc.add_paragraph("Introducción", style="Heading 1")
+        meta = DocumentMetadata(title="Título", author="Ana Gómez")
+        config = {"cover": {"author_align": "left"}}
+        APACoverHandler(doc, config).add_cover_page(meta)
+
+        by_text = {p.text: p for p in doc.paragraphs}
+        self.assertEqual(by_text["Título"].alignment, WD_ALIGN_PARAGRAPH.CENTER)
+        self.assertEqual(by_text["Ana Gómez"].alignment, WD_ALIGN_PARAGRAPH.LEFT)
+
+
 class TestBackwardCompatibilityModule(unittest.TestCase):
     """Tests for the backward compatibility apa.py module."""
 
@@ -127,24 +127,22 @@ def _add_paragraph_with_drawing(
     p._element.append(drawing)
 
 
-class TestGetFigureConfig(unittest.TestCase):
-    """Tests for _get_figure_config method."""
+class TestFigureSpec(unittest.TestCase):
+    """Tests for the figure settings the handler reads from its standard."""
 
     def test_default_config(self):
-        """Default config should have expected keys."""
+        """Without overrides the APA defaults apply."""
         doc = Document()
-        handler = APAFiguresHandler(doc)
-        config = handler._get_figure_config()
-        self.assertEqual(config["caption_prefix"], "Figure")
-        self.assertTrue(config["title_above"])
-        self.assertEqual(config["nota_prefix"], "Nota.")
+        figures = APAFiguresHandler(doc).standard.figures
+        self.assertEqual(figures.caption_prefix, "Figure")
+        self.assertTrue(figures.title_above)
+        self.assertEqual(figures.nota_prefix, "Note.")
 
     def test_custom_config(self):
         """Custom config should override defaults."""
         doc = Document()
         handler = APAFiguresHandler(doc, config={"figures": {"caption_prefix": "Image"}})
-        config = handler._get_figure_config()
-        self.assertEqual(config["caption_prefix"], "Image")
+        self.assertEqual(handler.standard.figures.caption_prefix, "Image")
 
 
 class TestGetBodyFont(unittest.TestCase):
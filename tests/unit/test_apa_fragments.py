@@ -0,0 +1,87 @@
+"""
+Unit tests for the cached APA XML fragment templates.
+"""
+
+import unittest
+
+from docx.oxml.ns import qn
+
+from normadocs.formatters.apa.apa_fragments import (
+    ParagraphFormat,
+    RunFormat,
+    cell_borders,
+    cell_margins,
+    page_break_paragraph,
+    text_paragraph,
+    valued_element,
+)
+
+
+class TestTextParagraph(unittest.TestCase):
+    """Tests for text_paragraph stamping."""
+
+    def test_runs_receive_their_text_and_format(self):
+        """Each run gets its own text and character formatting."""
+        p_el = text_paragraph(
+            ParagraphFormat(jc="left", after="0", line="240"),
+            [("Tabla 1", RunFormat(bold=True, font="Arial")), ("Título", RunFormat(italic=True))],
+        )
+        runs = p_el.findall(qn("w:r"))
+        self.assertEqual([r.find(qn("w:t")).text for r in runs], ["Tabla 1", "Título"])
+        self.assertIsNotNone(runs[0].find(f"{qn('w:rPr')}/{qn('w:b')}"))
+        self.assertIsNotNone(runs[1].find(f"{qn('w:rPr')}/{qn('w:i')}"))
+        fonts = runs[0].find(f"{qn('w:rPr')}/{qn('w:rFonts')}")
+        self.assertEqual(fonts.get(qn("w:ascii")), "Arial")
+        jc = p_el.find(f"{qn('w:pPr')}/{qn('w:jc')}")
+        self.assertEqual(jc.get(qn("w:val")), "left")
+
+    def test_stamped_copies_are_independent(self):
+        """Changing one stamped copy never leaks into the next one."""
+        fmt = ParagraphFormat(after="0")
+        first = text_paragraph(fmt, [("Nota. ", RunFormat(italic=True))])
+        first.find(f".//{qn('w:t')}").text = "changed"
+        second = text_paragraph(fmt, [("Nota. ", RunFormat(italic=True))])
+        self.assertEqual(second.find(f".//{qn('w:t')}").text, "Nota. ")
+        self.assertIsNot(first, second)
+
+    def test_text_preserves_spaces(self):
+        """Leading/trailing spaces survive because xml:space is preserve."""
+        p_el = text_paragraph(ParagraphFormat(), [(" Elaboración propia.", RunFormat())])
+        t = p_el.find(f".//{qn('w:t')}")
+        self.assertEqual(t.get(qn("xml:space")), "preserve")
+
+
+class TestSmallFragments(unittest.TestCase):
+    """Tests for page breaks and table-cell property fragments."""
+
+    def test_page_break_paragraph_wraps_break_in_run(self):
+        """The page break is a w:p > w:r > w:br[@type=page] tree."""
+        p_el = page_break_paragraph()
+        br = p_el.find(f"{qn('w:r')}/{qn('w:br')}")
+        self.assertEqual(br.get(qn("w:type")), "page")
+        self.assertIsNot(p_el, page_break_paragraph())
+
+    def test_cell_margins_have_all_sides(self):
+        """Margins carry the four sides in dxa."""
+        tc_mar = cell_margins("w:tcMar", "28")
+        self.assertEqual(tc_mar.tag, qn("w:tcMar"))
+        for side in ("top", "bottom", "start", "end"):
+            el = tc_mar.find(qn(f"w:{side}"))
+            self.assertEqual(el.get(qn("w:w")), "28")
+            self.assertEqual(el.get(qn("w:type")), "dxa")
+
+    def test_cell_borders_keep_edge_order(self):
+        """Border edges follow the schema order regardless of argument order."""
+        borders = cell_borders(bottom={"val": "single", "sz": 6}, top={"val": "single"})
+        tags = [child.tag for child in borders]
+        self.assertEqual(tags, [qn("w:top"), qn("w:bottom")])
+        self.assertEqual(borders.find(qn("w:bottom")).get(qn("w:sz")), "6")
+
+    def test_valued_element_optional_value(self):
+        """The w:val attribute is emitted only when given."""
+        self.assertEqual(valued_element("w:vAlign", "top").get(qn("w:val")), "top")
+        self.assertIsNone(valued_element("w:noWrap").get(qn("w:val")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,7 +13,9 @@ from docx.oxml.ns import qn
 from docx.shared import Inches
 
 from normadocs.formatters.apa import APADocxFormatter
+from normadocs.formatters.apa.apa_keywords import APAKeywordsHandler, section_kinds
 from normadocs.models import DocumentMetadata
+from normadocs.utils.term_matcher import TermMatcher
 
 
 class TestFormatKeywords(unittest.TestCase):
@@ -355,6 +357,78 @@ class TestApplyForeignWordItalics(unittest.TestCase):
             os.unlink(temp_path)
 
 
+class TestForeignWordMatcher(unittest.TestCase):
+    """Tests for the compiled foreign-word lexicon and body-text italics."""
+
+    def test_body_text_only_matched_word_is_italic(self):
+        """Body paragraphs get italics on the foreign word, not the whole run."""
+        doc = Document()
+        doc.add_paragraph("El equipo usa Django en el servidor.")
+        APAKeywordsHandler(doc).apply_foreign_word_italics()
+
+        runs = doc.paragraphs[0].runs
+        self.assertEqual("".join(r.text for r in runs), "El equipo usa Django en el servidor.")
+        italic = [r.text for r in runs if r.italic]
+        self.assertEqual(italic, ["Django"])
+
+    def test_headings_and_references_are_skipped(self):
+        """Headings and the reference list keep their original formatting."""
+        doc = Document()
+        doc.add_paragraph("Arquitectura Django", style="Heading 1")
+        doc.add_paragraph("Referencias", style="Heading 1")
+        doc.add_paragraph("Django Software Foundation. (2024). Django documentation.")
+        APAKeywordsHandler(doc).apply_foreign_word_italics()
+
+        for p in doc.paragraphs:
+            self.assertFalse(any(r.italic for r in p.runs))
+
+    def test_whole_words_only(self):
+        """Terms inside longer words (e.g. 'Pythonic') are not italicized."""
+        doc = Document()
+        doc.add_paragraph("Un estilo Pythonic.")
+        APAKeywordsHandler(doc).apply_foreign_word_italics()
+        self.assertFalse(any(r.italic for r in doc.paragraphs[0].runs))
+
+    def test_lexicon_comes_from_config(self):
+        """The foreign_words.terms config replaces the default lexicon."""
+        doc = Document()
+        doc.add_paragraph("Se usó Kubernetes con Django.")
+        config = {"foreign_words": {"terms": ["Kubernetes"]}}
+        APAKeywordsHandler(doc, config).apply_foreign_word_italics()
+        italic = [r.text for r in doc.paragraphs[0].runs if r.italic]
+        self.assertEqual(italic, ["Kubernetes"])
+
+    def test_ignore_case_comes_from_config(self):
+        """foreign_words.ignore_case also matches other letter cases."""
+        doc = Document()
+        doc.add_paragraph("Se usó DJANGO.")
+        config = {"foreign_words": {"ignore_case": True}}
+        APAKeywordsHandler(doc, config).apply_foreign_word_italics()
+        italic = [r.text for r in doc.paragraphs[0].runs if r.italic]
+        self.assertEqual(italic, ["DJANGO"])
+
+    def test_matcher_prefers_longest_term(self):
+        """Overlapping terms resolve to the longest one ('APIs' over 'API')."""
+        matcher = TermMatcher(["API", "APIs", "PCI DSS"])
+        text = "Las APIs cumplen PCI DSS."
+        self.assertEqual([text[a:b] for a, b in matcher.spans(text)], ["APIs", "PCI DSS"])
+
+    def test_empty_lexicon_matches_nothing(self):
+        """An empty lexicon yields a falsy matcher with no spans."""
+        matcher = TermMatcher([])
+        self.assertFalse(matcher)
+        self.assertEqual(matcher.spans("API"), [])
+
+    def test_section_kinds_single_scan(self):
+        """Section terms are detected together in one pass."""
+        self.assertEqual(section_kinds("resumen"), frozenset({"abstract"}))
+        self.assertEqual(section_kinds("tabla de contenido"), frozenset({"toc"}))
+        self.assertEqual(
+            section_kinds("resumen y palabras clave"), frozenset({"abstract", "keywords"})
+        )
+        self.assertEqual(section_kinds("introducción"), frozenset())
+
+
 class TestApplyBodyIndent(unittest.TestCase):
     """Tests for _apply_body_indent method."""
 
@@ -10,6 +10,8 @@ from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
 
 from normadocs.formatters.apa import APADocxFormatter
+from normadocs.formatters.apa.apa_tables import PAGE_CONTENT_WIDTH, solve_column_widths
+from normadocs.utils.font_metrics import FontMetrics, get_font_metrics
 
 
 def _make_doc_with_tables(num_tables: int = 1, cols: int = 3) -> tuple[Document, list]:
@@ -346,5 +348,69 @@ class TestAddTableNotes(unittest.TestCase):
         self.assertIn("Nota.", full_text)
 
 
+class TestSolveColumnWidths(unittest.TestCase):
+    """Tests for the vectorized column-width solver."""
+
+    def test_widths_sum_to_page_width(self):
+        """Solved widths always fill exactly the page content width."""
+        widths = solve_column_widths([4.0, 1.0, 0.5], [0.6, 0.4, 0.3], min_col=0.8)
+        self.assertAlmostEqual(float(widths.sum()), PAGE_CONTENT_WIDTH, places=6)
+
+    def test_longer_content_gets_wider_column(self):
+        """Leftover space is shared in proportion to content width."""
+        widths = solve_column_widths([4.0, 1.0], [0.5, 0.5], min_col=0.8)
+        self.assertGreater(widths[0], widths[1])
+
+    def test_minimum_width_respected_when_overfull(self):
+        """When minimums overflow, the floor still applies before normalizing."""
+        widths = solve_column_widths([10.0, 0.0, 0.0, 0.0], [3.0] * 4, min_col=0.8)
+        self.assertAlmostEqual(float(widths.sum()), PAGE_CONTENT_WIDTH, places=6)
+        self.assertTrue((widths > 0).all())
+
+    def test_wide_content_column_gets_more_width_in_table(self):
+        """format_tables gives the column with longer text more room."""
+        doc = Document()
+        tbl = doc.add_table(rows=2, cols=2)
+        tbl.rows[0].cells[0].text = "Descripción"
+        tbl.rows[0].cells[1].text = "ID"
+        tbl.rows[1].cells[0].text = "Una descripción bastante larga del requerimiento funcional"
+        tbl.rows[1].cells[1].text = "1"
+
+        formatter = APADocxFormatter.__new__(APADocxFormatter)
+        formatter.doc = doc
+        formatter._format_tables()
+
+        grid_cols = doc.tables[0]._tbl.find(qn("w:tblGrid")).findall(qn("w:gridCol"))
+        self.assertGreater(int(grid_cols[0].get(qn("w:w"))), int(grid_cols[1].get(qn("w:w"))))
+
+
+class TestFontMetrics(unittest.TestCase):
+    """Tests for cached font measurement."""
+
+    def test_fallback_metrics_scale_with_length_and_size(self):
+        """Without a font file, widths follow the per-character estimate."""
+        metrics = FontMetrics(None)
+        self.assertTrue(metrics.is_fallback)
+        self.assertAlmostEqual(metrics.text_width("abcd", 12), 2 * metrics.text_width("ab", 12))
+        self.assertAlmostEqual(metrics.text_width("ab", 24), 2 * metrics.text_width("ab", 12))
+
+    def test_longest_word_width(self):
+        """The widest word is measured, not the whole string."""
+        metrics = FontMetrics(None)
+        self.assertAlmostEqual(
+            metrics.longest_word_width("a bbbb cc", 12), metrics.text_width("bbbb", 12)
+        )
+        self.assertEqual(metrics.longest_word_width("   ", 12), 0.0)
+
+    def test_metrics_are_cached_per_family(self):
+        """The same family returns the same shared metrics object."""
+        self.assertIs(get_font_metrics("Times New Roman"), get_font_metrics("Times New Roman"))
+
+    def test_non_latin_text_is_measured(self):
+        """Characters outside the dense table still get a width."""
+        metrics = get_font_metrics("Times New Roman")
+        self.assertGreater(metrics.text_width("Ωμέγα — “x”", 12), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
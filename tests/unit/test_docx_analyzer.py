@@ -1,12 +1,20 @@
 """Unit tests for DOCXAnalyzer."""
 
 import unittest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest.mock import patch
 
 from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 
+from normadocs.models import DocumentMetadata
+from normadocs.verifier.apa_verifier import APAVerifier
+from normadocs.verifier.docx_analyzer import DOCXAnalyzer
+
 
 class TestDOCXAnalyzer(unittest.TestCase):
     """Tests for DOCXAnalyzer with controlled DOCX creation."""
@@ -253,5 +261,78 @@ class TestDOCXAnalyzerUtilities(unittest.TestCase):
         assert abs(check._pt_from_emu(12700 * 12) - 12.0) < 0.01
 
 
+class TestDOCXSnapshot(unittest.TestCase):
+    """Tests for the memoized, read-only DOCX snapshot."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "snapshot.docx"
+        doc = Document()
+        doc.sections[0].header.add_paragraph("SHORT TITLE")
+        doc.add_paragraph("Tabla 1")
+        table = doc.add_table(rows=2, cols=3)
+        borders = OxmlElement("w:tblBorders")
+        edge = OxmlElement("w:insideV")
+        edge.set(qn("w:val"), "single")
+        borders.append(edge)
+        table._tbl.tblPr.append(borders)
+        doc.add_paragraph("Nota. Fuente propia.")
+        doc.add_table(rows=1, cols=1)
+        doc.save(str(self.path))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_snapshot_is_built_once(self) -> None:
+        """Repeated calls return the same snapshot without re-reading paragraphs."""
+        analyzer = DOCXAnalyzer(self.path)
+        with patch.object(
+            analyzer, "get_paragraphs_info", wraps=analyzer.get_paragraphs_info
+        ) as extract:
+            first = analyzer.snapshot()
+            self.assertIs(analyzer.snapshot(), first)
+        extract.assert_called_once()
+
+    def test_snapshot_captures_body_order_and_tables(self) -> None:
+        """Paragraphs and tables are indexed in body order."""
+        snapshot = DOCXAnalyzer(self.path).snapshot()
+        self.assertEqual(snapshot.body_order, (("p", 0), ("tbl", 0), ("p", 1), ("tbl", 1)))
+        self.assertLess(snapshot.position("p", 0), snapshot.position("tbl", 0))
+        self.assertEqual([(t.rows, t.cols) for t in snapshot.tables], [(2, 3), (1, 1)])
+        self.assertEqual([t.has_horizontal_borders_only for t in snapshot.tables], [False, True])
+        self.assertEqual(snapshot.header_text(), "SHORT TITLE")
+        self.assertEqual(snapshot.footer_text("even"), "")
+
+    def test_snapshot_is_immutable(self) -> None:
+        """Checks cannot change the shared snapshot."""
+        snapshot = DOCXAnalyzer(self.path).snapshot()
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.paragraphs[0].text = "changed"  # type: ignore[misc]
+        with self.assertRaises(TypeError):
+            snapshot.headers["default"] = "changed"  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            snapshot.paragraphs[0].runs[0]["bold"] = True  # type: ignore[index]
+        self.assertIsInstance(snapshot.paragraphs[0].runs, tuple)
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.page.page_width = 1.0  # type: ignore[misc]
+        with self.assertRaises(TypeError):
+            snapshot.page.header_text_pages[0] = "changed"  # type: ignore[index]
+
+    def test_verify_all_extracts_paragraphs_once(self) -> None:
+        """All checks of a verification run share one extraction."""
+        pdf_path = Path(self.temp_dir.name) / "snapshot.pdf"
+        pdf_path.touch()
+        verifier = APAVerifier(
+            pdf_path, self.path, meta=DocumentMetadata(title="Test"), strict=False
+        )
+        original = DOCXAnalyzer.get_paragraphs_info
+        with patch.object(
+            DOCXAnalyzer, "get_paragraphs_info", autospec=True, side_effect=original
+        ) as extract:
+            verifier.verify_all()
+        extract.assert_called_once()
+        verifier.close()
+
+
 if __name__ == "__main__":
     unittest.main()
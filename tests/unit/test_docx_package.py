@@ -0,0 +1,217 @@
+"""Unit tests for normadocs.utils.docx_package."""
+
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml.ns import qn
+from docx.parts.image import ImagePart
+
+from normadocs.formatters import get_formatter
+from normadocs.formatters.ieee import IEEEDocxFormatter
+from normadocs.models import DocumentMetadata
+from normadocs.utils.docx_package import open_document, optimize_package, repack
+
+IMAGE = Path(__file__).resolve().parents[2] / "examples" / "gantt_real.png"
+
+
+def _to_bytes(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _document_with_duplicate_media():
+    """Two pictures whose identical image data is stored in two parts."""
+    doc = Document()
+    doc.add_picture(str(IMAGE))
+    doc.add_picture(str(IMAGE))
+    copy = ImagePart(PackURI("/word/media/image9.png"), "image/png", IMAGE.read_bytes())
+    r_id = doc.part.relate_to(copy, RT.IMAGE)
+    doc.element.body.findall(".//" + qn("a:blip"))[1].set(qn("r:embed"), r_id)
+    return doc
+
+
+class TestOptimizePackage(unittest.TestCase):
+    """Tests for optimize_package."""
+
+    def test_duplicate_media_is_stored_once(self):
+        data = _to_bytes(_document_with_duplicate_media())
+        self.assertEqual(
+            sum("media/" in n for n in zipfile.ZipFile(io.BytesIO(data)).namelist()), 2
+        )
+
+        optimized = optimize_package(data)
+
+        names = zipfile.ZipFile(io.BytesIO(optimized)).namelist()
+        self.assertEqual([n for n in names if "media/" in n], ["word/media/image1.png"])
+        self.assertLess(len(optimized), len(data))
+        doc = Document(io.BytesIO(optimized))
+        embeds = {b.get(qn("r:embed")) for b in doc.element.body.iter(qn("a:blip"))}
+        targets = {doc.part.rels[r_id].target_ref for r_id in embeds}
+        self.assertEqual(targets, {"media/image1.png"})
+
+    def test_unreferenced_relationships_and_parts_are_pruned(self):
+        doc = Document()
+        doc.add_paragraph("No pictures here.")
+        orphan = ImagePart(PackURI("/word/media/orphan.png"), "image/png", IMAGE.read_bytes())
+        doc.part.relate_to(orphan, RT.IMAGE)
+
+        optimized = optimize_package(_to_bytes(doc))
+
+        names = zipfile.ZipFile(io.BytesIO(optimized)).namelist()
+        self.assertNotIn("word/media/orphan.png", names)
+        self.assertEqual(names[0], "[Content_Types].xml")
+        self.assertEqual(Document(io.BytesIO(optimized)).paragraphs[0].text, "No pictures here.")
+
+    def test_unused_styles_and_numbering_are_pruned(self):
+        doc = Document()
+        doc.add_heading("Title", level=1)
+        doc.add_paragraph("item", style="List Bullet")
+
+        optimized = Document(io.BytesIO(optimize_package(_to_bytes(doc))))
+
+        names = {s.name for s in optimized.styles}
+        self.assertLess(len(names), len(list(doc.styles)))
+        self.assertTrue({"Normal", "Heading 1", "List Bullet", "Default Paragraph Font"} <= names)
+        self.assertNotIn("Quote", names)
+        numbering = optimized.part.numbering_part.element
+        self.assertEqual(len(numbering.findall(qn("w:num"))), 1)
+
+    def test_styles_used_by_fields_are_kept(self):
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        for kind, text in (("begin", None), (None, 'STYLEREF "Intense Quote"'), ("end", None)):
+            run = paragraph.add_run()._r
+            if kind is None:
+                instr = run.makeelement(qn("w:instrText"), {})
+                instr.text = text
+                run.append(instr)
+            else:
+                run.append(run.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): kind}))
+
+        optimized = Document(io.BytesIO(optimize_package(_to_bytes(doc))))
+
+        names = {s.name for s in optimized.styles}
+        self.assertTrue({"Caption", "TOC Heading", "Intense Quote"} <= names)
+        self.assertNotIn("Quote", names)
+
+    def test_styles_named_in_settings_are_kept(self):
+        doc = Document()
+        doc.add_paragraph("Body")
+        settings = doc.settings.element
+        for tag, style_id in (
+            ("defaultTableStyle", "LightShading"),
+            ("clickAndTypeStyle", "Quote"),
+        ):
+            settings.append(settings.makeelement(qn(f"w:{tag}"), {qn("w:val"): style_id}))
+
+        optimized = Document(io.BytesIO(optimize_package(_to_bytes(doc))))
+
+        names = {s.name for s in optimized.styles}
+        self.assertTrue({"Light Shading", "Quote"} <= names)
+        self.assertNotIn("Intense Quote", names)
+
+    def test_adjacent_runs_with_identical_properties_are_merged(self):
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        paragraph.add_run("Hello ")
+        paragraph.add_run("world")
+        bold = paragraph.add_run(" again")
+        bold.bold = True
+        paragraph.add_run("!").bold = True
+
+        optimized = Document(io.BytesIO(optimize_package(_to_bytes(doc))))
+
+        runs = optimized.paragraphs[0].runs
+        self.assertEqual([r.text for r in runs], ["Hello world", " again!"])
+        self.assertEqual([r.bold for r in runs], [None, True])
+
+    def test_runs_with_different_attributes_are_not_merged(self):
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        paragraph.add_run("Hello ")._r.set(qn("w:rsidR"), "00A1")
+        paragraph.add_run("world")._r.set(qn("w:rsidR"), "00B2")
+
+        optimized = Document(io.BytesIO(optimize_package(_to_bytes(doc))))
+
+        self.assertEqual([r.text for r in optimized.paragraphs[0].runs], ["Hello ", "world"])
+
+    def test_compression_level_is_applied_and_validated(self):
+        doc = Document()
+        for i in range(3000):
+            doc.add_paragraph(f"Paragraph {i} with some repeated body text.")
+        data = _to_bytes(doc)
+        stored = zipfile.ZipFile(io.BytesIO(repack(data, 0)))
+        self.assertTrue(all(i.compress_type == zipfile.ZIP_STORED for i in stored.infolist()))
+        self.assertLess(len(repack(data, 9)), len(repack(data, 1)))
+        self.assertLess(len(repack(data, 1)), len(repack(data, 0)))
+        self.assertLess(len(optimize_package(data, 9)), len(optimize_package(data, 1)))
+        with self.assertRaises(ValueError):
+            optimize_package(data, compression_level=10)
+
+
+class TestFormatterSave(unittest.TestCase):
+    """Tests for optimize-on-save in the formatters."""
+
+    def test_save_optimizes_when_requested(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "in.docx"
+            _document_with_duplicate_media().save(str(source))
+            formatter = IEEEDocxFormatter(str(source))
+            plain, optimized = Path(tmp) / "plain.docx", Path(tmp) / "optimized.docx"
+
+            formatter.save(str(plain))
+            formatter.save(str(optimized), optimize=True, compression_level=9)
+
+            self.assertLess(optimized.stat().st_size, plain.stat().st_size)
+            self.assertEqual(len(Document(str(optimized)).inline_shapes), 2)
+
+
+class _ForwardOnly(io.RawIOBase):
+    """A readable stream that cannot seek, like a socket or pipe."""
+
+    def __init__(self, data):
+        self._inner = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._inner.readinto(buffer)
+
+
+class TestInMemoryFormatting(unittest.TestCase):
+    """Tests for formatting DOCX bytes and streams without temp files."""
+
+    def setUp(self):
+        doc = Document()
+        doc.add_paragraph("In memory.")
+        self.data = _to_bytes(doc)
+
+    def test_open_document_accepts_every_source(self):
+        doc = Document(io.BytesIO(self.data))
+        self.assertIs(open_document(doc), doc)
+        sources = [self.data, bytearray(self.data), io.BytesIO(self.data), _ForwardOnly(self.data)]
+        for source in sources:
+            self.assertEqual(open_document(source).paragraphs[0].text, "In memory.")
+
+    def test_formatter_round_trips_bytes_through_streams(self):
+        for style in ("apa7", "icontec", "ieee"):
+            with self.subTest(style=style):
+                formatter = get_formatter(style, self.data)
+                formatter.process(DocumentMetadata(title="Title", author="Author"))
+                for optimize in (False, True):
+                    out = io.BytesIO()
+                    formatter.save(out, optimize=optimize)
+                    texts = [p.text for p in Document(io.BytesIO(out.getvalue())).paragraphs]
+                    self.assertIn("In memory.", texts)
+
+
+if __name__ == "__main__":
+    unittest.main()
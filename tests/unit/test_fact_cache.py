@@ -0,0 +1,192 @@
+"""Unit tests for normadocs.verifier.fact_cache."""
+
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import fitz
+import numpy as np
+from docx import Document
+from docx.shared import Inches, Pt
+
+from normadocs.models import DocumentMetadata
+from normadocs.verifier.apa_verifier import APAVerifier
+from normadocs.verifier.docx_analyzer import DOCXAnalyzer
+from normadocs.verifier.fact_cache import FactCache, snapshot_from_dict, snapshot_to_dict
+from normadocs.verifier.pdf_analyzer import GLYPH_DTYPE, PDFAnalyzer
+
+
+def _write_docx(path: Path, text: str = "Cuerpo del documento.") -> Path:
+    doc = Document()
+    doc.core_properties.title = "Informe"
+    doc.sections[0].header.add_paragraph("INFORME")
+    doc.add_heading("Introducción", level=1)
+    para = doc.add_paragraph()
+    para.paragraph_format.first_line_indent = Inches(0.5)
+    para.paragraph_format.line_spacing = 2.0
+    run = para.add_run(text)
+    run.font.name = "Times New Roman"
+    run.font.size = Pt(12)
+    doc.add_table(rows=2, cols=2)
+    doc.add_section()
+    doc.save(str(path))
+    return path
+
+
+def _write_pdf(path: Path) -> Path:
+    doc = fitz.open()
+    for i in range(2):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((72, 72), f"Página {i + 1}", fontname="tiro", fontsize=12)
+        page.insert_text((72, 96), "Negrita", fontname="tibo", fontsize=12)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestFactCache(unittest.TestCase):
+    """Tests for storing and restoring extracted facts."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.cache = FactCache(self.root / "cache")
+        self.docx_path = _write_docx(self.root / "doc.docx")
+        self.pdf_path = _write_pdf(self.root / "doc.pdf")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_docx_snapshot_round_trips(self) -> None:
+        snapshot = DOCXAnalyzer(self.docx_path).snapshot()
+        self.assertIsNone(self.cache.load_docx(self.docx_path))
+
+        entry = self.cache.store_docx(self.docx_path, snapshot)
+        restored = self.cache.load_docx(self.docx_path)
+
+        self.assertEqual(restored, snapshot)
+        self.assertEqual(len(restored.sections), 2)
+        self.assertEqual(restored.paragraphs[1].first_line_indent.inches, 0.5)
+        self.assertEqual(restored.paragraphs[1].runs[0]["font_size"].pt, 12)
+        self.assertEqual(json.loads(entry.read_text())["title"], "Informe")
+
+    def test_pdf_facts_round_trip_without_opening_the_pdf(self) -> None:
+        extracted = PDFAnalyzer(self.pdf_path)
+        self.assertFalse(self.cache.load_pdf(PDFAnalyzer(self.pdf_path)))
+        with self.assertRaises(ValueError):
+            self.cache.store_pdf(extracted)  # storing never parses pages
+        extracted.extract_text_by_page()
+        entry = self.cache.store_pdf(extracted)
+
+        restored = PDFAnalyzer(self.pdf_path)
+        restored.fonts.intern("Helvetica")  # font ids are remapped
+        with patch.object(fitz, "open") as fitz_open:
+            self.assertTrue(self.cache.load_pdf(restored))
+            for i in range(2):
+                expected, actual = extracted.get_page(i), restored.get_page(i)
+                self.assertEqual(actual.text_blocks, expected.text_blocks)
+                self.assertEqual(actual.fonts, expected.fonts)
+            np.testing.assert_allclose(restored.margins_by_page(), extracted.margins_by_page())
+            self.assertEqual(restored.font_histogram(), extracted.font_histogram())
+        fitz_open.assert_not_called()
+        extracted.close()
+
+        with np.load(entry, allow_pickle=False) as archive:
+            self.assertEqual(archive["glyphs"].dtype, GLYPH_DTYPE)
+            self.assertEqual(list(archive["fonts"]), ["Times-Roman", "Times-Bold"])
+            self.assertEqual(archive["sizes"].shape, (2, 2))
+
+    def test_entries_are_keyed_by_content_and_version(self) -> None:
+        first = self.cache.docx_entry(self.docx_path)
+        _write_docx(self.docx_path, text="Texto modificado.")
+        second = self.cache.docx_entry(self.docx_path)
+
+        self.assertNotEqual(first, second)
+        self.assertTrue(second.name.startswith("docx-v1-"))
+        with patch("normadocs.verifier.fact_cache.DOCX_EXTRACTOR_VERSION", 2):
+            self.assertNotEqual(self.cache.docx_entry(self.docx_path), second)
+
+    def test_corrupt_or_missing_inputs_are_misses(self) -> None:
+        entry = self.cache.store_docx(self.docx_path, DOCXAnalyzer(self.docx_path).snapshot())
+        entry.write_text("{", encoding="utf-8")
+        self.cache.pdf_entry(self.pdf_path, "pymupdf").write_bytes(b"not a zip")
+
+        self.assertIsNone(self.cache.load_docx(self.docx_path))
+        self.assertFalse(self.cache.load_pdf(PDFAnalyzer(self.pdf_path)))
+        self.assertIsNone(self.cache.load_docx(self.root / "missing.docx"))
+        self.assertFalse(self.cache.load_pdf(PDFAnalyzer(self.root / "missing.pdf")))
+
+    def test_snapshot_dict_is_json_serializable(self) -> None:
+        data = snapshot_to_dict(DOCXAnalyzer(self.docx_path).snapshot())
+        self.assertEqual(snapshot_from_dict(json.loads(json.dumps(data))).body_order[0], ("p", 0))
+
+
+class TestVerifierFactCache(unittest.TestCase):
+    """Tests for APAVerifier re-verification from the fact cache."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.docx_path = _write_docx(self.root / "doc.docx")
+        self.pdf_path = _write_pdf(self.root / "doc.pdf")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _verify(self, strict: bool, cache: bool = True):
+        verifier = APAVerifier(
+            self.pdf_path,
+            self.docx_path,
+            meta=DocumentMetadata(title="Informe"),
+            strict=strict,
+            cache_dir=self.root / "cache" if cache else None,
+        )
+        try:
+            return verifier.verify_all()
+        finally:
+            verifier.close()
+
+    def test_reverification_skips_parsing(self) -> None:
+        first = self._verify(strict=False)
+        uncached_strict = self._verify(strict=True, cache=False)
+        self.assertEqual(len(list((self.root / "cache").iterdir())), 2)
+
+        with (
+            patch("normadocs.verifier.docx_analyzer.Document") as parse_docx,
+            patch.object(fitz, "open") as parse_pdf,
+        ):
+            again = self._verify(strict=False)
+            strict = self._verify(strict=True)
+        parse_docx.assert_not_called()
+        parse_pdf.assert_not_called()
+
+        for cached, fresh in ((again, first), (strict, uncached_strict)):
+            self.assertEqual(
+                [(i.check, i.severity, i.actual) for i in cached.issues],
+                [(i.check, i.severity, i.actual) for i in fresh.issues],
+            )
+            self.assertEqual(cached.errors, fresh.errors)
+
+    def test_pdf_is_not_hashed_or_cached_unless_a_check_reads_it(self) -> None:
+        verifier = APAVerifier(
+            self.pdf_path,
+            self.docx_path,
+            meta=DocumentMetadata(title="Informe"),
+            cache_dir=self.root / "cache",
+            checks=["fonts", "margins"],
+        )
+        with patch.object(
+            FactCache, "pdf_entry", autospec=True, side_effect=FactCache.pdf_entry
+        ) as pdf_entry:
+            verifier.verify_all()
+            verifier.pdf.get_page(0)  # a single page is not a complete entry
+            verifier._store_pdf_facts()
+        verifier.close()
+        self.assertEqual(pdf_entry.call_count, 1)  # the lookup by get_page
+        self.assertEqual([p.name[:5] for p in (self.root / "cache").iterdir()], ["docx-"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Unit tests for normadocs.formatters.fragments."""
+
+import unittest
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from normadocs.formatters import fragments
+from normadocs.formatters.fragments import (
+    BlockLine,
+    block_paragraphs,
+    page_field_runs,
+    running_head_fragment,
+)
+from normadocs.formatters.icontec import IcontecFormatter
+from normadocs.models import DocumentMetadata
+
+LINES = (
+    BlockLine(None, bold=True, space_after=12),
+    BlockLine("Shared Institution"),
+    BlockLine(None),
+)
+
+
+def _texts(paragraphs):
+    return ["".join(t.text for t in p.iter(qn("w:t"))) for p in paragraphs]
+
+
+class TestBlockParagraphs(unittest.TestCase):
+    """Tests for block_paragraphs."""
+
+    def test_slots_are_filled_in_order(self):
+        paragraphs = block_paragraphs(LINES, ("Title", "2024"))
+        self.assertEqual(_texts(paragraphs), ["Title", "Shared Institution", "2024"])
+        self.assertIsNotNone(paragraphs[0].find(".//" + qn("w:b")))
+        self.assertIsNone(paragraphs[1].find(".//" + qn("w:b")))
+
+    def test_empty_slot_gets_no_run(self):
+        paragraphs = block_paragraphs(LINES, ("", "2024"))
+        self.assertEqual(paragraphs[0].r_lst, [])
+        self.assertEqual(len(paragraphs[2].r_lst), 1)
+
+    def test_template_is_built_once_per_shape(self):
+        fragments._block_template.cache_clear()
+        first = block_paragraphs(LINES, ("A", "1"), style_id="Title")
+        second = block_paragraphs(LINES, ("B", "2"), style_id="Title")
+        info = fragments._block_template.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+        self.assertIsNot(first[1], second[1])
+        self.assertEqual(_texts(first), ["A", "Shared Institution", "1"])
+
+    def test_icontec_cover_is_stamped_per_document(self):
+        texts = []
+        for title in ("First Thesis", "Second Thesis"):
+            doc = Document()
+            doc.add_paragraph("Body.")
+            formatter = IcontecFormatter(doc)
+            formatter.process(DocumentMetadata(title=title, institution="Uni"))
+            texts.append([p.text for p in formatter.doc.paragraphs])
+        self.assertIn("FIRST THESIS", texts[0])
+        self.assertIn("SECOND THESIS", texts[1])
+        self.assertNotIn("FIRST THESIS", texts[1])
+
+
+class TestPageFieldRuns(unittest.TestCase):
+    """Tests for page_field_runs and running_head_fragment."""
+
+    def test_field_runs_are_fresh_copies(self):
+        first, second = page_field_runs("Arial", 12), page_field_runs("Arial", 12)
+        self.assertEqual(len(first), 5)
+        self.assertTrue(all(a is not b for a, b in zip(first, second, strict=True)))
+        kinds = [c.get(qn("w:fldCharType")) for r in first for c in r.iter(qn("w:fldChar"))]
+        self.assertEqual(kinds, ["begin", "separate", "end"])
+
+    def test_running_head_sets_title(self):
+        tabs, runs = running_head_fragment("SHORT TITLE", "Times New Roman", 12)
+        self.assertEqual(len(tabs), 2)
+        self.assertEqual(runs[0].text, "SHORT TITLE")
+        _, again = running_head_fragment("OTHER", "Times New Roman", 12)
+        self.assertEqual((runs[0].text, again[0].text), ("SHORT TITLE", "OTHER"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for normadocs.formatters.images."""
+
+import io
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from docx import Document
+from docx.shared import Inches
+from PIL import Image
+
+from normadocs.formatters import get_formatter, images
+from normadocs.formatters.images import clear_image_cache, downsample_images, resample_image
+from normadocs.models import DocumentMetadata
+from normadocs.standards import compile_config
+
+
+def _photo(width, height, image_format="JPEG"):
+    """A noisy image that does not compress away."""
+    pixels = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+
+def _figures(**overrides):
+    return compile_config({"figures": overrides}, "apa7").figures
+
+
+class TestResampleImage(unittest.TestCase):
+    """Tests for resample_image."""
+
+    def test_large_jpeg_is_resampled_to_cover_the_target(self):
+        data = resample_image(_photo(1600, 1200), 400, 200)
+        self.assertIsNotNone(data)
+        with Image.open(io.BytesIO(data)) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertEqual(image.size, (400, 300))
+
+    def test_png_keeps_its_format(self):
+        data = resample_image(_photo(800, 800, "PNG"), 200, 200)
+        with Image.open(io.BytesIO(data)) as image:
+            self.assertEqual((image.format, image.size), ("PNG", (200, 200)))
+
+    def test_small_or_unsupported_images_are_kept(self):
+        self.assertIsNone(resample_image(_photo(300, 200), 400, 300))
+        self.assertIsNone(resample_image(_photo(800, 800, "GIF"), 100, 100))
+
+    def test_undecodable_images_are_kept(self):
+        self.assertIsNone(resample_image(SVG, 100, 100))
+        self.assertIsNone(resample_image(_photo(800, 800, "PNG")[:200], 100, 100))
+        with patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            self.assertIsNone(resample_image(_photo(800, 800), 100, 100))
+
+
+class TestDownsampleImages(unittest.TestCase):
+    """Tests for downsample_images."""
+
+    def setUp(self):
+        clear_image_cache()
+        self.doc = Document()
+        self.doc.add_picture(io.BytesIO(_photo(2400, 1800)), width=Inches(2))
+
+    def test_images_are_resampled_to_the_displayed_size(self):
+        replaced = downsample_images(self.doc, _figures(image_dpi=150))
+        self.assertEqual(replaced, 1)
+        r_id = self.doc.inline_shapes[0]._inline.graphic.graphicData.pic.blipFill.blip.embed
+        part = self.doc.part.related_parts[r_id]
+        self.assertEqual((part.image.px_width, part.image.px_height), (300, 225))
+
+    def test_results_are_cached_by_content_and_size(self):
+        other = Document()
+        other.add_picture(io.BytesIO(_photo(2400, 1800)), width=Inches(2))
+        with patch.object(images, "resample_image", wraps=resample_image) as resample:
+            downsample_images(self.doc, _figures(image_dpi=150))
+            downsample_images(other, _figures(image_dpi=150))
+        self.assertEqual(resample.call_count, 1)
+
+    def test_svg_in_place_of_a_png_is_left_as_is(self):
+        for style in ("apa7", "ieee"):
+            with self.subTest(style=style):
+                doc = Document()
+                doc.add_picture(io.BytesIO(_photo(2400, 1800, "PNG")), width=Inches(2))
+                r_id = doc.inline_shapes[0]._inline.graphic.graphicData.pic.blipFill.blip.embed
+                part = doc.part.related_parts[r_id]
+                part._blob = SVG
+                get_formatter(style, doc).process(DocumentMetadata(title="T", author="A"))
+                self.assertEqual(part.blob, SVG)
+
+    def test_cache_is_bounded_by_bytes(self):
+        cache = images._BlobCache(max_bytes=10)
+        cache.get_or_create("a", lambda: b"123456")
+        cache.get_or_create("b", lambda: None)
+        cache.get_or_create("c", lambda: b"123456")
+        self.assertEqual((len(cache), cache.size), (2, 6))
+        self.assertEqual(cache.get_or_create("d", lambda: b"x" * 11), b"x" * 11)
+        self.assertEqual(len(cache), 2)
+
+    def test_unsupported_python_docx_keeps_the_images(self):
+        with (
+            patch.object(images.docx, "__version__", "2.0.0"),
+            self.assertLogs("normadocs", "WARNING"),
+        ):
+            self.assertEqual(downsample_images(self.doc, _figures(image_dpi=150)), 0)
+
+    def test_zero_dpi_disables_resampling(self):
+        with patch.object(images, "resample_image") as resample:
+            self.assertEqual(downsample_images(self.doc, _figures(image_dpi=0)), 0)
+        resample.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
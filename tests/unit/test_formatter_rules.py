@@ -0,0 +1,114 @@
+"""Unit tests for declarative standard rules and the rule engine."""
+
+import unittest
+from unittest.mock import patch
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.shared import Cm, Pt
+
+from normadocs.formatters.rules import RuleEngine
+from normadocs.standards import InvalidStandardError, compile_config
+from normadocs.standards.rules import parse_rules
+
+CAPTION_RULES = [
+    {"name": "body", "select": {"role": "body"}, "apply": {"alignment": "justify"}},
+    {
+        "name": "captions",
+        "select": {"role": "caption"},
+        "apply": {"alignment": "center", "italic": True},
+    },
+    {"name": "tables", "select": {"role": "table"}, "apply": {"table_style": "Table Grid"}},
+    {
+        "name": "tables",
+        "select": {"role": "table_cell"},
+        "apply": {"space_after": 0, "line_spacing": "single"},
+    },
+    {
+        "name": "quotes",
+        "select": {"style": "Quote"},
+        "apply": {"left_indent": "1.27cm", "line_spacing": 1.15},
+    },
+]
+
+
+def _engine(doc, rules=CAPTION_RULES):
+    standard = compile_config({"rules": rules, "figures": {"caption_prefix": "Fig"}}, "ieee")
+    return RuleEngine(doc, standard=standard)
+
+
+class TestParseRules(unittest.TestCase):
+    """Tests for parse_rules validation."""
+
+    def test_valid_rules_compile_lengths_and_spacing(self):
+        problems = []
+        rules = parse_rules(CAPTION_RULES, problems)
+        self.assertEqual(problems, [])
+        self.assertEqual(rules[3].properties.space_after, Pt(0))
+        self.assertEqual(rules[4].properties.left_indent, Cm(1.27))
+        self.assertEqual(rules[4].properties.line_spacing, 1.15)
+        self.assertIn("table_cell", rules[4].roles)
+
+    def test_invalid_rules_are_rejected_up_front(self):
+        rules = [
+            {"select": {"role": "sidebar"}, "apply": {"alignment": "middle"}},
+            {"select": {"role": "body"}, "apply": {"table_style": "Grid", "color": "red"}},
+            {"select": {"role": "table"}, "apply": {"bold": True}},
+        ]
+        with self.assertRaises(InvalidStandardError) as ctx:
+            compile_config({"rules": rules})
+        self.assertEqual(len(ctx.exception.problems), 5)
+
+
+class TestRuleEngine(unittest.TestCase):
+    """Tests for RuleEngine."""
+
+    def setUp(self):
+        self.doc = Document()
+        self.heading = self.doc.add_heading("Intro", level=1)
+        self.body = self.doc.add_paragraph("Body text.")
+        self.caption = self.doc.add_paragraph("Fig. 1. A figure.")
+        self.quote = self.doc.add_paragraph("Quoted.", style="Quote")
+        self.table = self.doc.add_table(rows=1, cols=1)
+        self.table.cell(0, 0).text = "cell"
+
+    def test_all_rules_apply_in_one_walk(self):
+        engine = _engine(self.doc)
+        with patch.object(RuleEngine, "walk", wraps=engine.walk) as walk:
+            engine.apply()
+        self.assertEqual(walk.call_count, 1)
+        self.assertIsNone(self.heading.paragraph_format.alignment)
+        self.assertEqual(self.body.paragraph_format.alignment, WD_ALIGN_PARAGRAPH.JUSTIFY)
+        self.assertEqual(self.caption.paragraph_format.alignment, WD_ALIGN_PARAGRAPH.CENTER)
+        self.assertTrue(all(run.italic for run in self.caption.runs))
+        self.assertEqual(self.quote.paragraph_format.left_indent, Cm(1.27))
+        self.assertEqual(self.quote.paragraph_format.line_spacing, 1.15)
+        self.assertEqual(self.table.style.name, "Table Grid")
+        cell_format = self.table.cell(0, 0).paragraphs[0].paragraph_format
+        self.assertEqual(cell_format.space_after, Pt(0))
+        self.assertEqual(cell_format.line_spacing_rule, WD_LINE_SPACING.SINGLE)
+
+    def test_groups_select_a_subset_of_rules(self):
+        engine = _engine(self.doc)
+        engine.apply(frozenset(("captions",)))
+        self.assertIsNone(self.body.paragraph_format.alignment)
+        self.assertEqual(self.caption.paragraph_format.alignment, WD_ALIGN_PARAGRAPH.CENTER)
+        self.assertNotEqual(self.table.style.name, "Table Grid")
+
+    def test_dispatch_table_is_shared_by_identical_elements(self):
+        for i in range(20):
+            self.doc.add_paragraph(f"More body text {i}.")
+        engine = _engine(self.doc)
+        engine.apply()
+        body_keys = [key for key in engine._dispatch if key[1] == "Normal"]
+        self.assertEqual(len(body_keys), 3)  # body, caption and table-cell roles
+
+    def test_standard_without_rules_skips_the_walk(self):
+        engine = RuleEngine(self.doc, standard=compile_config({}, "apa7"))
+        with patch.object(RuleEngine, "walk") as walk:
+            engine.apply()
+        walk.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
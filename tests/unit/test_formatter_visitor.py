@@ -0,0 +1,81 @@
+"""Unit tests for the single-traversal body visitor."""
+
+import unittest
+
+from docx import Document
+
+from normadocs.formatters.visitor import BodyVisitor, StyleNames
+
+
+class _Recorder(BodyVisitor):
+    def __init__(self, doc):
+        super().__init__(doc)
+        self.events: list[tuple[str, str]] = []
+
+    def visit_paragraph(self, paragraph, style_name):
+        self.events.append(("p", style_name))
+
+    def visit_table(self, table):
+        self.events.append(("table", ""))
+
+    def visit_cell_paragraph(self, paragraph, style_name):
+        self.events.append(("cell", paragraph.text))
+
+
+class TestBodyVisitor(unittest.TestCase):
+    """Tests for BodyVisitor and StyleNames."""
+
+    def test_blocks_are_visited_once_in_document_order(self):
+        """Paragraphs, tables and each cell paragraph are visited once, in order."""
+        doc = Document()
+        doc.add_heading("Intro", level=1)
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "a"
+        table.cell(0, 1).text = "b"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        doc.add_paragraph("Body")
+
+        recorder = _Recorder(doc)
+        recorder.walk()
+
+        self.assertEqual(recorder.events[0], ("p", "Heading 1"))
+        self.assertEqual(recorder.events[1], ("table", ""))
+        cells = [e for e in recorder.events if e[0] == "cell"]
+        self.assertEqual(len(cells), len(table._tbl.findall(".//{*}p")))
+        self.assertEqual(recorder.events[-1], ("p", "Normal"))
+
+    def test_blocks_may_be_removed_during_the_walk(self):
+        """Removing the current or the next block neither stops nor repeats the walk."""
+
+        class _Merger(BodyVisitor):
+            def __init__(self, doc):
+                super().__init__(doc)
+                self.seen: list[str] = []
+
+            def visit_paragraph(self, paragraph, style_name):
+                self.seen.append(paragraph.text)
+                if paragraph.text == "merge":
+                    following = paragraph._p.getnext()
+                    following.getparent().remove(following)
+                elif paragraph.text == "drop":
+                    paragraph._p.getparent().remove(paragraph._p)
+
+        doc = Document()
+        for text in ("merge", "merged", "drop", "last"):
+            doc.add_paragraph(text)
+        merger = _Merger(doc)
+        merger.walk()
+        self.assertEqual(merger.seen, ["merge", "drop", "last"])
+
+    def test_style_names_resolve_default_and_explicit_styles(self):
+        """Unstyled paragraphs resolve to the default style name."""
+        doc = Document()
+        plain = doc.add_paragraph("x")
+        quote = doc.add_paragraph("y", style="Quote")
+        names = StyleNames(doc)
+        self.assertEqual(names.of(plain), "Normal")
+        self.assertEqual(names.of(quote), "Quote")
+
+
+if __name__ == "__main__":
+    unittest.main()
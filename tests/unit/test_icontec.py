@@ -227,18 +227,23 @@ class TestProcessParagraphs(unittest.TestCase):
                 f"Paragraph '{p.text}' is not justified",
             )
 
-    def test_body_font_is_arial(self):
-        """Body paragraph runs must have Arial font set."""
+    def test_body_runs_inherit_arial(self):
+        """Body runs carry no direct font; Arial comes from the styles."""
+        self.formatter._create_styles()
         for p in self.formatter.doc.paragraphs:
             if p.style and p.style.name.startswith("Heading"):
                 continue
+            self.assertEqual(p.style.font.name, "Arial")
             for run in p.runs:
-                if run.text.strip():
-                    self.assertEqual(
-                        run.font.name,
-                        "Arial",
-                        f"Run '{run.text}' is not Arial",
-                    )
+                self.assertIsNone(run.font.name, f"Run '{run.text}' has a direct font")
+
+    def test_document_defaults_use_body_font(self):
+        """The document-wide default run font is the configured body font."""
+        self.formatter._create_styles()
+        fonts = self.formatter.doc.styles.element.find(
+            f"{qn('w:docDefaults')}/{qn('w:rPrDefault')}/{qn('w:rPr')}/{qn('w:rFonts')}"
+        )
+        self.assertEqual(fonts.get(qn("w:ascii")), "Arial")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,257 @@
+"""Unit tests for normadocs.verifier.pdf_analyzer."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import fitz
+import numpy as np
+
+from normadocs.verifier import pdf_analyzer
+from normadocs.verifier.pdf_analyzer import GLYPH_DTYPE, PDFAnalyzer
+
+
+def _write_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((72, 72), f"Figura {i + 1}", fontsize=12)
+        page.insert_text((300, 120), "Título en negrita", fontname="tibo", fontsize=12)
+        page.insert_text((500, 120), str(i + 1), fontsize=12)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestPDFAnalyzerRendering(unittest.TestCase):
+    """Tests for lazy page rasterization."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.pdf_path = _write_pdf(Path(self.temp_dir.name) / "doc.pdf", 3)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_text_queries_never_render(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path)
+        with patch.object(fitz.Page, "get_pixmap") as get_pixmap:
+            self.assertEqual(len(analyzer.find_text("figura")), 3)
+            self.assertIn("Figura 2", analyzer.extract_text_by_page()[1])
+            analyzer.get_margins(0)
+        get_pixmap.assert_not_called()
+        analyzer.close()
+
+    def test_render_page_uses_the_requested_dpi(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path, render_dpi=36)
+        small = fitz.Pixmap(analyzer.render_page(0))
+        large = fitz.Pixmap(analyzer.render_page(0, dpi=72))
+        self.assertEqual((small.width, small.height), (306, 396))
+        self.assertEqual((large.width, large.height), (612, 792))
+        analyzer.close()
+
+    def test_renders_are_kept_in_an_lru_cache(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path, render_dpi=36, render_cache_size=2)
+        with patch.object(analyzer, "_render_page", wraps=analyzer._render_page) as render:
+            first = analyzer.render_page(0)
+            analyzer.render_page(1)
+            self.assertIs(analyzer.render_page(0), first)  # hit, 0 is now most recent
+            analyzer.render_page(2)  # evicts page 1
+            analyzer.render_page(0)
+            analyzer.render_page(1)
+        self.assertEqual(render.call_count, 4)
+        analyzer.close()
+
+    def test_render_page_checks_the_range(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path)
+        with self.assertRaises(IndexError):
+            analyzer.render_page(3)
+        analyzer.close()
+
+
+class TestPDFAnalyzerBackends(unittest.TestCase):
+    """Tests for the PyMuPDF and pdfplumber text backends."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.pdf_path = _write_pdf(Path(self.temp_dir.name) / "doc.pdf", 2)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_pymupdf_is_the_default_and_skips_pdfplumber(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path)
+        analyzer.extract_text_by_page()
+        self.assertEqual(analyzer.backend, "pymupdf")
+        self.assertIsNone(analyzer._pdf_plumber)
+        analyzer.close()
+
+    def test_backends_build_the_same_blocks(self) -> None:
+        pages = {}
+        for backend in ("pymupdf", "pdfplumber"):
+            analyzer = PDFAnalyzer(self.pdf_path, backend=backend)
+            pages[backend] = analyzer.get_page(1)
+            analyzer.close()
+
+        fast, plumber = pages["pymupdf"], pages["pdfplumber"]
+        self.assertEqual((fast.width, fast.height), (plumber.width, plumber.height))
+        self.assertEqual([b.text for b in fast.text_blocks], [b.text for b in plumber.text_blocks])
+        self.assertEqual([b.text for b in fast.text_blocks][-1], "2")
+        for a, b in zip(fast.text_blocks, plumber.text_blocks, strict=True):
+            self.assertAlmostEqual(a.x0, b.x0, delta=0.5)
+            self.assertAlmostEqual(a.y1, b.y1, delta=1.5)
+            self.assertEqual(a.font_size, b.font_size)
+            self.assertEqual(a.bold, b.bold)
+        bold = [b for b in fast.text_blocks if b.bold]
+        self.assertTrue(bold and bold[0].font_name)
+
+    def test_words_without_space_glyphs_split_alike(self) -> None:
+        path = Path(self.temp_dir.name) / "no_spaces.pdf"
+        doc = fitz.open()
+        page = doc.new_page(width=612, height=792)
+        x = 72.0
+        for word in ("Abstract", "Syntax", "Notation"):
+            page.insert_text((x, 100), word, fontname="tiro", fontsize=12)
+            x += fitz.get_text_length(word, "tiro", 12) + 8
+        doc.save(str(path))
+        doc.close()
+
+        for backend in ("pymupdf", "pdfplumber"):
+            analyzer = PDFAnalyzer(path, backend=backend)
+            blocks = [b.text for b in analyzer.get_page(0).text_blocks]
+            analyzer.close()
+            self.assertEqual(blocks, ["Abstract", "Syntax", "Notation"], backend)
+
+    def test_unknown_backend_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            PDFAnalyzer(self.pdf_path, backend="pdfminer")
+
+
+class TestPDFAnalyzerColumnar(unittest.TestCase):
+    """Tests for the NumPy glyph storage and vectorized queries."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "lines.pdf"
+        doc = fitz.open()
+        for _ in range(2):
+            page = doc.new_page(width=612, height=792)
+            for i in range(4):
+                page.insert_text((72, 100 + 24 * i), f"Line {i}", fontname="tiro", fontsize=12)
+            page.insert_text((90, 300), "Bold", fontname="tibo", fontsize=12)
+        doc.new_page(width=612, height=792)
+        doc.save(str(path))
+        doc.close()
+        self.analyzer = PDFAnalyzer(path)
+
+    def tearDown(self) -> None:
+        self.analyzer.close()
+        self.temp_dir.cleanup()
+
+    def test_glyphs_are_stored_column_wise(self) -> None:
+        page = self.analyzer.get_page(0)
+        self.assertEqual(page.glyphs.dtype, GLYPH_DTYPE)
+        self.assertEqual(len(page.glyphs), len(page.text))
+        self.assertEqual(page.text[page.glyphs["offset"][0]], "L")
+        self.assertEqual(self.analyzer.fonts.names, ["Times-Roman", "Times-Bold"])
+        self.assertEqual(page.fonts, {"Times-Roman": 24, "Times-Bold": 4})
+
+    def test_margins_by_page_match_get_margins(self) -> None:
+        margins = self.analyzer.margins_by_page()
+        self.assertEqual(margins.shape, (3, 4))
+        for i in range(3):
+            np.testing.assert_allclose(margins[i], self.analyzer.get_margins(i))
+        np.testing.assert_allclose(margins[2], 1.0)
+        self.assertAlmostEqual(margins[0][3], 1.0)
+
+    def test_pages_can_be_extracted_out_of_order(self) -> None:
+        self.assertEqual(self.analyzer.get_page(1).page_number, 1)
+        self.assertEqual(self.analyzer.get_page(0).page_number, 0)
+        self.assertEqual(self.analyzer.get_page(0).fonts, {"Times-Roman": 24, "Times-Bold": 4})
+
+    def test_concurrent_readers_share_one_extraction(self) -> None:
+        with (
+            patch.object(
+                self.analyzer, "_extract_page_info", wraps=self.analyzer._extract_page_info
+            ) as extract,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            texts = list(pool.map(lambda _: self.analyzer.extract_text_by_page(), range(16)))
+        self.assertEqual(extract.call_count, 3)
+        self.assertTrue(all(t == texts[0] for t in texts))
+
+    def test_document_font_histogram(self) -> None:
+        self.assertEqual(self.analyzer.font_histogram(), {"Times-Roman": 48, "Times-Bold": 8})
+
+    def test_baseline_spacing_stays_within_pages(self) -> None:
+        gaps = self.analyzer.baseline_spacing()
+        np.testing.assert_allclose(gaps, [24, 24, 24, 128] * 2)
+
+
+class TestPDFAnalyzerSharded(unittest.TestCase):
+    """Tests for multiprocess, page-sharded extraction."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.pdf_path = Path(self.temp_dir.name) / "long.pdf"
+        doc = fitz.open()
+        fonts = ("tiro", "tibo", "cour", "helv")
+        for i in range(9):
+            page = doc.new_page(width=612, height=792)
+            # Fonts first appear on different pages, so interning order matters.
+            for line, font in enumerate(fonts[: 1 + i // 3]):
+                page.insert_text((72, 100 + 24 * line), f"Page {i} {font}", fontname=font)
+        doc.new_page(width=612, height=792)
+        doc.save(str(self.pdf_path))
+        doc.close()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_sharded_extraction_matches_sequential(self) -> None:
+        sequential = PDFAnalyzer(self.pdf_path)
+        sharded = PDFAnalyzer(self.pdf_path, processes=3)
+        sequential.get_page(4)
+        sharded.get_page(4)
+        with (
+            patch.object(pdf_analyzer, "SHARD_MIN_PAGES", 2),
+            patch.object(pdf_analyzer, "_usable_cpus", return_value=3),
+            patch.object(sharded, "_extract_page_info") as extract_here,
+        ):
+            np.testing.assert_array_equal(sharded.glyphs(), sequential.glyphs())
+        extract_here.assert_not_called()
+
+        self.assertEqual(sharded.fonts.names, sequential.fonts.names)
+        for i in range(sequential.page_count):
+            expected, actual = sequential.get_page(i), sharded.get_page(i)
+            self.assertEqual(actual.page_number, i)
+            self.assertEqual((actual.width, actual.height), (expected.width, expected.height))
+            self.assertEqual((actual.text, actual.fonts), (expected.text, expected.fonts))
+            self.assertEqual(actual.text_blocks, expected.text_blocks)
+        np.testing.assert_array_equal(sharded.margins_by_page(), sequential.margins_by_page())
+        sequential.close()
+        sharded.close()
+
+    def test_no_more_shards_than_usable_cpus(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path, processes=4)
+        with (
+            patch.object(pdf_analyzer, "SHARD_MIN_PAGES", 2),
+            patch.object(pdf_analyzer, "_usable_cpus", return_value=1),
+            patch.object(pdf_analyzer, "ProcessPoolExecutor") as pool,
+        ):
+            self.assertEqual(len(analyzer.extract_text_by_page()), 10)
+        pool.assert_not_called()
+        analyzer.close()
+
+    def test_short_documents_are_extracted_in_process(self) -> None:
+        analyzer = PDFAnalyzer(self.pdf_path, processes=4)
+        with patch.object(pdf_analyzer, "ProcessPoolExecutor") as pool:
+            self.assertEqual(len(analyzer.extract_text_by_page()), 10)
+        pool.assert_not_called()
+        analyzer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
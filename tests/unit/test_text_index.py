@@ -0,0 +1,101 @@
+"""Unit tests for normadocs.verifier.text_index."""
+
+import random
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import fitz
+
+from normadocs.verifier.pdf_analyzer import PDFAnalyzer, TextBlock
+from normadocs.verifier.text_index import TextIndex
+
+TEXTS = [
+    "Figura 1. Distribución de la muestra",
+    "Véase la figura 2 (p. 14) y la Tabla 3.",
+    "INFORME DE LABORATORIO",
+    "Smith et al. (2020) sostienen que...",
+    "Straße ΟΔΟΣ naïve co-operation",
+    "",
+    "   ",
+    "Referencias",
+]
+
+
+def _blocks(texts):
+    return [(i // 3, TextBlock(text, 0, 0, 1, 1)) for i, text in enumerate(texts)]
+
+
+def _scan(blocks, term, case_sensitive=False):
+    needle = term if case_sensitive else term.lower()
+    return [
+        (page, block)
+        for page, block in blocks
+        if needle in (block.text if case_sensitive else block.text.lower())
+    ]
+
+
+class TestTextIndex(unittest.TestCase):
+    """Tests for TextIndex lookups."""
+
+    def setUp(self) -> None:
+        self.blocks = _blocks(TEXTS)
+        self.index = TextIndex(self.blocks)
+
+    def test_lookups_match_a_linear_scan(self) -> None:
+        rng = random.Random(1486)
+        terms = ["figura", "FIGURA 2", "gura 1. Distrib", "et al. (20", "(p.", "", " ", "..."]
+        terms += ["ΟΔΟΣ", "οδος", "STRASSE", "straße", "co-op", "e n", "ras"]
+        for text in TEXTS:
+            for _ in range(20):
+                start = rng.randrange(len(text) + 1)
+                terms.append(text[start : start + rng.randrange(1, 12)])
+        for term in terms:
+            for case_sensitive in (False, True):
+                with self.subTest(term=term, case_sensitive=case_sensitive):
+                    expected = _scan(self.blocks, term, case_sensitive)
+                    self.assertEqual(self.index.search(term, case_sensitive), expected)
+                    self.assertEqual(self.index.contains(term, case_sensitive), bool(expected))
+
+    def test_candidates_use_the_postings(self) -> None:
+        self.assertEqual(self.index.candidates("la figura 2"), [1])
+        self.assertEqual(self.index.candidates("informe de"), [2])
+        self.assertEqual(self.index.candidates("ncias"), [7])
+        self.assertEqual(self.index.candidates("zzz"), [])
+        self.assertEqual(self.index.candidates(". "), list(range(len(TEXTS))))
+
+
+class TestPDFAnalyzerTextIndex(unittest.TestCase):
+    """Tests for the index shared by PDFAnalyzer text queries."""
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "doc.pdf"
+        doc = fitz.open()
+        for i in range(3):
+            page = doc.new_page(width=612, height=792)
+            page.insert_text((72, 72), "INFORME FINAL", fontsize=12)
+            page.insert_text((300, 120), f"Figura {i + 1}", fontsize=12)
+        doc.save(str(path))
+        doc.close()
+        self.analyzer = PDFAnalyzer(path)
+
+    def tearDown(self) -> None:
+        self.analyzer.close()
+        self.temp_dir.cleanup()
+
+    def test_index_is_built_once_and_shared(self) -> None:
+        with patch("normadocs.verifier.pdf_analyzer.TextIndex", wraps=TextIndex) as build:
+            hits = self.analyzer.find_text("figura 2")
+            self.assertTrue(self.analyzer.contains_text("informe"))
+            self.assertFalse(self.analyzer.contains_text("Informe", case_sensitive=True))
+            self.assertEqual(len(self.analyzer.find_text("INFORME FINAL", True)), 3)
+        build.assert_called_once()
+        self.assertEqual([(h["page"], h["text"]) for h in hits], [(1, "Figura 2")])
+        self.assertIs(self.analyzer.text_index(), self.analyzer.text_index())
+        self.assertEqual(len(self.analyzer.text_index()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -255,7 +255,7 @@ class TestReferencesCheckAlphabeticalOrder(unittest.TestCase):
         doc.save(str(path))
         return path
 
-    def _run_check(self, docx_path: Path) -> list:
+    def _run_check(self, docx_path: Path, reference_locale: str = "es") -> list:
         pdf_path = self.temp_path / "output.pdf"
         pdf_path.touch()
         meta = DocumentMetadata(title="Test Document")
@@ -265,10 +265,25 @@ class TestReferencesCheckAlphabeticalOrder(unittest.TestCase):
             docx=verifier.docx,
             meta=meta,
             strict=False,
+            reference_locale=reference_locale,
         )
         check = ReferencesCheck()
         return check.run(ctx)
 
+    def test_order_follows_reference_locale(self) -> None:
+        """'Ñ' sorts after 'N' in Spanish but with it in English."""
+        path = self.temp_path / "locale_refs.docx"
+        doc = Document()
+        doc.add_paragraph("Referencias")
+        for text in ("Ñandú, A. (2020). Aves.", "Nuñez, B. (2021). Otro."):
+            doc.add_paragraph(text).paragraph_format.first_line_indent = Inches(-0.5)
+        doc.save(str(path))
+
+        for locale, expected in (("es", 1), ("en", 0)):
+            issues = self._run_check(path, reference_locale=locale)
+            order = [i for i in issues if "alphabetical_order" in i.check]
+            self.assertEqual(len(order), expected, locale)
+
     def test_out_of_order_raises_warning(self) -> None:
         """References out of alphabetical order should raise warning."""
         docx_path = self._create_docx_refs_out_of_order()
@@ -409,13 +424,14 @@ class TestReferencesCheckEntryFormat(unittest.TestCase):
     def tearDownClass(cls) -> None:
         cls.temp_dir.cleanup()
 
-    def _run_check(self, entry: str) -> list:
+    def _run_check(self, *entries: str) -> list:
         path = self.temp_path / "entry.docx"
         doc = Document()
         doc.add_paragraph("References", style="Heading 1")
-        ref = doc.add_paragraph(entry)
-        ref.paragraph_format.left_indent = Inches(0.5)
-        ref.paragraph_format.first_line_indent = Inches(-0.5)
+        for entry in entries:
+            ref = doc.add_paragraph(entry)
+            ref.paragraph_format.left_indent = Inches(0.5)
+            ref.paragraph_format.first_line_indent = Inches(-0.5)
         doc.save(str(path))
 
         pdf_path = self.temp_path / "output.pdf"
@@ -469,6 +485,17 @@ class TestReferencesCheckEntryFormat(unittest.TestCase):
         italic = [i for i in issues if "italic_source" in i.check]
         self.assertEqual(len(italic), 1)
 
+    def test_near_duplicate_entry_is_reported(self):
+        """The same author, year and title listed twice is flagged once."""
+        issues = self._run_check(
+            "García, A. (2023). Machine learning en educación. Editorial Uno.",
+            "Garcia, A. (2023). Machine Learning en Educación. Editorial Uno, 2.a ed.",
+            "López, B. (2021). Otro trabajo. Editorial Dos.",
+        )
+        duplicates = [i for i in issues if "duplicate" in i.check]
+        self.assertEqual(len(duplicates), 1)
+        self.assertIn("Near duplicate: reference 2 repeats reference 1", duplicates[0].evidence)
+
 
 if __name__ == "__main__":
     unittest.main()
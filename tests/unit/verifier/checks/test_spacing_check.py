@@ -11,7 +11,7 @@ from docx.shared import Inches, Pt
 from normadocs.models import DocumentMetadata
 from normadocs.verifier.apa_verifier import APAVerifier, VerificationContext
 from normadocs.verifier.checks.spacing import SpacingCheck
-from normadocs.verifier.docx_analyzer import DOCXParagraphInfo
+from normadocs.verifier.docx_analyzer import DOCXParagraphInfo, DOCXSnapshot
 
 
 class TestSpacingCheckCompliant(unittest.TestCase):
@@ -211,7 +211,7 @@ class TestSpacingCheckViolation(unittest.TestCase):
             strict=False,
         )
         check = SpacingCheck()
-        with patch.object(ctx.docx, "get_paragraphs_info", return_value=[info]):
+        with patch.object(ctx.docx, "snapshot", return_value=DOCXSnapshot(paragraphs=(info,))):
             return check.run(ctx)
 
     def test_int_line_spacing_handled(self) -> None:
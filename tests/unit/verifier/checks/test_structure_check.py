@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 from normadocs.models import DocumentMetadata
 from normadocs.verifier.apa_verifier import VerificationContext
 from normadocs.verifier.checks.structure import StructureCheck
-from normadocs.verifier.docx_analyzer import DOCXParagraphInfo
+from normadocs.verifier.docx_analyzer import DOCXParagraphInfo, DOCXSnapshot
 
 
 class _ParagraphSource:
@@ -15,9 +15,9 @@ class _ParagraphSource:
     def __init__(self, paragraphs: list[DOCXParagraphInfo]) -> None:
         self._paragraphs = paragraphs
 
-    def get_paragraphs_info(self) -> list[DOCXParagraphInfo]:
-        """Return the configured paragraph sequence."""
-        return self._paragraphs
+    def snapshot(self) -> DOCXSnapshot:
+        """Return a snapshot holding the configured paragraph sequence."""
+        return DOCXSnapshot(paragraphs=tuple(self._paragraphs))
 
 
 class TestStructureCheck(unittest.TestCase):